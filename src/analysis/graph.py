@@ -0,0 +1,322 @@
+# Standard Library
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple
+
+# Third-party Library
+import numpy as np
+
+# Custom Library
+from logger.set_logger import operation_logger
+from object.constants import IndexType
+from object.indexes import IndexLayout
+
+
+# name of the source node, its value is the tick itself, i.e., (price, high, low).
+TICK: str = "tick"
+
+
+class GraphNode:
+    '''
+    # intermediate of the indicator graph.
+    # factory() returns the step function of a fresh state, step(*values of the inputs) returns the value of the node.
+    '''
+    __slots__ = ("name", "inputs", "factory", "step", "calls", "elapsed_ns")
+
+    def __init__(
+        self: "GraphNode",
+        name: str,
+        inputs: Tuple[str, ...],
+        factory: Callable[[], Callable[..., Any]],
+    ) -> None:
+        self.name: str = name
+        self.inputs: Tuple[str, ...] = inputs
+        self.factory: Callable[[], Callable[..., Any]] = factory
+        self.step: Callable[..., Any] | None = None
+        self.calls: int = 0
+        self.elapsed_ns: int = 0
+        return
+
+
+class GraphOutput:
+    '''
+    # published indicator of the graph, i.e., one IndexType.
+    # render(out, *values of the inputs) writes the values aligned to the layout, it only runs on snapshot().
+    '''
+    __slots__ = ("index_type", "inputs", "layout", "render", "calls", "elapsed_ns")
+
+    def __init__(
+        self: "GraphOutput",
+        index_type: IndexType,
+        inputs: Tuple[str, ...],
+        layout: IndexLayout,
+        render: Callable[..., None],
+    ) -> None:
+        self.index_type: IndexType = index_type
+        self.inputs: Tuple[str, ...] = inputs
+        self.layout: IndexLayout = layout
+        self.render: Callable[..., None] = render
+        self.calls: int = 0
+        self.elapsed_ns: int = 0
+        return
+
+
+class IndicatorGraph:
+    '''
+    # indicators declared as a DAG of shared intermediates, e.g., rolling moments -> SMA, Bollinger and z-score.
+    # every tick walks the active nodes once in topological order and memoizes their values for the consumers.
+    # only the ancestors of the subscribed outputs are active, the rest of the graph costs nothing per tick.
+    # outputs are rendered lazily, i.e., only when snapshot() is called.
+
+    - the graph keeps the last <history_size> ticks and replays them whenever the set of active nodes changes.
+    - timings() reports the time spent in every node, to see which indicators cost the most.
+    '''
+    def __init__(
+        self: "IndicatorGraph",
+        history_size: int = 2_000,
+    ) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._nodes: Dict[str, GraphNode] = dict()
+        self._outputs: Dict[IndexType, GraphOutput] = dict()
+        self._subscriptions: IndexType = IndexType(0)
+        self._plan: List[GraphNode] = list()  # active nodes in topological order
+        self._values: Dict[str, Any] = dict()  # memo of the latest tick
+        self._history: Deque[Tuple[float, float | None, float | None]] = deque(maxlen = history_size)
+        return
+
+    """
+    ######################################################################################################################
+    #                                                  Declaration                                                       #
+    ######################################################################################################################
+    """
+    def add_node(
+        self: "IndicatorGraph",
+        name: str,
+        inputs: Tuple[str, ...],
+        factory: Callable[[], Callable[..., Any]],
+    ) -> None:
+        """
+        func add_node():
+            - declare an intermediate, the inputs are the names of other nodes or TICK.
+            - inputs may be declared later, the graph is validated when it is planned.
+        """
+        with self._lock:
+            if name == TICK or name in self._nodes:
+                raise ValueError(f"Node '{name}' has already been declared.")
+            self._nodes[name] = GraphNode(name, tuple(inputs), factory)
+        return
+
+    def add_output(
+        self: "IndicatorGraph",
+        index_type: IndexType,
+        inputs: Tuple[str, ...],
+        layout: IndexLayout,
+        render: Callable[..., None],
+    ) -> None:
+        """
+        func add_output():
+            - publish an IndexType computed from the given nodes.
+        """
+        with self._lock:
+            if index_type in self._outputs:
+                raise ValueError(f"{index_type!r} has already been registered.")
+            self._outputs[index_type] = GraphOutput(index_type, tuple(inputs), layout, render)
+        return
+
+    """
+    ######################################################################################################################
+    #                                                 Subscription                                                       #
+    ######################################################################################################################
+    """
+    def subscribe(
+        self: "IndicatorGraph",
+        index_types: IndexType,
+    ) -> None:
+        """
+        func subscribe():
+            - start computing the outputs of the given flags, e.g., IndexType.SMA | IndexType.EMA.
+            - the newly active nodes are warmed up with the ticks in the history.
+        """
+        with self._lock:
+            flags: IndexType = self._subscriptions
+            for index_type in IndexType:
+                if index_type not in index_types or index_type in flags:
+                    continue
+                if index_type not in self._outputs:
+                    operation_logger.warning(f"{__name__} - No indicator has been registered for {index_type!r}.")
+                    continue
+                flags |= index_type
+                operation_logger.info(f"{__name__} - {index_type!r} has been subscribed.")
+
+            if flags != self._subscriptions:
+                self._subscriptions = flags
+                self.__replan()
+        return
+
+    def unsubscribe(
+        self: "IndicatorGraph",
+        index_types: IndexType,
+    ) -> None:
+        with self._lock:
+            flags: IndexType = self._subscriptions & ~index_types
+            if flags != self._subscriptions:
+                self._subscriptions = flags
+                self.__replan()
+        return
+
+    @property
+    def subscriptions(self: "IndicatorGraph") -> IndexType:
+        with self._lock:
+            return self._subscriptions
+
+    @property
+    def active_nodes(self: "IndicatorGraph") -> Tuple[str, ...]:
+        with self._lock:
+            return tuple(node.name for node in self._plan)
+
+    def __replan(self: "IndicatorGraph") -> None:
+        """
+        func __replan():
+            - collect the ancestors of the subscribed outputs and sort them with Kahn's algorithm.
+            - every active node starts from a fresh state and replays the history, so all of them see the same ticks.
+        """
+        needed: Set[str] = set()
+        stack: List[str] = [
+            name
+            for index_type, output in self._outputs.items() if index_type in self._subscriptions
+            for name in output.inputs
+        ]
+        while stack:
+            name: str = stack.pop()
+            if name == TICK or name in needed:
+                continue
+            node: GraphNode | None = self._nodes.get(name)
+            if node is None:
+                raise ValueError(f"Node '{name}' has not been declared.")
+            needed.add(name)
+            stack.extend(node.inputs)
+
+        # Kahn's algorithm, ties are broken by the declaration order to keep the plan deterministic.
+        ordered: List[str] = [name for name in self._nodes if name in needed]
+        in_degree: Dict[str, int] = {
+            name: sum(1 for source in self._nodes[name].inputs if source != TICK) for name in ordered
+        }
+        consumers: Dict[str, List[str]] = {name: list() for name in ordered}
+        for name in ordered:
+            for source in self._nodes[name].inputs:
+                if source != TICK:
+                    consumers[source].append(name)
+
+        ready: Deque[str] = deque(name for name in ordered if in_degree[name] == 0)
+        plan: List[GraphNode] = list()
+        while ready:
+            name = ready.popleft()
+            plan.append(self._nodes[name])
+            for consumer in consumers[name]:
+                in_degree[consumer] -= 1
+                if in_degree[consumer] == 0:
+                    ready.append(consumer)
+
+        if len(plan) != len(needed):
+            raise ValueError(f"Indicator graph has a cycle among {sorted(needed - {node.name for node in plan})}.")
+
+        for node in plan:
+            node.step = node.factory()
+        self._plan = plan
+        self._values = dict()
+        for tick in self._history:
+            self.__evaluate(tick)
+
+        # the replay is not a cost of the live ticks.
+        for node in self._nodes.values():
+            node.calls = node.elapsed_ns = 0
+        for output in self._outputs.values():
+            output.calls = output.elapsed_ns = 0
+        return
+
+    """
+    ######################################################################################################################
+    #                                                  Evaluation                                                        #
+    ######################################################################################################################
+    """
+    def update(
+        self: "IndicatorGraph",
+        price: float,
+        high: float | None = None,
+        low: float | None = None,
+    ) -> None:
+        """
+        func update():
+            - feed a tick to every active node.
+        """
+        tick: Tuple[float, float | None, float | None] = (price, high, low)
+        with self._lock:
+            self._history.append(tick)
+            self.__evaluate(tick)
+        return
+
+    def __evaluate(
+        self: "IndicatorGraph",
+        tick: Tuple[float, float | None, float | None],
+    ) -> None:
+        values: Dict[str, Any] = self._values
+        values[TICK] = tick
+        clock: Callable[[], int] = time.perf_counter_ns
+        for node in self._plan:
+            start: int = clock()
+            values[node.name] = node.step(*[values[name] for name in node.inputs])
+            node.elapsed_ns += clock() - start
+            node.calls += 1
+        return
+
+    def snapshot(
+        self: "IndicatorGraph",
+    ) -> List[Tuple[IndexType, IndexLayout, np.ndarray]]:
+        """
+        func snapshot():
+            - render the current values of every subscribed output.
+
+        return List[Tuple[IndexType, IndexLayout, np.ndarray]]
+            - (index type, layout of the values, float64 values aligned to the layout)
+            - all NaN before the first tick.
+        """
+        with self._lock:
+            values: Dict[str, Any] = self._values
+            result: List[Tuple[IndexType, IndexLayout, np.ndarray]] = list()
+            for index_type, output in self._outputs.items():
+                if index_type not in self._subscriptions:
+                    continue
+                out: np.ndarray = np.full(len(output.layout), np.nan)
+                if TICK in values:
+                    start: int = time.perf_counter_ns()
+                    output.render(out, *[values[name] for name in output.inputs])
+                    output.elapsed_ns += time.perf_counter_ns() - start
+                    output.calls += 1
+                result.append((index_type, output.layout, out))
+            return result
+
+    def timings(
+        self: "IndicatorGraph",
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        func timings():
+            - time spent in the active nodes since the last replan, and in the rendering of the outputs.
+
+        return Dict[str, Dict[str, float]]
+            - {<node name> | "output:<IndexType name>": {"calls": <int>, "total_ns": <int>, "mean_ns": <float>}}
+        """
+        with self._lock:
+            entries: List[Tuple[str, int, int]] = [(node.name, node.calls, node.elapsed_ns) for node in self._plan]
+            entries.extend(
+                (f"output:{output.index_type.name}", output.calls, output.elapsed_ns)
+                for index_type, output in self._outputs.items() if index_type in self._subscriptions
+            )
+        return {
+            name: {
+                "calls": calls,
+                "total_ns": elapsed_ns,
+                "mean_ns": elapsed_ns / calls if calls else 0.0,
+            }
+            for name, calls, elapsed_ns in entries
+        }
@@ -0,0 +1,378 @@
+# Standard Library
+import math
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+# Third-party Library
+import numpy as np
+
+# Custom Library
+from object.constants import (
+    MA_WRITE_PERIODS,
+    RSI_WRITE_PERIODS,
+    RSI_READ_PERIODS,
+    ATR_WRITE_PERIODS,
+    ATR_READ_PERIODS,
+    MACD_PERIODS,
+    BOLLINGER_PERIOD,
+    BOLLINGER_WIDTH,
+)
+from object.indexes import IndexLayout, MA_LAYOUT
+
+
+class StreamingIndicator(ABC):
+    '''
+    # incremental indicator, i.e., a state machine fed one tick at a time.
+    # update() is O(1) per tick and only touches python floats.
+    # write() renders the current values into the float64 array of the Index layout, NaN while warming up.
+    '''
+    layout: IndexLayout = MA_LAYOUT
+
+    @abstractmethod
+    def update(
+        self: "StreamingIndicator",
+        price: float,
+        high: float | None = None,
+        low: float | None = None,
+    ) -> None:
+        return
+
+    @abstractmethod
+    def write(
+        self: "StreamingIndicator",
+        out: np.ndarray,
+    ) -> None:
+        return
+
+    def values(self: "StreamingIndicator") -> np.ndarray:
+        out: np.ndarray = np.full(len(self.layout), np.nan)
+        self.write(out)
+        return out
+
+
+class _RollingWindow:
+    '''
+    # ring buffer of the last <size> prices with running sums for several window lengths.
+    # the sums are recomputed exactly once per <size> ticks to bound the floating point drift.
+    '''
+    __slots__ = ("size", "periods", "buffer", "position", "count", "sums", "squares")
+
+    def __init__(
+        self: "_RollingWindow",
+        periods: Tuple[int, ...],
+    ) -> None:
+        self.size: int = max(periods)
+        self.periods: Tuple[int, ...] = periods
+        self.buffer: List[float] = [0.0] * self.size
+        self.position: int = 0
+        self.count: int = 0
+        self.sums: List[float] = [0.0] * len(periods)
+        self.squares: List[float] = [0.0] * len(periods)
+        return
+
+    def push(
+        self: "_RollingWindow",
+        value: float,
+    ) -> None:
+        buffer: List[float] = self.buffer
+        size: int = self.size
+        for offset, period in enumerate(self.periods):
+            if self.count >= period:
+                leaving: float = buffer[(self.position - period) % size]
+                self.sums[offset] -= leaving
+                self.squares[offset] -= leaving * leaving
+            self.sums[offset] += value
+            self.squares[offset] += value * value
+
+        buffer[self.position] = value
+        self.position = (self.position + 1) % size
+        self.count += 1
+
+        if self.position == 0:
+            self.__resum()
+        return
+
+    def __resum(self: "_RollingWindow") -> None:
+        for offset, period in enumerate(self.periods):
+            if self.count >= period:
+                window: List[float] = [self.buffer[(self.position - lag) % self.size] for lag in range(1, period + 1)]
+                self.sums[offset] = math.fsum(window)
+                self.squares[offset] = math.fsum(value * value for value in window)
+        return
+
+    def mean(self: "_RollingWindow", offset: int) -> float:
+        period: int = self.periods[offset]
+        return self.sums[offset] / period if self.count >= period else math.nan
+
+    def variance(self: "_RollingWindow", offset: int) -> float:
+        period: int = self.periods[offset]
+        if self.count < period:
+            return math.nan
+        mean: float = self.sums[offset] / period
+        return max(self.squares[offset] / period - mean * mean, 0.0)
+
+
+class _EmaBank:
+    '''
+    # EMAs of several periods over the same prices, alpha = 2 / (period + 1), seeded with the first price.
+    '''
+    __slots__ = ("periods", "alphas", "emas", "count")
+
+    def __init__(
+        self: "_EmaBank",
+        periods: Tuple[int, ...],
+    ) -> None:
+        self.periods: Tuple[int, ...] = periods
+        self.alphas: Tuple[float, ...] = tuple(2.0 / (period + 1.0) for period in periods)
+        self.emas: List[float] = [math.nan] * len(periods)
+        self.count: int = 0
+        return
+
+    def push(
+        self: "_EmaBank",
+        value: float,
+    ) -> None:
+        emas: List[float] = self.emas
+        if self.count == 0:
+            for offset in range(len(emas)):
+                emas[offset] = value
+        else:
+            for offset, alpha in enumerate(self.alphas):
+                emas[offset] += alpha * (value - emas[offset])
+        self.count += 1
+        return
+
+    def value(self: "_EmaBank", offset: int) -> float:
+        return self.emas[offset] if self.count >= self.periods[offset] else math.nan
+
+
+class SimpleMovingAverage(StreamingIndicator):
+    '''
+    # SMA over each of MA_WRITE_PERIODS ticks, published at MA_READ_PERIODS.
+    # with a shared window, which has to hold every period, the owner of the window feeds it, i.e., update() is not called.
+    '''
+    layout: IndexLayout = MA_LAYOUT
+
+    def __init__(
+        self: "SimpleMovingAverage",
+        periods: Tuple[int, ...] = MA_WRITE_PERIODS,
+        window: _RollingWindow | None = None,
+    ) -> None:
+        self.window: _RollingWindow = window if window is not None else _RollingWindow(periods)
+        self.offsets: Tuple[int, ...] = tuple(self.window.periods.index(period) for period in periods)
+        return
+
+    def update(self, price, high = None, low = None) -> None:
+        self.window.push(price)
+        return
+
+    def write(self, out: np.ndarray) -> None:
+        for index, offset in enumerate(self.offsets):
+            out[index] = self.window.mean(offset)
+        return
+
+
+class ExponentialMovingAverage(StreamingIndicator):
+    '''
+    # EMA with span = period, i.e., alpha = 2 / (period + 1), same as pandas ewm(span = period, adjust = False).
+    # a period is published once it has seen <period> ticks.
+    # with a shared bank, which has to hold every period, the owner of the bank feeds it, i.e., update() is not called.
+    '''
+    layout: IndexLayout = MA_LAYOUT
+
+    def __init__(
+        self: "ExponentialMovingAverage",
+        periods: Tuple[int, ...] = MA_WRITE_PERIODS,
+        bank: _EmaBank | None = None,
+    ) -> None:
+        self.bank: _EmaBank = bank if bank is not None else _EmaBank(periods)
+        self.offsets: Tuple[int, ...] = tuple(self.bank.periods.index(period) for period in periods)
+        return
+
+    def update(self, price, high = None, low = None) -> None:
+        self.bank.push(price)
+        return
+
+    def write(self, out: np.ndarray) -> None:
+        for index, offset in enumerate(self.offsets):
+            out[index] = self.bank.value(offset)
+        return
+
+
+class _WilderAverage:
+    '''
+    # Wilder smoothing: simple mean of the first <period> samples, then avg = (avg * (period - 1) + x) / period.
+    '''
+    __slots__ = ("period", "count", "total", "average")
+
+    def __init__(self: "_WilderAverage", period: int) -> None:
+        self.period: int = period
+        self.count: int = 0
+        self.total: float = 0.0
+        self.average: float = math.nan
+        return
+
+    def push(self: "_WilderAverage", value: float) -> None:
+        self.count += 1
+        if self.count < self.period:
+            self.total += value
+        elif self.count == self.period:
+            self.average = (self.total + value) / self.period
+        else:
+            self.average += (value - self.average) / self.period
+        return
+
+
+class RelativeStrengthIndex(StreamingIndicator):
+    '''
+    # Wilder RSI over each of RSI_WRITE_PERIODS ticks, published at RSI_READ_PERIODS, in the range [0, 100].
+    '''
+    layout: IndexLayout = IndexLayout.of(RSI_READ_PERIODS)
+
+    def __init__(
+        self: "RelativeStrengthIndex",
+        periods: Tuple[int, ...] = RSI_WRITE_PERIODS,
+    ) -> None:
+        self.gains: List[_WilderAverage] = [_WilderAverage(period) for period in periods]
+        self.losses: List[_WilderAverage] = [_WilderAverage(period) for period in periods]
+        self.previous: float | None = None
+        return
+
+    def update(self, price, high = None, low = None) -> None:
+        if self.previous is not None:
+            change: float = price - self.previous
+            gain: float = change if change > 0.0 else 0.0
+            loss: float = -change if change < 0.0 else 0.0
+            for offset in range(len(self.gains)):
+                self.gains[offset].push(gain)
+                self.losses[offset].push(loss)
+        self.previous = price
+        return
+
+    def write(self, out: np.ndarray) -> None:
+        for offset in range(len(self.gains)):
+            gain: float = self.gains[offset].average
+            loss: float = self.losses[offset].average
+            if gain != gain:  # NaN, still warming up
+                out[offset] = math.nan
+            elif loss == 0.0:
+                out[offset] = 100.0 if gain > 0.0 else 50.0
+            else:
+                out[offset] = 100.0 - 100.0 / (1.0 + gain / loss)
+        return
+
+
+class MovingAverageConvergenceDivergence(StreamingIndicator):
+    '''
+    # MACD line = EMA(fast) - EMA(slow), signal = EMA(signal) of the MACD line, histogram = MACD - signal.
+    # with a shared bank, which has to hold the fast and slow periods, the owner of the bank feeds it,
+    # and advance() is called after every push instead of update().
+    '''
+    layout: IndexLayout = IndexLayout.of(("macd", "signal", "histogram"))
+
+    def __init__(
+        self: "MovingAverageConvergenceDivergence",
+        periods: Tuple[int, int, int] = MACD_PERIODS,
+        bank: _EmaBank | None = None,
+    ) -> None:
+        self.fast, self.slow, self.signal_period = periods
+        self.bank: _EmaBank = bank if bank is not None else _EmaBank((self.fast, self.slow))
+        self.fast_offset: int = self.bank.periods.index(self.fast)
+        self.slow_offset: int = self.bank.periods.index(self.slow)
+        self.signal_alpha: float = 2.0 / (self.signal_period + 1.0)
+        self.signal: float = math.nan
+        self.signal_count: int = 0
+        return
+
+    def update(self, price, high = None, low = None) -> None:
+        self.bank.push(price)
+        self.advance()
+        return
+
+    def advance(self: "MovingAverageConvergenceDivergence") -> None:
+        """
+        func advance():
+            - step the signal line on the current EMAs, once per price pushed to the bank.
+        """
+        if self.bank.count >= self.slow:
+            macd: float = self.bank.emas[self.fast_offset] - self.bank.emas[self.slow_offset]
+            if self.signal_count == 0:
+                self.signal = macd
+            else:
+                self.signal += self.signal_alpha * (macd - self.signal)
+            self.signal_count += 1
+        return
+
+    def write(self, out: np.ndarray) -> None:
+        if self.signal_count < self.signal_period:
+            out[:3] = math.nan
+            return
+        macd: float = self.bank.emas[self.fast_offset] - self.bank.emas[self.slow_offset]
+        out[0] = macd
+        out[1] = self.signal
+        out[2] = macd - self.signal
+        return
+
+
+class BollingerBands(StreamingIndicator):
+    '''
+    # middle = SMA(period), upper/lower = middle -/+ width * population standard deviation over the same window.
+    # bandwidth = (upper - lower) / middle.
+    # with a shared window, which has to hold the period, the owner of the window feeds it, i.e., update() is not called.
+    '''
+    layout: IndexLayout = IndexLayout.of(("upper", "middle", "lower", "bandwidth"))
+
+    def __init__(
+        self: "BollingerBands",
+        period: int = BOLLINGER_PERIOD,
+        width: float = BOLLINGER_WIDTH,
+        window: _RollingWindow | None = None,
+    ) -> None:
+        self.window: _RollingWindow = window if window is not None else _RollingWindow((period,))
+        self.offset: int = self.window.periods.index(period)
+        self.width: float = width
+        return
+
+    def update(self, price, high = None, low = None) -> None:
+        self.window.push(price)
+        return
+
+    def write(self, out: np.ndarray) -> None:
+        middle: float = self.window.mean(self.offset)
+        deviation: float = math.sqrt(self.window.variance(self.offset)) if middle == middle else math.nan
+        out[0] = middle + self.width * deviation
+        out[1] = middle
+        out[2] = middle - self.width * deviation
+        out[3] = (2.0 * self.width * deviation / middle) if middle else math.nan
+        return
+
+
+class AverageTrueRange(StreamingIndicator):
+    '''
+    # Wilder ATR over each of ATR_WRITE_PERIODS ticks, published at ATR_READ_PERIODS.
+    # without high/low, a tick is a bar with high == low == price, i.e., the true range is |price - previous price|.
+    '''
+    layout: IndexLayout = IndexLayout.of(ATR_READ_PERIODS)
+
+    def __init__(
+        self: "AverageTrueRange",
+        periods: Tuple[int, ...] = ATR_WRITE_PERIODS,
+    ) -> None:
+        self.averages: List[_WilderAverage] = [_WilderAverage(period) for period in periods]
+        self.previous: float | None = None
+        return
+
+    def update(self, price, high = None, low = None) -> None:
+        high = price if high is None else high
+        low = price if low is None else low
+        if self.previous is not None:
+            true_range: float = max(high - low, abs(high - self.previous), abs(low - self.previous))
+            for average in self.averages:
+                average.push(true_range)
+        self.previous = price
+        return
+
+    def write(self, out: np.ndarray) -> None:
+        for offset, average in enumerate(self.averages):
+            out[offset] = average.average
+        return
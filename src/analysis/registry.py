@@ -0,0 +1,194 @@
+# Standard Library
+import math
+from typing import Any, Callable, Dict, Tuple
+
+# Third-party Library
+import numpy as np
+
+# Custom Library
+from object.constants import (
+    IndexType,
+    MA_WRITE_PERIODS,
+    MACD_PERIODS,
+    BOLLINGER_PERIOD,
+)
+from object.indexes import IndexLayout, MA_LAYOUT, PRICE_LAYOUT
+from analysis.graph import IndicatorGraph, TICK
+from analysis.indicators import (
+    StreamingIndicator,
+    SimpleMovingAverage,
+    ExponentialMovingAverage,
+    MovingAverageConvergenceDivergence,
+    BollingerBands,
+    RelativeStrengthIndex,
+    AverageTrueRange,
+    _EmaBank,
+    _RollingWindow,
+)
+
+
+# periods of the shared intermediates, i.e., one ring buffer and one EMA bank for every consumer.
+MOMENT_PERIODS: Tuple[int, ...] = tuple(sorted(set(MA_WRITE_PERIODS) | {BOLLINGER_PERIOD}))
+EMA_PERIODS: Tuple[int, ...] = tuple(sorted(set(MA_WRITE_PERIODS) | set(MACD_PERIODS[:2])))
+
+_MOMENT_OFFSETS: Dict[int, int] = {period: offset for offset, period in enumerate(MOMENT_PERIODS)}
+
+
+######################################################################################################################
+#                                              Steps of the Shared Nodes                                             #
+######################################################################################################################
+def _price_step() -> Callable[[Tuple[float, float | None, float | None]], float]:
+    return lambda tick: tick[0]
+
+
+def _moments_step() -> Callable[[float], _RollingWindow]:
+    window: _RollingWindow = _RollingWindow(MOMENT_PERIODS)
+
+    def step(price: float) -> _RollingWindow:
+        window.push(price)
+        return window
+    return step
+
+
+def _emas_step() -> Callable[[float], _EmaBank]:
+    bank: _EmaBank = _EmaBank(EMA_PERIODS)
+
+    def step(price: float) -> _EmaBank:
+        bank.push(price)
+        return bank
+    return step
+
+
+def _view_step(
+    factory: Callable[[Any], StreamingIndicator],
+) -> Callable[[], Callable[[Any], StreamingIndicator]]:
+    """
+    func _view_step():
+        - node of a built-in indicator reading a shared intermediate, bound to it on the first tick of the plan.
+    """
+    def build() -> Callable[[Any], StreamingIndicator]:
+        indicator: StreamingIndicator | None = None
+
+        def step(shared: Any) -> StreamingIndicator:
+            nonlocal indicator
+            if indicator is None:
+                indicator = factory(shared)
+            return indicator
+        return step
+    return build
+
+
+def _macd_step() -> Callable[[_EmaBank], MovingAverageConvergenceDivergence]:
+    macd: MovingAverageConvergenceDivergence | None = None
+
+    def step(bank: _EmaBank) -> MovingAverageConvergenceDivergence:
+        nonlocal macd
+        if macd is None:
+            macd = MovingAverageConvergenceDivergence(bank = bank)
+        macd.advance()
+        return macd
+    return step
+
+
+def _indicator_step(
+    factory: Callable[[], StreamingIndicator],
+) -> Callable[[], Callable[[Tuple[float, float | None, float | None]], StreamingIndicator]]:
+    def build() -> Callable[[Tuple[float, float | None, float | None]], StreamingIndicator]:
+        indicator: StreamingIndicator = factory()
+
+        def step(tick: Tuple[float, float | None, float | None]) -> StreamingIndicator:
+            indicator.update(*tick)
+            return indicator
+        return step
+    return build
+
+
+######################################################################################################################
+#                                                Renders of the Outputs                                              #
+######################################################################################################################
+def _render_price(out: np.ndarray, price: float) -> None:
+    out[0] = price
+    return
+
+
+def _render_zscore(out: np.ndarray, price: float, window: _RollingWindow) -> None:
+    for offset, period in enumerate(MA_WRITE_PERIODS):
+        moment: int = _MOMENT_OFFSETS[period]
+        variance: float = window.variance(moment)
+        out[offset] = (price - window.mean(moment)) / math.sqrt(variance) if variance > 0.0 else math.nan
+    return
+
+
+def _render_indicator(out: np.ndarray, indicator: StreamingIndicator) -> None:
+    indicator.write(out)
+    return
+
+
+class IndicatorRegistry(IndicatorGraph):
+    '''
+    # IndexType -> indicator, evaluated as an IndicatorGraph.
+    # the built-in indicators share their intermediates, e.g., SMA, Bollinger and z-score read the same rolling moments.
+    # register() plugs a standalone StreamingIndicator in as a single node fed by the tick.
+
+    - DataCollectorAndProcessor calls update() for every tick and snapshot() when it publishes the indexes.
+    - SignalGenerator calls subscribe() with the IndexTypes its rules read.
+    '''
+    @staticmethod
+    def default(
+        subscriptions: IndexType | None = None,
+    ) -> "IndicatorRegistry":
+        """
+        static func default():
+            - registry with every built-in indicator registered.
+
+        price ─┬─ moments ─┬─ sma ─ SMA
+               │           ├─ bollinger ─ BOLLINGER
+               │           └─ ZSCORE (+ price)
+               ├─ emas ────┬─ ema ─ EMA
+               │           └─ macd ─ MACD
+               └─ PRICE
+        tick ──┬─ rsi ─ RSI
+               └─ atr ─ ATR
+        """
+        registry: IndicatorRegistry = IndicatorRegistry()
+        registry.add_node("price", (TICK,), _price_step)
+        registry.add_node("moments", ("price",), _moments_step)
+        registry.add_node("emas", ("price",), _emas_step)
+        registry.add_node("sma", ("moments",), _view_step(lambda window: SimpleMovingAverage(window = window)))
+        registry.add_node("bollinger", ("moments",), _view_step(lambda window: BollingerBands(window = window)))
+        registry.add_node("ema", ("emas",), _view_step(lambda bank: ExponentialMovingAverage(bank = bank)))
+        registry.add_node("macd", ("emas",), _macd_step)
+
+        registry.add_output(IndexType.PRICE, ("price",), PRICE_LAYOUT, _render_price)
+        registry.add_output(IndexType.SMA, ("sma",), SimpleMovingAverage.layout, _render_indicator)
+        registry.add_output(IndexType.EMA, ("ema",), ExponentialMovingAverage.layout, _render_indicator)
+        registry.add_output(IndexType.ZSCORE, ("price", "moments"), MA_LAYOUT, _render_zscore)
+        registry.add_output(IndexType.BOLLINGER, ("bollinger",), BollingerBands.layout, _render_indicator)
+        registry.add_output(IndexType.MACD, ("macd",), MovingAverageConvergenceDivergence.layout, _render_indicator)
+
+        registry.register(IndexType.RSI, RelativeStrengthIndex)
+        registry.register(IndexType.ATR, AverageTrueRange)
+
+        if subscriptions:
+            registry.subscribe(subscriptions)
+        return registry
+
+    def register(
+        self: "IndicatorRegistry",
+        index_type: IndexType,
+        factory: Callable[[], StreamingIndicator],
+        layout: IndexLayout | None = None,
+    ) -> None:
+        """
+        func register():
+            - register a standalone StreamingIndicator under a single IndexType flag.
+            - layout defaults to the layout of the indicator class.
+        """
+        if index_type in self._outputs:
+            raise ValueError(f"{index_type!r} has already been registered.")
+        if layout is None:
+            layout = getattr(factory, "layout", None) or factory().layout
+        name: str = index_type.name.lower()
+        self.add_node(name, (TICK,), _indicator_step(factory))
+        self.add_output(index_type, (name,), layout, _render_indicator)
+        return
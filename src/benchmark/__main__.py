@@ -0,0 +1,63 @@
+# Standard Library
+import argparse
+import sys
+from typing import Any, Dict
+
+# Custom Library
+from benchmark.harness import compare, format_duration, load, print_comparison, save
+from benchmark.hot_paths import suite
+
+
+DEFAULT_BASELINE: str = "benchmark_baseline.json"
+
+
+def main() -> int:
+    """
+    func main():
+        - run: time the hot paths and write the results, e.g., python -m benchmark run --output benchmark_baseline.json
+        - compare: time them again, or read --current, and exit with 1 if a case is slower than the baseline by more than --threshold.
+    """
+    parser = argparse.ArgumentParser(prog = "python -m benchmark", description = "Benchmarks of the tick-to-order hot paths.")
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    run = commands.add_parser("run", help = "run the benchmarks and write the results as JSON")
+    run.add_argument("--output", default = DEFAULT_BASELINE)
+
+    check = commands.add_parser("compare", help = "compare a run against the baseline")
+    check.add_argument("--baseline", default = DEFAULT_BASELINE)
+    check.add_argument("--current", default = None, help = "results of an earlier run, the benchmarks are run if not given")
+    check.add_argument("--threshold", type = float, default = 0.1, help = "allowed slowdown of the median, 0.1 for 10%%")
+
+    for command in (run, check):
+        command.add_argument("--filter", action = "append", default = None, help = "run the cases containing the text, repeatable")
+        command.add_argument("--rounds", type = int, default = 5)
+        command.add_argument("--min-time", type = float, default = 0.1, help = "seconds per round")
+        command.add_argument("--list", action = "store_true", help = "print the selected cases and exit")
+    args = parser.parse_args()
+
+    names = suite.select(args.filter)
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    def report(name: str, result: Dict[str, float]) -> None:
+        print(f"{name:<32} {format_duration(result['median_ns']):>10} / op  ({result['ops_per_sec']:,.0f} ops/s)", file = sys.stderr)
+        return
+
+    if args.command == "run":
+        save(suite.run(names, rounds = args.rounds, min_time = args.min_time, report = report), args.output)
+        print(f"Results have been written to {args.output}.", file = sys.stderr)
+        return 0
+
+    baseline: Dict[str, Any] = load(args.baseline)
+    if args.current is not None:
+        current: Dict[str, Any] = load(args.current)
+    else:
+        current = suite.run([name for name in names if name in baseline["results"]], rounds = args.rounds, min_time = args.min_time, report = report)
+    rows = compare(baseline, current, threshold = args.threshold)
+    print_comparison(rows)
+    return 1 if any(regressed for *_, regressed in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# Standard Library
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Tuple
+
+
+# a benchmark is a context manager which sets the case up and yields the operation,
+# operation(n) runs the measured code n times, the teardown runs once every round is done.
+BenchmarkCase = Callable[[], ContextManager[Callable[[int], None]]]
+
+SCHEMA_VERSION: int = 1
+
+
+class BenchmarkSuite:
+    '''
+    # named benchmark cases, timed in rounds of <number> operations like timeit.autorange().
+        # the number of operations of a round is doubled until a round takes <min_time> seconds.
+        # the median of the per-operation time of the rounds is the figure compared against the baseline.
+
+    - results are plain dicts, so save() / load() round-trip them through JSON.
+    '''
+    def __init__(self: "BenchmarkSuite") -> None:
+        self.cases: Dict[str, BenchmarkCase] = dict()
+        return
+
+    def case(
+        self: "BenchmarkSuite",
+        name: str,
+    ) -> Callable[[Callable[[], Iterator[Callable[[int], None]]]], BenchmarkCase]:
+        """
+        func case():
+            - decorator which registers a generator function as a context manager under the name.
+        """
+        def register(function: Callable[[], Iterator[Callable[[int], None]]]) -> BenchmarkCase:
+            if name in self.cases:
+                raise ValueError(f"Benchmark {name} has already been registered.")
+            self.cases[name] = contextmanager(function)
+            return self.cases[name]
+        return register
+
+    def select(
+        self: "BenchmarkSuite",
+        patterns: List[str] | None = None,
+    ) -> List[str]:
+        """
+        func select():
+            - names containing any of the patterns, every case if no pattern is given.
+        """
+        return [name for name in self.cases if not patterns or any(pattern in name for pattern in patterns)]
+
+    @staticmethod
+    def measure(
+        operation: Callable[[int], None],
+        rounds: int = 5,
+        min_time: float = 0.1,
+    ) -> Dict[str, float]:
+        number: int = 1
+        while True:
+            started: float = time.perf_counter()
+            operation(number)
+            elapsed: float = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+            number *= 2
+
+        per_operation: List[float] = [elapsed / number]
+        for _ in range(rounds - 1):
+            started = time.perf_counter()
+            operation(number)
+            per_operation.append((time.perf_counter() - started) / number)
+
+        median: float = statistics.median(per_operation)
+        return {
+            "number": number,
+            "rounds": rounds,
+            "median_ns": median * 1e9,
+            "min_ns": min(per_operation) * 1e9,
+            "max_ns": max(per_operation) * 1e9,
+            "stdev_ns": (statistics.stdev(per_operation) if rounds > 1 else 0.0) * 1e9,
+            "ops_per_sec": 1 / median if median > 0 else float("inf"),
+        }
+
+    def run(
+        self: "BenchmarkSuite",
+        names: List[str] | None = None,
+        rounds: int = 5,
+        min_time: float = 0.1,
+        report: Callable[[str, Dict[str, float]], None] | None = None,
+    ) -> Dict[str, Any]:
+        results: Dict[str, Dict[str, float]] = dict()
+        for name in (names if names is not None else list(self.cases)):
+            with self.cases[name]() as operation:
+                results[name] = BenchmarkSuite.measure(operation, rounds = rounds, min_time = min_time)
+            if report is not None:
+                report(name, results[name])
+        return {
+            "schema": SCHEMA_VERSION,
+            "created": int(time.time() * 1_000),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+
+
+def save(
+    results: Dict[str, Any],
+    path: str,
+) -> None:
+    with open(path, "w", encoding = "utf-8") as file:
+        json.dump(results, file, indent = 2, sort_keys = True)
+        file.write("\n")
+    return
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding = "utf-8") as file:
+        results: Dict[str, Any] = json.load(file)
+    if results.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path} is not a benchmark baseline of schema {SCHEMA_VERSION}.")
+    return results
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.1,
+) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    func compare():
+        - (name, baseline ns, current ns, ratio, regressed) of the cases found in both runs.
+        - a case regresses when its median is slower than the baseline by more than <threshold>, e.g., 0.1 for 10%.
+    """
+    rows: List[Tuple[str, float, float, float, bool]] = list()
+    for name, result in current["results"].items():
+        reference: Dict[str, float] | None = baseline["results"].get(name)
+        if reference is None:
+            continue
+        ratio: float = result["median_ns"] / reference["median_ns"] if reference["median_ns"] else float("inf")
+        rows.append((name, reference["median_ns"], result["median_ns"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def format_duration(nanoseconds: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:.2f} {unit}"
+    return f"{nanoseconds:.0f} ns"
+
+
+def print_comparison(
+    rows: List[Tuple[str, float, float, float, bool]],
+    file: Any = sys.stdout,
+) -> None:
+    width: int = max([len(row[0]) for row in rows] + [4])
+    print(f"{'case':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}", file = file)
+    for name, reference, current, ratio, regressed in rows:
+        flag: str = "  REGRESSION" if regressed else ""
+        print(f"{name:<{width}}  {format_duration(reference):>10}  {format_duration(current):>10}  {ratio - 1:>+8.1%}{flag}", file = file)
+    return
@@ -0,0 +1,405 @@
+# Standard Library
+import hashlib
+import hmac
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List
+from urllib.parse import urlencode
+
+# Third Party
+import numpy as np
+import requests
+from pydantic import BaseModel
+
+# Custom Library
+from analysis.registry import IndicatorRegistry
+from benchmark.harness import BenchmarkSuite
+from binance.future import FutureMarket as BinanceFutureMarket
+from interface.exchange_interface import Book
+from interface.pipeline_interface import PipelineController
+from manager.data_collector_and_processor import DataCollectorAndProcessor
+from manager.smart_order_router import SmartOrderRouter
+from mexc.future import FutureMarket as MexcFutureMarket
+from mexc.websocket_base import _FutureWebSocketManager
+from object.constants import IndexType
+from object.indexes import IndexPool
+from object.signal import Signal, TradeSignal
+from pipeline.data_pipeline import DataPipeline
+from pipeline.signal_pipeline import SignalPipeline
+from sdk.base_sdk import CommonBaseSDK
+from sdk.signer import EncodedQuery, HmacSigner
+from simulation.market_feed import GeometricBrownianMotion, SyntheticFeed
+
+
+suite: BenchmarkSuite = BenchmarkSuite()
+
+# messages are rendered before the timing starts and replayed in a cycle.
+MESSAGE_POOL_SIZE: int = 1_000
+
+
+def _ticker_messages(
+    count: int = MESSAGE_POOL_SIZE,
+) -> List[Dict[str, Any]]:
+    feed: SyntheticFeed = SyntheticFeed(GeometricBrownianMotion(seed = 7), seed = 7)
+    start: int = int(time.time() * 1_000)
+    return [feed.message("push.ticker", timestamp = start + step * 100) for step in range(count)]
+
+
+def _prices(
+    count: int = MESSAGE_POOL_SIZE,
+) -> List[float]:
+    process: GeometricBrownianMotion = GeometricBrownianMotion(seed = 7)
+    return [process.step(0.1) for _ in range(count)]
+
+
+########################################################################################################################
+# Tick ingest                                                                                                          #
+########################################################################################################################
+class _StubTickerWebSocket:
+    '''
+    # stands in for the MEXC FutureWebSocket of the collector, the benchmark calls the ticker callback itself.
+    '''
+    def ticker(
+        self: "_StubTickerWebSocket",
+        callback: Callable[[dict], None],
+    ) -> None:
+        self.callback: Callable[[dict], None] = callback
+        return
+
+
+@suite.case("collector.tick_ingest")
+def tick_ingest() -> Iterator[Callable[[int], None]]:
+    """
+    func tick_ingest():
+        - _put_ticker_data() -> price_fetch_buffer -> _price_data_fetch() up to the indicator update, with its own threads.
+    """
+    registry: IndicatorRegistry = IndicatorRegistry.default(subscriptions = IndexType.SMA | IndexType.EMA | IndexType.PRICE)
+    processed: List[int] = [0]
+    condition: threading.Condition = threading.Condition()
+    update: Callable[..., None] = registry.update
+
+    def counting_update(price: float, high: float | None = None, low: float | None = None) -> None:
+        update(price, high, low)
+        with condition:
+            processed[0] += 1
+            condition.notify_all()
+        return
+
+    registry.update = counting_update  # type: ignore[method-assign]
+    collector: DataCollectorAndProcessor = DataCollectorAndProcessor(
+        pipeline_controller = PipelineController(pipeline = DataPipeline()),
+        websocket = _StubTickerWebSocket(),  # type: ignore[arg-type]
+        indicator_registry = registry,
+    )
+    messages: List[Dict[str, Any]] = _ticker_messages()
+
+    def operation(number: int) -> None:
+        with condition:
+            target: int = processed[0] + number
+        for step in range(number):
+            message: Dict[str, Any] = messages[step % MESSAGE_POOL_SIZE]
+            collector._put_ticker_data({"channel": message["channel"], "data": dict(message["data"])})
+        with condition:
+            condition.wait_for(lambda: processed[0] >= target, timeout = 60)
+        return
+
+    yield operation
+    return
+
+
+########################################################################################################################
+# Indicators                                                                                                           #
+########################################################################################################################
+@suite.case("indicators.update")
+def indicators_update() -> Iterator[Callable[[int], None]]:
+    """
+    func indicators_update():
+        - IndicatorRegistry.update() with the subscriptions of the collector, which replaced __calculate_ema_sma_price().
+    """
+    registry: IndicatorRegistry = IndicatorRegistry.default(subscriptions = IndexType.SMA | IndexType.EMA | IndexType.PRICE)
+    prices: List[float] = _prices()
+
+    def operation(number: int) -> None:
+        update: Callable[[float], None] = registry.update
+        for step in range(number):
+            update(prices[step % MESSAGE_POOL_SIZE])
+        return
+
+    yield operation
+    return
+
+
+@suite.case("indicators.update_all")
+def indicators_update_all() -> Iterator[Callable[[int], None]]:
+    registry: IndicatorRegistry = IndicatorRegistry.default(subscriptions = IndexType(sum(IndexType)))
+    prices: List[float] = _prices()
+
+    def operation(number: int) -> None:
+        update: Callable[[float], None] = registry.update
+        for step in range(number):
+            update(prices[step % MESSAGE_POOL_SIZE])
+        return
+
+    yield operation
+    return
+
+
+@suite.case("indicators.snapshot")
+def indicators_snapshot() -> Iterator[Callable[[int], None]]:
+    registry: IndicatorRegistry = IndicatorRegistry.default(subscriptions = IndexType.SMA | IndexType.EMA | IndexType.PRICE)
+    for price in _prices():
+        registry.update(price)
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            registry.snapshot()
+        return
+
+    yield operation
+    return
+
+
+########################################################################################################################
+# Pipelines                                                                                                            #
+########################################################################################################################
+@suite.case("pipeline.data")
+def data_pipeline() -> Iterator[Callable[[int], None]]:
+    """
+    func data_pipeline():
+        - IndexPool.acquire() -> PipelineController.push() -> pop() -> release(), one Index at a time.
+    """
+    controller: PipelineController = PipelineController(pipeline = DataPipeline())
+    pool: IndexPool = IndexPool()
+    values: np.ndarray = np.arange(7, dtype = np.float64)
+
+    def operation(number: int) -> None:
+        timestamp: int = PipelineController.generate_timestamp()
+        for _ in range(number):
+            controller.push(pool.acquire(timestamp = timestamp, index_type = IndexType.SMA, values = values))
+            pool.release(controller.pop())
+        return
+
+    yield operation
+    return
+
+
+@suite.case("pipeline.signal")
+def signal_pipeline() -> Iterator[Callable[[int], None]]:
+    controller: PipelineController = PipelineController(pipeline = SignalPipeline())
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            controller.push(Signal(signal = TradeSignal.SHORT_TERM_BUY))
+            controller.pop()
+        return
+
+    yield operation
+    return
+
+
+########################################################################################################################
+# Websocket                                                                                                            #
+########################################################################################################################
+@suite.case("websocket.decode_dispatch")
+def websocket_decode_dispatch() -> Iterator[Callable[[int], None]]:
+    """
+    func websocket_decode_dispatch():
+        - BasicWebSocketManager.__on_message() -> _deal_with_response() -> ticker callback, without a socket.
+    """
+    manager: _FutureWebSocketManager = _FutureWebSocketManager(endpoint = None)
+    manager._set_callback("ticker", lambda message: None)
+    on_message: Callable[[Any, str], None] = manager._BasicWebSocketManager__on_message  # type: ignore[attr-defined]
+    frames: List[str] = [json.dumps(message) for message in _ticker_messages()]
+
+    def operation(number: int) -> None:
+        for step in range(number):
+            on_message(None, frames[step % MESSAGE_POOL_SIZE])
+        return
+
+    yield operation
+    return
+
+
+########################################################################################################################
+# REST                                                                                                                 #
+########################################################################################################################
+@suite.case("rest.sign_binance")
+def sign_binance() -> Iterator[Callable[[int], None]]:
+    """
+    func sign_binance():
+        - the query string and the signature of a MARKET order, as FutureBase.call() of Binance builds them.
+    """
+    sdk: BinanceFutureMarket = BinanceFutureMarket(api_key = "benchmark_api_key", secret_key = "benchmark_secret_key")
+    params: Dict[str, Any] = dict(symbol = "BTCUSDT", side = "BUY", type = "MARKET", quantity = 0.002, recvWindow = 5_000)
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            params["timestamp"] = sdk.timestamp()
+            sdk.generate_signature(urlencode(list(params.items())))
+        return
+
+    yield operation
+    return
+
+
+@suite.case("rest.sign_mexc")
+def sign_mexc() -> Iterator[Callable[[int], None]]:
+    sdk: MexcFutureMarket = MexcFutureMarket(api_key = "benchmark_api_key", secret_key = "benchmark_secret_key")
+    params: Dict[str, Any] = dict(symbol = "BTC_USDT", price = 60_000.0, vol = 10, side = 1, type = 5, openType = 2, leverage = 10)
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            query_string: str = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+            sdk.request_signer.sign(str(sdk.timestamp()), query_string)
+        return
+
+    yield operation
+    return
+
+
+@suite.case("rest.sign_binance_prepared")
+def sign_binance_prepared() -> Iterator[Callable[[int], None]]:
+    """
+    func sign_binance_prepared():
+        - the same MARKET order as rest.sign_binance from prepare_order(), only the timestamp is encoded per request.
+    """
+    sdk: BinanceFutureMarket = BinanceFutureMarket(api_key = "benchmark_api_key", secret_key = "benchmark_secret_key")
+    prepared: EncodedQuery = sdk.prepare_order(symbol = "BTCUSDT", side = "BUY", type = "MARKET", quantity = 0.002)
+
+    def operation(number: int) -> None:
+        signer: HmacSigner = sdk.signer
+        for _ in range(number):
+            _, tail = prepared.render({"timestamp": sdk.timestamp()})
+            signer.sign(prepared.prefix_bytes, tail)
+        return
+
+    yield operation
+    return
+
+
+@suite.case("rest.sign_hmac_new")
+def sign_hmac_new() -> Iterator[Callable[[int], None]]:
+    """
+    func sign_hmac_new():
+        - hmac.new() per message, i.e., the key schedule of every request before HmacSigner, for reference.
+    """
+    key: bytes = b"benchmark_secret_key"
+    message: bytes = urlencode(dict(symbol = "BTCUSDT", side = "BUY", type = "MARKET", quantity = 0.002, recvWindow = 5_000, timestamp = 1_700_000_000_000)).encode("utf-8")
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            hmac.new(key, message, hashlib.sha256).hexdigest()
+        return
+
+    yield operation
+    return
+
+
+@suite.case("rest.sign_hmac_signer")
+def sign_hmac_signer() -> Iterator[Callable[[int], None]]:
+    signer: HmacSigner = HmacSigner("benchmark_secret_key")
+    message: bytes = urlencode(dict(symbol = "BTCUSDT", side = "BUY", type = "MARKET", quantity = 0.002, recvWindow = 5_000, timestamp = 1_700_000_000_000)).encode("utf-8")
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            signer.sign(message)
+        return
+
+    yield operation
+    return
+
+
+class PositionRisk(BaseModel):
+    '''
+    # one entry of GET /fapi/v2/positionRisk, the numbers are sent as strings.
+    '''
+    symbol: str
+    positionAmt: float
+    entryPrice: float
+    markPrice: float
+    unRealizedProfit: float
+    leverage: int
+    marginType: str
+    positionSide: str
+    updateTime: int
+
+
+def _position_risk_response() -> requests.Response:
+    response: requests.Response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps([
+        {
+            "symbol": symbol,
+            "positionAmt": "0.010",
+            "entryPrice": "60000.0",
+            "markPrice": "60125.5",
+            "unRealizedProfit": "1.255",
+            "liquidationPrice": "0",
+            "leverage": "10",
+            "maxNotionalValue": "1000000",
+            "marginType": "cross",
+            "isolatedMargin": "0.00000000",
+            "isAutoAddMargin": "false",
+            "positionSide": "BOTH",
+            "notional": "601.255",
+            "isolatedWallet": "0",
+            "updateTime": 1_700_000_000_000,
+        }
+        for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT")
+    ]).encode("utf-8")
+    return response
+
+
+@suite.case("rest.parse_response")
+def parse_response() -> Iterator[Callable[[int], None]]:
+    response: requests.Response = _position_risk_response()
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            CommonBaseSDK.parse_response(response)
+        return
+
+    yield operation
+    return
+
+
+@suite.case("rest.parse_response_pydantic")
+def parse_response_pydantic() -> Iterator[Callable[[int], None]]:
+    response: requests.Response = _position_risk_response()
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            CommonBaseSDK.parse_response(response, model = PositionRisk)
+        return
+
+    yield operation
+    return
+
+
+########################################################################################################################
+# Order routing                                                                                                        #
+########################################################################################################################
+@suite.case("routing.allocate")
+def routing_allocate() -> Iterator[Callable[[int], None]]:
+    """
+    func routing_allocate():
+        - SmartOrderRouter.allocate() of an order taking a few levels of two 20-level books, as it runs on every split order.
+    """
+    books: Dict[str, Book] = {
+        venue: (
+            [(60_000.0 - offset - 0.1 * level, 0.005) for level in range(20)],
+            [(60_000.1 + offset + 0.1 * level, 0.005) for level in range(20)],
+        )
+        for venue, offset in (("binance", 0.0), ("mexc", 0.05))
+    }
+    fees: Dict[str, float] = {"binance": 0.0005, "mexc": 0.0002}
+
+    def operation(number: int) -> None:
+        for _ in range(number):
+            SmartOrderRouter.allocate(books, 1, 0.05, 0.001, fees = fees)
+        return
+
+    yield operation
+    return
@@ -0,0 +1,203 @@
+# Standard Library
+import time
+from typing import Callable, List
+
+# Custom Library
+from binance.future import FutureMarket, FutureWebSocket
+from interface.exchange_interface import Book, BracketOrder, ExchangeAdapter
+from logger.set_logger import operation_logger
+from manager.order_manager import ManagedOrder, OrderManager, OrderState
+from manager.symbol_metadata import SymbolFilters, SymbolMetadataCache
+
+
+class BinanceAdapter(ExchangeAdapter):
+    '''
+    # Binance USD-M futures behind the ExchangeAdapter, the orders go through the OrderManager.
+        # the SL / TP are STOP_MARKET / TAKE_PROFIT_MARKET closePosition orders, sent once the entry has been accepted.
+        # an entry of UNKNOWN outcome is queried once more, and is reported unknown, not rejected, if it still is.
+    '''
+    name: str = "binance"
+
+    def __init__(
+        self: "BinanceAdapter",
+        future: FutureMarket,
+        ws: FutureWebSocket | None = None,
+        orders: OrderManager | None = None,
+        symbol_metadata: SymbolMetadataCache | None = None,
+    ) -> None:
+        super().__init__()
+        self.future: FutureMarket = future
+        self.ws: FutureWebSocket | None = ws
+        self.orders: OrderManager = orders if orders is not None else OrderManager(binance = future)
+        self.symbol_metadata: SymbolMetadataCache | None = symbol_metadata
+        return
+
+    def symbol(
+        self: "BinanceAdapter",
+        base: str,
+        ccy: str,
+    ) -> str:
+        return f"{base}{ccy}"
+
+    def filters(
+        self: "BinanceAdapter",
+        symbol: str,
+    ) -> SymbolFilters | None:
+        return None if self.symbol_metadata is None else self.symbol_metadata.get(self.name, symbol)
+
+    def taker_fee(
+        self: "BinanceAdapter",
+        base: str,
+        ccy: str,
+    ) -> float:
+        filters: SymbolFilters | None = self.filters(self.symbol(base, ccy))
+        return 0.0 if filters is None or filters.taker_fee is None else filters.taker_fee
+
+    def round_quantity(
+        self: "BinanceAdapter",
+        base: str,
+        ccy: str,
+        quantity: float,
+        price: float,
+    ) -> float:
+        filters: SymbolFilters | None = self.filters(self.symbol(base, ccy))
+        if filters is None:
+            return quantity
+        rounded: float = filters.round_quantity(quantity)
+        return rounded if rounded >= filters.min_qty and rounded * price >= filters.min_notional else 0.0
+
+    def price(
+        self: "BinanceAdapter",
+        base: str,
+        ccy: str,
+    ) -> float | None:
+        response: dict | None = self.timed(self.future.mark_price, symbol = self.symbol(base, ccy))
+        try:
+            return float(response["markPrice"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def available_balance(
+        self: "BinanceAdapter",
+        ccy: str,
+    ) -> float | None:
+        response: list | None = self.timed(self.future.future_account_balance_v2)
+        for balance in response or list():
+            if balance.get("asset") == ccy:
+                return float(balance.get("availableBalance", 0))
+        return None
+
+    def position(
+        self: "BinanceAdapter",
+        base: str,
+        ccy: str,
+    ) -> float | None:
+        response: list | None = self.timed(self.future.get_position_information_v2, symbol = self.symbol(base, ccy))
+        if not isinstance(response, list):
+            return None
+        return sum(float(position.get("positionAmt", 0)) for position in response if position)
+
+    def depth(
+        self: "BinanceAdapter",
+        base: str,
+        ccy: str,
+        limit: int = 20,
+    ) -> Book | None:
+        response: dict | None = self.timed(self.future.order_book, symbol = self.symbol(base, ccy), limit = limit)
+        try:
+            return (
+                [(float(price), float(quantity)) for price, quantity in response["bids"]],
+                [(float(price), float(quantity)) for price, quantity in response["asks"]],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def place_bracket(
+        self: "BinanceAdapter",
+        side: int,
+        base: str,
+        ccy: str,
+        quantity: float,
+        price: float,
+        sl_price: float,
+        tp_price: float,
+        leverage: int,
+    ) -> BracketOrder:
+        started: float = time.perf_counter()
+        symbol: str = self.symbol(base, ccy)
+        filters: SymbolFilters | None = self.filters(symbol)
+        if filters is not None:
+            quantity = filters.order_quantity(quantity, price)
+            sl_price, tp_price = filters.round_price(sl_price), filters.round_price(tp_price)
+
+        self.timed(self.future.change_initial_leverage, symbol = symbol, leverage = leverage)
+        entry: ManagedOrder = self.timed(
+            self.orders.submit,
+            side = "BUY" if side == 1 else "SELL", symbol = symbol, type = "MARKET", role = "entry", quantity = quantity,
+        )
+        if entry.state == OrderState.UNKNOWN:
+            self.timed(self.orders.reconcile, symbol = symbol, states = (OrderState.UNKNOWN,))
+        accepted: bool = entry.state in (OrderState.NEW, OrderState.PARTIALLY_FILLED, OrderState.FILLED)
+        if entry.state == OrderState.UNKNOWN:
+            operation_logger.error(f"{__name__} - {entry} has an unknown outcome, its exits are not sent.")
+        if accepted:
+            exits: List[ManagedOrder] = [
+                self.timed(
+                    self.orders.submit,
+                    side = "SELL" if side == 1 else "BUY", symbol = symbol, type = order_type, role = role,
+                    parent = entry.client_order_id, stop_price = stop_price, close_position = "true", time_in_force = "GTE_GTC",
+                )
+                for role, order_type, stop_price in (("sl", "STOP_MARKET", sl_price), ("tp", "TAKE_PROFIT_MARKET", tp_price))
+            ]
+            if any(order.state == OrderState.REJECTED for order in exits):
+                operation_logger.error(f"{__name__} - {entry} is open without all of its exits: {exits}")
+        return BracketOrder(
+            venue = self.name,
+            symbol = symbol,
+            side = side,
+            quantity = quantity,
+            entry_id = entry.client_order_id,
+            accepted = accepted,
+            latency_ms = (time.perf_counter() - started) * 1_000,
+            avg_price = entry.avg_price or None,
+            unknown = entry.state == OrderState.UNKNOWN,
+        )
+
+    def subscribe_price(
+        self: "BinanceAdapter",
+        callback: Callable[[str, float, int], None],
+        base: str,
+        ccy: str,
+    ) -> None:
+        def on_mark_price(msg: dict) -> None:
+            data: dict = msg.get("data") or dict()
+            try:
+                callback(self.name, float(data["p"]), int(data["E"]))
+            except (KeyError, TypeError, ValueError) as e:
+                operation_logger.warning(f"{__name__} - Unexpected mark price message: {msg} - {str(e)}")
+            return
+
+        self.ws.mark_price(callback = on_mark_price, symbol = self.symbol(base, ccy))
+        return
+
+    def subscribe_depth(
+        self: "BinanceAdapter",
+        callback: Callable[[str, Book, int], None],
+        base: str,
+        ccy: str,
+        levels: int = 20,
+    ) -> None:
+        def on_depth(msg: dict) -> None:
+            data: dict = msg.get("data") or dict()
+            try:
+                book: Book = (
+                    [(float(price), float(quantity)) for price, quantity in data["b"]],
+                    [(float(price), float(quantity)) for price, quantity in data["a"]],
+                )
+                callback(self.name, book, int(data["E"]))
+            except (KeyError, TypeError, ValueError) as e:
+                operation_logger.warning(f"{__name__} - Unexpected depth message: {msg} - {str(e)}")
+            return
+
+        self.ws.partial_depth(callback = on_depth, symbol = self.symbol(base, ccy), levels = levels)
+        return
@@ -2,10 +2,13 @@
 from typing import Union, Literal
 from urllib.parse import urlencode
 import json
+import threading
+from typing import Tuple
 
 # Custom Library
 from logger.set_logger import operation_logger
-from sdk.base_sdk import CommonBaseSDK
+from sdk.base_sdk import CommonBaseSDK, REST_ERRORS
+from sdk.signer import EncodedQuery
 
 
 class FutureBase(CommonBaseSDK):
@@ -28,8 +31,19 @@ class FutureBase(CommonBaseSDK):
         )
         # Set the specific content type for Binance
         self.set_content_type("application/x-www-form-urlencoded")
+        # (HTTP status, Binance error code) of the last failed call of the thread, see last_error.
+        self.__errors: threading.local = threading.local()
         return
 
+    @property
+    def last_error(self: "FutureBase") -> Tuple[int | None, int | None] | None:
+        """
+        func last_error():
+            - (HTTP status, Binance error code) of the last call() of the calling thread, None if it has succeeded.
+            - (None, None) when there is no response at all, e.g., a timeout, so the outcome of the request is unknown.
+        """
+        return getattr(self.__errors, "last", None)
+
     def call(
         self: "FutureBase",
         method: Union[
@@ -43,9 +57,14 @@ class FutureBase(CommonBaseSDK):
         params: dict | None = None,
         data: dict | None = None,
         headers: dict | None = None,
+        signed: bool = True,
+        prepared: EncodedQuery | None = None,
     ) -> dict | None:
         """
         Make a call to the Binance API.
+
+        signed = False is for the USER_STREAM and MARKET_DATA endpoints, i.e., only the api key header is sent.
+        prepared is the already encoded fixed part of the query, params are appended to it, e.g., the timestamp.
         """
         url = url if url.startswith("/") else f"/{url}"
 
@@ -57,8 +76,17 @@ class FutureBase(CommonBaseSDK):
 
         request_headers: dict[str, str | int | float] = headers.copy() if headers else {}
 
-        if (self.api_key and self.secret_key):
+        if (self.api_key):
             request_headers[api_key_title] = self.api_key
+
+        if prepared is not None:
+            # the query is sent as encoded here, so the signed bytes are exactly the bytes on the wire.
+            query_string, tail = prepared.render(filtered_params)
+            if (signed and self.api_key and self.secret_key):
+                query_string = f"{query_string}&signature={self.signer.sign(prepared.prefix_bytes, tail)}"
+            url = f"{url}?{query_string}"
+            filtered_params = dict()
+        elif (signed and self.api_key and self.secret_key):
             query_string = urlencode(list(filtered_params.items()))
             filtered_params["signature"] = self.generate_signature(query_string)
 
@@ -69,6 +97,7 @@ class FutureBase(CommonBaseSDK):
             else data
         )
 
+        self.__errors.last = (None, None)
         try:
             response = self.session.request(
                 url = f"{self.base_url}{url}",
@@ -82,11 +111,13 @@ class FutureBase(CommonBaseSDK):
 
             if response.status_code >= 400:
                 status: int = response.status_code  # Status Code of the response.
+                REST_ERRORS.labels(exchange = "binance", status = status).inc()
                 error_msg: str = (
                     payload.get("msg")  # type: ignore[union-attr]
                     if isinstance(payload, dict)
                     else str(payload)
                 )
+                self.__errors.last = (status, payload.get("code") if isinstance(payload, dict) else None)
 
                 if status == 400:
                     operation_logger.critical(f"{__name__} - BadRequest Error from Binance USDT-M Future API: {str(error_msg)}")
@@ -107,6 +138,7 @@ class FutureBase(CommonBaseSDK):
 
                 raise Exception(error_message = error_msg)
 
+            self.__errors.last = None
             return payload
         except ValueError:
             response.raise_for_status()
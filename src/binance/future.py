@@ -1,13 +1,16 @@
 # Standard Library
 from abc import abstractmethod
+import threading
 import time
-from typing import Literal, Union
+from typing import Callable, List, Literal, Sequence, Union
 
 from websocket import recv
 from logger.set_logger import operation_logger, trading_logger
 
 # Custom Library
 from binance.base_sdk import FutureBase
+from sdk.signer import EncodedQuery
+from binance.websocket_base import _FutureWebSocket
 
 
 class FutureMarket(FutureBase):
@@ -19,8 +22,21 @@ class FutureMarket(FutureBase):
 
     probably need to change this to "BTCUSDC" in the future.
     """
+    # (ttl, stale-while-revalidate) in seconds, the symbol filters hardly ever change, the prices every second.
+    CACHE_TTL = {
+        "exchange_info": (3_600.0, 3_600.0),
+        "mark_price": (0.5, 0.5),
+        "funding_rate_info": (60.0, 60.0),
+        "ticker_24hr": (5.0, 5.0),
+    }
 
     # PUBLIC ENDPOINT
+    def server_timestamp(
+        self: "FutureMarket",
+    ) -> int | None:
+        response: dict | None = self.server_time()
+        return response.get("serverTime") if isinstance(response, dict) else None
+
     def ping(
         self: "FutureMarket",
     ) -> dict:
@@ -67,7 +83,8 @@ class FutureMarket(FutureBase):
         """
         url: str = "/fapi/v1/exchangeInfo"
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "exchange_info",
             method = "GET",
             url = url,
         )
@@ -408,7 +425,8 @@ class FutureMarket(FutureBase):
             "symbol": symbol,
         }
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "mark_price",
             method = "GET",
             url = url,
             params = params,
@@ -453,15 +471,16 @@ class FutureMarket(FutureBase):
         self: "FutureMarket",
     ) -> dict:
         """
-        Get the current funding rate and funding rate history for all symbols.
+        Get the funding rate cap / floor and the funding interval of the symbols with adjusted funding.
 
-        GET /fapi/v1/fundingRate
+        GET /fapi/v1/fundingInfo
 
         return: The response from the server as a dictionary.
         """
-        url: str = "/fapi/v1/fundingRate"
+        url: str = "/fapi/v1/fundingInfo"
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "funding_rate_info",
             method = "GET",
             url = url,
         )
@@ -484,7 +503,8 @@ class FutureMarket(FutureBase):
             "symbol": symbol,
         }
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "ticker_24hr",
             method = "GET",
             url = url,
             params = params,
@@ -805,7 +825,7 @@ class FutureMarket(FutureBase):
             self_trade_prevention_mode = self_trade_prevention_mode,
             good_till_date = good_till_date,
             recv_window = recv_window,
-            timestamp = FutureMarket.generate_timestmap(),
+            timestamp = self.timestamp(),
         )
 
         return self.call(
@@ -814,6 +834,39 @@ class FutureMarket(FutureBase):
             url = url,
         )
 
+    def prepare_order(
+        self: "FutureMarket",
+        side: Union[Literal["BUY"], Literal["SELL"]],
+        symbol: str = "BTCUSDT",
+        type: Union[Literal["MARKET"], Literal["TAKE_PROFIT_MARKET"], Literal["STOP_MARKET"]] = "MARKET",
+        recv_window: int | None = 5_000,
+        **kwargs: str | int | float | None,
+    ) -> EncodedQuery:
+        """
+        func prepare_order():
+            - the query of new_order() without the timestamp, encoded once, e.g., for an order armed ahead of the signal.
+            - kwargs are the other parameters of new_order(), e.g., quantity = 0.002, close_position = "true".
+        """
+        params: dict[str, str | int | float | None] = dict(symbol = symbol, side = side, type = type, **kwargs)
+        params["recv_window"] = recv_window
+        return EncodedQuery({FutureMarket.snake_to_camel(key): value for key, value in params.items()})
+
+    def send_prepared_order(
+        self: "FutureMarket",
+        prepared: EncodedQuery,
+        url: str = "/fapi/v1/order",
+    ) -> dict | None:
+        """
+        func send_prepared_order():
+            - POST a query of prepare_order(), only the timestamp and the signature are computed here.
+        """
+        return self.call(
+            method = "POST",
+            url = url,
+            params = dict(timestamp = self.timestamp()),
+            prepared = prepared,
+        )
+
     def multiple_orders(
         self: "FutureMarket",
     ):
@@ -840,9 +893,27 @@ class FutureMarket(FutureBase):
 
     def cancel_order(
         self: "FutureMarket",
-    ):
-        raise NotImplementedError
-        return
+        symbol: str = "BTCUSDT",
+        order_id: int | None = None,
+        orig_client_order_id: str | None = None,
+        recv_window: int | None = 5_000,
+        url: str = "/fapi/v1/order",
+    ) -> dict | None:
+        '''
+        - cancel_order()
+            - cancel an open order by its orderId or by the newClientOrderId it has been sent with.
+        '''
+        return self.call(
+            method = "DELETE",
+            url = url,
+            params = dict(
+                symbol = symbol,
+                order_id = order_id,
+                orig_client_order_id = orig_client_order_id,
+                recv_window = recv_window,
+                timestamp = self.timestamp(),
+            ),
+        )
 
     def cancel_multiple_orders(self: "FutureMarket",):
         raise NotImplementedError
@@ -860,9 +931,30 @@ class FutureMarket(FutureBase):
         raise NotImplementedError
         return
 
-    def query_order(self: "FutureMarket",):
-        raise NotImplementedError
-        return
+    def query_order(
+        self: "FutureMarket",
+        symbol: str = "BTCUSDT",
+        order_id: int | None = None,
+        orig_client_order_id: str | None = None,
+        recv_window: int | None = 5_000,
+        url: str = "/fapi/v1/order",
+    ) -> dict | None:
+        '''
+        - query_order()
+            - the order by its orderId or by the newClientOrderId it has been sent with, open or not.
+            - None with last_error[1] == -2013 if the exchange has no such order.
+        '''
+        return self.call(
+            method = "GET",
+            url = url,
+            params = dict(
+                symbol = symbol,
+                order_id = order_id,
+                orig_client_order_id = orig_client_order_id,
+                recv_window = recv_window,
+                timestamp = self.timestamp(),
+            ),
+        )
 
     def query_all_orders(
         self: "FutureMarket",
@@ -878,7 +970,7 @@ class FutureMarket(FutureBase):
 
         params: dict[str, int | str] = {
             "symbol": symbol,
-            "timestamp": timestamp if timestamp is not None else FutureMarket.generate_timestmap(),
+            "timestamp": timestamp if timestamp is not None else self.timestamp(),
         }
 
         if order_id is not None:
@@ -911,7 +1003,7 @@ class FutureMarket(FutureBase):
         params: dict[str, int] = dict(
             symbol = symbol,
             recv_window = recv_window,
-            timestamp = FutureMarket.generate_timestmap(),
+            timestamp = self.timestamp(),
         )
 
         return self.call(
@@ -947,7 +1039,7 @@ class FutureMarket(FutureBase):
             "symbol": symbol,
             "leverage": leverage,
             "recvWindow": recvWindow,
-            "timestamp": FutureMarket.generate_timestmap(),
+            "timestamp": self.timestamp(),
         }
 
         return self.call(
@@ -993,7 +1085,7 @@ class FutureMarket(FutureBase):
     ) -> dict | None:
         params: dict[str, int] = dict(
             recvWindow = recv_window,
-            timestamp = FutureMarket.generate_timestmap(),
+            timestamp = self.timestamp(),
             asset = asset,
         )
 
@@ -1010,7 +1102,7 @@ class FutureMarket(FutureBase):
     ) -> dict | None:
         params: dict[str, int] = dict(
             recvWindow = recv_window,
-            timestamp = FutureMarket.generate_timestmap(),
+            timestamp = self.timestamp(),
         )
 
         return self.call(
@@ -1026,7 +1118,7 @@ class FutureMarket(FutureBase):
     ) -> dict | None:
         params: dict[str, int] = dict(
             recvWindow = recv_window,
-            timestamp = FutureMarket.generate_timestmap(),
+            timestamp = self.timestamp(),
         )
 
         return self.call(
@@ -1044,7 +1136,7 @@ class FutureMarket(FutureBase):
         params: dict[str, int | float] = dict(
             symbol = symbol,
             recv_window = recv_window,
-            timestamp = FutureMarket.generate_timestmap(),
+            timestamp = self.timestamp(),
         )
 
         return self.call(
@@ -1053,13 +1145,254 @@ class FutureMarket(FutureBase):
             params = params,
         )
 
+    # USER DATA STREAM
+    def new_listen_key(
+        self: "FutureMarket",
+    ) -> dict | None:
+        """
+        Start a new user data stream, valid for 60 minutes unless it is kept alive.
+
+        POST /fapi/v1/listenKey
 
-class FutureWebSocket:
+        return: {"listenKey": <str>}
+        """
+        return self.call(
+            method = "POST",
+            url = "/fapi/v1/listenKey",
+            signed = False,
+        )
+
+    def keep_alive_listen_key(
+        self: "FutureMarket",
+    ) -> dict | None:
+        """
+        Extend the validity of the listenKey by 60 minutes, recommended every 60 minutes at the latest.
+
+        PUT /fapi/v1/listenKey
+        """
+        return self.call(
+            method = "PUT",
+            url = "/fapi/v1/listenKey",
+            signed = False,
+        )
+
+    def close_listen_key(
+        self: "FutureMarket",
+    ) -> dict | None:
+        """
+        Close the user data stream.
+
+        DELETE /fapi/v1/listenKey
+        """
+        return self.call(
+            method = "DELETE",
+            url = "/fapi/v1/listenKey",
+            signed = False,
+        )
+
+
+class FutureWebSocket(_FutureWebSocket):
     """
     WebSocket endpoints for Binance Futures API.
+
+    - every topic goes through one combined-stream connection, so many symbols and topics share a socket.
+    - callbacks get the combined message, i.e., {"stream": <stream>, "data": <payload>}.
     """
+    @staticmethod
+    def _stream_names(
+        symbols: str | Sequence[str],
+        suffix: str,
+    ) -> List[str]:
+        if isinstance(symbols, str):
+            symbols = (symbols, )
+        return [f"{symbol.lower()}@{suffix}" for symbol in symbols]
 
     def __init__(
         self: "FutureWebSocket",
+        ws_name: str | None = None,
+        endpoint: str = "wss://fstream.binance.com",
+        api_key: str | None = None,
+        secret_key: str | None = None,
+        future_market: FutureMarket | None = None,
+        ping_interval: int = 60,
+        conn_timeout: int = 30,
+        listen_key_interval: int = 30 * 60,  # Second, the listenKey expires after 60 minutes.
+    ) -> None:
+        if future_market is None and api_key:
+            future_market = FutureMarket(api_key = api_key, secret_key = secret_key)
+
+        # REST API for the listenKey of the user data stream.
+        self.future_market: FutureMarket | None = future_market
+        self.listen_key: str | None = None
+        self.listen_key_interval: int = listen_key_interval
+        self.user_data_callback: Callable | None = None
+        self.listen_key_thread: threading.Thread | None = None
+
+        kwargs = dict(
+            ws_name = ws_name or "BinanceFutureWebSocket",
+            endpoint = endpoint,
+            api_key = api_key,
+            secret_key = secret_key,
+            ping_interval = ping_interval,
+            conn_timeout = conn_timeout,
+        )
+
+        super().__init__(**kwargs)
+        return
+
+    """
+    - Public Endpoint
+        - Mark Price
+        - Book Ticker
+        - Aggregate Trade
+        - Kline
+    """
+    def mark_price(
+        self: "FutureWebSocket",
+        callback: Callable,
+        symbol: str | Sequence[str] = "BTCUSDT",
+        speed: Literal["1s", "3s"] = "1s",
     ) -> None:
+        """
+        - Mark price, index price and funding rate, pushed every second or every three seconds.
+        - data: {"e": "markPriceUpdate", "s": <symbol>, "p": <mark price>, "i": <index price>, "r": <funding rate>, ...}
+        """
+        suffix: str = "markPrice@1s" if speed == "1s" else "markPrice"
+        self.subscribe(FutureWebSocket._stream_names(symbol, suffix), callback)
         return
+
+    def book_ticker(
+        self: "FutureWebSocket",
+        callback: Callable,
+        symbol: str | Sequence[str] = "BTCUSDT",
+    ) -> None:
+        """
+        - Best bid/ask price and quantity, pushed in real time.
+        """
+        self.subscribe(FutureWebSocket._stream_names(symbol, "bookTicker"), callback)
+        return
+
+    def partial_depth(
+        self: "FutureWebSocket",
+        callback: Callable,
+        symbol: str | Sequence[str] = "BTCUSDT",
+        levels: Literal[5, 10, 20] = 20,
+        speed: Literal["100ms", "250ms", "500ms"] = "100ms",
+    ) -> None:
+        """
+        - Top <levels> bids and asks, pushed every <speed>.
+        - data: {"e": "depthUpdate", "E": <event time>, "T": <transaction time>, "s": <symbol>, "b": [[<price>, <qty>]], "a": [...]}
+        """
+        suffix: str = f"depth{levels}" if speed == "250ms" else f"depth{levels}@{speed}"
+        self.subscribe(FutureWebSocket._stream_names(symbol, suffix), callback)
+        return
+
+    def agg_trade(
+        self: "FutureWebSocket",
+        callback: Callable,
+        symbol: str | Sequence[str] = "BTCUSDT",
+    ) -> None:
+        """
+        - Aggregate trades, pushed every 100ms.
+        """
+        self.subscribe(FutureWebSocket._stream_names(symbol, "aggTrade"), callback)
+        return
+
+    def kline(
+        self: "FutureWebSocket",
+        callback: Callable,
+        symbol: str | Sequence[str] = "BTCUSDT",
+        interval: str = "1m",
+    ) -> None:
+        """
+        - Kline/candlestick updates of the given interval, pushed every 250ms.
+        """
+        self.subscribe(FutureWebSocket._stream_names(symbol, f"kline_{interval}"), callback)
+        return
+
+    """
+    - Private Endpoint
+        - User Data Stream: ACCOUNT_UPDATE, ORDER_TRADE_UPDATE, MARGIN_CALL, ...
+    """
+    def user_data(
+        self: "FutureWebSocket",
+        callback: Callable,
+    ) -> str | None:
+        """
+        - subscribe to the user data stream, the listenKey is kept alive by a background thread.
+        - callback gets the combined message, the event type is data["e"].
+
+        return str | None
+            - the listenKey, None if it cannot be created.
+        """
+        if self.future_market is None:
+            raise ValueError(f"{self.ws_name} needs the api key for the user data stream.")
+
+        self.user_data_callback = callback
+        if not self.__open_listen_key():
+            return None
+
+        if self.listen_key_thread is None:
+            self.listen_key_thread = threading.Thread(
+                name = "binance_listen_key_keep_alive",
+                target = self.__keep_alive_listen_key,
+                daemon = True,
+            )
+            self.listen_key_thread.start()
+        return self.listen_key
+
+    def close_user_data(
+        self: "FutureWebSocket",
+    ) -> None:
+        listen_key: str | None = self.listen_key
+        self.listen_key = None
+        self.user_data_callback = None
+        if listen_key:
+            self.unsubscribe([listen_key])
+            self.future_market.close_listen_key()
+        return
+
+    def __open_listen_key(
+        self: "FutureWebSocket",
+    ) -> bool:
+        response: dict | None = self.future_market.new_listen_key()
+        listen_key: str | None = response.get("listenKey") if isinstance(response, dict) else None
+        if not listen_key:
+            operation_logger.critical(f"{__name__} - {self.ws_name} could not create the listenKey: {response}")
+            return False
+
+        # Binance returns the same listenKey while the previous one is still valid.
+        if listen_key != self.listen_key:
+            if self.listen_key:
+                self.unsubscribe([self.listen_key])
+            self.listen_key = listen_key
+            self.subscribe([listen_key], self.__on_user_data)
+        return True
+
+    def __on_user_data(
+        self: "FutureWebSocket",
+        msg: dict,
+    ) -> None:
+        data: dict = msg.get("data") or dict()
+        if data.get("e") == "listenKeyExpired":
+            operation_logger.warning(f"{__name__} - The listenKey of {self.ws_name} has expired, renewing it.")
+            self.__open_listen_key()
+            return
+
+        if self.user_data_callback:
+            self.user_data_callback(msg)
+        return
+
+    def __keep_alive_listen_key(
+        self: "FutureWebSocket",
+    ) -> None:
+        while True:
+            time.sleep(self.listen_key_interval)
+            if self.listen_key is None:
+                continue
+            try:
+                if self.future_market.keep_alive_listen_key() is None:
+                    # the key is gone, e.g., closed by the server, so start a new one.
+                    self.__open_listen_key()
+            except Exception as e:
+                operation_logger.error(f"{__name__} - {self.ws_name} could not keep the listenKey alive: {str(e)}")
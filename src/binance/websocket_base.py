@@ -1,529 +1,336 @@
-# Standard Library
-import hmac
+# Built-in Library
+import itertools
 import json
 import threading
-import websocket_base  # as 1.recommended in the API page, https://websocket-client.readthedocs.io/en/latest/index.html
 import time
-import hashlib
+from typing import Callable, List, Tuple
 
 # Custom Library
-from logger.set_logger import operation_logger
-
-
-class __BasicWebSocketManager:
-    def __init__(
-        self: "__BasicWebSocketManager",
-        # callback_function = None,
-        # endpoint: Optional[str] = "wss://contract.mexc.com/edge",
-        ws_name: str | None = None,
-        api_key: str | None = None,
-        secret_key: str | None = None,
-        ping_interval: int | None = 20,
-        ping_timeout: int | None = 10,
-        retries: bool | None = True,
-        restart_on_error: bool | None = True,
-        log_or_not: bool | None = True,
-        conn_timeout: int | None = 30,
-    ):
-        """
-        # method: __init__()
-            # params:
-                # callback_function: function, general callback_function for entire response from the endpoint
-                # endpoint: MexC Websocket API endpoint
-                # ws_name: WebSocketName
-                # api_key: api_key for API usage
-                # secret_key: secret_key for API usage
-                # ping_interval: WebSocketConnection ping interval, default 20 seconds
-                # ping_timeout: if there is no response for ping resposne for 10 seconds, close the websocket with the endpoint
-                # retries: retries for WebSocket Connection for error
-                    # TODO: error handling not yet implemented
-                # restart_on_error: retries on error
-                # log_or_not: if the WebSocket behavior will be logged or not
-                # conn_timeout: WebSocket will try to connect to the endpoint for the timeout interval
-                # login_required: if the websocket needs to authenticate to the system or not
-        """
-        # Set API key
-        self.api_key: str = api_key
-        self.secret_key: str = secret_key
-
-        # do we need to login for this WebSocketManager?
-
-        # get the callback function
-        # self.callback = callback_function
+from sdk.websocket_sdk import BasicWebSocketManager
 
-        # get the websocket name
-        self.ws_name: str = ws_name
-
-        # ping settings
-        self.ping_interval: int = ping_interval
-        self.ping_timeout: int = ping_timeout
-        self.retry_count: int = retries
+# get the Logger
+from logger.set_logger import operation_logger
 
-        # callback function setting
-        # self.callback_function = callback_function
 
-        # connection timeout interval
-        self.conn_timeout: int = conn_timeout
+class _StreamCallbacks:
+    '''
+    # every callback of one stream, e.g., the TradeManager and the BasisMonitor both following the mark price.
+        # a callback which raises does not keep the message from the ones after it.
+    '''
+    __slots__ = ("callbacks",)
 
-        # to save the list of subcriptions and the function for each subcription
-        # setup the directory as follow:
-        """
-        {
-            <subscription-type>: <callback-function>
-        }
-        """
-        self.callback_dictionary: dict = {}
+    def __init__(
+        self: "_StreamCallbacks",
+        callbacks: Tuple[Callable, ...],
+    ) -> None:
+        self.callbacks: Tuple[Callable, ...] = callbacks
+        return
 
-        # record the subscription made
-        self.subscriptions: list = []
+    def __call__(
+        self: "_StreamCallbacks",
+        msg: dict,
+    ) -> None:
+        for callback in self.callbacks:
+            try:
+                callback(msg)
+            except Exception as e:
+                operation_logger.error(f"{__name__} - {callback} has failed on {msg.get('stream')}: {str(e)}")
+        return
 
-        self.retries = True
-        self.restart_on_error = restart_on_error
 
-        # has the Websocket been authroized by the API? -> false initially
-        self.auth = False
+# Binance USDⓈ-M Future Websocket Manager
+class _FutureWebSocketManager(BasicWebSocketManager):
+    '''
+    # combined streams, i.e., <endpoint>/stream?streams=<stream-1>/<stream-2>/...
+    # every stream shares one connection and each message comes wrapped as {"stream": <stream>, "data": <payload>}.
+    # streams are added with SUBSCRIBE on the live connection, and a reconnect puts all of them in the URL.
 
-        # enable logging -> TODO: Test
-        websocket_base.enableTrace(
-            traceable = log_or_not, handler = operation_logger, level = "INFO",
-        )
+    - Binance has no websocket login, the api key is only used for the listenKey of the user data stream.
+    - the server sends a ping frame every few minutes which websocket-client answers, the ping thread only sends unsolicited pong frames.
+    - the connection listeners are told of a drop before the reconnect and of the connection after it, see add_connection_listener().
+    '''
+    MAX_STREAMS_PER_CONNECTION: int = 200
+    REQUEST_TIMEOUT: float = 10.0  # Second, wait for the connection before a SUBSCRIBE is left to the next one.
 
-    def _connect(
-        self: "__BasicWebSocketManager",
-        url: str,
+    def __init__(
+        self: "_FutureWebSocketManager",
+        ws_name: str = "BinanceFutureWebSocket",
+        api_key: str | None = None,
+        secret_key: str | None = None,
+        endpoint: str = "wss://fstream.binance.com",
+        ping_interval: int = 60,  # Second
+        connection_interval: int = 10,
+        ping_timeout: int = 10,
+        conn_timeout: int = 30,
+        default_callback: Callable | None = None,
     ) -> None:
-        """
-        # connect WebSocketApp to the API endpoint
-
-        # method: _connect()
-            # WebSocket tries to connect to the Endpoint, with the given endpoint
-        """
-        # if there is no retries attribute set to True, then no need to try, but we will anyway
-        infinite_reconnect: bool = False
-        if self.retries:
-            infinite_reconnect = True
-
-        # will make the WebSocketApp and will try to connect to the host
-        self.ws = websocket_base.WebSocketApp(
-            url = url,
-            on_message = self.__on_message,
-            on_open = self.__on_open,
-            on_close = self.__on_close,
-            on_error = self.__on_error,
-        )
-
-        # thread for connection
-        self.wst = threading.Thread(
-            target = lambda: self.ws.run_forever(
-                ping_interval = 30,
-            )
-        )
-        self.wst.daemon = (
-            True  # set this as the background program where it tries to connect
-        )
-        self.wst.start()  # start the thread for making a connection
-
-        # thread for ping
-        self.wsp = threading.Thread(
-            target = lambda: self._ping_loop(
-                ping_interval = 20,
-            )
+        self.base_endpoint: str = endpoint.rstrip("/")
+
+        kwargs: dict = dict(
+            ws_name = ws_name,
+            api_key = api_key,
+            secret_key = secret_key,
+            endpoint = f"{self.base_endpoint}/stream",
+            ping_interval = ping_interval,
+            connection_interval = connection_interval,
+            ping_timeout = ping_timeout,
+            conn_timeout = conn_timeout,
+            default_callback = default_callback,
         )
-        self.wsp.daemon = True  # set as the background thread
-        self.wsp.start()  # start the thread for ping
-
-        # wait until the websocket is connected to the endpoint
-        while (infinite_reconnect or self.conn_timeout) and not self._is_connected():
-            if not infinite_reconnect:
-                self.conn_timeout -= 1
 
-            time.sleep(1)
+        super().__init__(**kwargs)
 
-        # if timeout occurred
-        if not self.conn_timeout:
-            # connection timeout
-            # retry connection is set to False
-            operation_logger.info("connection timeout for the WebSocket")
-            return
+        # no login on the Binance websocket.
+        self.auth = False
 
-        # log the connection result
-        operation_logger.info(f"WebSocket has been connected to {url}")
+        self.callback_function = self._deal_with_response
 
-        # if api_key and secret_key are given, login to the WebSocketApi
-        if self.api_key and self.secret_key:
-            time.sleep(0.5)
-            self._authenticate()
+        # stream names of this connection, e.g., ["btcusdt@markPrice@1s", "btcusdt@bookTicker"]
+        self.subscriptions: List[str] = list()
+        self.subscription_lock: threading.Lock = threading.Lock()
+        self.__request_ids = itertools.count(1)
 
+        # called with False when the connection drops and with True once it is (re)established.
+        self.connection_listeners: List[Callable[[bool], None]] = list()
+        self.__connected_once: bool = False
         return
 
-    def _authenticate(self: "__BasicWebSocketManager") -> None:
+    def add_connection_listener(
+        self: "_FutureWebSocketManager",
+        listener: Callable[[bool], None],
+    ) -> None:
         """
-        # method: _authenticate
-        # login to the endpoint for private endpoint
+        func add_connection_listener():
+            - listener(False) on a drop, i.e., the messages until the reconnect are lost, listener(True) on a connection.
         """
-        # create the timestamp
-        timestamp: str = str(int(time.time() * 1000))
-        # basic signature
-        _signature: str = self.api_key + timestamp
-
-        # hmac using sha256
-        signature = hmac.new(
-            self.secret_key.encode("utf-8"),  # encoded secret key
-            _signature.encode("utf-8"),  # encoded _signature
-            hashlib.sha256,
-        ).hexdigest()
-
-        # make the parameter dictionary into json string
-        header = json.dumps(
-            dict(
-                subscribe = False,
-                method = "login",
-                param = dict(apiKey = self.api_key, reqTime = timestamp, signature = signature,),
-            )
-        )
-        self.ws.send(header)  # send the header to the endpoint
-        operation_logger.info("login request has been sent!")  # log the request
+        if listener not in self.connection_listeners:
+            self.connection_listeners.append(listener)
         return
 
-    def _are_connections_connected(self: "__BasicWebSocketManager", connections: list) -> bool:
-        # if there is connection which is not active, return False
-        for connection in connections:
-            if not connection.is_connected():
-                return False
-
-        return True
-
-    def _set_callback(self: "__BasicWebSocketManager", topic: str, callback_function = callable,) -> None:
-        """
-        method: _set_callback
-            - set the callback function for the specific topic and save it into the directory in the class for response handling
-        """
-        self.callback_dictionary[topic] = callback_function
+    def __notify_connection(
+        self: "_FutureWebSocketManager",
+        connected: bool,
+    ) -> None:
+        for listener in tuple(self.connection_listeners):
+            try:
+                listener(connected)
+            except Exception as e:
+                operation_logger.error(f"{__name__} - {listener} has failed on the connection change of {self.ws_name}: {str(e)}")
         return
 
-    # get the callback function according to the topic
-    def _get_callback(self: "__BasicWebSocketManager", topic: str,) -> callable | None:
-        """
-        - method: _get_callback
-            - get the callback function for the specific topic from the callback_directory in the class
-        """
-        return self.callback_dictionary.get(topic)
-
-    def _is_connected(self: "__BasicWebSocketManager") -> bool:
-        """
-        - method: _is_connected()
-            - check if the socket is connected to the endpoint or not
-        """
-        try:
-            if self.ws.sock or not self.ws.sock.is_connected:
-                return True
-            else:
-                return False
-        except (
-            AttributeError
-        ):  # exception handling, if there is any error occurred just return False
-            return False
-
-    def __on_message(
-        self: "__BasicWebSocketManager",
-        wsa,
-        message: str,
-    ) -> dict | None:
-        """
-        - Parsing the message from the server
-        """
-        # parsing the message into the json
-        response = json.loads(message)
-
-        # now response is parsed as a dictionary so that we can do something with it.
-        return self.callback_function(response)
+    def _combined_endpoint(
+        self: "_FutureWebSocketManager",
+    ) -> str:
+        if not self.subscriptions:
+            return f"{self.base_endpoint}/stream"
+        return f"{self.base_endpoint}/stream?streams={'/'.join(self.subscriptions)}"
 
-    def __on_error(
-        self: "__BasicWebSocketManager",
-        wsa,
-        exception: Exception,
+    def _connect(
+        self: "_FutureWebSocketManager",
     ) -> None:
         """
-        - when there is an error
-        - Exit and raise errors or attempt to reconnect
-        """
-        operation_logger.error(f"Unknown Error Occurred: {exception}")
-        return
-
-    def __on_open(self: "__BasicWebSocketManager", wsa) -> None:
-        """
-        - when the websocket is open
-        """
-        operation_logger.info("ws has been opened")
-        return
+        func _connect():
+            - (re)connect with every subscribed stream in the URL, so there is nothing to resend afterwards.
+            - the streams subscribed to while connecting are not in the URL, they are sent once connected.
+        """
+        if self.__connected_once:
+            self.__notify_connection(False)
+
+        with self.subscription_lock:
+            streams: List[str] = list(self.subscriptions)
+            self.endpoint = self._combined_endpoint()
+        super()._connect()
+        if not self._is_connected():
+            return None
+        self.__connected_once = True
+
+        with self.subscription_lock:
+            missed: List[str] = [stream for stream in self.subscriptions if stream not in streams]
+        if missed:
+            self._send_request("SUBSCRIBE", missed)
+        self.__notify_connection(True)
+        return None
+
+    def _authenticate(
+        self: "_FutureWebSocketManager",
+    ) -> None:
+        return None
 
-    def __on_close(
-        self: "__BasicWebSocketManager",
-        wsa,
-        status_code: str,
-        close_msg: str,
+    def _resubscribe(
+        self: "_FutureWebSocketManager",
     ) -> None:
-        """
-        - websocket close
-        - logging the status code and the msg into the logger
-        """
         operation_logger.info(
-            f"operation_logger has been closed: status code - {status_code}, close message = {close_msg}"
+            f"{__name__} - {self.ws_name} has reconnected with {len(self.subscriptions)} streams."
         )
-        return
+        return None
 
     def _ping_loop(
-        self: "__BasicWebSocketManager",
-        ping_interval: int,
-        ping_payload: str = '{"method":"ping"}',
+        self: "_FutureWebSocketManager",
+        ping_interval: int,  # Second
+        ping_payload: str = "",
     ) -> None:
         """
-        - method: _ping_loop
-        - for the ping thread of WebSocketApp
+        func _ping_loop():
+            - send an unsolicited pong frame every <ping_interval> seconds.
+            - the loop ends once the connection it was started for has been replaced.
         """
-        time.sleep(ping_interval)
-        while True:
-            self.ws.send(ping_payload)
+        ws = self.ws
+        while self.ws is ws:
             time.sleep(ping_interval)
-
-    def _reset(self: "__BasicWebSocketManager") -> None:
-        """
-        - _reset the WebSocket when reset signal incurred
-            - e.g., when there is error and we need to reset the entire program
-        """
-        self.subscriptions.clear()
-        self.callback_dictionary.clear()
-        operation_logger.info(f"WebSocketApp, {self.ws_name} has been reset.")
-        return
-
-    def exit(self: "__BasicWebSocketManager") -> None:
-        """
-        - close the websocket
-        """
-        self.ws.close()
-
-        operation_logger.info(
-            "The WebSocket Manager has been terminated - might need to restart the entire program"
-        )
-
-        while self.ws.sock:
-            continue
-
-
-class _FutureWebSocketManager(__BasicWebSocketManager):
-    def __init__(
+            try:
+                if ws.sock:
+                    ws.sock.pong(ping_payload)
+            except Exception as e:
+                operation_logger.warning(f"{__name__} - {self.ws_name} failed to send the pong frame: {str(e)}")
+        return None
+
+    def _send_request(
         self: "_FutureWebSocketManager",
-        ws_name: str | None = "FutureWebSocketV1",
-        **kwargs: dict,
-    ):
-        operation_logger.debug(f"{kwargs}")
-        # self.callback_function = kwargs.pop("callback_function") if kwargs.get("callback_function") else self._default_callback
-
-        super().__init__(ws_name=ws_name, **kwargs)
-
-        # if not callback_fuction:
-        self.callback_function = self._deal_with_response
-
-        return
-
-    def subscribe(
-        self: "_FutureWebSocketManager",
-        method: str | None,
-        callback_function: callable | None,
-        param: dict | None = None,
-    ):
-        if (param is None):
-            param = dict()
-
-        query = dict(method=method, param=param)
-
-        self._check_callback(query)
-
-        while not self._is_connected() and not self.ws:
+        method: str,
+        streams: List[str],
+    ) -> int | None:
+        """
+        func _send_request():
+            - send the request once connected, None if the connection is not up within REQUEST_TIMEOUT.
+            - self.subscriptions is updated before the request, so a request left unsent is made by the URL of the next connection.
+        """
+        deadline: float = time.monotonic() + self.REQUEST_TIMEOUT
+        while not self._is_connected():
+            if time.monotonic() >= deadline:
+                operation_logger.warning(
+                    f"{__name__} - {self.ws_name} is not connected, {method} {streams} is left to the next connection."
+                )
+                return None
             time.sleep(0.1)
 
-        operation_logger.info(f"subscription header for {method} has been sent!")
-
-        header = json.dumps(query)
-        self.ws.send(header)
-        self.subscriptions.append(query)
-
-        # set the callback function for specific topic
-        # if there is no given callback function, we just put _print_normal_msg as a callback function
-        self._set_callback(method.replace("sub.", ""), callback_function)
-
-        # logger.info(f"new sub has been established: {self.subscriptions}")
+        request_id: int = next(self.__request_ids)
+        self.ws.send(json.dumps(dict(method = method, params = streams, id = request_id)))
+        return request_id
 
-        return
-
-    def _deal_with_response(
+    def subscribe(
         self: "_FutureWebSocketManager",
-        msg: str,
-    ):
-        # comprehensive callback function which can deal with all of the message
+        streams: List[str],
+        callback_function: Callable | None = None,
+    ) -> None:
         """
-        Types of Response
-            # auth_message
-            # subscribe response
-            # pong
+        func subscribe():
+            - add the streams to the connection, the callback gets the combined message of each stream.
+            - a stream subscribed to again keeps its callbacks, the new one is called after them.
         """
-        def is_auth_response():
-            if msg.get("channel") == "rs.login":
-                return True
-            return False
-
-        def is_sub_response():
-            if str(msg.get("channel", "")).startswith("rs.sub."):
-                return True
-            return False
-
-        def is_pong_msg():
-            if msg.get("channel", "") == "pong":
-                return True
-            return False
-
-        def is_error_msg():
-            if msg.get("channel", "") == "rs.error":
-                return True
-            return False
-
-        if is_auth_response():
-            self._deal_with_auth_msg(msg = msg)
+        with self.subscription_lock:
+            new_streams: List[str] = [stream for stream in dict.fromkeys(streams) if stream not in self.subscriptions]
+            if len(self.subscriptions) + len(new_streams) > _FutureWebSocketManager.MAX_STREAMS_PER_CONNECTION:
+                raise ValueError(
+                    f"{self.ws_name} cannot hold more than {_FutureWebSocketManager.MAX_STREAMS_PER_CONNECTION} streams."
+                )
 
-        elif is_sub_response():
-            self._deal_with_sub_msg(msg = msg)
+            for stream in streams:
+                self._set_callback(stream, _FutureWebSocketManager.__add_callback(self._get_callback(stream), callback_function))
 
-        elif is_error_msg():
-            operation_logger.info(f"The error has been received from the host: {msg}")
+            if not new_streams:
+                return
+            self.subscriptions.extend(new_streams)
 
-        elif is_pong_msg():
-            pass
-
-        else:
-            self._deal_with_normal_msg(msg = msg)
+        self._send_request("SUBSCRIBE", new_streams)
+        return
 
+    @staticmethod
+    def __add_callback(
+        existing: Callable | None,
+        callback_function: Callable | None,
+    ) -> Callable | None:
+        if existing is None or callback_function is None:
+            return callback_function if callback_function is not None else existing
+        callbacks: Tuple[Callable, ...] = existing.callbacks if isinstance(existing, _StreamCallbacks) else (existing, )
+        if callback_function in callbacks:
+            return existing
+        return _StreamCallbacks(callbacks + (callback_function, ))
+
+    def unsubscribe(
+        self: "_FutureWebSocketManager",
+        streams: List[str],
+    ) -> None:
+        with self.subscription_lock:
+            removed: List[str] = [stream for stream in streams if stream in self.subscriptions]
+            for stream in removed:
+                self.subscriptions.remove(stream)
+                self.callback_dictionary.pop(stream, None)
+
+        if removed:
+            self._send_request("UNSUBSCRIBE", removed)
         return
 
-    def _deal_with_auth_msg(
+    def _deal_with_response(
         self: "_FutureWebSocketManager",
-        msg: str,
+        msg: dict,
     ) -> None:
         """
-        Determine if the login has been successful.
-        # notify the result to the user by logger.
-        """
-        if msg.get("data") == "success":  # login success
-            operation_logger.info(
-                f"Authorization for {self.ws_name} has been successful."
+        Types of Response
+            # stream message: {"stream": <stream>, "data": <payload>}
+            # request ack: {"result": null, "id": <id>}
+            # error: {"error": {"code": <code>, "msg": <msg>}, "id": <id>}
+        """
+        stream: str | None = msg.get("stream")
+        if stream is not None:
+            callback_function: Callable | None = self._get_callback(stream)
+            if (callback_function):
+                callback_function(msg)
+        elif "error" in msg:
+            operation_logger.error(
+                f"{__name__} - func _deal_with_response(): The error has been received from the host: {msg}"
             )
-            self.auth = True
-        else:  # login fail
-            operation_logger.debug(
-                f"Authoriztion for {self.ws_name} has not been successful."
-                f"Please check your keys!"
+        elif "id" in msg:
+            operation_logger.info(
+                f"{__name__} - func _deal_with_response(): Request {msg.get('id')} has been acknowledged by {self.ws_name}."
             )
-        return
-
-    def _deal_with_sub_msg(
-        self: "_FutureWebSocketManager",
-        msg: str,
-    ):
-        topic = msg.get("channel")
-
-        if ((msg.get("channel", "").startswith("rs.") or msg.get("channel", "").startswith("push.")) and msg.get("channel", "") != "rs.error"):
-            operation_logger.info(f"Subcription to {topic} has been establisehd")
-
         else:
             operation_logger.info(
-                f"Estabilishment of {topic} subscription has been failed."
+                f"{__name__} - func _deal_with_response(): Unknown message from the host: {msg}"
             )
-
-        if (msg.get("channel", "") != "rs.error"):
-            operation_logger.info(f"Subscription to {topic} has been established")
-
-        elif (msg.get("channel", "") == "rs.error"):
-            operation_logger.debug(f"Subscription to {topic} has failed to establish")
-
-        return
-
-    def _deal_with_normal_msg(
-        self: "_FutureWebSocketManager",
-        msg: str,
-    ):
-        topic = msg.get("channel").replace("push.", "").replace("sub.", "")
-
-        callback_function = self._get_callback(topic)
-
-        callback_function(msg)
-
         return
 
-    def _check_callback(
-        self: "_FutureWebSocketManager",
-        topics: list[str],
-    ):
-        for topic in topics:
-            if topic in self.callback_dictionary:
-                operation_logger.info(f"{topic} is already subscribed")
-                raise Exception
-
 
 class _FutureWebSocket(_FutureWebSocketManager):
     def __init__(
         self: "_FutureWebSocket",
-        ws_name: str = "FutureMarketWebSocketV1",
-        end_point: str = "wss://contract.mexc.com/edge",
-        **kwargs,
+        endpoint: str = "wss://fstream.binance.com",
+        ws_name: str = "BinanceFutureWebSocket",
+        api_key: str | None = None,
+        secret_key: str | None = None,
+        ping_interval: int = 60,  # Second
+        connection_interval: int = 10,
+        ping_timeout: int = 10,
+        conn_timeout: int = 30,
+        default_callback: Callable | None = None,
     ) -> None:
-        self.ws_name = ws_name
-        self.endpoint = end_point
-
-        self.active_connections = []
+        kwargs = dict(
+            ws_name = ws_name,
+            api_key = api_key,
+            secret_key = secret_key,
+            endpoint = endpoint,
+            ping_interval = ping_interval,
+            connection_interval = connection_interval,
+            ping_timeout = ping_timeout,
+            conn_timeout = conn_timeout,
+            default_callback = default_callback,
+        )
 
         super().__init__(**kwargs)
 
-        self.private_topics = [
-            "personal.order",
-            "personal.asset",
-            "personal.position",
-            "personal.risk.limit",
-            "personal.adl.level",
-            "personal.position.mode",
-        ]
-
         # initialize the WebSocket for Future End-point
-        self.ws = _FutureWebSocketManager(
-            ws_name = self.ws_name,
-            api_key = self.api_key,
-            secret_key = self.secret_key,
-        )
-        # connect the WebSocket to the API
-        self.ws._connect(self.endpoint)
+        self.__initialize_websocket()
+        return
 
+    def __initialize_websocket(
+        self: "_FutureWebSocket",
+    ) -> None:
+        try:
+            self._connect()
+        except Exception as e:
+            operation_logger.error(f"{__name__} - func initialize_websocket(): {e}")
         return
 
     def is_connected(
         self: "_FutureWebSocket",
     ) -> bool:
-        return self._are_connections_connected(self.active_connections)
-
-    def _method_subscribe(
-        self: "_FutureWebSocket",
-        method: str,
-        callback: callable,
-        param: dict | None = None,
-    ) -> None:
-        if param is None:
-            param = dict()
-
-        if not self.ws:
-            self.ws = _FutureWebSocketManager(
-                ws_name = self.ws_name,
-                api_key = self.api_key,
-                secret_key = self.secret_key,
-            )
-
-            self.ws._connect(url = self.endpoint)
-
-        self.ws.subscribe(method = method, callback_function = callback, param = param)
-        return
+        return self._is_connected()
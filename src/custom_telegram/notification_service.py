@@ -0,0 +1,349 @@
+# Standard Library
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque, OrderedDict
+from enum import IntEnum
+from typing import Any, Deque, Dict, Hashable, List, Tuple
+
+# Custom Library
+from custom_telegram.telegram_bot_class import CustomTelegramBot
+from logger.set_logger import operation_logger
+from telemetry.metrics import metrics
+
+
+# result = queued, coalesced (merged into a pending message of the same key), dropped, sent or failed.
+NOTIFICATIONS = metrics.counter(
+    "notifications_total",
+    "Telegram notifications by priority and outcome.",
+    ("priority", "result"),
+)
+
+
+class Priority(IntEnum):
+    HIGH = 0  # sent as soon as the rate limit allows, e.g., the orders.
+    LOW = 1  # sent in the digest, and the first to be dropped, e.g., the signals.
+
+
+class _RateLimiter:
+    '''
+    # Telegram allows about one message per second in a chat and 20 messages per minute in a group or a channel.
+    '''
+    def __init__(
+        self: "_RateLimiter",
+        min_interval: float = 1.0,  # Second
+        per_minute: int = 20,
+    ) -> None:
+        self.min_interval: float = min_interval
+        self.per_minute: int = per_minute
+        self.sent: Deque[float] = deque()
+        self.hold_until: float = 0.0  # set by the retry_after of Telegram.
+        return
+
+    def delay(
+        self: "_RateLimiter",
+        now: float,
+    ) -> float:
+        """
+        func delay():
+            - seconds to wait before the next message can be sent.
+        """
+        while self.sent and now - self.sent[0] >= 60.0:
+            self.sent.popleft()
+        delay: float = self.hold_until - now
+        if self.sent:
+            delay = max(delay, self.sent[-1] + self.min_interval - now)
+        if len(self.sent) >= self.per_minute:
+            delay = max(delay, self.sent[0] + 60.0 - now)
+        return max(delay, 0.0)
+
+    def record(
+        self: "_RateLimiter",
+        now: float,
+    ) -> None:
+        self.sent.append(now)
+        return
+
+
+class NotificationService:
+    '''
+    # Telegram notifications off the critical path.
+        # notify() only appends to a bounded in-memory queue, the messages are sent by one asyncio loop on its own thread,
+        # which owns the bot and its HTTP client for the whole run.
+        # HIGH messages wake the loop, LOW messages wait for the digest sent every digest_interval.
+        # the loop waits for the rate limit first and then takes everything pending, so a burst goes out as one message.
+        # messages with the same key are coalesced while pending, the latest text is kept with the count of the merged ones.
+        # the queue holds max_pending messages, when it is full a LOW message is dropped to make room for a HIGH one,
+        # and a new message is dropped if there is nothing to make room with.
+
+    - without a bot, e.g., no credentials, notify() returns False right away.
+    '''
+    MAX_LENGTH: int = 4_096  # characters per Telegram message
+
+    def __init__(
+        self: "NotificationService",
+        bot: CustomTelegramBot | None,
+        max_pending: int = 1_000,
+        digest_interval: float = 60.0,  # Second
+        min_interval: float = 1.0,  # Second
+        per_minute: int = 20,
+    ) -> None:
+        self.bot: CustomTelegramBot | None = bot
+        self.max_pending: int = max_pending
+        self.digest_interval: float = digest_interval
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__idle: threading.Condition = threading.Condition(self.__lock)
+        # priority -> key -> [message, count]
+        self.__pending: Dict[Priority, "OrderedDict[Hashable, List[Any]]"] = {priority: OrderedDict() for priority in Priority}
+        self.__size: int = 0
+        self.__sending: bool = False
+        self.__wake_scheduled: bool = False
+        self.__digest_due: bool = False
+        self.__sequence = itertools.count()  # keys of the messages which are not coalesced.
+
+        self.__limiter: _RateLimiter = _RateLimiter(min_interval = min_interval, per_minute = per_minute)
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__wakeup: asyncio.Event | None = None
+        self.__thread: threading.Thread | None = None
+        self.__running: bool = False
+
+        self.__counters: Dict[Tuple[Priority, str], Any] = {
+            (priority, result): NOTIFICATIONS.labels(priority = priority.name.lower(), result = result)
+            for priority in Priority
+            for result in ("queued", "coalesced", "dropped", "sent", "failed")
+        }
+        return
+
+    def start(self: "NotificationService") -> "NotificationService":
+        if self.bot is None or self.__running:
+            return self
+        self.__running = True
+        self.__loop = asyncio.new_event_loop()
+        self.__wakeup = asyncio.Event()
+        ready: threading.Event = threading.Event()
+        self.__thread = threading.Thread(
+            name = "Thread-Notification",
+            target = self.__run_loop,
+            args = (ready,),
+            daemon = True,
+        )
+        self.__thread.start()
+        ready.wait(timeout = 5.0)
+        operation_logger.info(f"{__name__} - NotificationService has been started.")
+        return self
+
+    def stop(
+        self: "NotificationService",
+        timeout: float = 5.0,  # Second
+    ) -> None:
+        """
+        func stop():
+            - send what is pending, the digest included, then close the bot and the loop.
+        """
+        if not self.__running:
+            return
+        self.flush(timeout = timeout)
+        self.__running = False
+        self.__loop.call_soon_threadsafe(self.__wakeup.set)
+        self.__thread.join(timeout = timeout)
+        return
+
+    def qsize(self: "NotificationService") -> int:
+        with self.__lock:
+            return self.__size
+
+    def notify(
+        self: "NotificationService",
+        message: str,
+        priority: Priority = Priority.HIGH,
+        key: Hashable | None = None,
+    ) -> bool:
+        """
+        func notify():
+            - enqueue the message and return whether it has been queued, it never waits for Telegram.
+            - a message with the key of a pending one of the same priority replaces it.
+        """
+        if not self.__running:
+            return False
+        with self.__lock:
+            pending: "OrderedDict[Hashable, List[Any]]" = self.__pending[priority]
+            if key is not None and key in pending:
+                entry: List[Any] = pending[key]
+                entry[0] = message
+                entry[1] += 1
+                self.__counters[(priority, "coalesced")].inc()
+                return True
+            if self.__size >= self.max_pending and not self.__make_room(priority):
+                self.__counters[(priority, "dropped")].inc()
+                return False
+            pending[(None, next(self.__sequence)) if key is None else key] = [message, 1]
+            self.__size += 1
+            self.__counters[(priority, "queued")].inc()
+            if priority == Priority.HIGH and not self.__wake_scheduled:
+                self.__wake_scheduled = True
+                self.__loop.call_soon_threadsafe(self.__wakeup.set)
+        return True
+
+    def flush(
+        self: "NotificationService",
+        timeout: float = 5.0,  # Second
+    ) -> bool:
+        """
+        func flush():
+            - send the digest now and block until nothing is pending or in flight, False on the timeout.
+        """
+        if not self.__running:
+            return self.qsize() == 0
+        with self.__lock:
+            self.__digest_due = True
+            self.__wake_scheduled = True
+        self.__loop.call_soon_threadsafe(self.__wakeup.set)
+        with self.__idle:
+            return self.__idle.wait_for(lambda: self.__size == 0 and not self.__sending and not self.__digest_due, timeout = timeout)
+
+    def __make_room(
+        self: "NotificationService",
+        priority: Priority,
+    ) -> bool:
+        """
+        func __make_room():
+            - called with the lock held, drop the oldest LOW message for a HIGH one.
+        """
+        low: "OrderedDict[Hashable, List[Any]]" = self.__pending[Priority.LOW]
+        if priority == Priority.LOW or not low:
+            return False
+        low.popitem(last = False)
+        self.__size -= 1
+        self.__counters[(Priority.LOW, "dropped")].inc()
+        return True
+
+    def __take(
+        self: "NotificationService",
+        digest: bool,
+    ) -> List[Tuple[Priority, str]]:
+        """
+        func __take():
+            - called with the lock held, the pending HIGH messages, and the LOW ones for the digest.
+        """
+        taken: List[Tuple[Priority, str]] = list()
+        for priority in (Priority.HIGH, Priority.LOW) if digest else (Priority.HIGH,):
+            pending: "OrderedDict[Hashable, List[Any]]" = self.__pending[priority]
+            for message, count in pending.values():
+                taken.append((priority, message if count == 1 else f"[x{count}] {message}"))
+            self.__size -= len(pending)
+            pending.clear()
+        return taken
+
+    @staticmethod
+    def pack(
+        messages: List[str],
+        max_length: int = MAX_LENGTH,
+    ) -> List[Tuple[str, int]]:
+        """
+        func pack():
+            - join the messages into as few Telegram messages as the length limit allows, a longer message is truncated.
+            - (text, number of the messages in it) for every Telegram message.
+        """
+        packed: List[Tuple[str, int]] = list()
+        current: str = ""
+        count: int = 0
+        for message in messages:
+            message = message if len(message) <= max_length else f"{message[:max_length - 3]}..."
+            if current and len(current) + 2 + len(message) <= max_length:
+                current = f"{current}\n\n{message}"
+                count += 1
+                continue
+            if current:
+                packed.append((current, count))
+            current, count = message, 1
+        if current:
+            packed.append((current, count))
+        return packed
+
+    def __run_loop(
+        self: "NotificationService",
+        ready: threading.Event,
+    ) -> None:
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_until_complete(self.__run(ready))
+        self.__loop.close()
+        return
+
+    async def __run(
+        self: "NotificationService",
+        ready: threading.Event,
+    ) -> None:
+        try:
+            await self.bot.initialize()
+        except Exception as e:
+            operation_logger.error(f"{__name__} - Error while initializing the Telegram bot: {str(e)}")
+        ready.set()
+
+        next_digest: float = time.monotonic() + self.digest_interval
+        while self.__running:
+            try:
+                await asyncio.wait_for(self.__wakeup.wait(), timeout = max(next_digest - time.monotonic(), 0.0))
+            except asyncio.TimeoutError:
+                pass
+            self.__wakeup.clear()
+
+            # the messages arriving during the wait for the rate limit join this batch.
+            await asyncio.sleep(self.__limiter.delay(time.monotonic()))
+            with self.__lock:
+                self.__wake_scheduled = False
+                digest: bool = self.__digest_due or time.monotonic() >= next_digest
+                self.__digest_due = False
+                taken: List[Tuple[Priority, str]] = self.__take(digest)
+                self.__sending = bool(taken)
+            if digest:
+                next_digest = time.monotonic() + self.digest_interval
+
+            await self.__send(taken)
+            with self.__idle:
+                self.__sending = False
+                self.__idle.notify_all()
+
+        try:
+            await self.bot.shutdown()
+        except Exception as e:
+            operation_logger.error(f"{__name__} - Error while shutting down the Telegram bot: {str(e)}")
+        return
+
+    async def __send(
+        self: "NotificationService",
+        taken: List[Tuple[Priority, str]],
+    ) -> None:
+        """
+        func __send():
+            - the HIGH messages are packed apart from the digest, so an order is never buried in the signals.
+        """
+        for priority in Priority:
+            for text, count in NotificationService.pack([message for of, message in taken if of == priority]):
+                await asyncio.sleep(self.__limiter.delay(time.monotonic()))
+                self.__counters[(priority, await self.__send_text(text))].inc(count)
+        return
+
+    async def __send_text(
+        self: "NotificationService",
+        text: str,
+    ) -> str:
+        """
+        func __send_text():
+            - send one message, retried once after the retry_after of Telegram, and return sent or failed.
+        """
+        for attempt in range(2):
+            try:
+                await self.bot.send_text(text)
+                self.__limiter.record(time.monotonic())
+                return "sent"
+            except Exception as e:
+                retry_after: Any = getattr(e, "retry_after", None)  # telegram.error.RetryAfter
+                if attempt == 0 and retry_after is not None:
+                    delay: float = retry_after.total_seconds() if hasattr(retry_after, "total_seconds") else float(retry_after)
+                    self.__limiter.hold_until = time.monotonic() + delay
+                    await asyncio.sleep(delay)
+                    continue
+                operation_logger.error(f"{__name__} - Error while sending the Telegram message: {str(e)}")
+        return "failed"
@@ -41,6 +41,15 @@ class CustomTelegramBot:
         )
         return
 
+    async def initialize(self) -> None:
+        # the HTTP client of the bot is bound to the loop which initializes it, see NotificationService.
+        await self._bot.initialize()
+        return
+
+    async def shutdown(self) -> None:
+        await self._bot.shutdown()
+        return
+
 
 """
 ########################################################################################################################################################################################
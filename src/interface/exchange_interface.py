@@ -0,0 +1,247 @@
+# Standard Library
+import asyncio
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Tuple
+
+# Custom Library
+from telemetry.metrics import metrics
+
+
+# latency of the REST calls made through the adapters, by venue, the VenueRouter ranks the venues by its moving average.
+VENUE_LATENCY = metrics.histogram(
+    "venue_rest_latency_ms",
+    "Latency of the REST calls of the exchange adapters in milliseconds.",
+    ("venue",),
+)
+
+# (bids, asks), each a list of (price, base quantity) from the touch outwards.
+Book = Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]
+
+
+class BracketOrder:
+    '''
+    # outcome of ExchangeAdapter.place_bracket(), the same for every venue.
+        # accepted: the entry has been taken by the venue, its SL / TP are only sent after it.
+        # unknown: the venue could not tell whether the entry has been taken, it may be filled without its SL / TP,
+        # so it is never sent again to another venue.
+        # entry_id: the id the venue knows the entry by, i.e., the client order id on Binance and the order id on MEXC.
+        # avg_price: average fill price of the entry when the venue reports it in the response, None otherwise.
+    '''
+    __slots__ = ("venue", "symbol", "side", "quantity", "entry_id", "accepted", "latency_ms", "avg_price", "unknown")
+
+    def __init__(
+        self: "BracketOrder",
+        venue: str,
+        symbol: str,
+        side: int,  # 1: long, -1: short
+        quantity: float,  # base asset, after the rounding of the venue
+        entry_id: str | None,
+        accepted: bool,
+        latency_ms: float,
+        avg_price: float | None = None,
+        unknown: bool = False,
+    ) -> None:
+        self.venue: str = venue
+        self.symbol: str = symbol
+        self.side: int = side
+        self.quantity: float = quantity
+        self.entry_id: str | None = entry_id
+        self.accepted: bool = accepted
+        self.latency_ms: float = latency_ms
+        self.avg_price: float | None = avg_price
+        self.unknown: bool = unknown
+        return
+
+    def __repr__(self: "BracketOrder") -> str:
+        return f"BracketOrder({self.venue} {self.symbol} {'long' if self.side == 1 else 'short'} {self.quantity}, accepted = {self.accepted}{', unknown' if self.unknown else ''})"
+
+
+class ExchangeAdapter(ABC):
+    '''
+    # one venue behind the calls of the TradeManager: price, balance, position, book depth, bracket orders and streams.
+        # symbols are given by the base and the quote currency, e.g., ("BTC", "USDT"), each venue spells them its own way.
+        # quantities are in the base asset, e.g., BTC, each venue converts and rounds them to its own unit.
+        # the REST calls go through timed(), latency_ms is their exponential moving average, see the VenueRouter.
+        # every call has an *_async() twin on the default executor of the running loop, for the coroutines.
+        # a failed call returns None, as the SDKs do.
+    '''
+    name: str
+    LATENCY_ALPHA: float = 0.2  # weight of the latest call in latency_ms
+
+    def __init__(self: "ExchangeAdapter") -> None:
+        self.__latency_lock: threading.Lock = threading.Lock()
+        self.__latency_ms: float | None = None
+        self.__latency_histogram = VENUE_LATENCY.labels(venue = self.name)
+        return
+
+    def __repr__(self: "ExchangeAdapter") -> str:
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def latency_ms(self: "ExchangeAdapter") -> float | None:
+        """
+        func latency_ms():
+            - moving average of the REST latency in ms, None until the first call.
+        """
+        return self.__latency_ms
+
+    def timed(
+        self: "ExchangeAdapter",
+        call: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        func timed():
+            - make the REST call and fold its latency into latency_ms.
+        """
+        started: float = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            elapsed: float = (time.perf_counter() - started) * 1_000
+            self.__latency_histogram.observe(elapsed)
+            with self.__latency_lock:
+                self.__latency_ms = (
+                    elapsed if self.__latency_ms is None
+                    else self.__latency_ms + ExchangeAdapter.LATENCY_ALPHA * (elapsed - self.__latency_ms)
+                )
+
+    @abstractmethod
+    def symbol(
+        self: "ExchangeAdapter",
+        base: str,
+        ccy: str,
+    ) -> str:
+        ...
+
+    @abstractmethod
+    def price(
+        self: "ExchangeAdapter",
+        base: str,
+        ccy: str,
+    ) -> float | None:
+        """
+        func price():
+            - the price the protective orders of the venue trigger on, i.e., mark price or fair price.
+        """
+        ...
+
+    @abstractmethod
+    def available_balance(
+        self: "ExchangeAdapter",
+        ccy: str,
+    ) -> float | None:
+        ...
+
+    @abstractmethod
+    def position(
+        self: "ExchangeAdapter",
+        base: str,
+        ccy: str,
+    ) -> float | None:
+        """
+        func position():
+            - signed quantity of the open position in the base asset, 0.0 when flat.
+        """
+        ...
+
+    @abstractmethod
+    def depth(
+        self: "ExchangeAdapter",
+        base: str,
+        ccy: str,
+        limit: int = 20,
+    ) -> Book | None:
+        ...
+
+    @abstractmethod
+    def place_bracket(
+        self: "ExchangeAdapter",
+        side: int,  # 1: long, -1: short
+        base: str,
+        ccy: str,
+        quantity: float,  # base asset
+        price: float,  # reference price of the entry
+        sl_price: float,
+        tp_price: float,
+        leverage: int,
+    ) -> BracketOrder:
+        """
+        func place_bracket():
+            - a MARKET entry with its stop-loss and take-profit, rounded to the filters of the venue.
+        """
+        ...
+
+    def taker_fee(
+        self: "ExchangeAdapter",
+        base: str,
+        ccy: str,
+    ) -> float:
+        """
+        func taker_fee():
+            - fee rate of a MARKET order, 0.0 when the venue has not reported it.
+        """
+        return 0.0
+
+    def round_quantity(
+        self: "ExchangeAdapter",
+        base: str,
+        ccy: str,
+        quantity: float,
+        price: float,
+    ) -> float:
+        """
+        func round_quantity():
+            - quantity floored to what the venue can fill, 0.0 below its minimum order.
+        """
+        return quantity
+
+    @abstractmethod
+    def subscribe_price(
+        self: "ExchangeAdapter",
+        callback: Callable[[str, float, int], None],  # (venue, price, exchange timestamp in ms)
+        base: str,
+        ccy: str,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def subscribe_depth(
+        self: "ExchangeAdapter",
+        callback: Callable[[str, Book, int], None],  # (venue, book, exchange timestamp in ms)
+        base: str,
+        ccy: str,
+        levels: int = 20,
+    ) -> None:
+        """
+        func subscribe_depth():
+            - snapshots of the top <levels> of the book, in the base asset like depth().
+        """
+        ...
+
+    async def __run(
+        self: "ExchangeAdapter",
+        call: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(call, *args, **kwargs))
+
+    async def price_async(self: "ExchangeAdapter", base: str, ccy: str) -> float | None:
+        return await self.__run(self.price, base, ccy)
+
+    async def available_balance_async(self: "ExchangeAdapter", ccy: str) -> float | None:
+        return await self.__run(self.available_balance, ccy)
+
+    async def position_async(self: "ExchangeAdapter", base: str, ccy: str) -> float | None:
+        return await self.__run(self.position, base, ccy)
+
+    async def depth_async(self: "ExchangeAdapter", base: str, ccy: str, limit: int = 20) -> Book | None:
+        return await self.__run(self.depth, base, ccy, limit)
+
+    async def place_bracket_async(self: "ExchangeAdapter", **kwargs: Any) -> BracketOrder:
+        return await self.__run(self.place_bracket, **kwargs)
@@ -1,10 +1,18 @@
 from typing import Generic, TypeVar
 from pipeline.base_pipeline import BasePipeline
 from logger.set_logger import operation_logger
+from telemetry.metrics import metrics
 import time
 
 T = TypeVar('T')  # User Defined template
 
+# items dropped by pop() since they are older than the time window of check_data_validity().
+STALE_ITEMS = metrics.counter(
+    "pipeline_stale_items_total",
+    "Items dropped by the pipeline controllers for being stale.",
+    ("pipeline",),
+)
+
 
 class PipelineController(Generic[T]):
     '''
@@ -27,6 +35,7 @@ class PipelineController(Generic[T]):
         '''
         # Let the programmer decides which operation to be used.
         self.pipeline: BasePipeline = pipeline
+        self.__stale_items = STALE_ITEMS.labels(pipeline = pipeline.__class__.__name__)
 
         operation_logger.info(
             f"{__name__} - pipelineController has been generated."
@@ -63,6 +72,7 @@ class PipelineController(Generic[T]):
             if data:
                 if self.check_data_validity(data.timestamp):
                     return data
+                self.__stale_items.inc()
 
             return None
         except Exception as e:
@@ -0,0 +1,357 @@
+# Standard Library
+import math
+import threading
+from typing import List, Tuple
+
+# Third-party Library
+import numpy as np
+
+# Custom Library
+from binance.future import FutureWebSocket as BinanceFutureWebSocket
+from interface.pipeline_interface import PipelineController
+from logger.set_logger import operation_logger
+from manager.data_collector_and_processor import IndexFactory
+from mexc.future import FutureWebSocket as MexcFutureWebSocket
+from object.constants import IndexType
+from object.indexes import Index, IndexData, IndexLayout
+
+
+'''
+# values of the IndexType.BASIS Index.
+    # basis: MEXC fair price - Binance mark price, basis_bps: the same in bps of the mark price.
+    # index_spread_bps: MEXC index price - Binance index price in bps, NaN until both have been seen.
+    # zscore: basis_bps against the mean and the deviation of its samples over the window.
+    # lead_lag_ms: lag of the MEXC returns behind the Binance returns with the highest correlation, negative when MEXC leads.
+    # lead_lag_corr: that correlation.
+'''
+BASIS_LAYOUT: IndexLayout = IndexLayout.of(("basis", "basis_bps", "index_spread_bps", "zscore", "lead_lag_ms", "lead_lag_corr"))
+
+
+class _RingBuffer:
+    '''
+    # the latest <capacity> (timestamp, price, index price) of one venue, oldest first from head.
+        # timestamps only go forward, so asof() is a binary search over the ring without copying it.
+    '''
+    __slots__ = ("capacity", "timestamps", "prices", "indexes", "head", "size")
+
+    def __init__(
+        self: "_RingBuffer",
+        capacity: int,
+    ) -> None:
+        self.capacity: int = capacity
+        self.timestamps: List[int] = [0] * capacity
+        self.prices: List[float] = [math.nan] * capacity
+        self.indexes: List[float] = [math.nan] * capacity
+        self.head: int = 0  # slot of the next append
+        self.size: int = 0
+        return
+
+    @property
+    def last(self: "_RingBuffer") -> int:
+        """
+        func last():
+            - slot of the latest row, -1 when empty.
+        """
+        return (self.head - 1) % self.capacity if self.size else -1
+
+    def append(
+        self: "_RingBuffer",
+        timestamp: int,
+        price: float,
+        index: float,
+    ) -> bool:
+        """
+        func append():
+            - add the row, False for a row older than the latest one, which is dropped.
+        """
+        last: int = self.last
+        if last >= 0 and timestamp < self.timestamps[last]:
+            return False
+        slot: int = self.head
+        self.timestamps[slot], self.prices[slot], self.indexes[slot] = timestamp, price, index
+        self.head = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        return True
+
+    def asof(
+        self: "_RingBuffer",
+        timestamp: int,
+    ) -> int:
+        """
+        func asof():
+            - slot of the latest row at or before the timestamp, -1 when every row is after it.
+        """
+        start: int = (self.head - self.size) % self.capacity
+        low, high = 0, self.size
+        while low < high:
+            middle: int = (low + high) // 2
+            if self.timestamps[(start + middle) % self.capacity] <= timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return -1 if low == 0 else (start + low - 1) % self.capacity
+
+
+class BasisMonitor:
+    '''
+    # cross-exchange basis of MEXC against Binance, published as an IndexType.BASIS Index on every tick of either venue.
+        # MEXC: fair price and index price, Binance: mark price and index price, each stamped with the time of its exchange.
+        # every tick is joined as-of its timestamp with the latest row of the other venue, not older than max_staleness.
+        # the z-score and the lead-lag are sampled on a grid of sample_interval, so a burst of ticks weighs as much as a quiet second.
+        # a grid point is only sampled once both venues have rows past it and its lags, either way, i.e., no late row can change it.
+        # the lead-lag keeps, for every lag, an EWMA of the products of the MEXC returns and the lagged Binance returns.
+        # everything is updated in O(log capacity + len(lags)) per tick, nothing is recomputed over the history.
+    '''
+    def __init__(
+        self: "BasisMonitor",
+        pipeline_controller: PipelineController[Index] | None = None,
+        index_factory: IndexFactory | None = None,
+        mexc_symbol: str = "BTC_USDT",
+        binance_symbol: str = "BTCUSDT",
+        capacity: int = 4_096,
+        max_staleness: int = 3_000,  # ms
+        sample_interval: int = 1_000,  # ms
+        zscore_window: int = 300,  # samples
+        lags: Tuple[int, ...] = (-3_000, -2_000, -1_000, 0, 1_000, 2_000, 3_000),  # ms, positive when Binance leads
+        lead_lag_alpha: float = 0.02,  # weight of the latest sample in the lead-lag correlations
+    ) -> None:
+        self.pipeline_controller: PipelineController[Index] | None = pipeline_controller
+        self.index_factory: IndexFactory = index_factory if index_factory is not None else IndexFactory()
+        self.mexc_symbol: str = mexc_symbol
+        self.binance_symbol: str = binance_symbol
+        self.max_staleness: int = max_staleness
+        self.sample_interval: int = sample_interval
+        self.zscore_window: int = zscore_window
+        self.lags: np.ndarray = np.array(lags, dtype = np.int64)
+        self.lead_lag_alpha: float = lead_lag_alpha
+
+        self.lock: threading.Lock = threading.Lock()  # the venues push from their own websocket threads.
+        self.mexc: _RingBuffer = _RingBuffer(capacity)
+        self.binance: _RingBuffer = _RingBuffer(capacity)
+        self.mexc_fair: float = math.nan
+        self.mexc_index: float = math.nan
+
+        # grid samples of basis_bps for the z-score, with their running sums.
+        self.samples: List[float] = [math.nan] * zscore_window
+        self.sample_count: int = 0
+        self.sample_sum: float = 0.0
+        self.sample_squares: float = 0.0
+        self.next_sample: int | None = None
+
+        # EWMA of x * y, x * x and y * y per lag, x: MEXC return, y: lagged Binance return.
+        self.cross: np.ndarray = np.zeros(len(lags), dtype = np.float64)
+        self.mexc_variance: float = 0.0
+        self.binance_variance: np.ndarray = np.zeros(len(lags), dtype = np.float64)
+        self.lead_lag_samples: int = 0
+
+        self.latest_timestamp: int | None = None
+        self.latest_values: np.ndarray = np.full(len(BASIS_LAYOUT), np.nan)
+        return
+
+    @property
+    def latest(self: "BasisMonitor") -> IndexData:
+        """
+        func latest():
+            - the values last published, e.g., monitor.latest.get("zscore"), without the ones still NaN.
+        """
+        return IndexData(BASIS_LAYOUT, self.latest_values)
+
+    def subscribe(
+        self: "BasisMonitor",
+        mexc_ws: MexcFutureWebSocket,
+        binance_ws: BinanceFutureWebSocket,
+    ) -> "BasisMonitor":
+        mexc_ws.fair_price(callback = self.on_mexc_fair_price, param = dict(symbol = self.mexc_symbol))
+        mexc_ws.index_price(callback = self.on_mexc_index_price, param = dict(symbol = self.mexc_symbol))
+        binance_ws.mark_price(callback = self.on_binance_mark_price, symbol = self.binance_symbol)
+        return self
+
+    """
+    ####################################################################################################################
+    #                                                 Stream Callbacks                                                 #
+    ####################################################################################################################
+    """
+    def on_mexc_fair_price(
+        self: "BasisMonitor",
+        msg: dict,
+    ) -> None:
+        try:
+            with self.lock:
+                self.mexc_fair = float(msg["data"]["price"])
+                self.__on_mexc(int(msg["ts"]))
+        except (KeyError, TypeError, ValueError) as e:
+            operation_logger.warning(f"{__name__} - Unexpected fair price message: {msg} - {str(e)}")
+        return
+
+    def on_mexc_index_price(
+        self: "BasisMonitor",
+        msg: dict,
+    ) -> None:
+        try:
+            with self.lock:
+                self.mexc_index = float(msg["data"]["price"])
+                self.__on_mexc(int(msg["ts"]))
+        except (KeyError, TypeError, ValueError) as e:
+            operation_logger.warning(f"{__name__} - Unexpected index price message: {msg} - {str(e)}")
+        return
+
+    def on_binance_mark_price(
+        self: "BasisMonitor",
+        msg: dict,
+    ) -> None:
+        data: dict = msg.get("data") or msg
+        try:
+            with self.lock:
+                timestamp: int = int(data["E"])
+                if self.binance.append(timestamp, float(data["p"]), float(data.get("i", math.nan))):
+                    self.__on_tick(timestamp)
+        except (KeyError, TypeError, ValueError) as e:
+            operation_logger.warning(f"{__name__} - Unexpected mark price message: {msg} - {str(e)}")
+        return
+
+    def __on_mexc(
+        self: "BasisMonitor",
+        timestamp: int,
+    ) -> None:
+        # the fair price and the index price arrive apart, the row carries the latest of both.
+        if self.mexc_fair == self.mexc_fair and self.mexc.append(timestamp, self.mexc_fair, self.mexc_index):
+            self.__on_tick(timestamp)
+        return
+
+    """
+    ####################################################################################################################
+    #                                                     Per Tick                                                     #
+    ####################################################################################################################
+    """
+    def __on_tick(
+        self: "BasisMonitor",
+        timestamp: int,
+    ) -> None:
+        """
+        func __on_tick():
+            - sample the grid points the tick has closed, then publish the basis as-of the tick.
+        """
+        self.__sample_grid()
+
+        mexc: int = self.mexc.asof(timestamp)
+        binance: int = self.binance.asof(timestamp)
+        if mexc < 0 or binance < 0:
+            return None
+        if timestamp - min(self.mexc.timestamps[mexc], self.binance.timestamps[binance]) > self.max_staleness:
+            return None
+
+        basis_bps: float = self.__basis_bps(mexc, binance)
+        mark: float = self.binance.prices[binance]
+        values: np.ndarray = np.array((
+            self.mexc.prices[mexc] - mark,
+            basis_bps,
+            (self.mexc.indexes[mexc] / self.binance.indexes[binance] - 1.0) * 10_000,
+            self.__zscore(basis_bps),
+            *self.__lead_lag(),
+        ), dtype = np.float64)
+        self.__publish(timestamp, values)
+        return None
+
+    def __basis_bps(
+        self: "BasisMonitor",
+        mexc: int,
+        binance: int,
+    ) -> float:
+        return (self.mexc.prices[mexc] / self.binance.prices[binance] - 1.0) * 10_000
+
+    def __zscore(
+        self: "BasisMonitor",
+        basis_bps: float,
+    ) -> float:
+        count: int = min(self.sample_count, self.zscore_window)
+        if count < 2:
+            return math.nan
+        mean: float = self.sample_sum / count
+        variance: float = self.sample_squares / count - mean * mean
+        return (basis_bps - mean) / math.sqrt(variance) if variance > 1e-12 else math.nan
+
+    def __lead_lag(
+        self: "BasisMonitor",
+    ) -> Tuple[float, float]:
+        if self.lead_lag_samples < 2:
+            return math.nan, math.nan
+        denominator: np.ndarray = np.sqrt(self.mexc_variance * self.binance_variance)
+        correlations: np.ndarray = np.divide(self.cross, denominator, out = np.full_like(self.cross, np.nan), where = denominator > 0)
+        if np.isnan(correlations).all():
+            return math.nan, math.nan
+        best: int = int(np.nanargmax(correlations))
+        return float(self.lags[best]), float(correlations[best])
+
+    def __sample_grid(
+        self: "BasisMonitor",
+    ) -> None:
+        """
+        func __sample_grid():
+            - sample every grid point both venues have closed, including its lags, a negative lag reads Binance after the point.
+        """
+        if not self.mexc.size or not self.binance.size:
+            return None
+        horizon: int = min(self.mexc.timestamps[self.mexc.last], self.binance.timestamps[self.binance.last]) - int(np.abs(self.lags).max(initial = 0))
+        if self.next_sample is None:
+            self.next_sample = horizon - horizon % self.sample_interval + self.sample_interval
+        elif horizon - self.next_sample > self.zscore_window * self.sample_interval:
+            # a gap longer than the window, the samples in it would all be the same stale rows.
+            self.next_sample = horizon - horizon % self.sample_interval
+        while self.next_sample <= horizon:
+            self.__sample(self.next_sample)
+            self.next_sample += self.sample_interval
+        return None
+
+    def __sample(
+        self: "BasisMonitor",
+        point: int,
+    ) -> None:
+        mexc: int = self.mexc.asof(point)
+        binance: int = self.binance.asof(point)
+        if mexc < 0 or binance < 0 or point - min(self.mexc.timestamps[mexc], self.binance.timestamps[binance]) > self.max_staleness:
+            return None
+
+        # running sums of the z-score window, the sample falling out of it is subtracted.
+        basis_bps: float = self.__basis_bps(mexc, binance)
+        slot: int = self.sample_count % self.zscore_window
+        dropped: float = self.samples[slot]
+        if dropped == dropped:
+            self.sample_sum -= dropped
+            self.sample_squares -= dropped * dropped
+        self.samples[slot] = basis_bps
+        self.sample_sum += basis_bps
+        self.sample_squares += basis_bps * basis_bps
+        self.sample_count += 1
+
+        previous: int = self.mexc.asof(point - self.sample_interval)
+        if previous < 0:
+            return None
+        x: float = math.log(self.mexc.prices[mexc] / self.mexc.prices[previous])
+        y: np.ndarray = np.full(len(self.lags), np.nan)
+        for offset, lag in enumerate(self.lags):
+            now, before = self.binance.asof(point - int(lag)), self.binance.asof(point - int(lag) - self.sample_interval)
+            if now >= 0 and before >= 0:
+                y[offset] = math.log(self.binance.prices[now] / self.binance.prices[before])
+        y = np.nan_to_num(y)
+        alpha: float = self.lead_lag_alpha
+        self.cross += alpha * (x * y - self.cross)
+        self.mexc_variance += alpha * (x * x - self.mexc_variance)
+        self.binance_variance += alpha * (y * y - self.binance_variance)
+        self.lead_lag_samples += 1
+        return None
+
+    def __publish(
+        self: "BasisMonitor",
+        timestamp: int,
+        values: np.ndarray,
+    ) -> None:
+        self.latest_timestamp, self.latest_values = timestamp, values
+        index: Index | None = self.index_factory.generate_index({
+            "timestamp": timestamp,
+            "type": IndexType.BASIS,
+            "data": values,
+            "layout": BASIS_LAYOUT,
+        })
+        if index is not None and self.pipeline_controller is not None:
+            self.pipeline_controller.push(index)
+        return None
@@ -1,6 +1,6 @@
 # Standard Module
 import time
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 from h11 import Data
 import pandas as pd
 import numpy as np
@@ -11,8 +11,13 @@ from queue import Queue
 from mexc.future import FutureWebSocket
 from logger.set_logger import operation_logger
 from manager.data_saver import DataSaver
-from object.constants import MA_WRITE_PERIODS, IndexType
-from object.indexes import Index
+from manager.market_data_store import MarketDataStore
+from object.constants import IndexType
+from object.indexes import Index, IndexLayout, IndexPool
+from analysis.registry import IndicatorRegistry
+from sdk.clock_sync import ClockSync
+from telemetry.metrics import metrics
+from telemetry.tracing import TRACE_KEY, Stage, TraceContext, tracer
 from pipeline.data_pipeline import DataPipeline
 from interface.pipeline_interface import PipelineController
 
@@ -43,22 +48,37 @@ class IndexFactory:
     def __init__(
         self: "IndexFactory",
         # index: Dict[str, int | IndexType | Dict[int, float]],
+        pool: IndexPool | None = None,
     ) -> None:
+        # free-list for the hot path, Index objects are recycled instead of allocated when it is given.
+        self.pool: IndexPool | None = pool
         return
 
     def generate_index(
         self: "IndexFactory",
-        index: Dict[str, int | IndexType | Dict[int, float]],
+        index: Dict[str, int | IndexType | IndexLayout | Dict[int, float] | np.ndarray | float],
     ) -> Index | None:
         timestamp: int = index.get("timestamp", IndexFactory.generate_timestamp())
+        trace: TraceContext | None = index.get("trace", None)
         index_type: IndexType | None = index.get("type", None)
-        data: Dict[int, float] | None = index.get("data", None)
-
-        if (index_type and data):
+        data: Dict[int, float] | np.ndarray | float | None = index.get("data", None)
+        layout: IndexLayout | None = index.get("layout", None)  # None -> the default layout of the index type.
+
+        if (index_type and data is not None):
+            if self.pool is not None and isinstance(data, np.ndarray):
+                return self.pool.acquire(
+                    timestamp = timestamp,
+                    index_type = index_type,
+                    values = data,
+                    layout = layout,
+                    trace = trace,
+                )
             return Index(
                 timestamp = timestamp,
                 index_type = index_type,
                 data = data,
+                layout = layout,
+                trace = trace,
             )
         else:
             return None
@@ -94,6 +114,10 @@ class DataCollectorAndProcessor:
         websocket: FutureWebSocket,  # assume that only fetches the price data.
         index_factory: IndexFactory = IndexFactory(),  # dependency injection would work.
         memory_count_limit: int = 2_000,
+        market_data_store: MarketDataStore | None = None,
+        symbol: str = "BTC_USDT",
+        indicator_registry: IndicatorRegistry | None = None,
+        clock: ClockSync | None = None,
     ) -> None:
         """
         func __init__() for StrategyManager
@@ -109,6 +133,15 @@ class DataCollectorAndProcessor:
             - class object
         params pipeline
             - pipeline to transmit the data to the StrategyManager.
+        params market_data_store
+            - if given, the rows trimmed from the Price DataFrame are recorded to the store.
+        params symbol
+            - symbol of the ticker data, used as the partition key of the store.
+        params indicator_registry
+            - streaming indicators fed with every tick, only the subscribed ones are computed.
+            - if not given, SMA, EMA and PRICE are subscribed as before.
+        params clock
+            - clock of the exchange which stamps the ticker data, used for the exchange-to-us latency of every tick.
 
         return None
 
@@ -119,10 +152,34 @@ class DataCollectorAndProcessor:
         self.ws: FutureWebSocket = websocket
         self._ma_period: int = 20  # ! No need to be here I think.
         self._memory_saver: DataSaver = DataSaver()  # can be here.
+        self._market_data_store: MarketDataStore | None = market_data_store
+        self.symbol: str = symbol
         self._df_size_limit: int = memory_count_limit
         self.threads: list[threading.Thread] = list()
         self.pipeline_controller: PipelineController[Index] = pipeline_controller
         self.__index_factory: IndexFactory = index_factory
+        if indicator_registry is None:
+            indicator_registry = IndicatorRegistry.default(
+                subscriptions = IndexType.SMA | IndexType.EMA | IndexType.PRICE,
+            )
+        self.indicator_registry: IndicatorRegistry = indicator_registry
+
+        # exchange-to-us latency of the ticks in ms, reset every time it is logged.
+        self._clock: ClockSync | None = clock
+        self.latency_lock: threading.Lock = threading.Lock()
+        self.tick_latency: Dict[str, float] = dict(count = 0, total = 0.0, max = 0.0, last = 0.0)
+
+        # per-tick metrics, the children are resolved once so that a tick only pays for the increment.
+        self.__ticks_received = metrics.counter(
+            "ticks_received_total", "Ticker messages put into the price buffer.", ("symbol",),
+        ).labels(symbol = symbol)
+        self.__tick_latency_ms = metrics.histogram(
+            "tick_exchange_latency_ms", "Time between the exchange stamping a tick and its processing, in ms.", ("symbol",),
+            buckets = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500),
+        ).labels(symbol = symbol)
+
+        # trace of the latest tick fed to the registry, handed over to the next snapshot of the indexes.
+        self.__latest_trace: TraceContext | None = None
 
         # wait till WebSocket set up is done
         time.sleep(1)
@@ -297,8 +354,14 @@ class DataCollectorAndProcessor:
         return None
         """
         try:
+            data: dict | None = msg.get("data")
+            trace: TraceContext | None = msg.get(TRACE_KEY)
+            if trace is not None and isinstance(data, dict):
+                data[TRACE_KEY] = trace.mark(Stage.TICK_BUFFERED)
+            self.__ticks_received.inc()
+
             self.price_fetch_buffer.put(
-                msg.get("data"),
+                data,
                 block = False,
                 timeout = None,
             )
@@ -333,8 +396,13 @@ class DataCollectorAndProcessor:
                     self._get_data_buffer()
                 )  # data from the data buffer
                 if response:
+                    trace: TraceContext | None = response.pop(TRACE_KEY, None)
+                    if trace is not None:
+                        trace.mark(Stage.TICK_DEQUEUED)
+
                     # TODO: store 'riseFallRates' and 'riseFallRatesTimezone'
-                    # timestamp = response["timestamp"]
+                    if self._clock is not None and response.get("timestamp") is not None:
+                        self.__record_latency(self._clock.latency_ms(response["timestamp"]))
 
                     # make `the data, dictionary, into the pandas dataframe.
                     tmp = pd.DataFrame(
@@ -348,12 +416,31 @@ class DataCollectorAndProcessor:
                     with self.df_lock:
                         self.price_data = pd.concat([self.price_data, tmp], axis = 0)
 
+                    # O(1) update of the subscribed indicators, no rescan of the DataFrame.
+                    fair_price: float | None = response.get("fairPrice")
+                    if fair_price is not None:
+                        self.indicator_registry.update(float(fair_price))
+                        if trace is not None:
+                            self.__latest_trace = trace.mark(Stage.INDICATOR_UPDATED)
+
             except Exception as e:
                 operation_logger.critical(
                     f'Unexpected Error Occurred in function "_price_data_fetch": {e}'
                 )
         return
 
+    def __record_latency(
+        self: 'DataCollectorAndProcessor',
+        latency: float,
+    ) -> None:
+        self.__tick_latency_ms.observe(latency)
+        with self.latency_lock:
+            self.tick_latency["count"] += 1
+            self.tick_latency["total"] += latency
+            self.tick_latency["max"] = max(self.tick_latency["max"], latency)
+            self.tick_latency["last"] = latency
+        return
+
     def _get_data_buffer(
         self: 'DataCollectorAndProcessor',
     ) -> dict | None:
@@ -419,31 +506,15 @@ class DataCollectorAndProcessor:
     ) -> None:
         """
         func _push_moving_averages():
-            - call the function __calculate_ema_sma_price() to calculate the EMA and SMA
-            - get tuple of data where:
-                - data[0] = SMA values
-                - data[1] = EMA values
+            - call the function __snapshot_indexes() to read the subscribed indicators.
             - when the data is available, push the data to the data pipeline.
         """
-        # TODO: Need to change this.
         while True:
-            data: (
-                Tuple[
-                    Dict[int, float],
-                    Dict[int, float],
-                    Dict[int, float],
-                ] | None
-            ) = self.__calculate_ema_sma_price()
+            data: List[Dict[str, int | IndexType | IndexLayout | np.ndarray]] | None = self.__snapshot_indexes()
 
             if data:
-                sma_values: Index = self.__index_factory.generate_index(data[0])
-                ema_values: Index = self.__index_factory.generate_index(data[1])
-                price: Index = self.__index_factory.generate_index(data[2])
-
                 indexes: list[Index, ] = [
-                    sma_values,
-                    ema_values,
-                    price
+                    self.__index_factory.generate_index(index) for index in data
                 ]
 
                 # TODO: need to change -> other wrapper which can get the result and push to the data pipeline.
@@ -452,80 +523,45 @@ class DataCollectorAndProcessor:
             time.sleep(2)
         return
 
-    def __calculate_ema_sma_price(
+    def __snapshot_indexes(
         self: 'DataCollectorAndProcessor',
-        periods: Tuple[int, ...] = MA_WRITE_PERIODS,  # this will be just used. -> just default input.
-    ) -> tuple[dict[str, float | int | IndexType]] | None:
+    ) -> List[Dict[str, int | IndexType | IndexLayout | np.ndarray]] | None:
         """
-        # TODO: make a separate class fo this.
-        func __calculate_ema_sma_price():
-            - It calculate the Simple Moving Average (SMA) and Exponential Moving Average (EMA) of the lastPrice.
+        func __snapshot_indexes():
+            - read the current values of every subscribed indicator of the registry.
 
         params self: DataCollectorAndProcessor
             - class object
-        params periods: Tuple[int]
-            - periods for the calculation of the SMA and EMA
 
-        return (smas, emas): Tuple[Tuple[float], Tuple[float]] | None
-            - Tuple of SMA and EMA values
+        return List[Dict[str, int | IndexType | IndexLayout | np.ndarray]] | None
+            - one Index payload per subscribed IndexType, None before the first tick.
+            - values are float64 arrays aligned to the layout, NaN for the periods without enough data.
         """
         try:
-            with self.df_lock:
-                if self.price_data.shape[0] == 0:
-                    return None
-                tmp_dataframe = self.price_data[-periods[-1] :]["fairPrice"].copy()
-
-            sma:   Dict[int, float] = dict()  # oh.. make the dictionary object and put it.
-            ema:   Dict[int, float] = dict()
-            price: float = tmp_dataframe.iloc[-1]  # just last price data.
-
-            # TODO: this should be fast enough, but can be optimized further.
-            for period in periods:
-                window = tmp_dataframe.tail(period)
-                if len(window) < period:
-                    break
-                sma[period * 2] = float(window.mean())
-                ema[period * 2] = float(window.ewm(span = period, adjust = False).mean().iloc[-1])
+            snapshot = self.indicator_registry.snapshot()
+            if not snapshot:
+                return None
 
-            timestamp: int = DataCollectorAndProcessor.generate_timestamp()
-
-            smas: Dict[str, float | IndexType | Dict[int, float]] = {
-                "data": sma,
-                "timestamp": timestamp,
-                "type": IndexType.SMA,
-            }
+            # every Index of the snapshot carries the trace of the latest tick, a tick is published only once.
+            trace: TraceContext | None = self.__latest_trace
+            self.__latest_trace = None
 
-            emas: Dict[str, float | IndexType | Dict[int, float]] = {
-                "data": ema,
-                "timestamp": timestamp,
-                "type": IndexType.EMA,
-            }
-
-            price: Dict[str, float | IndexType | Dict[int, float]] = {
-                "data": price,
-                "timestamp": timestamp,
-                "type": IndexType.PRICE,
-            }
-
-            return smas, emas, price
-
-        except KeyError as e:
-            # Specific error handling for KeyError, i.e., missing collumn
-            operation_logger.error(
-                f"{__name__}: function {self.__class__.__name__}.__calculate_ema_sma_price has raised the KeyError: {e}"
-            )
-            return None
-
-        except IndexError as e:
-            # Specific error handling for IndexError, i.e., out of range and slicing of the DataFrame.
-            operation_logger.error(
-                f"{__name__}: function {self.__class__.__name__}.__calculate_ema_sma_price has raised the IndexError: {e}"
-            )
-            return None
+            timestamp: int = DataCollectorAndProcessor.generate_timestamp()
+            return [
+                {
+                    "data": values,
+                    "timestamp": timestamp,
+                    "type": index_type,
+                    "layout": layout,
+                    "trace": trace,
+                }
+                for index_type, layout, values in snapshot
+                if not np.isnan(values).all()
+            ] or None
 
         except Exception as e:
             operation_logger.warning(
-                f"{__name__}: function {self.__class__.__name__}.__calculate_ema_sma_price has has raised the Unknown Exception - {str(e)}."
+                f"{__name__}: function {self.__class__.__name__}.__snapshot_indexes has raised the Unknown Exception - {str(e)}."
             )
             return None
 
@@ -566,13 +602,35 @@ class DataCollectorAndProcessor:
                                 f"{__name__} - Data Saver has not cleaned up the self.price_data, since the data size is below the threshold: {self.price_data.shape[0]}"
                             )
 
-                    # TODO: add the proper database.
-                    # Disable the .csv generation for now.
+                    # Disable the .csv generation for now, the trimmed rows go to the memory-mapped tick store.
                     # if data is not None:
                     #     self._memory_saver.write(data)
-                    #     operation_logger.info(
-                    #         f"{__name__} - Data Saver has stored the recent price data: size: {data.shape[0]} rows and {data.shape[1]} columns"
-                    #     )
+                    if data is not None and self._market_data_store is not None:
+                        written: int = self._market_data_store.write(self.symbol, data)
+                        operation_logger.info(
+                            f"{__name__} - Market Data Store has recorded {written} rows of {self.symbol}."
+                        )
+
+                    with self.latency_lock:
+                        count: int = int(self.tick_latency["count"])
+                        if count:
+                            operation_logger.info(
+                                f"{__name__} - Tick latency (ms) over {count} ticks: mean={self.tick_latency['total'] / count:.1f}, max={self.tick_latency['max']:.1f}"
+                            )
+                        self.tick_latency.update(count = 0, total = 0.0, max = 0.0)
+
+                    # per-node cost of the indicator graph, mean in microseconds.
+                    timings: Dict[str, Dict[str, float]] = self.indicator_registry.timings()
+                    operation_logger.info(
+                        f"{__name__} - Indicator timings (us): " + ", ".join(f"{name}={timing['mean_ns'] / 1_000:.2f}" for name, timing in timings.items())
+                    )
+
+                    # tick-to-order latency per stage, since the last report.
+                    for name, latency in tracer.report().items():
+                        operation_logger.info(
+                            f"{__name__} - Trace {name} (us) over {latency['count']}: p50={latency['p50']}, p99={latency['p99']}, p999={latency['p999']}, max={latency['max']}"
+                        )
+                    tracer.reset()
 
                     curr_timestamp = DataCollectorAndProcessor.generate_timestamp()
             except Exception as e:
@@ -631,6 +689,8 @@ class DataCollectorAndProcessor:
         try:
             for index in indexes:
                 if (index):
+                    if index.trace is not None:
+                        index.trace.mark_once(Stage.INDEX_PUBLISHED)
                     self.pipeline_controller.push(index)
             return True
         except Exception as e:
@@ -0,0 +1,361 @@
+# Standard Library
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+# Third-party Library
+import numpy as np
+import pandas as pd
+
+# Custom Library
+from logger.set_logger import operation_logger
+
+
+'''
+# Numeric ticker columns recorded on disk.
+# Every record is stored as (timestamp: int64, <column>: float64, ...) in a fixed-width binary layout.
+'''
+TICK_COLUMNS: Tuple[str, ...] = (
+    "lastPrice",
+    "fairPrice",
+    "indexPrice",
+    "bid1",
+    "ask1",
+    "maxBidPrice",
+    "minAskPrice",
+    "lower24Price",
+    "high24Price",
+    "volume24",
+    "amount24",
+    "holdVol",
+    "riseFallRate",
+    "riseFallValue",
+    "fundingRate",
+)
+
+
+class MarketDataStore:
+    '''
+    Append-only, memory-mapped tick store with a time-range query API.
+
+    directory layout:
+        <root>/<symbol>/catalog.json      -> per-file min/max timestamp and record count.
+        <root>/<symbol>/<YYYYMMDD>.ticks  -> fixed-width binary records, sorted by timestamp.
+        <root>/<symbol>/<YYYYMMDD>.sidx   -> sparse index, timestamp of every <index_stride>-th record.
+
+    - read() selects the day files from the catalog, binary-searches the sparse index
+      and then only the <index_stride> records around each bound, so a query never scans a day file.
+    '''
+    @staticmethod
+    def generate_timestamp() -> int:
+        return int(time.time() * 1_000)
+
+    @staticmethod
+    def day_key(timestamp: int) -> str:
+        """
+        static func day_key():
+            - UTC day partition of the given epoch timestamp in ms, e.g., "20250101".
+        """
+        return time.strftime("%Y%m%d", time.gmtime(timestamp // 1_000))
+
+    def __init__(
+        self: "MarketDataStore",
+        root_dir: str | None = None,
+        columns: Sequence[str] = TICK_COLUMNS,
+        index_stride: int = 256,
+    ) -> None:
+        """
+        func __init__():
+            - set up the root directory and the record layout of the store.
+
+        param root_dir: str | None
+            - directory to store the data, default is 'src/data/market'.
+        param columns: Sequence[str]
+            - numeric columns to be recorded next to the timestamp.
+        param index_stride: int
+            - one sparse index entry is kept per <index_stride> records.
+        """
+        if root_dir is None:
+            root_dir = os.path.join(
+                os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
+                "data",
+                "market",
+            )
+        self.root_dir: str = root_dir
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.index_stride: int = index_stride
+        self.dtype: np.dtype = np.dtype(
+            [("timestamp", "<i8")] + [(column, "<f8") for column in self.columns]
+        )
+
+        self._lock: threading.Lock = threading.Lock()
+        # symbol -> {day_key: {"min": int, "max": int, "count": int}}
+        self._catalogs: Dict[str, Dict[str, Dict[str, int]]] = dict()
+        # path -> (record count, memmap)
+        self._memmaps: Dict[str, Tuple[int, np.memmap]] = dict()
+        return
+
+    """
+    ######################################################################################################################
+    #                                                   Path & Catalog                                                   #
+    ######################################################################################################################
+    """
+    def _symbol_dir(self: "MarketDataStore", symbol: str) -> str:
+        return os.path.join(self.root_dir, symbol)
+
+    def _data_path(self: "MarketDataStore", symbol: str, day: str) -> str:
+        return os.path.join(self._symbol_dir(symbol), f"{day}.ticks")
+
+    def _index_path(self: "MarketDataStore", symbol: str, day: str) -> str:
+        return os.path.join(self._symbol_dir(symbol), f"{day}.sidx")
+
+    def _catalog(self: "MarketDataStore", symbol: str) -> Dict[str, Dict[str, int]]:
+        """
+        func _catalog():
+            - get the catalog of the symbol, loading it from the disk on the first access.
+            - caller must hold self._lock.
+        """
+        catalog: Dict[str, Dict[str, int]] | None = self._catalogs.get(symbol)
+        if catalog is None:
+            catalog_path: str = os.path.join(self._symbol_dir(symbol), "catalog.json")
+            try:
+                with open(catalog_path, "r", encoding = "utf-8") as file:
+                    catalog = json.load(file)
+            except FileNotFoundError:
+                catalog = dict()
+            self._catalogs[symbol] = catalog
+        return catalog
+
+    def _save_catalog(self: "MarketDataStore", symbol: str) -> None:
+        catalog_path: str = os.path.join(self._symbol_dir(symbol), "catalog.json")
+        tmp_path: str = f"{catalog_path}.tmp"
+        with open(tmp_path, "w", encoding = "utf-8") as file:
+            json.dump(self._catalogs[symbol], file)
+        os.replace(tmp_path, catalog_path)  # atomic swap, readers never see a half-written catalog.
+        return
+
+    """
+    ######################################################################################################################
+    #                                                       Write                                                        #
+    ######################################################################################################################
+    """
+    def to_records(
+        self: "MarketDataStore",
+        data: pd.DataFrame,
+    ) -> np.ndarray:
+        """
+        func to_records():
+            - convert the price DataFrame, indexed by timestamp, into the on-disk record layout.
+            - missing or non-numeric columns are stored as NaN.
+        """
+        records: np.ndarray = np.empty(len(data), dtype = self.dtype)
+        records["timestamp"] = np.asarray(data.index, dtype = "int64")
+        for column in self.columns:
+            if column in data.columns:
+                records[column] = pd.to_numeric(data[column], errors = "coerce").to_numpy(dtype = "float64")
+            else:
+                records[column] = np.nan
+        return records
+
+    def write(
+        self: "MarketDataStore",
+        symbol: str,
+        data: pd.DataFrame | np.ndarray,
+    ) -> int:
+        """
+        func write():
+            - append the records to the day files of the symbol.
+            - records older than the latest record of the target day file are dropped, to keep the file sorted.
+
+        param symbol: str
+            - symbol of the records, e.g., "BTC_USDT".
+        param data: pd.DataFrame | np.ndarray
+            - DataFrame indexed by timestamp, or an array with the store's record dtype.
+
+        return int
+            - the number of records written.
+        """
+        try:
+            records: np.ndarray = data if isinstance(data, np.ndarray) else self.to_records(data)
+            if records.shape[0] == 0:
+                return 0
+
+            records = records[np.argsort(records["timestamp"], kind = "stable")]
+            days: np.ndarray = records["timestamp"] // 86_400_000  # UTC day number
+            boundaries: np.ndarray = np.flatnonzero(np.diff(days)) + 1
+
+            written: int = 0
+            with self._lock:
+                os.makedirs(self._symbol_dir(symbol), exist_ok = True)
+                for chunk in np.split(records, boundaries):
+                    written += self.__append_day(symbol, chunk)
+                self._save_catalog(symbol)
+            return written
+
+        except (OSError, ValueError, TypeError) as e:
+            operation_logger.error(
+                f"{__name__} - MarketDataStore.write(): fail to store the records of {symbol}: {str(e)}"
+            )
+            return 0
+
+    def __append_day(
+        self: "MarketDataStore",
+        symbol: str,
+        records: np.ndarray,
+    ) -> int:
+        """
+        func __append_day():
+            - append the sorted records of a single day to its file and extend the sparse index.
+            - caller must hold self._lock.
+        """
+        day: str = MarketDataStore.day_key(int(records["timestamp"][0]))
+        entry: Dict[str, int] = self._catalog(symbol).setdefault(
+            day, {"min": int(records["timestamp"][0]), "max": -1, "count": 0}
+        )
+
+        stale: int = int(np.searchsorted(records["timestamp"], entry["max"], side = "left"))
+        if stale:
+            operation_logger.warning(
+                f"{__name__} - MarketDataStore: dropped {stale} out-of-order records of {symbol} on {day}."
+            )
+            records = records[stale:]
+        if records.shape[0] == 0:
+            return 0
+
+        start: int = entry["count"]
+        with open(self._data_path(symbol, day), "ab") as file:
+            records.tofile(file)
+
+        # sparse index entries at every multiple of the stride covered by this chunk.
+        first: int = -(-start // self.index_stride) * self.index_stride
+        positions: np.ndarray = np.arange(first, start + records.shape[0], self.index_stride) - start
+        if positions.shape[0]:
+            with open(self._index_path(symbol, day), "ab") as file:
+                records["timestamp"][positions].astype("<i8").tofile(file)
+
+        entry["count"] = start + int(records.shape[0])
+        entry["max"] = int(records["timestamp"][-1])
+        return int(records.shape[0])
+
+    """
+    ######################################################################################################################
+    #                                                        Read                                                        #
+    ######################################################################################################################
+    """
+    def _open(
+        self: "MarketDataStore",
+        symbol: str,
+        day: str,
+        count: int,
+    ) -> np.memmap:
+        """
+        func _open():
+            - memory-map the day file, re-mapping it only when the file has grown since the last mapping.
+            - caller must hold self._lock.
+        """
+        path: str = self._data_path(symbol, day)
+        cached: Tuple[int, np.memmap] | None = self._memmaps.get(path)
+        if cached is None or cached[0] != count:
+            cached = (count, np.memmap(path, dtype = self.dtype, mode = "r", shape = (count,)))
+            self._memmaps[path] = cached
+        return cached[1]
+
+    def _locate(
+        self: "MarketDataStore",
+        timestamps: np.ndarray,
+        sparse_index: np.ndarray,
+        target: int,
+    ) -> int:
+        """
+        func _locate():
+            - index of the first record whose timestamp is >= target.
+            - the sparse index narrows the search to a single stride of records.
+        """
+        block: int = int(np.searchsorted(sparse_index, target, side = "left"))
+        lo: int = max(block - 1, 0) * self.index_stride
+        hi: int = min(block * self.index_stride, timestamps.shape[0])
+        return lo + int(np.searchsorted(timestamps[lo:hi], target, side = "left"))
+
+    def read(
+        self: "MarketDataStore",
+        symbol: str,
+        start_ms: int,
+        end_ms: int,
+        columns: Sequence[str] | None = None,
+        as_frame: bool = False,
+    ) -> Dict[str, np.ndarray] | pd.DataFrame:
+        """
+        func read():
+            - get the records of the symbol in the time range [start_ms, end_ms).
+
+        param symbol: str
+        param start_ms: int
+            - inclusive lower bound, epoch in ms.
+        param end_ms: int
+            - exclusive upper bound, epoch in ms.
+        param columns: Sequence[str] | None
+            - columns to be returned, default is every column.
+        param as_frame: bool
+            - if True, return a DataFrame indexed by timestamp.
+
+        return Dict[str, np.ndarray]
+            - column name -> array; "timestamp" is always included.
+            - a range inside a single day file is returned as views of the memory map,
+              so pages are only loaded when the arrays are accessed.
+        return pd.DataFrame
+            - when as_frame is True.
+        """
+        fields: List[str] = ["timestamp"] + [
+            column for column in (self.columns if columns is None else columns) if column != "timestamp"
+        ]
+        unknown: List[str] = [column for column in fields if column not in self.dtype.names]
+        if unknown:
+            raise KeyError(f"Unknown columns for MarketDataStore.read(): {unknown}")
+
+        parts: List[np.ndarray] = list()
+        with self._lock:
+            catalog: Dict[str, Dict[str, int]] = self._catalog(symbol)
+            for day in sorted(catalog):
+                entry: Dict[str, int] = catalog[day]
+                if entry["count"] == 0 or entry["max"] < start_ms or entry["min"] >= end_ms:
+                    continue
+
+                records: np.memmap = self._open(symbol, day, entry["count"])
+                sparse_index: np.ndarray = np.fromfile(self._index_path(symbol, day), dtype = "<i8")
+                timestamps: np.ndarray = records["timestamp"]
+
+                lo: int = 0 if entry["min"] >= start_ms else self._locate(timestamps, sparse_index, start_ms)
+                hi: int = entry["count"] if entry["max"] < end_ms else self._locate(timestamps, sparse_index, end_ms)
+                if hi > lo:
+                    parts.append(records[lo:hi])
+
+        if not parts:
+            result: Dict[str, np.ndarray] = {field: np.empty(0, dtype = self.dtype[field]) for field in fields}
+        elif len(parts) == 1:
+            result = {field: parts[0][field] for field in fields}
+        else:
+            result = {field: np.concatenate([part[field] for part in parts]) for field in fields}
+
+        if as_frame:
+            frame: pd.DataFrame = pd.DataFrame(
+                {field: result[field] for field in fields[1:]},
+                index = pd.Index(result["timestamp"], name = "timestamp"),
+            )
+            return frame
+        return result
+
+    def time_range(
+        self: "MarketDataStore",
+        symbol: str,
+    ) -> Tuple[int, int] | None:
+        """
+        func time_range():
+            - (first, last) timestamp recorded for the symbol, or None if nothing is recorded.
+        """
+        with self._lock:
+            entries = [entry for entry in self._catalog(symbol).values() if entry["count"]]
+        if not entries:
+            return None
+        return min(entry["min"] for entry in entries), max(entry["max"] for entry in entries)
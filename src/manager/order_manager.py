@@ -0,0 +1,460 @@
+# Standard Library
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Custom Library
+from binance.future import FutureMarket as BinanceFutureMarket
+from logger.set_logger import operation_logger
+from sdk.signer import EncodedQuery
+from telemetry.metrics import metrics
+
+
+# every state an order enters, the orders rejected by the exchange included.
+ORDER_STATES = metrics.counter(
+    "oms_order_states_total",
+    "Orders of the OrderManager by the state they have entered.",
+    ("state",),
+)
+
+
+class OrderState(Enum):
+    PENDING_NEW = "PENDING_NEW"  # sent, no answer yet
+    UNKNOWN = "UNKNOWN"  # the answer has been lost and the exchange could not tell, see OrderManager.reconcile()
+    NEW = "NEW"
+    PARTIALLY_FILLED = "PARTIALLY_FILLED"
+    FILLED = "FILLED"
+    CANCELED = "CANCELED"
+    EXPIRED = "EXPIRED"
+    REJECTED = "REJECTED"
+
+
+# an update never moves an order back, e.g., a late NEW after the FILLED of the user data stream.
+_RANK: Dict[OrderState, int] = {
+    OrderState.PENDING_NEW: 0,
+    OrderState.UNKNOWN: 0,
+    OrderState.NEW: 1,
+    OrderState.PARTIALLY_FILLED: 2,
+    OrderState.FILLED: 3,
+    OrderState.CANCELED: 3,
+    OrderState.EXPIRED: 3,
+    OrderState.REJECTED: 3,
+}
+OPEN_STATES = (OrderState.PENDING_NEW, OrderState.UNKNOWN, OrderState.NEW, OrderState.PARTIALLY_FILLED)
+
+
+class ManagedOrder:
+    '''
+    # one order of the OrderManager, keyed by the newClientOrderId it is sent with.
+        # role and parent tie the legs together, e.g., the "sl" and "tp" orders of an "entry".
+    '''
+    __slots__ = (
+        "client_order_id", "symbol", "side", "type", "quantity", "stop_price", "role", "parent",
+        "state", "order_id", "executed_qty", "avg_price", "updated", "attempts", "error",
+    )
+
+    def __init__(
+        self: "ManagedOrder",
+        client_order_id: str,
+        symbol: str,
+        side: str,
+        type: str,
+        quantity: float | None = None,
+        stop_price: float | None = None,
+        role: str | None = None,
+        parent: str | None = None,
+    ) -> None:
+        self.client_order_id: str = client_order_id
+        self.symbol: str = symbol
+        self.side: str = side
+        self.type: str = type
+        self.quantity: float | None = quantity
+        self.stop_price: float | None = stop_price
+        self.role: str | None = role
+        self.parent: str | None = parent
+
+        self.state: OrderState = OrderState.PENDING_NEW
+        self.order_id: int | None = None  # orderId of the exchange
+        self.executed_qty: float = 0.0
+        self.avg_price: float = 0.0
+        self.updated: int = 0  # ms, the time of the exchange of the latest update
+        self.attempts: int = 0  # requests sent with the client_order_id
+        self.error: int | None = None  # code of the rejection of the exchange, e.g., -2022
+        return
+
+    @property
+    def is_open(self: "ManagedOrder") -> bool:
+        return self.state in OPEN_STATES
+
+    def __repr__(self: "ManagedOrder") -> str:
+        return f"ManagedOrder({self.client_order_id}, {self.symbol}, {self.side}, {self.type}, {self.state.value})"
+
+
+class OrderManager:
+    '''
+    # in-memory own-order management of the Binance futures orders.
+        # every order gets a generated newClientOrderId and goes through the OrderState machine,
+        # updated from the REST responses and the ORDER_TRADE_UPDATE events of the user data stream.
+        # the orders are indexed by client id, orderId, symbol and state, every lookup is a dict access.
+
+    # an order is sent once, it is never sent again by itself:
+        # the exchange only refuses a duplicated client id among the open orders, so a MARKET order which lands
+        # after its lost response and fills at once would not stop a second one sent under the same client id.
+        # a lost response is followed by query_order(), which finds the order if it has made it by then,
+        # otherwise the order stays UNKNOWN, until an update of the user data stream or reconcile() settles it.
+
+    - the closed orders are kept up to max_closed, the oldest are forgotten first.
+    '''
+    # errors where the request may or may not have been executed, the rest are definite rejections.
+    UNKNOWN_OUTCOME_CODES = (-1000, -1001, -1006, -1007, -4116)
+    NOT_FOUND_CODE: int = -2013
+
+    def __init__(
+        self: "OrderManager",
+        binance: BinanceFutureMarket,
+        prefix: str = "act",
+        max_closed: int = 1_000,
+    ) -> None:
+        self.binance: BinanceFutureMarket = binance
+        # client ids are unique across the restarts, <prefix>-<session>-<sequence>, at most 36 characters.
+        self.prefix: str = f"{prefix}-{os.urandom(4).hex()}"
+        self.max_closed: int = max_closed
+
+        self.__lock: threading.RLock = threading.RLock()
+        self.__ids: Iterator[int] = itertools.count(1)
+        self.__orders: Dict[str, ManagedOrder] = dict()
+        self.__by_order_id: Dict[int, ManagedOrder] = dict()
+        # the inner dicts are ordered sets, so an order is moved between them in O(1).
+        self.__by_symbol: Dict[str, Dict[str, ManagedOrder]] = dict()
+        self.__by_state: Dict[OrderState, Dict[str, ManagedOrder]] = {state: dict() for state in OrderState}
+        self.__by_parent: Dict[str, Dict[str, ManagedOrder]] = dict()
+        self.__closed: "OrderedDict[str, None]" = OrderedDict()
+        return
+
+    """
+    ####################################################################################################################
+    # Lookups                                                                                                          #
+    ####################################################################################################################
+    """
+    def get(
+        self: "OrderManager",
+        client_order_id: str,
+    ) -> ManagedOrder | None:
+        with self.__lock:
+            return self.__orders.get(client_order_id)
+
+    def get_by_order_id(
+        self: "OrderManager",
+        order_id: int,
+    ) -> ManagedOrder | None:
+        with self.__lock:
+            return self.__by_order_id.get(order_id)
+
+    def by_symbol(
+        self: "OrderManager",
+        symbol: str,
+    ) -> List[ManagedOrder]:
+        with self.__lock:
+            return list(self.__by_symbol.get(symbol, dict()).values())
+
+    def by_state(
+        self: "OrderManager",
+        *states: OrderState,
+    ) -> List[ManagedOrder]:
+        with self.__lock:
+            return [order for state in states for order in self.__by_state[state].values()]
+
+    def open_orders(
+        self: "OrderManager",
+        symbol: str | None = None,
+    ) -> List[ManagedOrder]:
+        orders: List[ManagedOrder] = self.by_state(*OPEN_STATES)
+        return orders if symbol is None else [order for order in orders if order.symbol == symbol]
+
+    def legs(
+        self: "OrderManager",
+        parent: str,
+    ) -> List[ManagedOrder]:
+        """
+        func legs():
+            - the orders sent with the parent, e.g., the SL and TP of an entry, in the order they have been sent.
+        """
+        with self.__lock:
+            return list(self.__by_parent.get(parent, dict()).values())
+
+    """
+    ####################################################################################################################
+    # Orders                                                                                                           #
+    ####################################################################################################################
+    """
+    def new_client_order_id(self: "OrderManager") -> str:
+        return f"{self.prefix}-{next(self.__ids)}"
+
+    def track(
+        self: "OrderManager",
+        client_order_id: str,
+        symbol: str,
+        side: str,
+        type: str,
+        quantity: float | None = None,
+        stop_price: float | None = None,
+        role: str | None = None,
+        parent: str | None = None,
+    ) -> ManagedOrder:
+        """
+        func track():
+            - register an order as PENDING_NEW before it is sent, the one already tracked under the client id is returned.
+        """
+        with self.__lock:
+            order: ManagedOrder | None = self.__orders.get(client_order_id)
+            if order is not None:
+                return order
+            order = ManagedOrder(client_order_id, symbol, side, type, quantity, stop_price, role, parent)
+            self.__orders[client_order_id] = order
+            self.__by_symbol.setdefault(symbol, dict())[client_order_id] = order
+            self.__by_state[order.state][client_order_id] = order
+            if parent is not None:
+                self.__by_parent.setdefault(parent, dict())[client_order_id] = order
+        ORDER_STATES.labels(state = order.state.value).inc()
+        return order
+
+    def submit(
+        self: "OrderManager",
+        side: str,
+        symbol: str = "BTCUSDT",
+        type: str = "MARKET",
+        role: str | None = None,
+        parent: str | None = None,
+        **kwargs: Any,
+    ) -> ManagedOrder:
+        """
+        func submit():
+            - new_order() with a generated client id, sent once, see the class.
+            - kwargs are the other parameters of new_order(), e.g., quantity = 0.002, close_position = "true".
+        """
+        order: ManagedOrder = self.track(
+            self.new_client_order_id(), symbol, side, type,
+            quantity = kwargs.get("quantity"), stop_price = kwargs.get("stop_price"), role = role, parent = parent,
+        )
+        return self.__send(
+            order,
+            lambda: self.binance.new_order(side = side, symbol = symbol, type = type, new_client_order_id = order.client_order_id, **kwargs),
+        )
+
+    def prepare(
+        self: "OrderManager",
+        side: str,
+        symbol: str = "BTCUSDT",
+        type: str = "MARKET",
+        **kwargs: Any,
+    ) -> EncodedQuery:
+        """
+        func prepare():
+            - prepare_order() with a generated client id, the order is tracked once it is sent by submit_prepared().
+        """
+        return self.binance.prepare_order(side = side, symbol = symbol, type = type, new_client_order_id = self.new_client_order_id(), **kwargs)
+
+    def submit_prepared(
+        self: "OrderManager",
+        prepared: EncodedQuery,
+        role: str | None = None,
+        parent: str | None = None,
+    ) -> ManagedOrder:
+        params: Dict[str, Any] = prepared.params
+        order: ManagedOrder = self.track(
+            params["newClientOrderId"], params["symbol"], params["side"], params["type"],
+            quantity = params.get("quantity"), stop_price = params.get("stopPrice"), role = role, parent = parent,
+        )
+        return self.__send(order, lambda: self.binance.send_prepared_order(prepared))
+
+    def cancel(
+        self: "OrderManager",
+        client_order_id: str,
+    ) -> ManagedOrder | None:
+        order: ManagedOrder | None = self.get(client_order_id)
+        if order is None:
+            return None
+        response: dict | None = self.binance.cancel_order(symbol = order.symbol, orig_client_order_id = client_order_id)
+        if response is not None:
+            self.apply(response)
+        return order
+
+    def reconcile(
+        self: "OrderManager",
+        symbol: str | None = None,
+        states: Tuple[OrderState, ...] = (OrderState.PENDING_NEW, OrderState.UNKNOWN),
+    ) -> int:
+        """
+        func reconcile():
+            - query the orders in states, the PENDING_NEW and UNKNOWN ones by default, e.g., after a reconnect of the user data stream.
+            - an order the exchange does not have is REJECTED, return the number of the orders settled.
+            - a PENDING_NEW order may still be on its way, so only UNKNOWN is safe while orders are being sent.
+        """
+        settled: int = 0
+        for order in self.by_state(*states):
+            if symbol is not None and order.symbol != symbol:
+                continue
+            response: dict | None = self.binance.query_order(symbol = order.symbol, orig_client_order_id = order.client_order_id)
+            if response is not None:
+                self.apply(response)
+            elif self.__error_code() == OrderManager.NOT_FOUND_CODE:
+                self.__set_state(order, OrderState.REJECTED)
+            else:
+                continue
+            settled += 1
+        return settled
+
+    def __send(
+        self: "OrderManager",
+        order: ManagedOrder,
+        send: Callable[[], dict | None],
+    ) -> ManagedOrder:
+        order.attempts += 1
+        response: dict | None = send()
+        if response is not None:
+            self.apply(response)
+            return order
+        status, code = self.binance.last_error or (None, None)
+        if status is not None and status < 500 and status not in (418, 429) and code not in OrderManager.UNKNOWN_OUTCOME_CODES:
+            order.error = code
+            self.__set_state(order, OrderState.REJECTED)
+            return order
+
+        # the outcome is unknown, only the exchange can tell whether the order has made it, -2013 may only mean not yet.
+        response = self.binance.query_order(symbol = order.symbol, orig_client_order_id = order.client_order_id)
+        if response is not None:
+            self.apply(response)
+            return order
+        self.__set_state(order, OrderState.UNKNOWN if order.state == OrderState.PENDING_NEW else order.state)
+        operation_logger.error(f"{__name__} - {order} has an unknown outcome, it is left to the user data stream and reconcile().")
+        return order
+
+    def __error_code(self: "OrderManager") -> int | None:
+        last_error = self.binance.last_error
+        return None if last_error is None else last_error[1]
+
+    """
+    ####################################################################################################################
+    # Updates                                                                                                          #
+    ####################################################################################################################
+    """
+    def apply(
+        self: "OrderManager",
+        report: dict,
+    ) -> ManagedOrder | None:
+        """
+        func apply():
+            - update the order from an order of the REST API, e.g., the response of new_order() or query_order().
+            - an order which has not been sent through the OrderManager is tracked from then on.
+        """
+        client_order_id: str | None = report.get("clientOrderId")
+        if not client_order_id:
+            return None
+        return self.__update(
+            client_order_id,
+            symbol = report.get("symbol"),
+            side = report.get("side"),
+            type = report.get("type"),
+            status = report.get("status"),
+            order_id = report.get("orderId"),
+            executed_qty = report.get("executedQty"),
+            avg_price = report.get("avgPrice"),
+            updated = report.get("updateTime"),
+        )
+
+    def on_user_data(
+        self: "OrderManager",
+        msg: dict,
+    ) -> ManagedOrder | None:
+        """
+        func on_user_data():
+            - update the order from an ORDER_TRADE_UPDATE event, the other events are ignored.
+        """
+        data: dict = msg.get("data") or msg
+        if data.get("e") != "ORDER_TRADE_UPDATE":
+            return None
+        event: dict = data.get("o") or dict()
+        if not event.get("c"):
+            return None
+        return self.__update(
+            event["c"],
+            symbol = event.get("s"),
+            side = event.get("S"),
+            type = event.get("o"),
+            status = event.get("X"),
+            order_id = event.get("i"),
+            executed_qty = event.get("z"),
+            avg_price = event.get("ap"),
+            updated = event.get("T") or data.get("E"),
+        )
+
+    def __update(
+        self: "OrderManager",
+        client_order_id: str,
+        symbol: str | None,
+        side: str | None,
+        type: str | None,
+        status: str | None,
+        order_id: int | None,
+        executed_qty: str | float | None,
+        avg_price: str | float | None,
+        updated: int | None,
+    ) -> ManagedOrder | None:
+        try:
+            state: OrderState = OrderState(status)
+        except ValueError:
+            operation_logger.error(f"{__name__} - Unknown order status {status} of {client_order_id}.")
+            return None
+
+        with self.__lock:
+            order: ManagedOrder = self.track(client_order_id, symbol or "", side or "", type or "")
+            updated = int(updated) if updated else int(time.time() * 1_000)
+            if _RANK[state] < _RANK[order.state] or (_RANK[state] == _RANK[order.state] and updated < order.updated):
+                return order  # stale, e.g., the REST response arriving after the event of the stream.
+            if order_id is not None and order.order_id is None:
+                order.order_id = int(order_id)
+                self.__by_order_id[order.order_id] = order
+            if executed_qty is not None:
+                order.executed_qty = max(order.executed_qty, float(executed_qty))
+            if avg_price is not None and float(avg_price):
+                order.avg_price = float(avg_price)
+            order.updated = updated
+            self.__set_state(order, state)
+        return order
+
+    def __set_state(
+        self: "OrderManager",
+        order: ManagedOrder,
+        state: OrderState,
+    ) -> None:
+        with self.__lock:
+            if order.state == state:
+                return
+            del self.__by_state[order.state][order.client_order_id]
+            order.state = state
+            self.__by_state[state][order.client_order_id] = order
+            if not order.is_open:
+                self.__closed[order.client_order_id] = None
+                while len(self.__closed) > self.max_closed:
+                    self.__forget(self.__closed.popitem(last = False)[0])
+        ORDER_STATES.labels(state = state.value).inc()
+        return
+
+    def __forget(
+        self: "OrderManager",
+        client_order_id: str,
+    ) -> None:
+        order: ManagedOrder | None = self.__orders.pop(client_order_id, None)
+        if order is None:
+            return
+        self.__by_state[order.state].pop(client_order_id, None)
+        self.__by_symbol.get(order.symbol, dict()).pop(client_order_id, None)
+        if order.parent is not None:
+            self.__by_parent.get(order.parent, dict()).pop(client_order_id, None)
+        if order.order_id is not None:
+            self.__by_order_id.pop(order.order_id, None)
+        return
@@ -0,0 +1,339 @@
+# Standard Library
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
+# Custom Library
+from logger.set_logger import operation_logger, trading_logger
+from manager.order_manager import ManagedOrder, OrderManager, OrderState
+from telemetry.metrics import metrics
+
+
+VIRTUAL_STOPS = metrics.counter(
+    "virtual_stops_triggered_total",
+    "Local stop-loss / take-profit triggers of the ProtectiveOrderEngine.",
+    ("kind",),
+)
+
+
+class VirtualStop:
+    '''
+    # a stop-loss or take-profit kept locally, closing <quantity> of the position with a reduce-only MARKET order.
+        # above: triggered at or above the trigger price, e.g., the SL of a short, otherwise at or below it.
+        # trail: the SL follows the best price at this distance, e.g., 0.005 for 0.5%, None for a fixed SL.
+        # the stops of one position are siblings, the first one triggered cancels the others.
+    '''
+    __slots__ = (
+        "symbol", "side", "kind", "trigger", "quantity", "trail", "parent", "backstop",
+        "above", "siblings", "active", "future", "failures",
+    )
+
+    def __init__(
+        self: "VirtualStop",
+        symbol: str,
+        side: int,  # 1: long, -1: short, the side of the position
+        kind: str,  # "sl" or "tp"
+        trigger: float,
+        quantity: float,
+        trail: float | None = None,
+        parent: str | None = None,
+        backstop: str | None = None,
+    ) -> None:
+        self.symbol: str = symbol
+        self.side: int = side
+        self.kind: str = kind
+        self.trigger: float = trigger
+        self.quantity: float = quantity
+        self.trail: float | None = trail
+        self.parent: str | None = parent  # client id of the entry
+        self.backstop: str | None = backstop  # client id of the exchange-side stop, cancelled once this one has closed
+
+        self.above: bool = (kind == "sl") == (side == -1)
+        self.siblings: List[VirtualStop] = [self]
+        self.active: bool = True
+        self.future: Future | None = None  # -> ManagedOrder of the closing order, once triggered
+        self.failures: int = 0  # closing orders of the position not accepted
+        return
+
+    def __repr__(self: "VirtualStop") -> str:
+        return f"VirtualStop({self.symbol}, {'long' if self.side == 1 else 'short'} {self.kind} at {self.trigger})"
+
+
+class _StopBook:
+    '''
+    # the active stops of a symbol in two arrays sorted by the trigger price, with the stops in the same order.
+        # below: triggered when the price falls to the trigger, the highest trigger is the first to go.
+        # above: triggered when the price rises to the trigger, the lowest trigger is the first to go.
+    '''
+    def __init__(self: "_StopBook") -> None:
+        self.below_prices: List[float] = list()
+        self.below_stops: List[VirtualStop] = list()
+        self.above_prices: List[float] = list()
+        self.above_stops: List[VirtualStop] = list()
+        self.trailing: List[VirtualStop] = list()
+        return
+
+    def add(
+        self: "_StopBook",
+        stop: VirtualStop,
+    ) -> None:
+        prices, stops = (self.above_prices, self.above_stops) if stop.above else (self.below_prices, self.below_stops)
+        index: int = bisect_right(prices, stop.trigger)
+        prices.insert(index, stop.trigger)
+        stops.insert(index, stop)
+        return
+
+    def remove(
+        self: "_StopBook",
+        stop: VirtualStop,
+    ) -> None:
+        prices, stops = (self.above_prices, self.above_stops) if stop.above else (self.below_prices, self.below_stops)
+        index: int = bisect_left(prices, stop.trigger)
+        while index < len(stops) and stops[index] is not stop:
+            index += 1
+        if index < len(stops):
+            del prices[index]
+            del stops[index]
+        return
+
+    def triggered(
+        self: "_StopBook",
+        price: float,
+    ) -> List[VirtualStop]:
+        """
+        func triggered():
+            - the stops crossed by the price, two bisections, nothing is allocated when none is crossed.
+        """
+        below: int = bisect_left(self.below_prices, price)
+        above: int = bisect_right(self.above_prices, price)
+        if below == len(self.below_prices) and above == 0:
+            return list()
+        return self.below_stops[below:] + self.above_stops[:above]
+
+
+class ProtectiveOrderEngine:
+    '''
+    # local stop-loss / take-profit / trailing stops checked on every price tick, instead of exchange-side orders.
+        # on_tick() costs O(log n) in the active stops, plus the update of the trailing ones.
+        # a triggered stop is taken out at once, so it fires once, and its reduce-only MARKET order is sent
+        # through the OrderManager on the worker thread, never on the thread of the tick.
+        # the exchange-side stop of the position, the backstop, is left wide for the case this process is gone,
+        # and is cancelled once a local stop has closed the position.
+        # a closing order which is REJECTED or UNKNOWN keeps the backstop:
+        # rejected as reduce-only, the position is gone, e.g., liquidated or closed by hand, and so are its stops.
+        # otherwise the stops are put back in the book after retry_delay, doubled on every failure, up to max_retries,
+        # and then left to the backstop. a position cancelled meanwhile, e.g., by its filled backstop, is not put back.
+    '''
+    # the reduce-only order would not reduce a position, i.e., there is none left on that side.
+    POSITION_GONE_CODES = (-2022, -4118)
+
+    def __init__(
+        self: "ProtectiveOrderEngine",
+        orders: OrderManager,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,  # seconds, before the first retry
+    ) -> None:
+        self.orders: OrderManager = orders
+        self.max_retries: int = max_retries
+        self.retry_delay: float = retry_delay
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__books: Dict[str, _StopBook] = dict()
+        self.__groups: Dict[str, List[VirtualStop]] = dict()  # parent -> stops of the position
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "Thread-Protective-Orders")
+        return
+
+    def stop(self: "ProtectiveOrderEngine") -> None:
+        self.__executor.shutdown(wait = False)
+        return
+
+    def protect(
+        self: "ProtectiveOrderEngine",
+        symbol: str,
+        side: int,  # 1: long, -1: short
+        quantity: float,
+        sl_price: float | None = None,
+        tp_price: float | None = None,
+        trail: float | None = None,
+        parent: str | None = None,
+        backstop: str | None = None,
+    ) -> List[VirtualStop]:
+        """
+        func protect():
+            - keep the SL and / or the TP of a position locally, the SL trails the price if trail is given.
+        """
+        stops: List[VirtualStop] = [
+            VirtualStop(symbol, side, kind, price, quantity, trail if kind == "sl" else None, parent, backstop)
+            for kind, price in (("sl", sl_price), ("tp", tp_price)) if price is not None
+        ]
+        with self.__lock:
+            book: _StopBook = self.__books.setdefault(symbol, _StopBook())
+            for stop in stops:
+                stop.siblings = stops
+                book.add(stop)
+                if stop.trail is not None:
+                    book.trailing.append(stop)
+            if parent is not None:
+                self.__groups[parent] = stops
+        return stops
+
+    def cancel(
+        self: "ProtectiveOrderEngine",
+        parent: str,
+    ) -> int:
+        """
+        func cancel():
+            - drop the stops of the position, e.g., closed by its backstop, and return how many were active.
+        """
+        with self.__lock:
+            stops: List[VirtualStop] = self.__groups.get(parent, list())
+            active: int = sum(stop.active for stop in stops)
+            if stops:
+                self.__deactivate(stops[0])
+        return active
+
+    def stops(
+        self: "ProtectiveOrderEngine",
+        symbol: str,
+    ) -> List[VirtualStop]:
+        with self.__lock:
+            book: _StopBook | None = self.__books.get(symbol)
+            return list() if book is None else book.below_stops + book.above_stops
+
+    def on_tick(
+        self: "ProtectiveOrderEngine",
+        symbol: str,
+        price: float,
+    ) -> List[VirtualStop]:
+        """
+        func on_tick():
+            - move the trailing stops, take out the stops crossed by the price and send their orders.
+            - return the triggered stops, their future gives the ManagedOrder of the closing order.
+        """
+        with self.__lock:
+            book: _StopBook | None = self.__books.get(symbol)
+            if book is None:
+                return list()
+            for stop in book.trailing:
+                self.__trail(book, stop, price)
+            triggered: List[VirtualStop] = book.triggered(price)
+            for stop in triggered:
+                if stop.active:
+                    self.__deactivate(stop, forget = False)  # registered until its closing order has settled
+                    stop.active = True  # the one which closes the position
+            triggered = [stop for stop in triggered if stop.active]
+            for stop in triggered:
+                stop.active = False
+        for stop in triggered:
+            VIRTUAL_STOPS.labels(kind = "trailing" if stop.trail is not None else stop.kind).inc()
+            trading_logger.info(f"{__name__} - {stop} has been triggered at {price}.")
+            stop.future = self.__executor.submit(self.__fire, stop)
+        return triggered
+
+    def __trail(
+        self: "ProtectiveOrderEngine",
+        book: _StopBook,
+        stop: VirtualStop,
+        price: float,
+    ) -> None:
+        """
+        func __trail():
+            - called with the lock held, tighten the SL to <trail> away from the price, it is never loosened.
+        """
+        trigger: float = price * (1 - stop.side * stop.trail)
+        if (trigger - stop.trigger) * stop.side <= 0:
+            return
+        book.remove(stop)
+        stop.trigger = trigger
+        book.add(stop)
+        return
+
+    def __deactivate(
+        self: "ProtectiveOrderEngine",
+        stop: VirtualStop,
+        forget: bool = True,
+    ) -> None:
+        """
+        func __deactivate():
+            - called with the lock held, take the stop and its siblings out of the book, and forget the position unless told not to.
+        """
+        book: _StopBook = self.__books[stop.symbol]
+        for sibling in stop.siblings:
+            if not sibling.active:
+                continue
+            sibling.active = False
+            book.remove(sibling)
+            if sibling.trail is not None:
+                book.trailing.remove(sibling)
+        if forget and stop.parent is not None:
+            self.__groups.pop(stop.parent, None)
+        return
+
+    def __forget(
+        self: "ProtectiveOrderEngine",
+        stop: VirtualStop,
+    ) -> None:
+        with self.__lock:
+            if stop.parent is not None and self.__groups.get(stop.parent) is stop.siblings:
+                del self.__groups[stop.parent]
+        return
+
+    def __rearm(
+        self: "ProtectiveOrderEngine",
+        stop: VirtualStop,
+    ) -> None:
+        """
+        func __rearm():
+            - put the stop and its siblings back in the book, the position is still open after a failed close.
+            - not when the position has been cancelled meanwhile, e.g., closed by its backstop.
+        """
+        with self.__lock:
+            if stop.parent is not None and self.__groups.get(stop.parent) is not stop.siblings:
+                operation_logger.info(f"{__name__} - {stop} is not re-armed, its position has been cancelled.")
+                return
+            book: _StopBook = self.__books.setdefault(stop.symbol, _StopBook())
+            for sibling in stop.siblings:
+                if sibling.active:
+                    continue
+                sibling.active = True
+                book.add(sibling)
+                if sibling.trail is not None:
+                    book.trailing.append(sibling)
+        return
+
+    def __fire(
+        self: "ProtectiveOrderEngine",
+        stop: VirtualStop,
+    ) -> ManagedOrder:
+        order: ManagedOrder = self.orders.submit(
+            side = "SELL" if stop.side == 1 else "BUY",
+            symbol = stop.symbol,
+            type = "MARKET",
+            role = f"virtual_{stop.kind}",
+            parent = stop.parent,
+            quantity = stop.quantity,
+            reduce_only = "true",
+        )
+        if order.state == OrderState.REJECTED and order.error in ProtectiveOrderEngine.POSITION_GONE_CODES:
+            operation_logger.warning(f"{__name__} - {stop} has no position left to close, {order} is rejected with {order.error}.")
+            self.__forget(stop)
+            return order
+        if order.state not in (OrderState.NEW, OrderState.PARTIALLY_FILLED, OrderState.FILLED):
+            for sibling in stop.siblings:
+                sibling.failures += 1  # counted for the position, whichever of its stops fires
+            if stop.failures > self.max_retries:
+                operation_logger.error(f"{__name__} - {stop} has not been closed after {stop.failures} orders, it is left to the backstop.")
+                self.__forget(stop)
+                return order
+            delay: float = self.retry_delay * 2 ** (stop.failures - 1)
+            operation_logger.error(f"{__name__} - {stop} has not been closed, {order} is {order.state.value}, the backstop is kept, retry in {delay} s.")
+            timer: threading.Timer = threading.Timer(delay, self.__rearm, args = (stop,))
+            timer.daemon = True
+            timer.start()
+            return order
+        self.__forget(stop)
+        if stop.backstop is not None:
+            self.orders.cancel(stop.backstop)
+        operation_logger.info(f"{__name__} - {stop} has been closed by {order}.")
+        return order
@@ -5,15 +5,27 @@ from typing import Dict, List
 import time
 
 # CUSTOM LIBRARY
-from object.indexes import Index
+from object.indexes import Index, IndexPool
+from custom_telegram.notification_service import NotificationService, Priority
 from custom_telegram.telegram_bot_class import CustomTelegramBot
 from logger.set_logger import operation_logger, trading_logger
 from object.signal import TradeSignal, Signal
 from interface.pipeline_interface import PipelineController
 from object.constants import IndexType
+from analysis.registry import IndicatorRegistry
+from telemetry.tracing import Stage, TraceContext
 
 
 class SignalGenerator:
+    # IndexTypes read by each rule, the union is subscribed to the IndicatorRegistry.
+    RULE_INDEXES: Dict[str, IndexType] = {
+        "golden_cross": IndexType.SMA | IndexType.EMA,
+        "death_cross": IndexType.SMA | IndexType.EMA,
+        "price_moving_average": IndexType.SMA | IndexType.PRICE,
+        "ema_sma_divergence": IndexType.SMA | IndexType.EMA,
+        "price_reversal": IndexType.SMA | IndexType.PRICE,
+    }
+
     '''
     ######################################################################################################################
     #                                               Static Method                                                        #
@@ -35,6 +47,8 @@ class SignalGenerator:
     @staticmethod
     def __generate_signal(
         signal: TradeSignal,
+        trace: TraceContext | None = None,
+        strategy: str | None = None,
     ) -> Signal:
         """
         - func __generate_signal():
@@ -45,11 +59,19 @@ class SignalGenerator:
             - class object
         - param signal: object.TradeSignal
             - the signal object to be generated.
+        - param trace: TraceContext | None
+            - trace of the tick behind the indexes the rule has read.
+        - param strategy: str | None
+            - name of the rule, the score contributions of the TradeManager are kept per rule.
 
         - return indicator
         """
+        if trace is not None:
+            trace.mark(Stage.SIGNAL_GENERATED)
         return Signal(
             signal = signal,
+            trace = trace,
+            strategy = strategy,
         )
     '''
     ######################################################################################################################
@@ -62,6 +84,9 @@ class SignalGenerator:
         signal_pipeline_controller: PipelineController[dict[str, int | TradeSignal]],
         custom_telegram_bot: CustomTelegramBot,
         signal_window: int = 5_000,
+        index_pool: IndexPool | None = None,
+        indicator_registry: IndicatorRegistry | None = None,
+        notifier: NotificationService | None = None,
     ) -> None:
         """
         func __init__():
@@ -74,6 +99,13 @@ class SignalGenerator:
             - class object
         param pipeline: DataPipeline
             - Data pipeline for the indicator fetching.
+        param index_pool: IndexPool | None
+            - if given, the values of the incoming Index are copied into the latest Index of its type
+            - and the incoming Index is released back to the pool right away.
+        param indicator_registry: IndicatorRegistry | None
+            - if given, the IndexTypes in RULE_INDEXES are subscribed, so only the indicators of the rules are computed.
+        param notifier: NotificationService | None
+            - the signals are sent to Telegram in its digest, nothing is sent if not given.
 
         return None
         """
@@ -83,6 +115,7 @@ class SignalGenerator:
 
         # telegram bot manager to send the notification.
         self.__telegram_bot: CustomTelegramBot = custom_telegram_bot
+        self.notifier: NotificationService | None = notifier
 
         # Shared Structure
         # Mutex Lock
@@ -92,6 +125,17 @@ class SignalGenerator:
             IndexType.EMA: None,  # latest EMA data
             IndexType.PRICE: None,  # latest Price data
         }
+        # Index pool shared with the IndexFactory of the DataCollectorAndProcessor.
+        self.index_pool: IndexPool | None = index_pool
+        self.latest_indexes: dict[IndexType, Index] = dict()
+        # trace of the latest tick received through the data pipeline, forked into every signal of the rules.
+        self.latest_trace: TraceContext | None = None
+
+        if indicator_registry is not None:
+            subscriptions: IndexType = IndexType(0)
+            for index_types in SignalGenerator.RULE_INDEXES.values():
+                subscriptions |= index_types
+            indicator_registry.subscribe(subscriptions)
 
         # threads pool
         self.threads: List[threading.Thread] = list()
@@ -115,28 +159,31 @@ class SignalGenerator:
     ######################################################################################################################
     """
 
-    async def send_telegram_message(
+    def send_telegram_message(
         self: 'SignalGenerator',
         message: str = "",
+        key: str | None = None,
     ) -> None:
         """
         - func send_telegram_message:
             - Send the message to the telegram chat room.
-            - It will be used to send the notification to the telegram chat room.
+            - It is only enqueued as a LOW message, so the rules never wait for Telegram,
+            - and the messages of the same key are coalesced until the next digest of the notifier.
 
         - param self: StrategyHandler
         - param message: str
+        - param key: str | None
+            - the name of the rule.
 
         - param None
         """
-        try:
-            await self.__telegram_bot.send_text(
-                message=message,
-            )
-        except Exception as e:
-            operation_logger.error(
-                f"Error sending Telegram message: {str(e)}"
+        if self.notifier is not None:
+            self.notifier.notify(
+                message,
+                priority = Priority.LOW,
+                key = key,
             )
+        return None
 
     # TODO: This is not used currently.
     def generate_telegram_msg(
@@ -329,11 +376,54 @@ class SignalGenerator:
                 data: Index = self.data_pipeline_controller.pop(block = True,)
                 # print(f"{data.index_type}: {data.data}")
                 if (data):
-                    with self.indicators_lock:
-                        self.indicators[data.index_type] = data.data
+                    if data.trace is not None:
+                        with self.indicators_lock:
+                            self.latest_trace = data.trace.mark_once(Stage.INDEX_RECEIVED)
+                    if self.index_pool is None:
+                        with self.indicators_lock:
+                            self.indicators[data.index_type] = data.data
+                    else:
+                        self.__update_latest_index(data)
             except Exception as e:
                 operation_logger.critical(f"{__name__} -  Unexpected Exeption occured - {str(e)}")
 
+    def __update_latest_index(
+        self: 'SignalGenerator',
+        data: Index,
+    ) -> None:
+        """
+        - func __update_latest_index():
+            - copy the values of the pooled Index into the long-lived Index of the same type.
+            - the rules keep reading the long-lived Index, so the pooled one can be recycled immediately.
+            - its values are overwritten in place, so the rules read them under indicators_lock, never after it.
+        """
+        with self.indicators_lock:
+            latest: Index | None = self.latest_indexes.get(data.index_type)
+            if latest is None or latest.layout is not data.layout:
+                latest = Index(
+                    timestamp = data.timestamp,
+                    index_type = data.index_type,
+                    data = data.values.copy(),
+                    layout = data.layout,
+                )
+                self.latest_indexes[data.index_type] = latest
+            else:
+                latest.update(data.timestamp, data.values)
+            self.indicators[data.index_type] = latest.data
+
+        self.index_pool.release(data)
+        return None
+
+    def __fork_latest_trace(
+        self: 'SignalGenerator',
+    ) -> TraceContext | None:
+        """
+        - func __fork_latest_trace():
+            - every signal gets its own copy of the trace, since one tick can trigger several rules.
+        """
+        with self.indicators_lock:
+            return None if self.latest_trace is None else self.latest_trace.fork()
+
     """
     ######################################################################################################################
     #                                            Functions for Threads                                                   #
@@ -426,29 +516,33 @@ class SignalGenerator:
         key: str = "golden_cross"
         while True:
             with self.indicators_lock:
+                # the views are overwritten in place on every tick, so the values of a decision are read under the lock.
                 sma_data: dict | None = self.indicators.get(IndexType.SMA)
                 ema_data: dict | None = self.indicators.get(IndexType.EMA)
+                available: bool = bool(sma_data and ema_data)
+                ten_sec_sma: float | None = sma_data.get(10) if available else None
+                five_min_ema: float | None = ema_data.get(300) if available else None
 
             with self.signal_timestamps_lock:
                 prev_timestamp: int = self.signal_timestamps.get(key, 0)
 
             curr_timestamp: int = SignalGenerator.generate_timestamp()
 
-            if (curr_timestamp - prev_timestamp > self.signal_window) and (sma_data and ema_data):  # only need to check if the sma and ema data are available.
+            if (curr_timestamp - prev_timestamp > self.signal_window) and available:  # only need to check if the sma and ema data are available.
                 # generate the signal based on the data and passit to the signal pipeline.
-                ten_sec_sma: float | None = sma_data.get(10)
-                five_min_ema: float | None = ema_data.get(300)
-
                 if ten_sec_sma and five_min_ema:
                     if ten_sec_sma > five_min_ema:
                         # generate the signal
                         signal: Signal = SignalGenerator.__generate_signal(
-                            signal = TradeSignal.LONG_TERM_BUY
+                            signal = TradeSignal.LONG_TERM_BUY,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         self.signal_pipeline_controller.push(signal)
                         trading_logger.info(
                             f"{__name__} - Golden Cross Signal has been generated!: Bullish Trend."
                         )
+                        self.send_telegram_message("Golden Cross Signal has been generated!: Bullish Trend.", key = key)
 
                 with self.signal_timestamps_lock:
                     self.signal_timestamps[key] = curr_timestamp
@@ -471,8 +565,12 @@ class SignalGenerator:
         key: str = "death_cross"
         while True:
             with self.indicators_lock:
+                # the views are overwritten in place on every tick, so the values of a decision are read under the lock.
                 sma_data: dict = self.indicators.get(IndexType.SMA, None)
                 ema_data: dict = self.indicators.get(IndexType.EMA, None)
+                available: bool = bool(sma_data and ema_data)
+                ten_sec_sma: float | None = sma_data.get(10) if available else None
+                five_min_ema: float | None = ema_data.get(300) if available else None
 
             with self.signal_timestamps_lock:
                 prev_timestamp: int = self.signal_timestamps.get(key, 0)
@@ -480,23 +578,21 @@ class SignalGenerator:
 
             if (
                 curr_timestamp - prev_timestamp > self.signal_window
-            ) and (
-                sma_data and ema_data
-            ):  # only need to check if the sma and ema data are available.
+            ) and available:  # only need to check if the sma and ema data are available.
                 # generate the signal based on the data and passit to the signal pipeline.
-                ten_sec_sma: float | None = sma_data.get(10)
-                five_min_ema: float | None = ema_data.get(300)
-
                 if ten_sec_sma and five_min_ema:
                     if ten_sec_sma < five_min_ema:
                         # generate the signal
                         signal: Signal = SignalGenerator.__generate_signal(
-                            signal=TradeSignal.LONG_TERM_SELL
+                            signal=TradeSignal.LONG_TERM_SELL,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         self.signal_pipeline_controller.push(signal)
                         trading_logger.info(
                             f"{__name__} - Death Cross Signal has been generated!: Bearish Trend."
                         )
+                        self.send_telegram_message("Death Cross Signal has been generated!: Bearish Trend.", key = key)
 
                 with self.signal_timestamps_lock:
                     self.signal_timestamps[key] = curr_timestamp
@@ -522,8 +618,11 @@ class SignalGenerator:
         key: str = "price_moving_average"  # TODO: Check if we need to have the direction -> maybe separate this as well?
         while True:
             with self.indicators_lock:
+                # the views are overwritten in place on every tick, so the values of a decision are read under the lock.
                 sma_data: Dict[int, float] = self.indicators.get(IndexType.SMA)
                 current_price:       float = self.indicators.get(IndexType.PRICE)
+                available: bool = bool(sma_data and current_price)
+                sma_60: float | None = sma_data.get(60) if available else None  # Example for 1 min SMA
 
             with self.signal_timestamps_lock:
                 prev_timestamp: int = self.signal_timestamps.get(key, 0)
@@ -532,29 +631,32 @@ class SignalGenerator:
 
             if (
                 curr_timestamp - prev_timestamp > self.signal_window
-            ) and (
-                sma_data and current_price
-            ):
-                sma_60 = sma_data.get(60)  # Example for 1 min SMA
+            ) and available:
 
                 if sma_60:
                     if current_price > sma_60:
                         signal: Signal = SignalGenerator.__generate_signal(
                             signal = TradeSignal.SHORT_TERM_BUY,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         self.signal_pipeline_controller.push(signal)
                         trading_logger.info(
                             f"{__name__} - Short Term Buy Signal has been generated!: Bullish Trend."
                         )
+                        self.send_telegram_message("Short Term Buy Signal has been generated!: Bullish Trend.", key = key)
 
                     elif current_price < sma_60:
                         signal: Signal = SignalGenerator.__generate_signal(
                             signal=TradeSignal.SHORT_TERM_SELL,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         self.signal_pipeline_controller.push(signal)
                         trading_logger.info(
                             f"{__name__} - Short Term Sell Signal has been generated!: Bearish Trend."
                         )
+                        self.send_telegram_message("Short Term Sell Signal has been generated!: Bearish Trend.", key = key)
 
                 with self.signal_timestamps_lock:
                     self.signal_timestamps[key] = curr_timestamp
@@ -580,29 +682,31 @@ class SignalGenerator:
         key: str = "ema_sma_divergence"
         while True:
             with self.indicators_lock:
+                # the views are overwritten in place on every tick, so the values of a decision are read under the lock.
                 sma_data: Dict[int, float] = self.indicators.get(IndexType.SMA)
                 ema_data: Dict[int, float] = self.indicators.get(IndexType.EMA)
+                available: bool = bool(sma_data and ema_data)
+                sma_60: float | None = sma_data.get(60) if available else None  # data for 1 min SMA
+                ema_60: float | None = ema_data.get(60) if available else None  # data for 1 min EMA
 
             with self.signal_timestamps_lock:
                 prev_timestamp: int = self.signal_timestamps.get(key, 0)
             curr_timestamp: int = SignalGenerator.generate_timestamp()
 
-            if (curr_timestamp - prev_timestamp > self.signal_window) and (
-                sma_data and ema_data
-            ):
-                sma_60 = sma_data.get(60)  # data for 1 min SMA
-                ema_60 = ema_data.get(60)  # data for 1 min EMA
-
+            if (curr_timestamp - prev_timestamp > self.signal_window) and available:
                 if sma_60 and ema_60:
                     divergence: float = abs(sma_60 - ema_60)
                     if divergence > threshold:
                         signal: Signal = SignalGenerator.__generate_signal(
                             signal=TradeSignal.HOLD,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         self.signal_pipeline_controller.push(signal)
                         trading_logger.info(
                             f"{__name__} - Divergence Signal has been generated!: Potential Trend Change."
                         )
+                        self.send_telegram_message("Divergence Signal has been generated!: Potential Trend Change.", key = key)
 
                 with self.signal_timestamps_lock:
                     self.signal_timestamps[key] = curr_timestamp
@@ -624,35 +728,40 @@ class SignalGenerator:
         key: str = "price_reversal"
         while True:
             with self.indicators_lock:
+                # the views are overwritten in place on every tick, so the values of a decision are read under the lock.
                 sma_data: Dict[int, float] = self.indicators.get(IndexType.SMA)
                 current_price: float = self.indicators.get(IndexType.PRICE)
+                available: bool = bool(sma_data and current_price)
+                sma_60: float | None = sma_data.get(60) if available else None
 
             with self.signal_timestamps_lock:
                 prev_timestamp: int = self.signal_timestamps.get(key, 0)
             curr_timestamp: int = SignalGenerator.generate_timestamp()
 
-            if (curr_timestamp - prev_timestamp > self.signal_window) and (
-                sma_data and current_price
-            ):
-                sma_60: float = sma_data.get(60)
-
+            if (curr_timestamp - prev_timestamp > self.signal_window) and available:
                 if sma_60:
                     if current_price > sma_60:
                         signal: Signal = SignalGenerator.__generate_signal(
                             signal=TradeSignal.SHORT_TERM_BUY,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         trading_logger.info(
                             f"{__name__} - Price Reversal Signal has been generated!: Bullish Reveral."
                         )
+                        self.send_telegram_message("Price Reversal Signal has been generated!: Bullish Reveral.", key = key)
                         self.signal_pipeline_controller.push(signal)
                     elif current_price < sma_60:
                         signal: Signal = SignalGenerator.__generate_signal(
                             signal=TradeSignal.SHORT_TERM_SELL,
+                            trace = self.__fork_latest_trace(),
+                            strategy = key,
                         )
                         self.signal_pipeline_controller.push(signal)
                         trading_logger.info(
                             f"{__name__} - Price Reversal Signal has been generated!: Bearish Reveral."
                         )
+                        self.send_telegram_message("Price Reversal Signal has been generated!: Bearish Reveral.", key = key)
 
                 with self.signal_timestamps_lock:
                     self.signal_timestamps[key] = curr_timestamp
@@ -0,0 +1,278 @@
+# Standard Library
+import asyncio
+import heapq
+import time
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Custom Library
+from interface.exchange_interface import Book, BracketOrder, ExchangeAdapter
+from logger.set_logger import operation_logger, trading_logger
+from manager.venue_router import VenueRouter
+from telemetry.metrics import metrics
+
+
+# child orders of the split orders by venue and outcome, accepted, rejected or unknown.
+CHILD_ORDERS = metrics.counter(
+    "smart_order_children_total",
+    "Child orders of the SmartOrderRouter by venue and outcome.",
+    ("venue", "result"),
+)
+# requested quantity the books could not take within max_slippage, i.e., 0.0 when the whole order has been allocated.
+UNALLOCATED = metrics.histogram(
+    "smart_order_unallocated_ratio",
+    "Share of the requested quantity left out of the allocation of a split order.",
+    buckets = (0.0, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0),
+).labels()
+
+
+class LocalBook:
+    '''
+    # latest depth snapshot of one venue, fed by ExchangeAdapter.subscribe_depth().
+        # the book and its timestamp are replaced as one tuple, so a reader never sees the levels of two snapshots.
+        # a snapshot older than ttl ms is stale, the router then asks the venue over REST.
+    '''
+    __slots__ = ("venue", "ttl", "clock", "__snapshot")
+
+    def __init__(
+        self: "LocalBook",
+        venue: str,
+        ttl: int = 1_000,  # ms
+        clock: Callable[[], int] | None = None,  # ms, the wall clock if not given
+    ) -> None:
+        self.venue: str = venue
+        self.ttl: int = ttl
+        self.clock: Callable[[], int] = clock if clock is not None else lambda: int(time.time() * 1_000)
+        self.__snapshot: Tuple[Book, int] | None = None
+        return
+
+    def update(
+        self: "LocalBook",
+        venue: str,
+        book: Book,
+        timestamp: int,  # ms
+    ) -> None:
+        self.__snapshot = (book, timestamp)
+        return
+
+    def snapshot(self: "LocalBook") -> Book | None:
+        """
+        func snapshot():
+            - the latest book, None when there is none or it is older than ttl.
+        """
+        snapshot: Tuple[Book, int] | None = self.__snapshot
+        if snapshot is None or self.clock() - snapshot[1] > self.ttl:
+            return None
+        return snapshot[0]
+
+
+class SplitOrder(BracketOrder):
+    '''
+    # outcome of SmartOrderRouter.place_bracket(), the aggregate of its child BracketOrders.
+        # quantity: the filled quantity, the sum of the accepted children, requested is what was asked for.
+        # expected_price: average price of the allocation on the books, avg_price that of the fills when every venue reported it.
+        # unknown: a child has an unknown outcome, its share may be filled on top of quantity, without its SL / TP.
+    '''
+    __slots__ = ("children", "requested", "expected_price")
+
+    def __init__(
+        self: "SplitOrder",
+        symbol: str,
+        side: int,
+        requested: float,
+        children: List[BracketOrder],
+        expected_price: float,
+        latency_ms: float,
+    ) -> None:
+        accepted: List[BracketOrder] = [child for child in children if child.accepted]
+        filled: float = sum(child.quantity for child in accepted)
+        super().__init__(
+            venue = "+".join(child.venue for child in accepted),
+            symbol = symbol,
+            side = side,
+            quantity = filled,
+            entry_id = ",".join(str(child.entry_id) for child in accepted),
+            accepted = bool(accepted),
+            latency_ms = latency_ms,
+            avg_price = (
+                sum(child.avg_price * child.quantity for child in accepted) / filled
+                if accepted and filled and all(child.avg_price for child in accepted) else None
+            ),
+            unknown = any(child.unknown for child in children),
+        )
+        self.children: List[BracketOrder] = children
+        self.requested: float = requested
+        self.expected_price: float = expected_price
+        return
+
+    def __repr__(self: "SplitOrder") -> str:
+        return f"SplitOrder({self.symbol} {'long' if self.side == 1 else 'short'} {self.quantity} / {self.requested}, {self.children})"
+
+
+class SmartOrderRouter(VenueRouter):
+    '''
+    # splits every order across the venues by the liquidity of their books, instead of sending it to one venue.
+        # the levels of the books are walked best price first, the taker fee of each venue included in its price,
+        # up to max_slippage from the best of them, and each venue takes the levels of its own book.
+        # a venue takes no more than its available margin covers at the leverage with margin_buffer to spare.
+        # the books come from the depth streams, see watch(), or over REST when a stream is stale or not watched.
+        # the children are rounded to each venue, sent concurrently with their own SL / TP, and aggregated in a SplitOrder.
+        # the share left out of the allocation, i.e., more than the books hold within max_slippage, is not sent.
+    '''
+    def __init__(
+        self: "SmartOrderRouter",
+        adapters: Sequence[ExchangeAdapter],
+        max_slippage: float = 0.001,  # 0.1% from the best price
+        margin_buffer: float = 1.1,
+        depth_limit: int = 20,
+        book_ttl: int = 1_000,  # ms
+    ) -> None:
+        super().__init__(adapters, max_slippage = max_slippage, margin_buffer = margin_buffer, depth_limit = depth_limit)
+        self.book_ttl: int = book_ttl
+        self.books: Dict[str, LocalBook] = dict()
+        return
+
+    def watch(
+        self: "SmartOrderRouter",
+        base: str,
+        ccy: str,
+    ) -> "SmartOrderRouter":
+        """
+        func watch():
+            - keep a LocalBook of every venue from its depth stream.
+        """
+        for adapter in self.adapters:
+            book: LocalBook = self.books.setdefault(adapter.name, LocalBook(adapter.name, ttl = self.book_ttl))
+            adapter.subscribe_depth(book.update, base, ccy, self.depth_limit)
+        return self
+
+    @staticmethod
+    def allocate(
+        books: Dict[str, Book],
+        side: int,  # 1: buy, takes the asks, -1: sell, takes the bids
+        quantity: float,
+        max_slippage: float,
+        fees: Dict[str, float] | None = None,  # venue -> taker fee rate
+        capacities: Dict[str, float] | None = None,  # venue -> largest quantity it can take
+    ) -> Tuple[Dict[str, float], float]:
+        """
+        func allocate():
+            - quantity of each venue, best prices first across the books, and the average price of the allocation.
+            - the levels of each book are sorted already, so they are merged lazily and only the levels taken are visited.
+        """
+        fees = fees or dict()
+        capacities = capacities or dict()
+
+        def levels(venue: str, book: Book) -> Iterator[Tuple[float, float, float, str]]:
+            cost: float = 1 + side * fees.get(venue, 0.0)
+            for price, size in (book[1] if side == 1 else book[0]):
+                yield (side * price * cost, price, size, venue)
+
+        allocations: Dict[str, float] = dict()
+        left: Dict[str, float] = dict(capacities)
+        remaining: float = quantity
+        notional: float = 0.0
+        limit: float | None = None
+        for key, price, size, venue in heapq.merge(*(levels(venue, book) for venue, book in books.items())):
+            if limit is None:
+                limit = key + abs(key) * max_slippage
+            if key > limit or remaining <= 0:
+                break
+            taken: float = min(size, remaining, left.get(venue, remaining))
+            if taken <= 0:
+                continue
+            allocations[venue] = allocations.get(venue, 0.0) + taken
+            if venue in left:
+                left[venue] -= taken
+            remaining -= taken
+            notional += taken * price
+        filled: float = quantity - remaining
+        return allocations, (notional / filled if filled > 0 else 0.0)
+
+    async def __book(
+        self: "SmartOrderRouter",
+        adapter: ExchangeAdapter,
+        base: str,
+        ccy: str,
+    ) -> Book | None:
+        local: LocalBook | None = self.books.get(adapter.name)
+        book: Book | None = None if local is None else local.snapshot()
+        if book is None:
+            book = await adapter.depth_async(base, ccy, self.depth_limit)
+        return book
+
+    async def place_bracket(
+        self: "SmartOrderRouter",
+        side: int,
+        base: str,
+        ccy: str,
+        quantity: float,
+        leverage: int,
+        target_prices: Callable[[float], Tuple[float, float]],  # price of the venue -> (tp price, sl price)
+    ) -> SplitOrder | None:
+        """
+        func place_bracket():
+            - the bracket split across the venues, a child bracket per venue, None when every child has been rejected.
+            - a child of unknown outcome is not counted as filled, nor as rejected, see SplitOrder.unknown.
+            - the SL / TP of every child are set from the price of its venue.
+        """
+        started: float = time.perf_counter()
+        quotes: List[Tuple[Book | None, float | None, float | None]] = await asyncio.gather(*(
+            asyncio.gather(self.__book(adapter, base, ccy), adapter.price_async(base, ccy), adapter.available_balance_async(ccy))
+            for adapter in self.adapters
+        ))
+
+        venues: Dict[str, Tuple[ExchangeAdapter, float]] = dict()
+        books: Dict[str, Book] = dict()
+        capacities: Dict[str, float] = dict()
+        for adapter, (book, price, available) in zip(self.adapters, quotes):
+            if book is None or not price or available is None:
+                operation_logger.info(f"{__name__} - {adapter.name} is left out of the split, book: {book is not None}, price: {price}, margin: {available}")
+                continue
+            venues[adapter.name] = (adapter, price)
+            books[adapter.name] = book
+            capacities[adapter.name] = available * leverage / (price * self.margin_buffer)
+
+        allocations, expected_price = SmartOrderRouter.allocate(
+            books, side, quantity, self.max_slippage,
+            fees = {venue: adapter.taker_fee(base, ccy) for venue, (adapter, _) in venues.items()},
+            capacities = capacities,
+        )
+        children: Dict[str, float] = dict()
+        for venue, allocated in allocations.items():
+            adapter, price = venues[venue]
+            rounded: float = adapter.round_quantity(base, ccy, allocated, price)
+            if rounded > 0:
+                children[venue] = rounded
+        UNALLOCATED.observe(max(quantity - sum(children.values()), 0.0) / quantity if quantity > 0 else 0.0)
+        if not children:
+            operation_logger.error(f"{__name__} - {quantity} {base} could not be allocated, {allocations}")
+            return None
+
+        async def child(venue: str, child_quantity: float) -> BracketOrder:
+            adapter, price = venues[venue]
+            tp_price, sl_price = target_prices(price)
+            return await adapter.place_bracket_async(
+                side = side, base = base, ccy = ccy, quantity = child_quantity, price = price,
+                sl_price = sl_price, tp_price = tp_price, leverage = leverage,
+            )
+
+        orders: List[BracketOrder] = await asyncio.gather(*(child(venue, child_quantity) for venue, child_quantity in children.items()))
+        for order in orders:
+            CHILD_ORDERS.labels(venue = order.venue, result = "accepted" if order.accepted else "unknown" if order.unknown else "rejected").inc()
+            if order.unknown:
+                operation_logger.error(f"{__name__} - {order} has an unknown outcome, its share of the split may be filled without its exits.")
+            elif not order.accepted:
+                operation_logger.error(f"{__name__} - {order} has been rejected, its share of the split is not filled.")
+
+        split: SplitOrder = SplitOrder(
+            symbol = f"{base}{ccy}",
+            side = side,
+            requested = quantity,
+            children = orders,
+            expected_price = expected_price,
+            latency_ms = (time.perf_counter() - started) * 1_000,
+        )
+        if not split.accepted:
+            return split if split.unknown else None
+        trading_logger.info(f"{__name__} - {split} has been placed in {split.latency_ms:.1f} ms at {expected_price:.2f} on the books.")
+        return split
@@ -0,0 +1,412 @@
+# Standard Library
+import json
+import os
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Third-party Library
+import numpy as np
+
+# Custom Library
+from logger.set_logger import operation_logger
+
+
+SNAPSHOT_VERSION: int = 1
+
+# a value within this many steps of a step boundary is treated as on it, i.e., 0.30000000000000004 / 0.1.
+_STEP_EPSILON: float = 1e-9
+
+
+def _decimals(step: float) -> int:
+    """
+    func _decimals():
+        - number of decimal places of a step size, e.g., 0.001 -> 3, used to drop the float noise of the rounded values.
+    """
+    exponent: int = Decimal(repr(float(step))).normalize().as_tuple().exponent  # type: ignore[assignment]
+    return max(0, -exponent)
+
+
+def _round_to_step(
+    values: Any,
+    step: float,
+    decimals: int,
+    mode: str,
+) -> Any:
+    array: np.ndarray = np.asarray(values, dtype = np.float64)
+    if step > 0:
+        units: np.ndarray = array / step
+        if mode == "down":
+            units = np.floor(units + _STEP_EPSILON)
+        elif mode == "up":
+            units = np.ceil(units - _STEP_EPSILON)
+        elif mode == "nearest":
+            units = np.round(units)
+        else:
+            raise ValueError(f"Unknown rounding mode {mode}, expected down, up or nearest.")
+        array = np.round(units * step, decimals)
+    return float(array) if array.ndim == 0 else array
+
+
+class SymbolFilters:
+    '''
+    # trading rules of one symbol on one exchange.
+        # Binance: quantities are in the base asset, e.g., BTC, from the LOT_SIZE / PRICE_FILTER / MIN_NOTIONAL filters.
+        # MEXC: quantities are in contracts (vol), contract_size converts them to the base asset.
+
+    - fees are rates, e.g., 0.0004, None when the exchange did not report them.
+    '''
+    __slots__ = (
+        "exchange", "symbol", "tick_size", "step_size", "min_qty", "max_qty", "min_notional",
+        "contract_size", "max_leverage", "maker_fee", "taker_fee", "updated", "price_decimals", "quantity_decimals",
+    )
+
+    def __init__(
+        self: "SymbolFilters",
+        exchange: str,
+        symbol: str,
+        tick_size: float,
+        step_size: float,
+        min_qty: float = 0.0,
+        max_qty: float | None = None,
+        min_notional: float = 0.0,
+        contract_size: float = 1.0,
+        max_leverage: int | None = None,
+        maker_fee: float | None = None,
+        taker_fee: float | None = None,
+        updated: int | None = None,  # ms
+    ) -> None:
+        self.exchange: str = exchange
+        self.symbol: str = symbol
+        self.tick_size: float = float(tick_size)
+        self.step_size: float = float(step_size)
+        self.min_qty: float = float(min_qty)
+        self.max_qty: float | None = None if max_qty is None else float(max_qty)
+        self.min_notional: float = float(min_notional)
+        self.contract_size: float = float(contract_size)
+        self.max_leverage: int | None = None if max_leverage is None else int(max_leverage)
+        self.maker_fee: float | None = None if maker_fee is None else float(maker_fee)
+        self.taker_fee: float | None = None if taker_fee is None else float(taker_fee)
+        self.updated: int = updated if updated is not None else int(time.time() * 1_000)
+        self.price_decimals: int = _decimals(self.tick_size)
+        self.quantity_decimals: int = _decimals(self.step_size)
+        return
+
+    def to_dict(self: "SymbolFilters") -> Dict[str, Any]:
+        return {
+            name: getattr(self, name)
+            for name in SymbolFilters.__slots__
+            if name not in ("price_decimals", "quantity_decimals")
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "SymbolFilters":
+        return SymbolFilters(**data)
+
+    def round_price(
+        self: "SymbolFilters",
+        prices: Any,
+        mode: str = "nearest",
+    ) -> Any:
+        return _round_to_step(prices, self.tick_size, self.price_decimals, mode)
+
+    def round_quantity(
+        self: "SymbolFilters",
+        quantities: Any,
+        mode: str = "down",
+    ) -> Any:
+        return _round_to_step(quantities, self.step_size, self.quantity_decimals, mode)
+
+    def order_quantity(
+        self: "SymbolFilters",
+        quantity: float,
+        price: float,
+    ) -> float:
+        """
+        func order_quantity():
+            - quantity floored to the step and raised to the minimum quantity and the minimum notional at the price.
+            - capped at max_qty, so the result is always an order the exchange accepts.
+        """
+        minimum: float = max(
+            self.min_qty,
+            self.round_quantity(self.min_notional / (price * self.contract_size), mode = "up") if price > 0 else 0.0,
+        )
+        result: float = max(self.round_quantity(quantity), minimum)
+        if self.max_qty is not None:
+            result = min(result, self.max_qty)
+        return result
+
+
+class SymbolMetadataCache:
+    '''
+    # (exchange, symbol) -> SymbolFilters, looked up in O(1) on the order path.
+        # start() loads the snapshot file, so the first order never waits for the exchange.
+        # a background thread refreshes from exchange_info() (Binance) and detail() (MEXC) every <refresh_interval> seconds,
+        # fee_rate() and risk_limit() are added for the MEXC symbols of <mexc_symbols> when the SDK is signed.
+        # every successful refresh is written back to the snapshot, swapped in atomically.
+    '''
+    def __init__(
+        self: "SymbolMetadataCache",
+        binance: Any = None,  # binance.future.FutureMarket
+        mexc: Any = None,  # mexc.future.FutureMarket
+        path: str | None = None,
+        refresh_interval: float = 3_600.0,  # Second
+        mexc_symbols: Sequence[str] = ("BTC_USDT",),
+    ) -> None:
+        if path is None:
+            path = os.path.join(
+                os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
+                "data",
+                "metadata",
+                "symbols.json",
+            )
+        self.binance: Any = binance
+        self.mexc: Any = mexc
+        self.path: str = path
+        self.refresh_interval: float = refresh_interval
+        self.mexc_symbols: Tuple[str, ...] = tuple(mexc_symbols)
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__filters: Dict[Tuple[str, str], SymbolFilters] = dict()
+        self.__stop: threading.Event = threading.Event()
+        self.__thread: threading.Thread | None = None
+        return
+
+    """
+    ######################################################################################################################
+    #                                                     Lookup                                                         #
+    ######################################################################################################################
+    """
+    def get(
+        self: "SymbolMetadataCache",
+        exchange: str,
+        symbol: str,
+    ) -> SymbolFilters | None:
+        return self.__filters.get((exchange, symbol))
+
+    def __getitem__(
+        self: "SymbolMetadataCache",
+        key: Tuple[str, str],
+    ) -> SymbolFilters:
+        filters: SymbolFilters | None = self.__filters.get(key)
+        if filters is None:
+            raise KeyError(f"No metadata for {key[1]} on {key[0]}.")
+        return filters
+
+    def __len__(self: "SymbolMetadataCache") -> int:
+        return len(self.__filters)
+
+    def put(
+        self: "SymbolMetadataCache",
+        filters: Iterable[SymbolFilters],
+    ) -> None:
+        with self.__lock:
+            # readers look up without the lock, so the dict is replaced rather than mutated.
+            updated: Dict[Tuple[str, str], SymbolFilters] = dict(self.__filters)
+            for item in filters:
+                updated[(item.exchange, item.symbol)] = item
+            self.__filters = updated
+        return
+
+    def round_price(
+        self: "SymbolMetadataCache",
+        exchange: str,
+        symbol: str,
+        prices: Any,
+        mode: str = "nearest",
+    ) -> Any:
+        """
+        func round_price():
+            - prices, a number or an array, rounded to the tick size; KeyError for an unknown symbol.
+        """
+        return self[(exchange, symbol)].round_price(prices, mode = mode)
+
+    def round_quantity(
+        self: "SymbolMetadataCache",
+        exchange: str,
+        symbol: str,
+        quantities: Any,
+        mode: str = "down",
+    ) -> Any:
+        """
+        func round_quantity():
+            - quantities, a number or an array, floored to the step size by default; KeyError for an unknown symbol.
+        """
+        return self[(exchange, symbol)].round_quantity(quantities, mode = mode)
+
+    """
+    ######################################################################################################################
+    #                                                     Parsing                                                        #
+    ######################################################################################################################
+    """
+    @staticmethod
+    def parse_binance_exchange_info(response: Any) -> List[SymbolFilters]:
+        result: List[SymbolFilters] = list()
+        for item in (response or dict()).get("symbols", list()):
+            filters: Dict[str, Dict[str, Any]] = {entry.get("filterType"): entry for entry in item.get("filters", list())}
+            lot_size: Dict[str, Any] = filters.get("LOT_SIZE", dict())
+            result.append(SymbolFilters(
+                exchange = "binance",
+                symbol = item["symbol"],
+                tick_size = float(filters.get("PRICE_FILTER", dict()).get("tickSize", 0.0)),
+                step_size = float(lot_size.get("stepSize", 0.0)),
+                min_qty = float(lot_size.get("minQty", 0.0)),
+                max_qty = float(lot_size["maxQty"]) if lot_size.get("maxQty") else None,
+                min_notional = float(filters.get("MIN_NOTIONAL", dict()).get("notional", 0.0)),
+            ))
+        return result
+
+    @staticmethod
+    def parse_mexc_detail(response: Any) -> List[SymbolFilters]:
+        data: Any = (response or dict()).get("data") if isinstance(response, dict) else None
+        items: List[Dict[str, Any]] = data if isinstance(data, list) else ([data] if isinstance(data, dict) else list())
+        return [
+            SymbolFilters(
+                exchange = "mexc",
+                symbol = item["symbol"],
+                tick_size = float(item.get("priceUnit", 0.0)),
+                step_size = float(item.get("volUnit", 1.0)),
+                min_qty = float(item.get("minVol", 0.0)),
+                max_qty = float(item["maxVol"]) if item.get("maxVol") else None,
+                contract_size = float(item.get("contractSize", 1.0)),
+                max_leverage = item.get("maxLeverage"),
+                maker_fee = item.get("makerFeeRate"),
+                taker_fee = item.get("takerFeeRate"),
+            )
+            for item in items
+            if item.get("symbol")
+        ]
+
+    def __mexc_account_filters(
+        self: "SymbolMetadataCache",
+        filters: SymbolFilters,
+    ) -> None:
+        """
+        func __mexc_account_filters():
+            - the fees of the account tier and the first risk limit tier, both are signed endpoints.
+        """
+        fee_rate: Any = self.mexc.fee_rate(symbol = filters.symbol)
+        fees: Any = fee_rate.get("data") if isinstance(fee_rate, dict) and fee_rate.get("success") else None
+        if isinstance(fees, dict):
+            filters.maker_fee = float(fees.get("makerFee", filters.maker_fee or 0.0))
+            filters.taker_fee = float(fees.get("takerFee", filters.taker_fee or 0.0))
+
+        risk_limit: Any = self.mexc.risk_limit(symbol = filters.symbol)
+        tiers: Any = risk_limit.get("data") if isinstance(risk_limit, dict) and risk_limit.get("success") else None
+        if isinstance(tiers, dict):
+            tiers = tiers.get(filters.symbol)
+        if isinstance(tiers, list) and tiers and isinstance(tiers[0], dict):
+            if tiers[0].get("maxVol"):
+                filters.max_qty = float(tiers[0]["maxVol"])
+            if tiers[0].get("maxLeverage"):
+                filters.max_leverage = int(tiers[0]["maxLeverage"])
+        return
+
+    """
+    ######################################################################################################################
+    #                                                Snapshot and Refresh                                                #
+    ######################################################################################################################
+    """
+    def load(self: "SymbolMetadataCache") -> int:
+        """
+        func load():
+            - read the snapshot file, a missing or unreadable snapshot leaves the cache as it is.
+
+        return int:
+            - number of symbols loaded.
+        """
+        try:
+            with open(self.path, "r", encoding = "utf-8") as file:
+                snapshot: Dict[str, Any] = json.load(file)
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {snapshot.get('version')}")
+            filters: List[SymbolFilters] = [SymbolFilters.from_dict(item) for item in snapshot.get("symbols", list())]
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            operation_logger.warning(f"{__name__} - Symbol metadata snapshot {self.path} is ignored: {str(e)}")
+            return 0
+
+        self.put(filters)
+        operation_logger.info(f"{__name__} - {len(filters)} symbols have been loaded from {self.path}")
+        return len(filters)
+
+    def save(self: "SymbolMetadataCache") -> None:
+        snapshot: Dict[str, Any] = {
+            "version": SNAPSHOT_VERSION,
+            "saved": int(time.time() * 1_000),
+            "symbols": [filters.to_dict() for filters in self.__filters.values()],
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok = True)
+        tmp_path: str = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding = "utf-8") as file:
+            json.dump(snapshot, file)
+        os.replace(tmp_path, self.path)  # atomic swap, a crash never leaves a half-written snapshot.
+        return
+
+    def refresh(self: "SymbolMetadataCache") -> int:
+        """
+        func refresh():
+            - fetch the rules of every symbol from the exchanges, bypassing the response cache, and save the snapshot.
+
+        return int:
+            - number of symbols refreshed, 0 if no exchange answered.
+        """
+        fetched: List[SymbolFilters] = list()
+        if self.binance is not None:
+            self.binance.cache.invalidate("exchange_info")
+            fetched.extend(SymbolMetadataCache.parse_binance_exchange_info(self.binance.exchange_info()))
+        if self.mexc is not None:
+            self.mexc.cache.invalidate("detail")
+            mexc_filters: List[SymbolFilters] = SymbolMetadataCache.parse_mexc_detail(self.mexc.detail(symbol = None))
+            if self.mexc.api_key and self.mexc.secret_key:
+                for filters in mexc_filters:
+                    if filters.symbol in self.mexc_symbols:
+                        self.__mexc_account_filters(filters)
+            fetched.extend(mexc_filters)
+
+        if fetched:
+            self.put(fetched)
+            try:
+                self.save()
+            except OSError as e:
+                operation_logger.warning(f"{__name__} - Failed to save the symbol metadata snapshot: {str(e)}")
+        return len(fetched)
+
+    """
+    ######################################################################################################################
+    #                                               Threading Management                                                 #
+    ######################################################################################################################
+    """
+    def start(self: "SymbolMetadataCache") -> "SymbolMetadataCache":
+        """
+        func start():
+            - load the snapshot in the caller's thread, the first refresh runs in the background right away.
+        """
+        if self.__thread is not None:
+            return self
+        self.load()
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            name = "symbol_metadata_refresh",
+            target = self.__refresh_loop,
+            daemon = True,
+        )
+        self.__thread.start()
+        return self
+
+    def stop(self: "SymbolMetadataCache") -> None:
+        self.__stop.set()
+        self.__thread = None
+        return
+
+    def __refresh_loop(self: "SymbolMetadataCache") -> None:
+        while not self.__stop.is_set():
+            try:
+                refreshed: int = self.refresh()
+                operation_logger.info(f"{__name__} - {refreshed} symbols have been refreshed")
+            except Exception as e:
+                operation_logger.error(f"{__name__} - Symbol metadata refresh failed: {str(e)}")
+            self.__stop.wait(self.refresh_interval)
+        return
@@ -5,30 +5,53 @@ import sys
 import threading
 
 # CUSTOM LIBRARY
+from custom_telegram.notification_service import NotificationService
 from custom_telegram.telegram_bot_class import CustomTelegramBot
+from manager.basis_monitor import BasisMonitor
 from manager.data_collector_and_processor import DataCollectorAndProcessor, IndexFactory
+from manager.market_data_store import MarketDataStore
+from manager.order_manager import OrderManager
 from manager.signal_generator import SignalGenerator
+from manager.smart_order_router import SmartOrderRouter
+from manager.symbol_metadata import SymbolMetadataCache
+from analysis.registry import IndicatorRegistry
 from manager.trade_manager import TradeManager
+from manager.venue_router import VenueRouter
 from pipeline.data_pipeline import DataPipeline
 from logger.set_logger import operation_logger
 from pipeline.signal_pipeline import SignalPipeline
+from simulation.paper_trading import PaperFutureMarket
 from interface.pipeline_interface import PipelineController
 from object.constants import IndexType
 from object.score_mapping import ScoreMapper
-from object.indexes import Index
+from object.indexes import Index, IndexPool
 from object.signal import Signal
+from telemetry.metrics import MetricsServer, metrics
+from telemetry.tracing import tracer
 
 # MEXC
+from mexc.adapter import MexcAdapter
 from mexc.future import FutureMarket as MexcFutureMarket, FutureWebSocket as MexcFutureWebSocket
 
 # BINANCE
-from binance.future import FutureMarket as BinanceFutureMarket
+from binance.adapter import BinanceAdapter
+from binance.future import FutureMarket as BinanceFutureMarket, FutureWebSocket as BinanceFutureWebSocket
 
 
 class SystemManager:
     # @log_decorator
     def __init__(
         self: "SystemManager",
+        mexc_rest_url: str = "https://contract.mexc.com",
+        mexc_ws_url: str = "wss://contract.mexc.com/edge",
+        binance_rest_url: str = "https://fapi.binance.com",
+        binance_ws_url: str = "wss://fstream.binance.com",
+        metrics_port: int | None = None,
+        metadata_path: str | None = None,
+        paper_trading: bool | None = None,
+        venue_routing: bool | None = None,
+        smart_routing: bool | None = None,
+        block: bool = True,
     ):
         """
         func __init__():
@@ -36,6 +59,22 @@ class SystemManager:
 
         param self: SystemManager
             - class object
+        params mexc_rest_url, mexc_ws_url, binance_rest_url, binance_ws_url
+            - endpoints of the exchange SDKs, e.g., the mock servers of the simulation package for the load tests.
+        param metrics_port
+            - port of the metrics endpoint, METRICS_PORT or 9464 if not given, 0 for a port picked by the OS.
+        param metadata_path
+            - snapshot file of the symbol metadata, src/data/metadata/symbols.json if not given.
+        param paper_trading
+            - fill the orders in memory against the live Binance prices instead of sending them, PAPER_TRADING=1 if not given.
+        param venue_routing
+            - place every trade on Binance or MEXC, whichever the VenueRouter picks, VENUE_ROUTING=1 if not given.
+            - ignored with paper_trading, the paper market is Binance only.
+        param smart_routing
+            - split every trade across Binance and MEXC by the depth of their books, SMART_ORDER_ROUTING=1 if not given.
+            - implies venue_routing, and is ignored with paper_trading as well.
+        param block
+            - keep the calling thread in start() until stop(), as main() does.
 
         return None
         """
@@ -43,17 +82,53 @@ class SystemManager:
             self._stop = threading.Event()
 
             self.telegram_bot: CustomTelegramBot = self.__set_up_telegram_bot()
+            # one loop and one HTTP client for every notification, the trading threads only enqueue.
+            self.notifier: NotificationService = NotificationService(bot = self.telegram_bot).start()
 
             # prepare the necessary parts for injection.
-            self.mexc_ws: MexcFutureWebSocket = SystemManager.__construct_mexc_ws()
+            self.mexc_ws: MexcFutureWebSocket = SystemManager.__construct_mexc_ws(mexc_ws_url)
             operation_logger.info(f"{__name__} - {self.mexc_ws} has been initialized successfully.")
 
-            self.mexc_future: MexcFutureMarket = SystemManager.__construct_mexc_future()
+            self.mexc_future: MexcFutureMarket = SystemManager.__construct_mexc_future(mexc_rest_url)
             operation_logger.info(f"{__name__} - {self.mexc_ws} has been initialized successfully.")
 
-            self.binance_future: BinanceFutureMarket = SystemManager.__construct_binance_future()
+            self.binance_future: BinanceFutureMarket = SystemManager.__construct_binance_future(binance_rest_url)
             operation_logger.info(f"{__name__} - {self.binance_future} has been initialized successfully.")
 
+            # the signed requests are stamped with the exchange clock, and the MEXC clock gives the latency of the ticks.
+            self.mexc_future.start_clock_sync()
+            if self.binance_future is not None:
+                self.binance_future.start_clock_sync()
+
+            # filters of the symbols from the last snapshot, refreshed from the exchanges in the background.
+            self.symbol_metadata: SymbolMetadataCache = SymbolMetadataCache(
+                binance = self.binance_future,
+                mexc = self.mexc_future,
+                path = metadata_path,
+            ).start()
+
+            self.binance_ws: BinanceFutureWebSocket = SystemManager.__construct_binance_ws(binance_ws_url, self.binance_future)
+            operation_logger.info(f"{__name__} - {self.binance_ws} has been initialized successfully.")
+
+            # the paper account follows the public streams only, there is no user data stream of it to subscribe to.
+            self.paper_future: PaperFutureMarket | None = None
+            if paper_trading if paper_trading is not None else os.getenv("PAPER_TRADING") == "1":
+                self.paper_future = PaperFutureMarket().subscribe(self.binance_ws)
+                operation_logger.info(f"{__name__} - Paper trading, the orders are filled by {self.paper_future}.")
+
+            # one OrderManager for the TradeManager and the Binance adapter, so the user data stream tracks the routed orders too.
+            self.order_manager: OrderManager | None = None
+            self.venue_router: VenueRouter | None = None
+            smart_routing = smart_routing if smart_routing is not None else os.getenv("SMART_ORDER_ROUTING") == "1"
+            if self.paper_future is None and (smart_routing or (venue_routing if venue_routing is not None else os.getenv("VENUE_ROUTING") == "1")):
+                self.order_manager = OrderManager(binance = self.binance_future)
+                adapters = [
+                    BinanceAdapter(self.binance_future, self.binance_ws, self.order_manager, self.symbol_metadata),
+                    MexcAdapter(self.mexc_future, self.mexc_ws, self.symbol_metadata),
+                ]
+                self.venue_router = SmartOrderRouter(adapters).watch("BTC", "USDT") if smart_routing else VenueRouter(adapters)
+                operation_logger.info(f"{__name__} - The trades are routed among {self.venue_router.adapters}.")
+
             self.data_pipeline: DataPipeline = DataPipeline()
             operation_logger.info(f"{self.data_pipeline} has been started.")
 
@@ -66,31 +141,60 @@ class SystemManager:
             self.data_pipeline_controller: PipelineController[Index] = PipelineController(pipeline = self.data_pipeline)
             self.signal_pipeline_controller: PipelineController[Signal] = PipelineController(pipeline = self.signal_pipline)
 
+            self.market_data_store: MarketDataStore = MarketDataStore()
+            operation_logger.info(f"{self.market_data_store} has been started.")
+
+            # Index free-list shared by the producer (IndexFactory) and the consumer (SignalGenerator).
+            self.index_pool: IndexPool = IndexPool()
+
+            # streaming indicators, computed by the collector for whatever the SignalGenerator subscribes to.
+            self.indicator_registry: IndicatorRegistry = IndicatorRegistry.default()
+
             self.data_collector_processor: DataCollectorAndProcessor = (
                 DataCollectorAndProcessor(
                     pipeline_controller = self.data_pipeline_controller,
                     websocket = self.mexc_ws,  # use MEXC API Endpoint for Real-Time Data Fetching.
+                    index_factory = IndexFactory(pool = self.index_pool),
+                    market_data_store = self.market_data_store,
+                    indicator_registry = self.indicator_registry,
+                    clock = self.mexc_future.clock,
                 )
             )
 
+            # basis of the MEXC fair price over the Binance mark price, aligned on the exchange timestamps.
+            self.basis_monitor: BasisMonitor = BasisMonitor(
+                pipeline_controller = self.data_pipeline_controller,
+                index_factory = IndexFactory(pool = self.index_pool),
+            ).subscribe(self.mexc_ws, self.binance_ws)
+
             self.signal_generator: SignalGenerator = SignalGenerator(
                 data_pipeline_controller = self.data_pipeline_controller,
                 custom_telegram_bot = self.telegram_bot,
                 signal_pipeline_controller = self.signal_pipeline_controller,
+                index_pool = self.index_pool,
+                indicator_registry = self.indicator_registry,
+                notifier = self.notifier,
             )
 
             # one more classs: trade_manager -> it will have the FutureMarket SDWK
             self.trade_manager: TradeManager = TradeManager(
                 signal_pipeline_controller = self.signal_pipeline_controller,
                 mexc_future = self.mexc_future,
-                binanace_future = self.binance_future,
+                binanace_future = self.binance_future if self.paper_future is None else self.paper_future,
                 delta_mapper = self.mapper,
                 telegram_bot = self.telegram_bot,
+                binance_ws = self.binance_ws if self.paper_future is None else None,
+                symbol_metadata = self.symbol_metadata,
+                notifier = self.notifier,
+                order_manager = self.order_manager,
+                venue_router = self.venue_router,
             )
 
+            self.metrics_server: MetricsServer = self.__set_up_metrics(metrics_port)
+
             # Start working
-            while True:
-                time.sleep(0.5)  # Sleep to reduce the cpu usage.
+            if block:
+                self.start()
         except KeyboardInterrupt:
             operation_logger.info("Program interrupted by user. Exiting...")
             sys.exit(0)
@@ -121,6 +225,18 @@ class SystemManager:
             return
         self._stop.set()
         # add the stop for other compponents as well.
+        for ws in (self.mexc_ws, self.binance_ws):
+            ws.exit()
+        self.metrics_server.stop()
+        self.symbol_metadata.stop()
+        self.notifier.stop()
+        for sdk in (self.mexc_future, self.binance_future):
+            if sdk is not None and sdk.clock is not None:
+                sdk.clock.stop()
+        if self.paper_future is not None:
+            operation_logger.info(f"{__name__} - Paper trading result: {self.paper_future.summary()}")
+        return
+
     """
     ######################################################################################################################
     #                                                Static Method                                                       #
@@ -152,6 +268,27 @@ class SystemManager:
             operation_logger.critical(f"{__name__} - The Unknown Error occured: {str(e)}")
             return None
 
+    def __set_up_metrics(
+        self: "SystemManager",
+        port: int | None = None,
+    ) -> MetricsServer:
+        """
+        func __set_up_metrics():
+            - expose the depth of the queues between the components, sampled on every scrape.
+            - serve the metrics registry and the tracer percentiles on the port, METRICS_PORT or 9464 if not given.
+        """
+        queue_depth = metrics.gauge("queue_depth", "Number of items waiting in the queue.", ("queue",))
+        queue_depth.labels(queue = "price_fetch_buffer").set_function(self.data_collector_processor.price_fetch_buffer.qsize)
+        queue_depth.labels(queue = "data_pipeline").set_function(self.data_pipeline.queue.qsize)
+        queue_depth.labels(queue = "signal_pipeline").set_function(self.signal_pipline.signal_queue.qsize)
+        queue_depth.labels(queue = "notifications").set_function(self.notifier.qsize)
+        metrics.add_collector(tracer.expose)
+
+        return MetricsServer(
+            registry = metrics,
+            port = port if port is not None else int(os.getenv("METRICS_PORT", "9464")),
+        ).start()
+
     @staticmethod
     def __get_telegram_credentials():
         api_key = os.getenv("TELEGRAM_API_KEY")
@@ -182,35 +319,55 @@ class SystemManager:
             operation_logger.critica(f"{__name__} - Getting unexpected error during getting the credentials for Binance Future: {str(e)}")
 
     @staticmethod
-    def __construct_mexc_ws() -> MexcFutureWebSocket:
+    def __construct_mexc_ws(
+        endpoint: str,
+    ) -> MexcFutureWebSocket:
         api_key, secret_key = SystemManager.__get_mexc_future_credentials()
 
         return MexcFutureWebSocket(
+            endpoint = endpoint,
             api_key = api_key,
             secret_key = secret_key,
         )
 
     @staticmethod
-    def __construct_mexc_future() -> MexcFutureMarket:
+    def __construct_mexc_future(
+        base_url: str,
+    ) -> MexcFutureMarket:
         api_key, secret_key = SystemManager.__get_mexc_future_credentials()
 
         return MexcFutureMarket(
+            base_url = base_url,
             api_key = api_key,
             secret_key = secret_key,
         )
 
     @staticmethod
-    def __construct_binance_future() -> BinanceFutureMarket:
+    def __construct_binance_future(
+        base_url: str,
+    ) -> BinanceFutureMarket:
         try:
             api_key, secret_key = SystemManager.__get_binance_future_credentials()
 
             return BinanceFutureMarket(
+                base_url = base_url,
                 api_key = api_key,
                 secret_key = secret_key,
             )
         except ValueError as e:
             operation_logger.critical(f"{__name__} - binance_api_key or/and binance_secret_key is/are None.")
 
+    @staticmethod
+    def __construct_binance_ws(
+        endpoint: str,
+        binance_future: BinanceFutureMarket | None,
+    ) -> BinanceFutureWebSocket:
+        # the REST client creates the listenKey of the user data stream.
+        return BinanceFutureWebSocket(
+            endpoint = endpoint,
+            future_market = binance_future,
+        )
+
 
 def main():  # to test run the system manager.
     # ! make the start, stop and terminate command for the SystemManager
@@ -2,17 +2,57 @@
 import threading
 import asyncio
 import time
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 
 # Custom Library
+from custom_telegram.notification_service import NotificationService, Priority
 from custom_telegram.telegram_bot_class import CustomTelegramBot
 from logger.set_logger import operation_logger, trading_logger
 from mexc.future import FutureMarket as MexCFutureMarket
-from binance.future import FutureMarket as BinanceFutureMarket
+from binance.future import FutureMarket as BinanceFutureMarket, FutureWebSocket as BinanceFutureWebSocket
+from manager.order_manager import ManagedOrder, OrderManager, OrderState
+from manager.protective_orders import ProtectiveOrderEngine
+from manager.symbol_metadata import SymbolFilters, SymbolMetadataCache
+from manager.venue_router import VenueRouter
+from object.score_accumulator import ScoreAccumulator
 from object.score_mapping import ScoreMapper
+from sdk.signer import EncodedQuery
 from object.signal import Signal, TradeSignal
 from pipeline.signal_pipeline import SignalPipeline
+from interface.exchange_interface import BracketOrder
 from interface.pipeline_interface import PipelineController
+from telemetry.tracing import Stage, TraceContext, tracer
+
+
+class ArmedOrder:
+    '''
+    # orders of one side, sized, rounded and encoded ahead of the threshold, only the timestamp and signature are left.
+        # entry: the MARKET order, exits: (role, order) of the STOP_MARKET and TAKE_PROFIT_MARKET closePosition orders,
+        # or of the backstop alone when the SL and the TP are kept by the ProtectiveOrderEngine.
+        # the queries carry their newClientOrderId of the OrderManager, so the orders are tracked once sent.
+        # flat: no position was open when it has been armed, used when the positions are not pushed by the websocket.
+    '''
+    def __init__(
+        self: "ArmedOrder",
+        side: int,  # 1: long, -1: short
+        price: float,
+        quantity: float,
+        tp_price: float,
+        sl_price: float,
+        entry: EncodedQuery,
+        exits: List[Tuple[str, EncodedQuery]],
+        flat: bool,
+    ) -> None:
+        self.side: int = side
+        self.price: float = price
+        self.quantity: float = quantity
+        self.tp_price: float = tp_price
+        self.sl_price: float = sl_price
+        self.entry: EncodedQuery = entry
+        self.exits: List[Tuple[str, EncodedQuery]] = exits
+        self.flat: bool = flat
+        self.created: int = int(time.time() * 1_000)
+        return
 
 
 class TradeManager:
@@ -74,12 +114,50 @@ class TradeManager:
         stop_loss_rate: float = 0.05,  # 5%
         score_threashold: int = 1_000,  # 1_000,
         trend_managing_score: int = 200,  # 200
+        binance_ws: BinanceFutureWebSocket | None = None,
+        price_ttl: int = 5_000,  # ms
+        symbol_metadata: SymbolMetadataCache | None = None,
+        arm_fraction: float | None = 0.8,  # None -> no pre-arming
+        arm_ttl: int = 2_000,  # ms
+        arm_drift: float = 0.001,  # 0.1%
+        score_half_lives: Dict[TradeSignal | None, int | None] | None = ScoreAccumulator.HALF_LIVES,  # ms, None -> no decay
+        score_clock: Callable[[], int] | None = None,  # ms, the wall clock if not given
+        notifier: NotificationService | None = None,
+        order_manager: OrderManager | None = None,
+        protective_orders: ProtectiveOrderEngine | None = None,
+        backstop_factor: float = 2.0,
+        trailing_stop: float | None = None,  # 0.005 -> the SL trails the price by 0.5%, only with protective_orders
+        venue_router: VenueRouter | None = None,
+        reconcile_interval: float = 5.0,  # Second
     ) -> None:
         """
         func __init__():
             - initialize the TradeManager with the given signal generator and REST API caller for MexC.
             - initialize the necessary member variables and start the TradeManager.
+            - if binance_ws is given, the mark price and the account updates are pushed to the TradeManager
+            - and the REST API is only called when the pushed state is stale or has been invalidated.
+            - if symbol_metadata is given, the quantity and the prices of the orders follow the filters of the symbol.
+            - once |trade_score| reaches arm_fraction * score_threshold, the orders of both sides are armed in the background,
+            - an armed order older than arm_ttl or priced more than arm_drift away from the current price is not sent.
+            - the score contribution of every signal halves with the half-life of its TradeSignal in score_half_lives,
+            - and is decayed by its own timestamp, so a backtest with score_clock on the simulated time scores the same.
+            - the trades are notified through the notifier, one of its own on the telegram_bot if not given.
+            - the orders are sent and tracked by the order_manager, one of its own on binanace_future if not given.
+            - with protective_orders, the SL and the TP are triggered locally on the mark price stream, and only a backstop
+            - STOP_MARKET backstop_factor times as far as the SL is sent with the entry, in case this process is gone.
+            - protective_orders needs binance_ws and trailing_stop needs protective_orders, ValueError otherwise.
+            - with venue_router, the trades are placed as brackets on the venue it picks, or split across the venues
+            - by a SmartOrderRouter, and are not pre-armed,
+            - as the armed orders are encoded for Binance before the venue is known.
+            - the exits of an entry which has ended UNKNOWN are held back, and sent once the user data stream
+            - or reconcile(), every reconcile_interval and on a reconnect of the stream, shows it accepted.
         """
+        # the local stops are only triggered by the mark price stream, without it the positions would be left to the backstop.
+        if protective_orders is not None and binance_ws is None:
+            raise ValueError("protective_orders needs binance_ws, the local stops are triggered on its mark price stream.")
+        if trailing_stop is not None and protective_orders is None:
+            raise ValueError("trailing_stop needs protective_orders, only the local stops trail the price.")
+
         self.base_symbol: str = base_symbol
         self.ccy_symbol: str = ccy_symbol
 
@@ -91,10 +169,19 @@ class TradeManager:
         # TODO: Need to change this to interface. -> FUTURE TODO
         self.mexc_future_market_sdk = mexc_future
         self.binance_future_market = binanace_future
+        self.orders: OrderManager = order_manager if order_manager is not None else OrderManager(binance = binanace_future)
+        self.protective_orders: ProtectiveOrderEngine | None = protective_orders
+        self.backstop_factor: float = backstop_factor
+        self.trailing_stop: float | None = trailing_stop
+        self.venue_router: VenueRouter | None = venue_router
+        if venue_router is not None:
+            arm_fraction = None
 
         self.delta_mapper: ScoreMapper = delta_mapper
 
         self.telegram_bot: CustomTelegramBot = telegram_bot
+        # the order path only enqueues the message, Telegram is called from the loop of the notifier.
+        self.notifier: NotificationService = notifier if notifier is not None else NotificationService(bot = telegram_bot).start()
 
         self.score_threshold: int = score_threashold
         self.trend_manager_score: int = trend_managing_score
@@ -103,15 +190,45 @@ class TradeManager:
         self.threads: List[threading.Thread] = list()
 
         # Set the trade score as a member variable.
-        self.trade_score_lock: threading.Lock = threading.Lock()
-        self.trade_score: int = 0
+        # the decision coroutine and the arming thread are woken by the score only when it crosses a band.
+        self.score: ScoreAccumulator = ScoreAccumulator(
+            threshold = self.score_threshold,
+            arm_threshold = None if arm_fraction is None else arm_fraction * self.score_threshold,
+            half_lives = score_half_lives,
+            clock = score_clock,
+        )
 
         self.leverage: int = leverage
         self.trade_amount: float = trade_amount
         self.tp_rate: float = take_profit_rate
         self.sl_rate: float = stop_loss_rate
-
-        self.async_loop = asyncio.new_event_loop()  # only for Telegram Client
+        self.symbol_metadata: SymbolMetadataCache | None = symbol_metadata
+
+        # pre-armed orders, side -> ArmedOrder, see __thread_arm_orders().
+        self.arm_fraction: float | None = arm_fraction
+        self.arm_ttl: int = arm_ttl
+        self.arm_drift: float = arm_drift
+        self.armed_lock: threading.Lock = threading.Lock()
+        self.armed: Dict[int, ArmedOrder] = dict()
+        self.leverage_applied: int | None = None  # the leverage is set once when arming, not per order.
+
+        # exits of the entries which have ended UNKNOWN, entry client id -> (side, quantity, price, sl price, tp price).
+        self.reconcile_interval: float = reconcile_interval
+        self.pending_exits_lock: threading.Lock = threading.Lock()
+        self.pending_exits: Dict[str, Tuple[int, float, float, float, float]] = dict()
+
+        self.async_loop = asyncio.new_event_loop()  # only for the decision coroutine
+
+        # state pushed by the Binance websocket.
+        self.binance_ws: BinanceFutureWebSocket | None = binance_ws
+        self.price_ttl: int = price_ttl
+        self.market_state_lock: threading.Lock = threading.Lock()
+        self.index_price: Tuple[int, float] | None = None  # (event time in ms, index price)
+        self.available_usdt: float | None = None  # None -> fetch it from the REST API.
+        self.position_amounts: Dict[Tuple[str, str], float] | None = None  # (symbol, position side) -> amount, None -> not seeded yet.
+        self.account_stream_live: bool = False  # the two above are only kept while the user data stream is connected.
+        if self.binance_ws is not None:
+            self.__subscribe_account_streams()
 
         # Start the TradeManager
         self.start()
@@ -185,16 +302,27 @@ class TradeManager:
         thread_get_signal: threading.Thread = threading.Thread(
             target = self.__thread_get_signal,
             name = "Thread-Get-Signal",
+            daemon = True,
         )
 
         thread_decide_trade: threading.Thread = threading.Thread(
             target = self.thread_handle_async_trade_execution,
             name = "Thread-Decide-Trade",
             args = (self.async_loop,),
+            daemon = True,
         )
 
         # initialize the threads for the operations
         self.threads.extend([thread_get_signal, thread_decide_trade])
+
+        if self.arm_fraction is not None:
+            self.threads.append(
+                threading.Thread(
+                    target = self.__thread_arm_orders,
+                    name = "Thread-Arm-Orders",
+                    daemon = True,
+                )
+            )
         return None
 
     def __start_threads(
@@ -241,6 +369,10 @@ class TradeManager:
     #                                             Signal Management Method                                               #
     ######################################################################################################################
     """
+    @property
+    def trade_score(self: "TradeManager") -> float:
+        return self.score.score
+
     def thread_handle_async_trade_execution(self, loop) -> None:
         """ """
         asyncio.set_event_loop(loop)
@@ -255,6 +387,7 @@ class TradeManager:
             - private method
             - decide the trade based on the signal.
             - This function should be run by the other function which is monitoring some schema.
+            - it sleeps until the score moves to another band, so the crossing signal is acted on at once.
 
         param self:
             - TradeManager object
@@ -263,8 +396,10 @@ class TradeManager:
         """
         while True:
             try:
-                with self.trade_score_lock:
-                    score: int = self.trade_score
+                score, band, trace = self.score.snapshot()
+                if abs(band) < 2:
+                    await self.score.changed(band)
+                    continue
 
                 decision: int = self.__decide_trade(
                     score = score,
@@ -274,14 +409,12 @@ class TradeManager:
                     # Trade
                     await self.__execute_trade(
                         buy_or_sell = decision,
+                        trace = trace,
                     )
 
                     # reset the score, but based on the trend
                     # TODO: need to implement more sophisticated one.
-                    with self.trade_score_lock:
-                        self.trade_score = self.trend_manager_score if decision == 1 else -1 * (self.trend_manager_score)
-
-                await asyncio.sleep(0.25)
+                    self.score.reset(self.trend_manager_score if decision == 1 else -1 * (self.trend_manager_score))
 
             except Exception as e:
                 operation_logger.error(
@@ -321,6 +454,7 @@ class TradeManager:
     async def __execute_trade(
         self,
         buy_or_sell: int,
+        trace: TraceContext | None = None,
     ) -> None:
         """
         func __execute_trade():
@@ -330,8 +464,19 @@ class TradeManager:
 
         param self:
             - TradeManager object
+        param trace:
+            - trace of the signal which has tipped the score, the order submission and ack are recorded on a fork of it.
         """
         try:
+            armed: ArmedOrder | None = self.__take_armed(buy_or_sell)
+            if armed is not None:
+                await self.__execute_armed(armed, trace)
+                return None
+
+            if self.venue_router is not None and (buy_or_sell == 1 or buy_or_sell == -1):
+                await self.__execute_routed(buy_or_sell, trace)
+                return None
+
             if buy_or_sell == 1 or buy_or_sell == -1:
                 current_price: float = self.__get_current_price()
 
@@ -353,19 +498,22 @@ class TradeManager:
 
                 # order trigger to the telgram bot
                 if self.__decide_to_make_trade():  # make the trade
-                    self.binance_future_market.order(
+                    order_trace: TraceContext | None = None if trace is None else trace.fork().mark(Stage.ORDER_SUBMITTED)
+                    entry: ManagedOrder = self.__place_orders(
+                        side = "BUY" if order_type == 1 else "SELL",
+                        quantity = self.__order_quantity(trade_amount, current_price),
+                        price = current_price,
                         sl_price = sl_price,
                         tp_price = tp_price,
-                        leverage = self.leverage,
-                        symbol_curr_quantity = max(trade_amount, 0.002),
-                        side = "BUY" if order_type == 1 else "SELL"
-                    )
-                    await self.telegram_bot.send_text(
-                        f"Trade Signal: {'Buy' if order_type == 1 else 'Sell'}\nEntry Price: {current_price}\nAmount: {trade_amount}\nTake Profit: {tp_price}\nStop Loss: {sl_price}"
-                    )
-                    trading_logger.info(
-                        f"Trade Signal: {'Buy' if order_type == 1 else 'Sell'}\nEntry Price: {current_price}\nAmount: {trade_amount}\nTake Profit: {tp_price}\nStop Loss: {sl_price}"
                     )
+                    if order_trace is not None:
+                        tracer.record(order_trace.mark(Stage.ORDER_ACKED), Stage.SIGNAL_SCORED, Stage.ORDER_ACKED)
+                    message: str = f"Trade Signal: {'Buy' if order_type == 1 else 'Sell'}\nEntry Price: {current_price}\nAmount: {trade_amount}\nTake Profit: {tp_price}\nStop Loss: {sl_price}"
+                    if entry.state in (OrderState.REJECTED, OrderState.UNKNOWN):
+                        self.__report_failed_entry(entry, message)
+                        return None
+                    self.notifier.notify(message, priority = Priority.HIGH)
+                    trading_logger.info(message)
                 else:
                     trading_logger.info(
                         f"Trade Signal: {'Buy' if order_type == 1 else 'Sell'}\nEntry Price: {current_price}\nAmount: {trade_amount}\nTake Profit: {tp_price}\nStop Loss: {sl_price}\nHowever, the trade has not been occured."
@@ -375,6 +523,396 @@ class TradeManager:
             operation_logger.error(f"{__name__} - Error while executing the trade: {str(e)}")
         return None
 
+    async def __execute_routed(
+        self: "TradeManager",
+        buy_or_sell: int,
+        trace: TraceContext | None = None,
+    ) -> None:
+        """
+        func __execute_routed():
+            - private method
+            - the trade as a bracket on the venue picked by the venue_router, only when no venue holds a position.
+            - the quantity is sized as for Binance, the SL / TP are set from the price of the venue the order goes to.
+            - an order of unknown outcome is reported, it may be open on its venue without its SL / TP.
+        """
+        side: str = "Buy" if buy_or_sell == 1 else "Sell"
+        if not await self.venue_router.flat(self.base_symbol, self.ccy_symbol):
+            trading_logger.info(f"Trade Signal: {side}\nHowever, the trade has not been occured, a position is open on a venue.")
+            return None
+
+        current_price: float | None = self.__get_current_price()
+        quantity: float | None = None if current_price is None else self.get_base_qty(base_asset_price = current_price)
+        if not quantity:
+            operation_logger.error(f"{__name__} - The {side} trade has not been sized, price: {current_price}.")
+            return None
+
+        order_trace: TraceContext | None = None if trace is None else trace.fork().mark(Stage.ORDER_SUBMITTED)
+        order: BracketOrder | None = await self.venue_router.place_bracket(
+            side = buy_or_sell,
+            base = self.base_symbol,
+            ccy = self.ccy_symbol,
+            quantity = quantity,
+            leverage = self.leverage,
+            target_prices = lambda price: self.__get_target_prices(buy_or_sell = buy_or_sell, current_price = price),
+        )
+        if order is None:
+            operation_logger.error(f"{__name__} - The {side} trade of {quantity} {self.base_symbol} has not been taken by any venue.")
+            return None
+        if order.unknown:
+            failure: str = f"Trade Signal: {side}\nHowever, the outcome of {order} is unknown, it may be open without its SL / TP."
+            operation_logger.error(f"{__name__} - {failure}")
+            trading_logger.info(failure)
+            self.notifier.notify(failure, priority = Priority.HIGH)
+        if not order.accepted:
+            return None
+
+        if order_trace is not None:
+            tracer.record(order_trace.mark(Stage.ORDER_ACKED), Stage.SIGNAL_SCORED, Stage.ORDER_ACKED)
+        self.notifier.notify(
+            f"Trade Signal: {side}\nVenue: {order.venue}\nAmount: {order.quantity}",
+            priority = Priority.HIGH,
+        )
+        trading_logger.info(f"Trade Signal: {side}\nVenue: {order.venue}\nAmount: {order.quantity}")
+        return None
+
+    def __report_failed_entry(
+        self: "TradeManager",
+        entry: ManagedOrder,
+        message: str,
+    ) -> None:
+        """
+        func __report_failed_entry():
+            - the entry of the trade has been REJECTED, or ended UNKNOWN, i.e., it may be filled without its exits yet.
+        """
+        failure: str = f"{message}\nHowever, the entry order is {entry.state.value}: {entry.client_order_id}."
+        operation_logger.error(f"{__name__} - {failure}")
+        trading_logger.info(failure)
+        self.notifier.notify(failure, priority = Priority.HIGH)
+        return None
+
+    def __place_orders(
+        self: "TradeManager",
+        side: str,
+        quantity: float,
+        price: float,
+        sl_price: float,
+        tp_price: float,
+    ) -> ManagedOrder:
+        """
+        func __place_orders():
+            - the leverage, the MARKET entry and its exits, see __exit_orders(), through the OrderManager.
+            - the exits are only sent when the entry has been accepted.
+        """
+        symbol: str = f"{self.base_symbol}{self.ccy_symbol}"
+        self.binance_future_market.change_initial_leverage(leverage = self.leverage)
+        entry: ManagedOrder = self.orders.submit(side = side, symbol = symbol, type = "MARKET", role = "entry", quantity = quantity)
+        buy_or_sell: int = 1 if side == "BUY" else -1
+        if entry.state == OrderState.UNKNOWN:
+            self.__defer_exits(entry, buy_or_sell, quantity, price, sl_price, tp_price)
+            return entry
+        if entry.state == OrderState.REJECTED:
+            operation_logger.error(f"{__name__} - {entry} has not been placed, the exits are not sent.")
+            return entry
+
+        self.__send_exits(entry, buy_or_sell, quantity, price, sl_price, tp_price)
+        return entry
+
+    def __send_exits(
+        self: "TradeManager",
+        entry: ManagedOrder,
+        buy_or_sell: int,
+        quantity: float,
+        price: float,
+        sl_price: float,
+        tp_price: float,
+    ) -> None:
+        exits: List[ManagedOrder] = [
+            self.orders.submit(role = role, parent = entry.client_order_id, **kwargs)
+            for role, kwargs in self.__exit_orders(buy_or_sell, price, sl_price, tp_price)
+        ]
+        self.__protect(entry, buy_or_sell, quantity, sl_price, tp_price, exits)
+        operation_logger.info(f"{__name__} - {entry} has been placed with the STOP LOSS at {sl_price} and the TAKE PROFIT at {tp_price}.")
+        return
+
+    def __defer_exits(
+        self: "TradeManager",
+        entry: ManagedOrder,
+        buy_or_sell: int,
+        quantity: float,
+        price: float,
+        sl_price: float,
+        tp_price: float,
+    ) -> None:
+        """
+        func __defer_exits():
+            - the entry has ended UNKNOWN, i.e., it may be filled, so its exits wait for the exchange to tell,
+            - through the user data stream or __reconcile(), see __settle_pending_exits().
+        """
+        with self.pending_exits_lock:
+            self.pending_exits[entry.client_order_id] = (buy_or_sell, quantity, price, sl_price, tp_price)
+        operation_logger.error(f"{__name__} - {entry} has ended UNKNOWN, its exits are sent once it turns out to be accepted.")
+        self.__schedule_reconcile()
+        return
+
+    def __schedule_reconcile(self: "TradeManager") -> None:
+        timer: threading.Timer = threading.Timer(self.reconcile_interval, self.__reconcile)
+        timer.daemon = True
+        timer.start()
+        return
+
+    def __reconcile(self: "TradeManager") -> None:
+        """
+        func __reconcile():
+            - ask the exchange for the UNKNOWN orders, and settle the deferred exits of the entries among them.
+            - scheduled again while an entry with deferred exits is still UNKNOWN.
+        """
+        try:
+            self.orders.reconcile(states = (OrderState.UNKNOWN, ))
+        except Exception as e:
+            operation_logger.error(f"{__name__} - The UNKNOWN orders could not be reconciled: {str(e)}")
+
+        with self.pending_exits_lock:
+            pending: List[str] = list(self.pending_exits)
+        unsettled: bool = False
+        for client_order_id in pending:
+            entry: ManagedOrder | None = self.orders.get(client_order_id)
+            if entry is None:
+                with self.pending_exits_lock:
+                    self.pending_exits.pop(client_order_id, None)
+                continue
+            unsettled |= not self.__settle_pending_exits(entry)
+        if unsettled:
+            self.__schedule_reconcile()
+        return
+
+    def __settle_pending_exits(
+        self: "TradeManager",
+        entry: ManagedOrder,
+    ) -> bool:
+        """
+        func __settle_pending_exits():
+            - send the deferred exits of an entry once it is accepted, or drop them once it is rejected, canceled or expired.
+            - the exits are popped under the lock, so the stream and __reconcile() never send them twice.
+
+        return bool
+            - False while the entry is still PENDING_NEW or UNKNOWN.
+        """
+        if entry.state in (OrderState.PENDING_NEW, OrderState.UNKNOWN):
+            return False
+        with self.pending_exits_lock:
+            pending: Tuple[int, float, float, float, float] | None = self.pending_exits.pop(entry.client_order_id, None)
+        if pending is None:
+            return True
+
+        if entry.state not in (OrderState.NEW, OrderState.PARTIALLY_FILLED, OrderState.FILLED):
+            operation_logger.info(f"{__name__} - {entry} has been settled, its exits are not sent.")
+            return True
+        buy_or_sell, quantity, price, sl_price, tp_price = pending
+        self.__send_exits(entry, buy_or_sell, quantity, price, sl_price, tp_price)
+        trading_logger.info(f"{__name__} - {entry} has turned out to be accepted, its exits have been sent.")
+        return True
+
+    def __exit_orders(
+        self: "TradeManager",
+        buy_or_sell: int,
+        price: float,
+        sl_price: float,
+        tp_price: float,
+    ) -> List[Tuple[str, dict]]:
+        """
+        func __exit_orders():
+            - (role, parameters of the order) of the exchange-side exits of a position.
+            - the STOP_MARKET SL and the TAKE_PROFIT_MARKET TP, or with protective_orders only the STOP_MARKET backstop,
+            - backstop_factor times as far from the price as the SL.
+        """
+        common: dict = dict(
+            symbol = f"{self.base_symbol}{self.ccy_symbol}",
+            side = "SELL" if buy_or_sell == 1 else "BUY",
+            close_position = "true",
+            time_in_force = "GTE_GTC",
+        )
+        if self.protective_orders is None:
+            return [
+                (role, dict(common, type = order_type, stop_price = stop_price))
+                for role, order_type, stop_price in (("sl", "STOP_MARKET", sl_price), ("tp", "TAKE_PROFIT_MARKET", tp_price))
+            ]
+        backstop_price: float = price - self.backstop_factor * (price - sl_price)
+        filters: SymbolFilters | None = self.__symbol_filters()
+        backstop_price = round(backstop_price, 2) if filters is None else filters.round_price(backstop_price)
+        return [("backstop", dict(common, type = "STOP_MARKET", stop_price = backstop_price))]
+
+    def __protect(
+        self: "TradeManager",
+        entry: ManagedOrder,
+        buy_or_sell: int,
+        quantity: float,
+        sl_price: float,
+        tp_price: float,
+        exits: List[ManagedOrder],
+    ) -> None:
+        """
+        func __protect():
+            - hand the SL and the TP of the accepted entry over to the ProtectiveOrderEngine, with its backstop.
+        """
+        if self.protective_orders is None:
+            return
+        backstop: ManagedOrder | None = next((order for order in exits if order.role == "backstop"), None)
+        self.protective_orders.protect(
+            symbol = entry.symbol,
+            side = buy_or_sell,
+            quantity = quantity,
+            sl_price = sl_price,
+            tp_price = tp_price,
+            trail = self.trailing_stop,
+            parent = entry.client_order_id,
+            backstop = None if backstop is None or not backstop.is_open else backstop.client_order_id,
+        )
+        return
+
+    """
+    ######################################################################################################################
+    #                                                Pre-Armed Orders                                                    #
+    ######################################################################################################################
+    """
+    def __thread_arm_orders(
+        self: "TradeManager",
+    ) -> None:
+        """
+        func __thread_arm_orders():
+            - private method
+            - keep both sides armed while |trade_score| is above arm_fraction of the threshold, drop them below it.
+            - an armed order is renewed at half of its ttl, so the one taken at the threshold is always fresh.
+            - between the renewals, the thread sleeps until the score changes its band.
+        """
+        band: int = self.score.band
+        while True:
+            try:
+                band = self.score.refresh()  # the decay alone may have taken the score out of the band.
+                if band != 0:
+                    for side in (1, -1):
+                        with self.armed_lock:
+                            armed: ArmedOrder | None = self.armed.get(side)
+                        if armed is None or TradeManager.generate_timestamp() - armed.created > self.arm_ttl / 2:
+                            self.arm(side)
+                else:
+                    with self.armed_lock:
+                        self.armed.clear()
+            except Exception as e:
+                operation_logger.error(f"{__name__} - Error while arming the orders: {str(e)}")
+            band = self.score.wait(band, timeout = self.arm_ttl / 2_000 if band != 0 else None)
+        return None
+
+    def arm(
+        self: "TradeManager",
+        buy_or_sell: int,
+    ) -> ArmedOrder | None:
+        """
+        func arm():
+            - do everything of __execute_trade() up to the request: price, balance, quantity, TP / SL, leverage, encoding.
+            - the cached price and balance are used when the websocket pushes them, the REST API otherwise.
+
+        return ArmedOrder | None:
+            - None if the price or the balance is not available.
+        """
+        current_price: float | None = self.__get_current_price()
+        if not current_price:
+            return None
+        base_qty: float | None = self.get_base_qty(base_asset_price = current_price)
+        if base_qty is None:
+            return None
+
+        tp_price, sl_price = self.__get_target_prices(buy_or_sell = buy_or_sell, current_price = current_price)
+        quantity: float = self.__order_quantity(base_qty, current_price)
+        flat: bool = self.__decide_to_make_trade()
+        if self.leverage_applied != self.leverage:
+            if self.binance_future_market.change_initial_leverage(leverage = self.leverage) is None:
+                return None
+            self.leverage_applied = self.leverage
+
+        symbol: str = f"{self.base_symbol}{self.ccy_symbol}"
+        side: str = "BUY" if buy_or_sell == 1 else "SELL"
+        armed: ArmedOrder = ArmedOrder(
+            side = buy_or_sell,
+            price = current_price,
+            quantity = quantity,
+            tp_price = tp_price,
+            sl_price = sl_price,
+            entry = self.orders.prepare(symbol = symbol, side = side, type = "MARKET", quantity = quantity),
+            exits = [
+                (role, self.orders.prepare(**kwargs))
+                for role, kwargs in self.__exit_orders(buy_or_sell, current_price, sl_price, tp_price)
+            ],
+            flat = flat,
+        )
+        with self.armed_lock:
+            self.armed[buy_or_sell] = armed
+        return armed
+
+    def __take_armed(
+        self: "TradeManager",
+        buy_or_sell: int,
+    ) -> ArmedOrder | None:
+        """
+        func __take_armed():
+            - the armed order of the side if it is still fresh and priced near the pushed price, no REST call is made.
+            - both sides are dropped, the balance and the position change with the trade.
+        """
+        with self.armed_lock:
+            armed: ArmedOrder | None = self.armed.get(buy_or_sell)
+            self.armed.clear()
+        if armed is None or TradeManager.generate_timestamp() - armed.created > self.arm_ttl:
+            return None
+
+        current_price: float | None = self.__cached_index_price()
+        if current_price is not None and abs(current_price / armed.price - 1) > self.arm_drift:
+            operation_logger.info(f"{__name__} - The armed order at {armed.price} is dropped, the price has moved to {current_price}")
+            return None
+        return armed
+
+    async def __execute_armed(
+        self: "TradeManager",
+        armed: ArmedOrder,
+        trace: TraceContext | None = None,
+    ) -> None:
+        """
+        func __execute_armed():
+            - the entry order is the only request before the ack, the exits are sent together right after it.
+        """
+        side: str = "Buy" if armed.side == 1 else "Sell"
+        message: str = f"Trade Signal: {side}\nEntry Price: {armed.price}\nAmount: {armed.quantity}\nTake Profit: {armed.tp_price}\nStop Loss: {armed.sl_price}"
+
+        with self.market_state_lock:
+            position_amounts: Dict[Tuple[str, str], float] | None = self.position_amounts
+        symbol: str = f"{self.base_symbol}{self.ccy_symbol}"
+        flat: bool = (
+            armed.flat if position_amounts is None
+            else not any(amount for (position_symbol, _), amount in position_amounts.items() if position_symbol == symbol)
+        )
+        if not flat:
+            trading_logger.info(f"{message}\nHowever, the trade has not been occured.")
+            return None
+
+        order_trace: TraceContext | None = None if trace is None else trace.fork().mark(Stage.ORDER_SUBMITTED)
+        entry: ManagedOrder = self.orders.submit_prepared(armed.entry, role = "entry")
+        if order_trace is not None:
+            tracer.record(order_trace.mark(Stage.ORDER_ACKED), Stage.SIGNAL_SCORED, Stage.ORDER_ACKED)
+        if entry.state in (OrderState.REJECTED, OrderState.UNKNOWN):
+            if entry.state == OrderState.UNKNOWN:
+                # the prepared exits are signed already, they may be past the recvWindow by the time the entry is known.
+                self.__defer_exits(entry, armed.side, armed.quantity, armed.price, armed.sl_price, armed.tp_price)
+            self.__report_failed_entry(entry, message)
+            return None
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        exits: List[ManagedOrder] = await asyncio.gather(*(
+            loop.run_in_executor(None, self.orders.submit_prepared, prepared, role, entry.client_order_id)
+            for role, prepared in armed.exits
+        ))
+        self.__protect(entry, armed.side, armed.quantity, armed.sl_price, armed.tp_price, exits)
+        self.notifier.notify(message, priority = Priority.HIGH)
+        trading_logger.info(message)
+        return None
+
     def __thread_get_signal(
         self,
         timestamp_window: int = 5000,
@@ -394,16 +932,21 @@ class TradeManager:
         curr_timestamp = 0
         while True:
             try:
-                signal: TradeSignal = self.__get_signal(timestamp_window = timestamp_window,)
+                signal: Signal | None = self.__get_signal(timestamp_window = timestamp_window,)
                 if signal:
-                    with self.trade_score_lock:
-                        self.trade_score += self.__calculate_signal_score_delta(
-                            signal_data = signal,
-                        )
-                        if (TradeManager.generate_timestamp() - curr_timestamp > 300_000):
-                            operation_logger.info(f"{__name__} - The current score is {self.trade_score}")
-                            curr_timestamp = TradeManager.generate_timestamp()
-                        # print(f"now the score is {self.trade_score}")
+                    score: float = self.score.add(
+                        self.__calculate_signal_score_delta(
+                            signal_data = signal.signal,
+                        ),
+                        trace = None if signal.trace is None else signal.trace.mark(Stage.SIGNAL_SCORED),
+                        signal = signal.signal,
+                        strategy = signal.strategy,
+                        timestamp = signal.timestamp,
+                    )
+                    if (TradeManager.generate_timestamp() - curr_timestamp > 300_000):
+                        operation_logger.info(f"{__name__} - The current score is {score}")
+                        curr_timestamp = TradeManager.generate_timestamp()
+                    tracer.record(signal.trace, Stage.WS_RECEIVE, Stage.SIGNAL_SCORED)
             except Exception as e:
                 operation_logger.error(
                     f"{__name__} - Error while getting the signal: {e}"
@@ -413,7 +956,7 @@ class TradeManager:
     def __get_signal(
         self,
         timestamp_window: int = 5000,
-    ) -> TradeSignal | None:
+    ) -> Signal | None:
         """
         func __get_signal(): private method
             - get the signal from the signal pipeline
@@ -422,13 +965,15 @@ class TradeManager:
         param self:
             - TradeManager object
 
-        return TradeSignal:
-            - it will return the parameter signal and decide the action based on the signal.
+        return Signal:
+            - it will return the verified signal, the action is decided based on Signal.signal.
         return None
             - if the signal is not valid, then it will return None.
         """
         signal_data: Signal = self.signal_pipeline_controller.pop()
-        return signal_data.signal if TradeManager.verify_signal(signal_data = signal_data, timestamp_window = timestamp_window) else None
+        if signal_data.trace is not None:
+            signal_data.trace.mark(Stage.SIGNAL_RECEIVED)
+        return signal_data if TradeManager.verify_signal(signal_data = signal_data, timestamp_window = timestamp_window) else None
 
     def __calculate_signal_score_delta(
         self,
@@ -452,6 +997,116 @@ class TradeManager:
             signal = signal_data
         )
 
+    '''
+    - Pushed Market and Account State
+    '''
+    def __subscribe_account_streams(
+        self: "TradeManager",
+    ) -> None:
+        """
+        func __subscribe_account_streams():
+            - subscribe to the mark price and the user data stream of Binance on the shared combined-stream connection.
+        """
+        symbol: str = f"{self.base_symbol}{self.ccy_symbol}"
+        try:
+            self.binance_ws.add_connection_listener(self.__on_connection)
+            self.binance_ws.mark_price(callback = self.__on_mark_price, symbol = symbol)
+            if self.binance_ws.user_data(callback = self.__on_user_data) is not None:
+                with self.market_state_lock:
+                    self.account_stream_live = self.binance_ws.is_connected()
+        except Exception as e:
+            operation_logger.error(f"{__name__} - Binance streams could not be subscribed, falling back to the REST API: {str(e)}")
+        return
+
+    def __on_connection(
+        self: "TradeManager",
+        connected: bool,
+    ) -> None:
+        """
+        func __on_connection():
+            - the account updates sent while the stream is down are lost, so the cached balance and positions
+            - are dropped on a disconnect and the REST API is asked until the stream is back.
+        """
+        with self.market_state_lock:
+            self.account_stream_live = connected and self.binance_ws.listen_key is not None
+            if not connected:
+                self.available_usdt = None
+                self.position_amounts = None
+        if not connected:
+            operation_logger.warning(f"{__name__} - The user data stream is down, the balance and the positions are read from the REST API.")
+        else:
+            # the order updates sent while it was down are lost as well, so the UNKNOWN orders are asked for.
+            threading.Thread(name = "trade_manager_reconcile", target = self.__reconcile, daemon = True).start()
+        return
+
+    def __on_mark_price(
+        self: "TradeManager",
+        msg: dict,
+    ) -> None:
+        data: dict = msg.get("data") or dict()
+        try:
+            with self.market_state_lock:
+                self.index_price = (int(data["E"]), float(data["i"]))
+            if self.protective_orders is not None:
+                # the exchange-side stops trigger on the mark price as well, see workingType.
+                self.protective_orders.on_tick(data["s"], float(data["p"]))
+        except (KeyError, TypeError, ValueError) as e:
+            operation_logger.warning(f"{__name__} - Unexpected mark price message: {msg} - {str(e)}")
+        return
+
+    def __on_user_data(
+        self: "TradeManager",
+        msg: dict,
+    ) -> None:
+        """
+        func __on_user_data():
+            - ACCOUNT_UPDATE carries the new position amounts, and invalidates the cached available balance
+            - since the event only has the wallet balance, not the available balance.
+            - ORDER_TRADE_UPDATE moves the order along in the OrderManager.
+        """
+        data: dict = msg.get("data") or dict()
+        if data.get("e") == "ORDER_TRADE_UPDATE":
+            order: ManagedOrder | None = self.orders.on_user_data(data)
+            if order is not None and order.role == "entry":
+                self.__settle_pending_exits(order)
+            if self.protective_orders is not None and order is not None and order.role == "backstop" and order.state == OrderState.FILLED:
+                self.protective_orders.cancel(order.parent)  # the position is gone, so are its local stops.
+            return
+        if data.get("e") != "ACCOUNT_UPDATE":
+            return
+
+        update: dict = data.get("a") or dict()
+        with self.market_state_lock:
+            self.available_usdt = None
+            if self.position_amounts is not None:
+                for position in update.get("P", list()):
+                    self.position_amounts[(position.get("s"), position.get("ps", "BOTH"))] = float(position.get("pa", 0))
+        return
+
+    def __cached_index_price(
+        self: "TradeManager",
+    ) -> float | None:
+        with self.market_state_lock:
+            if self.index_price is None:
+                return None
+            timestamp, price = self.index_price
+        return price if TradeManager.generate_timestamp() - timestamp <= self.price_ttl else None
+
+    def __seed_positions(
+        self: "TradeManager",
+        positions: list[dict | None],
+    ) -> None:
+        if self.binance_ws is None or not isinstance(positions, list):
+            return
+        with self.market_state_lock:
+            if not self.account_stream_live:
+                return
+            self.position_amounts = {
+                (position.get("symbol"), position.get("positionSide", "BOTH")): float(position.get("positionAmt", 0))
+                for position in positions if position
+            }
+        return
+
     '''
     - Execute Trade Utility Function
     '''
@@ -469,6 +1124,10 @@ class TradeManager:
         return float:
             - current price of the asset
         """
+        cached_price: float | None = self.__cached_index_price()
+        if cached_price is not None:
+            return cached_price
+
         try:
             return float(self.binance_future_market.mark_price(symbol = f"{self.base_symbol}{self.ccy_symbol}").get("indexPrice", 0))
         except Exception as e:
@@ -501,9 +1160,35 @@ class TradeManager:
             - if the signal is not valid, then it will return None.
         """
         if buy_or_sell == 1:  # Long
-            return round(current_price * (1 + (self.tp_rate / self.leverage)), 2), round(current_price * (1 - (self.sl_rate / self.leverage)), 2)
+            tp_price, sl_price = current_price * (1 + (self.tp_rate / self.leverage)), current_price * (1 - (self.sl_rate / self.leverage))
         else:  # Short
-            return round(current_price * (1 - (self.tp_rate / self.leverage)), 2), round(current_price * (1 + (self.sl_rate / self.leverage)), 2)
+            tp_price, sl_price = current_price * (1 - (self.tp_rate / self.leverage)), current_price * (1 + (self.sl_rate / self.leverage))
+
+        filters: SymbolFilters | None = self.__symbol_filters()
+        if filters is None:
+            return round(tp_price, 2), round(sl_price, 2)
+        return filters.round_price(tp_price), filters.round_price(sl_price)
+
+    def __symbol_filters(self: "TradeManager") -> SymbolFilters | None:
+        if self.symbol_metadata is None:
+            return None
+        return self.symbol_metadata.get("binance", f"{self.base_symbol}{self.ccy_symbol}")
+
+    def __order_quantity(
+        self: "TradeManager",
+        trade_amount: float,
+        current_price: float,
+    ) -> float:
+        """
+        func __order_quantity():
+            - private method
+            - the quantity on the step size of the symbol, at least the minimum quantity and the minimum notional.
+            - 0.002 is the floor of BTCUSDT until the metadata of the symbol has been loaded.
+        """
+        filters: SymbolFilters | None = self.__symbol_filters()
+        if filters is None:
+            return max(trade_amount, 0.002)
+        return filters.order_quantity(trade_amount, current_price)
 
     def __get_trade_amount(
         self,
@@ -541,9 +1226,16 @@ class TradeManager:
             - if there is an order held, then we will not make an order.
                 - return False
         """
+        symbol: str = f"{self.base_symbol}{self.ccy_symbol}"
+        with self.market_state_lock:
+            position_amounts: Dict[Tuple[str, str], float] | None = self.position_amounts
+            if position_amounts is not None:
+                return not any(amount for (position_symbol, _), amount in position_amounts.items() if position_symbol == symbol)
+
         try:
             # currently_holding_order: Dict = self.mexc_future_market_sdk.current_position()
             currently_holding_order: list[dict | None] = self.binance_future_market.get_position_information_v2()
+            self.__seed_positions(currently_holding_order)
 
             if len(currently_holding_order) <= 1:
                 # No position is currently held, so it's okay to make a trade.
@@ -588,12 +1280,22 @@ class TradeManager:
             return None
 
     def get_available_usdt_amt(self: "TradeManager", ) -> float | None:
+        with self.market_state_lock:
+            if self.available_usdt is not None:
+                return self.available_usdt
+
         try:
             account_balances = self.binance_future_market.future_account_balance_v2()
 
             for balance in account_balances:
                 if (balance.get("asset") == "USDT"):
-                    return float(balance.get("availableBalance"))
+                    available_usdt: float = float(balance.get("availableBalance"))
+                    if self.binance_ws is not None:
+                        # kept until the next ACCOUNT_UPDATE of the user data stream, or until it drops.
+                        with self.market_state_lock:
+                            if self.account_stream_live:
+                                self.available_usdt = available_usdt
+                    return available_usdt
             account_balances = self.binance_future_market.future_account_balance()
 
             for balance in account_balances:
@@ -0,0 +1,184 @@
+# Standard Library
+import asyncio
+import math
+from typing import Callable, List, Sequence, Tuple
+
+# Custom Library
+from interface.exchange_interface import Book, BracketOrder, ExchangeAdapter
+from logger.set_logger import operation_logger, trading_logger
+from telemetry.metrics import metrics
+
+
+# result = accepted, rejected (tried and refused by the venue), unknown (the venue cannot tell) or skipped (not eligible for the order).
+VENUE_ORDERS = metrics.counter(
+    "venue_orders_total",
+    "Orders of the VenueRouter by venue and outcome.",
+    ("venue", "result"),
+)
+
+
+class VenueQuote:
+    '''
+    # state of one venue for one order, see VenueRouter.quote().
+        # liquidity: base quantity on the side of the book the order takes, within max_slippage of the touch.
+        # reason: why the venue cannot take the order, None if it can.
+    '''
+    __slots__ = ("adapter", "price", "available", "liquidity", "latency_ms", "reason")
+
+    def __init__(
+        self: "VenueQuote",
+        adapter: ExchangeAdapter,
+        price: float | None,
+        available: float | None,
+        liquidity: float,
+        latency_ms: float | None,
+        reason: str | None,
+    ) -> None:
+        self.adapter: ExchangeAdapter = adapter
+        self.price: float | None = price
+        self.available: float | None = available
+        self.liquidity: float = liquidity
+        self.latency_ms: float | None = latency_ms
+        self.reason: str | None = reason
+        return
+
+    @property
+    def eligible(self: "VenueQuote") -> bool:
+        return self.reason is None
+
+    def __repr__(self: "VenueQuote") -> str:
+        return f"VenueQuote({self.adapter.name}, price = {self.price}, latency = {self.latency_ms}, reason = {self.reason})"
+
+
+class VenueRouter:
+    '''
+    # picks the venue of every order among the ExchangeAdapters, and fails over to the next venue on a rejection.
+        # an order of unknown outcome may be filled, so it stops the failover instead of doubling the position.
+        # a venue is eligible when its available margin covers the order at the leverage with margin_buffer to spare,
+        # and its book holds the quantity within max_slippage of the touch.
+        # the eligible venues are ranked by the REST latency the adapters have measured, the fastest first,
+        # a venue without a measurement yet goes last, and the larger available margin breaks the ties.
+        # the venues are quoted concurrently, so the choice costs the round trip of the slowest venue, not their sum.
+    '''
+    def __init__(
+        self: "VenueRouter",
+        adapters: Sequence[ExchangeAdapter],
+        max_slippage: float = 0.001,  # 0.1% from the touch
+        margin_buffer: float = 1.1,
+        depth_limit: int = 20,
+    ) -> None:
+        self.adapters: List[ExchangeAdapter] = list(adapters)
+        self.max_slippage: float = max_slippage
+        self.margin_buffer: float = margin_buffer
+        self.depth_limit: int = depth_limit
+        return
+
+    @staticmethod
+    def liquidity(
+        book: Book | None,
+        side: int,  # 1: buy, takes the asks, -1: sell, takes the bids
+        max_slippage: float,
+    ) -> float:
+        """
+        func liquidity():
+            - base quantity of the levels within max_slippage of the touch, on the side the order takes.
+        """
+        if book is None:
+            return 0.0
+        levels: List[Tuple[float, float]] = book[1] if side == 1 else book[0]
+        if not levels:
+            return 0.0
+        limit: float = levels[0][0] * (1 + side * max_slippage)
+        return sum(quantity for price, quantity in levels if (limit - price) * side >= 0)
+
+    async def quote(
+        self: "VenueRouter",
+        adapter: ExchangeAdapter,
+        side: int,
+        base: str,
+        ccy: str,
+        quantity: float,
+        leverage: int,
+    ) -> VenueQuote:
+        price, available, book = await asyncio.gather(
+            adapter.price_async(base, ccy),
+            adapter.available_balance_async(ccy),
+            adapter.depth_async(base, ccy, self.depth_limit),
+        )
+        liquidity: float = VenueRouter.liquidity(book, side, self.max_slippage)
+        reason: str | None = None
+        if not price:
+            reason = "no price"
+        elif available is None or available < quantity * price / leverage * self.margin_buffer:
+            reason = f"margin {available}"
+        elif liquidity < quantity:
+            reason = f"liquidity {liquidity}"
+        return VenueQuote(adapter, price, available, liquidity, adapter.latency_ms, reason)
+
+    async def rank(
+        self: "VenueRouter",
+        side: int,
+        base: str,
+        ccy: str,
+        quantity: float,
+        leverage: int,
+    ) -> List[VenueQuote]:
+        """
+        func rank():
+            - the eligible venues for the order, best first.
+        """
+        quotes: List[VenueQuote] = await asyncio.gather(*(
+            self.quote(adapter, side, base, ccy, quantity, leverage) for adapter in self.adapters
+        ))
+        for quote in quotes:
+            if not quote.eligible:
+                VENUE_ORDERS.labels(venue = quote.adapter.name, result = "skipped").inc()
+                operation_logger.info(f"{__name__} - {quote.adapter.name} is not eligible for {quantity} {base}: {quote.reason}")
+        return sorted(
+            (quote for quote in quotes if quote.eligible),
+            key = lambda quote: (math.inf if quote.latency_ms is None else quote.latency_ms, -(quote.available or 0.0)),
+        )
+
+    async def flat(
+        self: "VenueRouter",
+        base: str,
+        ccy: str,
+    ) -> bool:
+        """
+        func flat():
+            - no position on any venue, a venue which cannot tell counts as holding one.
+        """
+        positions: List[float | None] = await asyncio.gather(*(adapter.position_async(base, ccy) for adapter in self.adapters))
+        return all(position is not None and not position for position in positions)
+
+    async def place_bracket(
+        self: "VenueRouter",
+        side: int,
+        base: str,
+        ccy: str,
+        quantity: float,
+        leverage: int,
+        target_prices: Callable[[float], Tuple[float, float]],  # price of the venue -> (tp price, sl price)
+    ) -> BracketOrder | None:
+        """
+        func place_bracket():
+            - the bracket on the best venue, then on the next ones until a venue accepts it, None if none does.
+            - an order of unknown outcome is returned as it is, it is not sent to the next venue.
+            - the SL / TP are set from the price of the venue the order goes to.
+        """
+        for quote in await self.rank(side, base, ccy, quantity, leverage):
+            tp_price, sl_price = target_prices(quote.price)
+            order: BracketOrder = await quote.adapter.place_bracket_async(
+                side = side, base = base, ccy = ccy, quantity = quantity, price = quote.price,
+                sl_price = sl_price, tp_price = tp_price, leverage = leverage,
+            )
+            result: str = "accepted" if order.accepted else "unknown" if order.unknown else "rejected"
+            VENUE_ORDERS.labels(venue = quote.adapter.name, result = result).inc()
+            if order.accepted:
+                trading_logger.info(f"{__name__} - {order} has been placed in {order.latency_ms:.1f} ms, {quote}")
+                return order
+            if order.unknown:
+                operation_logger.error(f"{__name__} - {order} has an unknown outcome, it is not sent to the next venue.")
+                return order
+            operation_logger.error(f"{__name__} - {order} has been rejected, trying the next venue.")
+        return None
@@ -0,0 +1,229 @@
+# Standard Library
+import time
+from typing import Any, Callable
+
+# Custom Library
+from interface.exchange_interface import Book, BracketOrder, ExchangeAdapter
+from logger.set_logger import operation_logger
+from manager.symbol_metadata import SymbolFilters, SymbolMetadataCache
+from mexc.future import FutureMarket, FutureWebSocket
+
+
+class MexcAdapter(ExchangeAdapter):
+    '''
+    # MEXC USDT perpetual contracts behind the ExchangeAdapter.
+        # quantities are converted to contracts (vol) with the contract size of the symbol metadata, or contract_size.
+        # the SL / TP are the stopLossPrice / takeProfitPrice of the entry itself, one request for the whole bracket.
+        # the responses are {"success", "code", "data"}, a call is failed unless success is true.
+    '''
+    name: str = "mexc"
+
+    def __init__(
+        self: "MexcAdapter",
+        future: FutureMarket,
+        ws: FutureWebSocket | None = None,
+        symbol_metadata: SymbolMetadataCache | None = None,
+        contract_size: float = 0.0001,  # BTC_USDT, used without symbol_metadata
+        open_type: int = 1,  # 1: isolated, 2: cross
+    ) -> None:
+        super().__init__()
+        self.future: FutureMarket = future
+        self.ws: FutureWebSocket | None = ws
+        self.symbol_metadata: SymbolMetadataCache | None = symbol_metadata
+        self.contract_size: float = contract_size
+        self.open_type: int = open_type
+        return
+
+    @staticmethod
+    def data(response: Any) -> Any:
+        if isinstance(response, dict) and response.get("success"):
+            return response.get("data")
+        return None
+
+    def symbol(
+        self: "MexcAdapter",
+        base: str,
+        ccy: str,
+    ) -> str:
+        return f"{base}_{ccy}"
+
+    def filters(
+        self: "MexcAdapter",
+        symbol: str,
+    ) -> SymbolFilters | None:
+        return None if self.symbol_metadata is None else self.symbol_metadata.get(self.name, symbol)
+
+    def contracts(
+        self: "MexcAdapter",
+        symbol: str,
+    ) -> float:
+        """
+        func contracts():
+            - base asset of one contract of the symbol.
+        """
+        filters: SymbolFilters | None = self.filters(symbol)
+        return self.contract_size if filters is None else filters.contract_size
+
+    def taker_fee(
+        self: "MexcAdapter",
+        base: str,
+        ccy: str,
+    ) -> float:
+        filters: SymbolFilters | None = self.filters(self.symbol(base, ccy))
+        return 0.0 if filters is None or filters.taker_fee is None else filters.taker_fee
+
+    def round_quantity(
+        self: "MexcAdapter",
+        base: str,
+        ccy: str,
+        quantity: float,
+        price: float,
+    ) -> float:
+        symbol: str = self.symbol(base, ccy)
+        size: float = self.contracts(symbol)
+        filters: SymbolFilters | None = self.filters(symbol)
+        if filters is None:
+            return float(int(quantity / size + 1e-9)) * size
+        vol: float = filters.round_quantity(quantity / size)
+        return vol * size if vol >= max(filters.min_qty, filters.step_size) else 0.0
+
+    def price(
+        self: "MexcAdapter",
+        base: str,
+        ccy: str,
+    ) -> float | None:
+        data: Any = MexcAdapter.data(self.timed(self.future.fair_price, symbol = self.symbol(base, ccy)))
+        try:
+            return float(data["fairPrice"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def available_balance(
+        self: "MexcAdapter",
+        ccy: str,
+    ) -> float | None:
+        data: Any = MexcAdapter.data(self.timed(self.future.asset, currency = ccy))
+        try:
+            return float(data["availableBalance"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def position(
+        self: "MexcAdapter",
+        base: str,
+        ccy: str,
+    ) -> float | None:
+        symbol: str = self.symbol(base, ccy)
+        data: Any = MexcAdapter.data(self.timed(self.future.current_position, symbol = symbol))
+        if not isinstance(data, list):
+            return None
+        size: float = self.contracts(symbol)
+        return sum(
+            float(position.get("holdVol", 0)) * size * (1 if position.get("positionType") == 1 else -1)
+            for position in data if position.get("symbol") == symbol
+        )
+
+    def depth(
+        self: "MexcAdapter",
+        base: str,
+        ccy: str,
+        limit: int = 20,
+    ) -> Book | None:
+        symbol: str = self.symbol(base, ccy)
+        data: Any = MexcAdapter.data(self.timed(self.future.depth, symbol = symbol, limit = limit))
+        size: float = self.contracts(symbol)
+        try:
+            return (
+                [(float(level[0]), float(level[1]) * size) for level in data["bids"]],
+                [(float(level[0]), float(level[1]) * size) for level in data["asks"]],
+            )
+        except (KeyError, TypeError, ValueError, IndexError):
+            return None
+
+    def place_bracket(
+        self: "MexcAdapter",
+        side: int,
+        base: str,
+        ccy: str,
+        quantity: float,
+        price: float,
+        sl_price: float,
+        tp_price: float,
+        leverage: int,
+    ) -> BracketOrder:
+        started: float = time.perf_counter()
+        symbol: str = self.symbol(base, ccy)
+        size: float = self.contracts(symbol)
+        filters: SymbolFilters | None = self.filters(symbol)
+        if filters is not None:
+            vol: float = filters.order_quantity(quantity / size, price)
+            sl_price, tp_price = filters.round_price(sl_price), filters.round_price(tp_price)
+        else:
+            vol = max(float(int(quantity / size)), 1.0)
+
+        response: Any = self.timed(
+            self.future.place_order,
+            symbol = symbol,
+            price = price,
+            vol = vol,
+            side = 1 if side == 1 else 3,  # open long, open short
+            type = 5,  # market
+            openType = self.open_type,
+            stopLossPrice = sl_price,
+            takeProfitPrice = tp_price,
+            leverage = leverage,
+        )
+        order_id: Any = MexcAdapter.data(response)
+        if order_id is None:
+            operation_logger.error(f"{__name__} - The {symbol} bracket has been rejected: {response}")
+        return BracketOrder(
+            venue = self.name,
+            symbol = symbol,
+            side = side,
+            quantity = vol * size,
+            entry_id = None if order_id is None else str(order_id),
+            accepted = order_id is not None,
+            latency_ms = (time.perf_counter() - started) * 1_000,
+        )
+
+    def subscribe_price(
+        self: "MexcAdapter",
+        callback: Callable[[str, float, int], None],
+        base: str,
+        ccy: str,
+    ) -> None:
+        def on_ticker(msg: dict) -> None:
+            data: dict = msg.get("data") or dict()
+            try:
+                callback(self.name, float(data["fairPrice"]), int(data["timestamp"]))
+            except (KeyError, TypeError, ValueError) as e:
+                operation_logger.warning(f"{__name__} - Unexpected ticker message: {msg} - {str(e)}")
+            return
+
+        self.ws.ticker(callback = on_ticker, param = dict(symbol = self.symbol(base, ccy)))
+        return
+
+    def subscribe_depth(
+        self: "MexcAdapter",
+        callback: Callable[[str, Book, int], None],
+        base: str,
+        ccy: str,
+        levels: int = 20,
+    ) -> None:
+        symbol: str = self.symbol(base, ccy)
+
+        def on_depth(msg: dict) -> None:
+            data: dict = msg.get("data") or dict()
+            size: float = self.contracts(symbol)
+            try:
+                book: Book = (
+                    [(float(level[0]), float(level[1]) * size) for level in data["bids"]],
+                    [(float(level[0]), float(level[1]) * size) for level in data["asks"]],
+                )
+                callback(self.name, book, int(msg["ts"]))
+            except (KeyError, TypeError, ValueError, IndexError) as e:
+                operation_logger.warning(f"{__name__} - Unexpected depth message: {msg} - {str(e)}")
+            return
+
+        self.ws.depth_full(callback = on_depth, param = dict(symbol = symbol, limit = levels))
+        return
@@ -1,10 +1,11 @@
 # Built in libraries
 from urllib.parse import urlencode
-from typing import Optional, Union, Literal
+from typing import Optional, Tuple, Union, Literal
 import json
 
 # Custom libraries
-from sdk.base_sdk import CommonBaseSDK
+from sdk.base_sdk import CommonBaseSDK, REST_ERRORS
+from sdk.signer import HmacSigner
 from logger.set_logger import operation_logger
 
 
@@ -27,6 +28,18 @@ class FutureBase(CommonBaseSDK):
         # Set the specific content type for MEXC
         self.set_content_type("application/json")
 
+        # signer with the apiKey absorbed, every request signs apiKey + Request-Time + the sorted params.
+        self._request_signer: HmacSigner | None = None
+        self._request_signer_key: Tuple[HmacSigner, str] | None = None
+
+    @property
+    def request_signer(self: "FutureBase") -> HmacSigner:
+        signer: HmacSigner = self.signer
+        if self._request_signer is None or self._request_signer_key != (signer, self.api_key):
+            self._request_signer = signer.prefixed(self.api_key)
+            self._request_signer_key = (signer, self.api_key)
+        return self._request_signer
+
     def call(
         self: "FutureBase",
         method: Union[
@@ -48,7 +61,7 @@ class FutureBase(CommonBaseSDK):
         if not url.startswith("/"):
             url = f"/{url}"
 
-        timestamp: int = FutureBase.generate_timestmap()
+        timestamp: int = self.timestamp()
 
         if params is not None:
             params = {key: value for key, value in params.items() if value is not None}
@@ -56,22 +69,23 @@ class FutureBase(CommonBaseSDK):
         else:
             query_string: str = ""
 
-        query_string = f"{self.api_key}{timestamp}{query_string}"
-
         # apiKey in header
         if self.api_key and self.secret_key:  # menas it is signed instance.
+            request_time: str = str(timestamp)
+            # the signature of apiKey + Request-Time + query_string, the apiKey is already in the signer.
+            signature: str = self.request_signer.sign(request_time, query_string)
             if headers is None:
                 headers = {
-                    "Request-Time": str(timestamp),
+                    "Request-Time": request_time,
                     api_key_title: self.api_key,
-                    "Signature": self.generate_signature(query_string),
+                    "Signature": signature,
                 }
             else:
                 headers.update(
                     {
                         api_key_title: self.api_key,
-                        "Request-Time": str(timestamp),
-                        "Signature": self.generate_signature(query_string),
+                        "Request-Time": request_time,
+                        "Signature": signature,
                     }
                 )
 
@@ -88,6 +102,7 @@ class FutureBase(CommonBaseSDK):
 
             if response.status_code >= 400:
                 status: int = response.status_code
+                REST_ERRORS.labels(exchange = "mexc", status = status).inc()
                 error_msg: str = (
                     payload.get("msg")  # type: ignore[union-attr]
                     if isinstance(payload, dict)
@@ -17,6 +17,24 @@ class FutureMarket(FutureBase):
     #                                                    Public Endpoint                                                 #
     ######################################################################################################################
     """
+    # (ttl, stale-while-revalidate) in seconds, detail is limited to 1 time / 5 seconds and hardly ever changes.
+    CACHE_TTL = {
+        "detail": (3_600.0, 3_600.0),
+        "ticker": (0.5, 0.5),
+        "fair_price": (0.5, 0.5),
+        "index_price": (0.5, 0.5),
+        "funding_rate": (60.0, 60.0),
+    }
+
+    def server_timestamp(
+        self: "FutureMarket",
+    ) -> int | None:
+        """
+        - func server_timestamp():
+            - The server time in ms, from the data field of ping().
+        """
+        response: dict | None = self.ping()
+        return response.get("data") if isinstance(response, dict) and response.get("success") else None
 
     def ping(
         self: "FutureMarket",
@@ -61,7 +79,8 @@ class FutureMarket(FutureBase):
         """
         url: str = "api/v1/contract/detail"
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "detail",
             method = "GET",
             url = url,
             params = dict(symbol = symbol),
@@ -171,7 +190,8 @@ class FutureMarket(FutureBase):
         """
         url: str = f"api/v1/contract/index_price/{symbol}"
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "index_price",
             method = "GET",
             url = url,
         )
@@ -194,7 +214,8 @@ class FutureMarket(FutureBase):
             - https://mexcdevelop.github.io/apidocs/contract_v1_en/?python#get-contract-fair-price
         """
         url: str = f"api/v1/contract/fair_price/{symbol}"
-        return self.call(
+        return self.cached_call(
+            endpoint = "fair_price",
             method = "GET",
             url = url,
         )
@@ -214,7 +235,8 @@ class FutureMarket(FutureBase):
             - 20 times / 2 seconds
         """
         url: str = f"api/v1/contract/funding_rate/{symbol}"
-        return self.call(
+        return self.cached_call(
+            endpoint = "funding_rate",
             method = "GET",
             url = url,
         )
@@ -431,7 +453,8 @@ class FutureMarket(FutureBase):
             symbol = symbol,
         )
 
-        return self.call(
+        return self.cached_call(
+            endpoint = "ticker",
             method = "GET",
             url = url,
             params = params,
@@ -890,6 +913,22 @@ class FutureWebSocket(_FutureWebSocket):
         self._method_subscribe(method=method, callback=callback, param=param)
         return
 
+    def depth_full(
+        self: "FutureWebSocket",
+        callback: Callable,
+        param: dict | None = None,
+    ) -> None:
+        """
+        - Full snapshots of the top <limit> levels, 5, 10 or 20, instead of the incremental depth.
+        - data: {"asks": [[price, vol, order count]], "bids": [...], "version": <version>}
+        """
+        if param is None:
+            param: dict[str, str | int] = dict(symbol = "BTC_USDT", limit = 20)
+
+        method = "sub.depth.full"
+        self._method_subscribe(method = method, callback = callback, param = param)
+        return
+
     def kline(
         self: "FutureWebSocket",
         callback: Callable,
@@ -950,7 +989,7 @@ class FutureWebSocket(_FutureWebSocket):
         """
         - Get the index price and will keep updating if there is any changes
         """
-        if param is not None:
+        if param is None:
             param: dict[str, str] = dict(symbol = "BTC_USDT")
 
         method = "sub.index.price"
@@ -972,7 +1011,7 @@ class FutureWebSocket(_FutureWebSocket):
         if param is None:
             param: dict[str, str] = dict(symbol = "BTC_USDT")
 
-        method = "sub.fair_price"
+        method = "sub.fair.price"  # pushed on push.fair.price
         self._method_subscribe(
             method = method,
             callback = callback,
@@ -31,8 +31,28 @@ MA_READ_PERIODS: Tuple[int, ...] = (
     1800,  # 1800 sec, 30 min
 )
 
+'''
+# streaming indicators, periods are in ticks on the write side and doubled on the read side like the MAs.
+'''
+RSI_WRITE_PERIODS: Tuple[int, ...] = (7, 14, 30)
+RSI_READ_PERIODS: Tuple[int, ...] = (14, 28, 60)
+
+ATR_WRITE_PERIODS: Tuple[int, ...] = (14, 30)
+ATR_READ_PERIODS: Tuple[int, ...] = (28, 60)
+
+MACD_PERIODS: Tuple[int, int, int] = (12, 26, 9)  # fast, slow, signal
+
+BOLLINGER_PERIOD: int = 20
+BOLLINGER_WIDTH: float = 2.0  # number of standard deviations
+
 
 class IndexType(IntFlag):
-    EMA = 1    # 0001
-    SMA = 2    # 0010
-    PRICE = 4  # 0100
+    EMA = 1          # 00000001
+    SMA = 2          # 00000010
+    PRICE = 4        # 00000100
+    RSI = 8          # 00001000
+    MACD = 16        # 00010000
+    BOLLINGER = 32   # 00100000
+    ATR = 64         # 01000000
+    ZSCORE = 128     # 10000000
+    BASIS = 256      # 100000000, cross-exchange basis, see manager.basis_monitor
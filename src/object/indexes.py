@@ -1,6 +1,98 @@
 import time
-from typing import Dict
-from object.constants import IndexType
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Deque, Dict, Hashable, Iterator, Tuple
+
+import numpy as np
+
+from object.constants import IndexType, MA_READ_PERIODS
+
+
+class IndexLayout:
+    '''
+    # fixed key order of the Index value array.
+    # keys: e.g., MA_READ_PERIODS -> (10, 30, 60, 300, 600, 1_200, 1_800)
+    # offsets: key-to-offset lookup table, e.g., {10: 0, 30: 1, ...}
+
+    - layouts are interned by IndexLayout.of(), so they can be compared by identity.
+    '''
+    __slots__ = ("keys", "offsets")
+
+    _layouts: Dict[Tuple[Hashable, ...], "IndexLayout"] = dict()
+
+    @staticmethod
+    def of(keys: Tuple[Hashable, ...]) -> "IndexLayout":
+        layout: IndexLayout | None = IndexLayout._layouts.get(keys)
+        if layout is None:
+            layout = IndexLayout._layouts.setdefault(keys, IndexLayout(keys))
+        return layout
+
+    def __init__(
+        self: "IndexLayout",
+        keys: Tuple[Hashable, ...],
+    ) -> None:
+        self.keys: Tuple[Hashable, ...] = keys
+        self.offsets: Dict[Hashable, int] = {key: offset for offset, key in enumerate(keys)}
+        return
+
+    def __len__(self: "IndexLayout") -> int:
+        return len(self.keys)
+
+    def __repr__(self: "IndexLayout") -> str:
+        return f"IndexLayout{self.keys}"
+
+
+MA_LAYOUT: IndexLayout = IndexLayout.of(MA_READ_PERIODS)
+PRICE_LAYOUT: IndexLayout = IndexLayout.of((0,))
+
+
+class IndexData(Mapping):
+    '''
+    # read-only, dict-compatible view over the value array of an Index.
+    # NaN marks a missing value, e.g., a period without enough data, and is hidden from the mapping.
+
+    - sma_data.get(10), sma_data[300], 60 in sma_data, dict(sma_data) keep working for the existing rules.
+    '''
+    __slots__ = ("_layout", "_values")
+
+    def __init__(
+        self: "IndexData",
+        layout: IndexLayout,
+        values: np.ndarray,
+    ) -> None:
+        self._layout: IndexLayout = layout
+        self._values: np.ndarray = values
+        return
+
+    def get(
+        self: "IndexData",
+        key: Hashable,
+        default: float | None = None,
+    ) -> float | None:
+        offset: int | None = self._layout.offsets.get(key)
+        if offset is None:
+            return default
+        value: float = float(self._values[offset])
+        return default if value != value else value  # NaN check without the function call.
+
+    def __getitem__(
+        self: "IndexData",
+        key: Hashable,
+    ) -> float:
+        value: float | None = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self: "IndexData") -> Iterator[Hashable]:
+        keys: Tuple[Hashable, ...] = self._layout.keys
+        return iter([keys[offset] for offset in np.flatnonzero(~np.isnan(self._values))])
+
+    def __len__(self: "IndexData") -> int:
+        return int(np.count_nonzero(~np.isnan(self._values)))
+
+    def __repr__(self: "IndexData") -> str:
+        return f"IndexData({dict(self.items())})"
 
 
 class Index:
@@ -30,7 +122,12 @@ class Index:
             "0" = <float>,
         }
     }
+
+    - the values are kept in a fixed-length float64 array aligned to the layout, i.e., MA_READ_PERIODS by default.
+    - data returns a dict-compatible IndexData view, or the float itself for IndexType.PRICE.
     '''
+    __slots__ = ("_timestamp", "_index_type", "_layout", "_values", "_data", "_trace")
+
     @staticmethod
     def generate_timestamp() -> int:
         return int(time.time() * 1_000)
@@ -39,21 +136,133 @@ class Index:
         self: 'Index',
         timestamp: int,
         index_type: IndexType,
-        data: Dict[str, Dict[int, float]],
+        data: Dict[Hashable, float] | np.ndarray | float,
+        layout: IndexLayout | None = None,
+        trace: Any = None,  # telemetry.tracing.TraceContext of the tick behind the values
+    ) -> None:
+        if layout is None:
+            layout = PRICE_LAYOUT if index_type == IndexType.PRICE else MA_LAYOUT
+
+        if isinstance(data, np.ndarray):
+            values: np.ndarray = data
+        else:
+            values = np.full(len(layout), np.nan, dtype = np.float64)
+            if isinstance(data, Mapping):
+                for key, value in data.items():
+                    offset: int | None = layout.offsets.get(key)
+                    if offset is not None and value is not None:
+                        values[offset] = value
+            else:
+                values[0] = data
+
+        self._timestamp: int = timestamp
+        self._index_type: IndexType = index_type
+        self._layout: IndexLayout = layout
+        self._values: np.ndarray = values
+        self._data: IndexData = IndexData(layout, values)
+        self._trace: Any = trace
+        return
+
+    def update(
+        self: 'Index',
+        timestamp: int,
+        values: np.ndarray,
     ) -> None:
-        self.__timestamp: int = timestamp
-        self.__index_type: IndexType = index_type
-        self.__data: Dict[str, Dict[int, float]] = data
+        '''
+        func update():
+            - overwrite the timestamp and the values in place, no allocation.
+        '''
+        self._timestamp = timestamp
+        np.copyto(self._values, values)
         return
 
     @property
     def timestamp(self):
-        return self.__timestamp
+        return self._timestamp
 
     @property
     def data(self):
-        return self.__data
+        if self._index_type == IndexType.PRICE:
+            value: float = float(self._values[0])
+            return None if value != value else value
+        return self._data
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def layout(self) -> IndexLayout:
+        return self._layout
 
     @property
     def index_type(self):
-        return self.__index_type
+        return self._index_type
+
+    @property
+    def trace(self):
+        return self._trace
+
+
+class IndexPool:
+    '''
+    # free-list of Index objects for the hot path.
+    # acquire() hands out a recycled Index when there is one, release() puts it back.
+    # deque.append() and deque.pop() are atomic, so producer and consumer threads can share the pool without a lock.
+
+    - the consumer must release an Index only once nothing reads its values anymore.
+    '''
+    def __init__(
+        self: "IndexPool",
+        capacity: int = 64,
+    ) -> None:
+        self.capacity: int = capacity
+        self.__free_lists: Dict[IndexLayout, Deque[Index]] = dict()
+        return
+
+    def __free_list(
+        self: "IndexPool",
+        layout: IndexLayout,
+    ) -> Deque[Index]:
+        free_list: Deque[Index] | None = self.__free_lists.get(layout)
+        if free_list is None:
+            free_list = self.__free_lists.setdefault(layout, deque(maxlen = self.capacity))
+        return free_list
+
+    def acquire(
+        self: "IndexPool",
+        timestamp: int,
+        index_type: IndexType,
+        values: np.ndarray,
+        layout: IndexLayout | None = None,
+        trace: Any = None,
+    ) -> Index:
+        if layout is None:
+            layout = PRICE_LAYOUT if index_type == IndexType.PRICE else MA_LAYOUT
+
+        try:
+            index: Index = self.__free_list(layout).pop()
+        except IndexError:
+            return Index(
+                timestamp = timestamp,
+                index_type = index_type,
+                data = np.array(values, dtype = np.float64),
+                layout = layout,
+                trace = trace,
+            )
+
+        index._index_type = index_type
+        index._trace = trace
+        index.update(timestamp, values)
+        return index
+
+    def release(
+        self: "IndexPool",
+        index: Index,
+    ) -> None:
+        index._trace = None
+        self.__free_list(index.layout).append(index)
+        return
+
+    def __len__(self: "IndexPool") -> int:
+        return sum(len(free_list) for free_list in self.__free_lists.values())
@@ -0,0 +1,268 @@
+# Standard Library
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Custom Library
+from object.signal import TradeSignal
+
+
+class ScoreAccumulator:
+    '''
+    # trade score of the TradeManager, shared by the thread adding the signal deltas and the ones deciding on it.
+    # the score is split into bands, and the waiters are only woken when the band changes:
+        # +2: score > threshold, i.e., buy      -2: score < -threshold, i.e., sell
+        # +1: score >= arm_threshold            -1: score <= -arm_threshold
+        #  0: otherwise
+    # wait() blocks a thread, changed() suspends a coroutine, both return at once if the band already differs.
+
+    # the deltas decay exponentially with the half-life of their TradeSignal, given in ms by half_lives.
+        # the key None of half_lives is the half-life of the carry of reset() and of the signals not listed, None -> no decay.
+        # every (TradeSignal) and (strategy, TradeSignal) contribution keeps its value and the time of its last update,
+        # and the decay is applied when it is read, so there is no decay thread and a read costs the same at any signal rate.
+        # the time is the timestamp of the signal, and clock() when none is given,
+        # so a backtest replaying the signals with their own timestamps and clock decays exactly as the live run did.
+    # the band is evaluated when the score is updated, i.e., by add(), reset() and refresh(),
+    # a crossing caused by the decay alone is seen at the next update.
+    '''
+    HALF_LIVES: Dict[TradeSignal | None, int | None] = {
+        TradeSignal.SHORT_TERM_BUY: 600_000,  # 10 minutes
+        TradeSignal.SHORT_TERM_SELL: 600_000,
+        TradeSignal.LONG_TERM_BUY: 1_800_000,  # 30 minutes
+        TradeSignal.LONG_TERM_SELL: 1_800_000,
+        None: 1_800_000,
+    }
+
+    def __init__(
+        self: "ScoreAccumulator",
+        threshold: int | float,
+        arm_threshold: int | float | None = None,
+        score: int | float = 0,
+        half_lives: Dict[TradeSignal | None, int | None] | None = None,  # None -> no decay
+        clock: Callable[[], int] | None = None,  # ms, the wall clock if not given
+    ) -> None:
+        self.threshold: int | float = threshold
+        self.arm_threshold: int | float | None = arm_threshold
+        self.half_lives: Dict[TradeSignal | None, int | None] = dict(half_lives or dict())
+        self.clock: Callable[[], int] = clock or (lambda: int(time.time() * 1_000))
+
+        self.__condition: threading.Condition = threading.Condition()
+        # key -> [value, timestamp of the value]
+        self.__by_signal: Dict[TradeSignal | None, List[float]] = dict()
+        self.__by_strategy: Dict[Tuple[str | None, TradeSignal | None], List[float]] = dict()
+        self.__score: float = 0
+        self.__band: int = 0
+        self.__trace: Any = None  # trace of the latest signal, the next order is attributed to it.
+        self.__async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = list()
+        self.reset(score)
+        return
+
+    def band_of(
+        self: "ScoreAccumulator",
+        score: int | float,
+    ) -> int:
+        if score > self.threshold:
+            return 2
+        if score < -self.threshold:
+            return -2
+        if self.arm_threshold is not None:
+            if score >= self.arm_threshold:
+                return 1
+            if score <= -self.arm_threshold:
+                return -1
+        return 0
+
+    def half_life(
+        self: "ScoreAccumulator",
+        signal: TradeSignal | None,
+    ) -> int | None:
+        return self.half_lives.get(signal, self.half_lives.get(None))
+
+    @property
+    def score(self: "ScoreAccumulator") -> float:
+        """
+        func score():
+            - the decayed score as of now.
+        """
+        with self.__condition:
+            return self.__total(self.clock())
+
+    @property
+    def band(self: "ScoreAccumulator") -> int:
+        with self.__condition:
+            return self.__band
+
+    def snapshot(self: "ScoreAccumulator") -> Tuple[float, int, Any]:
+        """
+        func snapshot():
+            - (score, band, trace) of the last update read together, the band is the one of this score.
+        """
+        with self.__condition:
+            return self.__score, self.__band, self.__trace
+
+    def contributions(
+        self: "ScoreAccumulator",
+        by: str = "signal",
+        timestamp: int | None = None,
+    ) -> Dict[Any, float]:
+        """
+        func contributions():
+            - the decayed contributions as of the timestamp, clock() if not given, which add up to the score.
+            - by "signal": TradeSignal -> contribution
+            - by "strategy": strategy -> contribution, summed over the signals of the strategy.
+            - the carry of reset() is under None.
+        """
+        with self.__condition:
+            timestamp = self.clock() if timestamp is None else timestamp
+            if by == "signal":
+                return {
+                    signal: self.__decayed(component, self.half_life(signal), timestamp)
+                    for signal, component in self.__by_signal.items()
+                }
+            if by == "strategy":
+                contributions: Dict[str | None, float] = dict()
+                for (strategy, signal), component in self.__by_strategy.items():
+                    contributions[strategy] = contributions.get(strategy, 0) + self.__decayed(component, self.half_life(signal), timestamp)
+                return contributions
+        raise ValueError(f"contributions by {by} is not supported, use signal or strategy.")
+
+    def add(
+        self: "ScoreAccumulator",
+        delta: int | float,
+        trace: Any = None,
+        signal: TradeSignal | None = None,
+        strategy: str | None = None,
+        timestamp: int | None = None,
+    ) -> float:
+        """
+        func add():
+            - add the delta of the signal at its timestamp, clock() if not given, and return the score as of then.
+        """
+        with self.__condition:
+            timestamp = self.clock() if timestamp is None else timestamp
+            half_life: int | None = self.half_life(signal)
+            ScoreAccumulator.__accumulate(self.__by_signal, signal, delta, half_life, timestamp)
+            ScoreAccumulator.__accumulate(self.__by_strategy, (strategy, signal), delta, half_life, timestamp)
+            if trace is not None:
+                self.__trace = trace
+            self.__update_band(timestamp)
+            return self.__score
+
+    def reset(
+        self: "ScoreAccumulator",
+        score: int | float = 0,
+        timestamp: int | None = None,
+    ) -> None:
+        """
+        func reset():
+            - drop every contribution, the score carried over decays with the half-life of None.
+        """
+        with self.__condition:
+            timestamp = self.clock() if timestamp is None else timestamp
+            self.__by_signal.clear()
+            self.__by_strategy.clear()
+            if score:
+                self.__by_signal[None] = [score, timestamp]
+                self.__by_strategy[(None, None)] = [score, timestamp]
+            self.__update_band(timestamp)
+        return
+
+    def refresh(
+        self: "ScoreAccumulator",
+        timestamp: int | None = None,
+    ) -> int:
+        """
+        func refresh():
+            - evaluate the band of the decayed score as of the timestamp, clock() if not given, and return it.
+        """
+        with self.__condition:
+            self.__update_band(self.clock() if timestamp is None else timestamp)
+            return self.__band
+
+    @staticmethod
+    def __decayed(
+        component: List[float],
+        half_life: int | None,
+        timestamp: int,
+    ) -> float:
+        value, updated = component
+        if half_life is None or timestamp <= updated:
+            return value
+        return value * 0.5 ** ((timestamp - updated) / half_life)
+
+    @staticmethod
+    def __accumulate(
+        components: Dict[Any, List[float]],
+        key: Any,
+        delta: int | float,
+        half_life: int | None,
+        timestamp: int,
+    ) -> None:
+        component: List[float] | None = components.get(key)
+        if component is None:
+            components[key] = [delta, timestamp]
+        elif timestamp >= component[1]:
+            component[0] = ScoreAccumulator.__decayed(component, half_life, timestamp) + delta
+            component[1] = timestamp
+        else:  # a late signal, its delta is decayed to the time of the component instead.
+            component[0] += ScoreAccumulator.__decayed([delta, timestamp], half_life, component[1])
+        return
+
+    def __total(
+        self: "ScoreAccumulator",
+        timestamp: int,
+    ) -> float:
+        return sum(
+            ScoreAccumulator.__decayed(component, self.half_life(signal), timestamp)
+            for signal, component in self.__by_signal.items()
+        )
+
+    def __update_band(
+        self: "ScoreAccumulator",
+        timestamp: int,
+    ) -> None:
+        """
+        func __update_band():
+            - called with the condition held, wakes the waiters only on a band change.
+        """
+        self.__score = self.__total(timestamp)
+        band: int = self.band_of(self.__score)
+        if band == self.__band:
+            return
+        self.__band = band
+        self.__condition.notify_all()
+        for loop, event in self.__async_waiters:
+            loop.call_soon_threadsafe(event.set)
+        self.__async_waiters.clear()
+        return
+
+    def wait(
+        self: "ScoreAccumulator",
+        band: int,
+        timeout: float | None = None,
+    ) -> int:
+        """
+        func wait():
+            - block until the band is no longer <band> or the timeout has passed, and return the current band.
+        """
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__band != band, timeout = timeout)
+            return self.__band
+
+    async def changed(
+        self: "ScoreAccumulator",
+        band: int,
+    ) -> int:
+        """
+        func changed():
+            - coroutine version of wait(), the event is set from the adding thread with call_soon_threadsafe().
+        """
+        event: asyncio.Event = asyncio.Event()
+        with self.__condition:
+            if self.__band != band:
+                return self.__band
+            self.__async_waiters.append((asyncio.get_running_loop(), event))
+        await event.wait()
+        with self.__condition:
+            return self.__band
@@ -1,5 +1,5 @@
 # Standard Library
-from typing import List, Dict, Union, Tuple
+from typing import Any, List, Dict, Union, Tuple
 from enum import IntFlag
 import time
 
@@ -23,6 +23,8 @@ class Signal:
     def generate_timestamp() -> int:
         return int(time.time() * 1_000)
 
+    __slots__ = ("_timestamp", "_signal", "_trace", "_strategy")
+
     '''
     data_struct = {
     "indicator": {
@@ -39,13 +41,19 @@ class Signal:
     def __init__(
         self: 'Signal',
         signal: TradeSignal,
+        trace: Any = None,
+        strategy: str | None = None,
     ) -> None:
         """
         func __init__:
             - Create an indicator instance with the given signal and timestamp.
+            - trace is the telemetry.tracing.TraceContext of the tick which has triggered the signal, if any.
+            - strategy is the name of the rule which has generated the signal, e.g., "golden_cross".
         """
         self._timestamp: int = Signal.generate_timestamp()
         self._signal: TradeSignal = signal
+        self._trace: Any = trace
+        self._strategy: str | None = strategy
 
         return None
 
@@ -56,3 +64,11 @@ class Signal:
     @property  # signal getter.
     def signal(self) -> TradeSignal:
         return self._signal
+
+    @property  # trace getter.
+    def trace(self) -> Any:
+        return self._trace
+
+    @property  # strategy getter.
+    def strategy(self) -> str | None:
+        return self._strategy
@@ -1,21 +1,34 @@
 import requests
-import hmac
-import hashlib
 import time
-from typing import Any, Union, Literal, Type, TypeVar
+from typing import Any, Dict, Union, Literal, Tuple, Type, TypeVar
 from abc import ABC, abstractmethod
 
 from pydantic import BaseModel, ValidationError
 
+from sdk.clock_sync import ClockSync
+from sdk.response_cache import ResponseCache
+from sdk.signer import HmacSigner
+from telemetry.metrics import metrics
+
 
 TBaseModel = TypeVar("TBaseModel", bound = BaseModel)
 
+# REST responses with an error status code, counted by the call() of the exchange SDKs.
+REST_ERRORS = metrics.counter(
+    "rest_errors_total",
+    "REST responses with an error status code.",
+    ("exchange", "status"),
+)
+
 
 class CommonBaseSDK(ABC):
     """
     A common base class for handling API requests, signature generation, and session management
     for different exchange SDKs (e.g., MEXC and Binance).
     """
+    # endpoint -> (ttl, stale-while-revalidate) in seconds of the reads going through cached_call().
+    CACHE_TTL: Dict[str, Tuple[float, float]] = dict()
+
     @staticmethod
     def snake_to_camel(
         s: str,
@@ -84,6 +97,71 @@ class CommonBaseSDK(ABC):
         # Initialize a session
         self.session = requests.Session()
 
+        # estimator of the exchange clock, see start_clock_sync().
+        self.clock: ClockSync | None = None
+
+        # public market reads, per instance so the TTLs can be tuned without touching the class.
+        self.cache: ResponseCache = ResponseCache(name = self.__class__.__module__.split(".")[0])
+        self.cache_ttl: Dict[str, Tuple[float, float]] = dict(self.CACHE_TTL)
+
+        # keyed HMAC state of the secret key, rebuilt by the signer property when the secret key is replaced.
+        self._signer: HmacSigner | None = None
+        self._signer_key: str | None = None
+
+    def timestamp(self: "CommonBaseSDK") -> int:
+        """
+        func timestamp():
+            - timestamp for the signed requests, on the exchange clock once the clock sync has been started.
+        """
+        if self.clock is not None and self.clock.synced:
+            return self.clock.now()
+        return CommonBaseSDK.generate_timestmap()
+
+    def server_timestamp(self: "CommonBaseSDK") -> int | None:
+        """
+        func server_timestamp():
+            - current time of the exchange in ms, implemented by the child classes with their server time endpoint.
+        """
+        raise NotImplementedError
+
+    def start_clock_sync(
+        self: "CommonBaseSDK",
+        interval: float = 30.0,
+    ) -> ClockSync:
+        """
+        func start_clock_sync():
+            - sample server_timestamp() every <interval> seconds and stamp the requests with the corrected time.
+        """
+        if self.clock is None:
+            self.clock = ClockSync(
+                fetch_server_time = self.server_timestamp,
+                name = self.__class__.__module__,
+                interval = interval,
+            )
+        return self.clock.start()
+
+    def cached_call(
+        self: "CommonBaseSDK",
+        endpoint: str,
+        url: str,
+        params: dict | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        func cached_call():
+            - call() through the response cache with the TTL of the endpoint in cache_ttl.
+            - concurrent identical reads share one request, even for an endpoint without a TTL.
+        """
+        ttl, stale = self.cache_ttl.get(endpoint, (0.0, 0.0))
+        key: Tuple[Any, ...] = (endpoint, url, tuple(sorted((params or dict()).items())))
+        return self.cache.get(
+            key,
+            lambda: self.call(url = url, params = params, **kwargs),
+            ttl = ttl,
+            stale = stale,
+            endpoint = endpoint,
+        )
+
     def set_content_type(self: "CommonBaseSDK", content_type: str):
         """
         Set the Content-Type header for the session.
@@ -94,6 +172,16 @@ class CommonBaseSDK(ABC):
             }
         )
 
+    @property
+    def signer(self: "CommonBaseSDK") -> HmacSigner:
+        if not self.secret_key:
+            # !: this api is not sigend.
+            raise ValueError("Secret key is required for signature generation.")
+        if self._signer is None or self._signer_key is not self.secret_key:
+            self._signer = HmacSigner(self.secret_key)
+            self._signer_key = self.secret_key
+        return self._signer
+
     def generate_signature(
         self: "CommonBaseSDK",
         query_string: str,
@@ -109,16 +197,9 @@ class CommonBaseSDK(ABC):
 
         return: The generated signature as a hex digest (readable string).
             - if we do not disgest using hexdigest, the signature will be a hmac object.
+            - signed on a copy of the precomputed HMAC state of the secret key, see HmacSigner.
         """
-        if not self.secret_key:
-            # !: this api is not sigend.
-            raise ValueError("Secret key is required for signature generation.")
-
-        return hmac.new(
-            key = self.secret_key.encode("utf-8"),
-            msg = query_string.encode("utf-8"),
-            digestmod = hashlib.sha256,
-        ).hexdigest()
+        return self.signer.sign(query_string)
 
     @staticmethod
     def parse_response(
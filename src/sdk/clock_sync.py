@@ -0,0 +1,159 @@
+# Standard Library
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Tuple
+
+# Custom Library
+from logger.set_logger import operation_logger
+
+
+class ClockSync:
+    '''
+    # NTP-style estimator of the exchange clock.
+    # one sample: t0 = local send time, server = exchange time, t1 = local receive time.
+        # rtt = t1 - t0
+        # offset = server - (t0 + t1) / 2, i.e., exchange time - local time, assuming a symmetric path.
+    # the sample with the minimum rtt among the last <window> samples wins, since it had the least queuing delay.
+    # one-way latency is estimated as rtt / 2 of the same sample.
+
+    - now() is the local time corrected to the exchange clock, used to stamp the signed requests.
+    - latency_ms() turns an exchange timestamp into the true exchange-to-us latency.
+    '''
+    @staticmethod
+    def local_time_ms() -> float:
+        return time.time_ns() / 1_000_000
+
+    def __init__(
+        self: "ClockSync",
+        fetch_server_time: Callable[[], int | None],
+        name: str = "ClockSync",
+        interval: float = 30.0,  # Second
+        window: int = 16,
+        burst: int = 4,
+    ) -> None:
+        """
+        func __init__():
+            - fetch_server_time returns the exchange time in ms, e.g., binance.FutureMarket.server_time()["serverTime"].
+            - every <interval> seconds, <burst> samples are taken back to back.
+        """
+        self.name: str = name
+        self.fetch_server_time: Callable[[], int | None] = fetch_server_time
+        self.interval: float = interval
+        self.burst: int = burst
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__samples: Deque[Tuple[float, float]] = deque(maxlen = window)  # (rtt, offset) in ms
+        self.__offset: float = 0.0
+        self.__rtt: float | None = None
+
+        self.__stop: threading.Event = threading.Event()
+        self.__thread: threading.Thread | None = None
+        return
+
+    """
+    ######################################################################################################################
+    #                                                  Estimation                                                        #
+    ######################################################################################################################
+    """
+    def sample(
+        self: "ClockSync",
+    ) -> Tuple[float, float] | None:
+        """
+        func sample():
+            - take one sample and update the estimate.
+
+        return Tuple[float, float] | None
+            - (rtt, offset) of the sample in ms, None if the exchange did not answer.
+        """
+        t0: float = ClockSync.local_time_ms()
+        try:
+            server_time: int | None = self.fetch_server_time()
+        except Exception as e:
+            operation_logger.warning(f"{__name__} - {self.name} failed to fetch the server time: {str(e)}")
+            return None
+        t1: float = ClockSync.local_time_ms()
+
+        if server_time is None:
+            return None
+
+        rtt: float = t1 - t0
+        offset: float = float(server_time) - (t0 + t1) / 2
+        self.add_sample(rtt, offset)
+        return rtt, offset
+
+    def add_sample(
+        self: "ClockSync",
+        rtt: float,
+        offset: float,
+    ) -> None:
+        with self.__lock:
+            self.__samples.append((rtt, offset))
+            self.__rtt, self.__offset = min(self.__samples)
+        return
+
+    @property
+    def offset_ms(self: "ClockSync") -> float:
+        with self.__lock:
+            return self.__offset
+
+    @property
+    def one_way_latency_ms(self: "ClockSync") -> float | None:
+        with self.__lock:
+            return None if self.__rtt is None else self.__rtt / 2
+
+    @property
+    def synced(self: "ClockSync") -> bool:
+        with self.__lock:
+            return self.__rtt is not None
+
+    def now(self: "ClockSync") -> int:
+        """
+        func now():
+            - current time on the exchange clock in ms.
+        """
+        return int(ClockSync.local_time_ms() + self.offset_ms)
+
+    def latency_ms(
+        self: "ClockSync",
+        exchange_timestamp: int | float,
+    ) -> float:
+        """
+        func latency_ms():
+            - time between the exchange stamping an event and us processing it, in ms.
+        """
+        return ClockSync.local_time_ms() + self.offset_ms - float(exchange_timestamp)
+
+    """
+    ######################################################################################################################
+    #                                               Threading Management                                                 #
+    ######################################################################################################################
+    """
+    def start(self: "ClockSync") -> "ClockSync":
+        if self.__thread is not None:
+            return self
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            name = f"{self.name}_clock_sync",
+            target = self.__sample_loop,
+            daemon = True,
+        )
+        self.__thread.start()
+        return self
+
+    def stop(self: "ClockSync") -> None:
+        self.__stop.set()
+        self.__thread = None
+        return
+
+    def __sample_loop(self: "ClockSync") -> None:
+        while not self.__stop.is_set():
+            for _ in range(self.burst):
+                self.sample()
+
+            if self.synced:
+                operation_logger.info(
+                    f"{__name__} - {self.name}: offset {self.offset_ms:.1f} ms, one-way latency {self.one_way_latency_ms:.1f} ms"
+                )
+            self.__stop.wait(self.interval)
+        return
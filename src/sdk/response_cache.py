@@ -0,0 +1,134 @@
+# Standard Library
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# Custom Library
+from logger.set_logger import operation_logger
+from telemetry.metrics import metrics
+
+
+# result = hit, stale (served while revalidating), miss (fetched by the caller) or coalesced (waited for a miss in flight).
+CACHE_REQUESTS = metrics.counter(
+    "rest_cache_requests_total",
+    "Cached REST reads by the outcome of the cache lookup.",
+    ("exchange", "endpoint", "result"),
+)
+
+
+class _Flight:
+    '''
+    # one fetch in flight, the callers asking for the same key wait on it instead of sending their own request.
+    '''
+    def __init__(self: "_Flight") -> None:
+        self.done: threading.Event = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+        return
+
+
+class ResponseCache:
+    '''
+    # TTL cache of the public REST reads with stale-while-revalidate and single-flight coalescing.
+        # age < ttl: the cached response is returned.
+        # ttl <= age < ttl + stale: the cached response is returned and one background fetch refreshes it.
+        # otherwise: the first caller fetches, the concurrent callers of the same key share its response.
+
+    - None, i.e., the call() of the SDKs failed, is never cached, so the next read tries the exchange again.
+    - the cached responses are shared between the callers, treat them as read-only.
+    '''
+    def __init__(
+        self: "ResponseCache",
+        name: str = "rest",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name: str = name
+        self.clock: Callable[[], float] = clock
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__entries: Dict[Hashable, Tuple[Any, float]] = dict()  # key -> (response, fetched at)
+        self.__flights: Dict[Hashable, _Flight] = dict()
+        self.stats: Dict[str, int] = dict(hit = 0, stale = 0, miss = 0, coalesced = 0)
+        return
+
+    def get(
+        self: "ResponseCache",
+        key: Hashable,
+        fetch: Callable[[], Any],
+        ttl: float = 0.0,  # Second
+        stale: float = 0.0,  # Second, on top of the ttl
+        endpoint: str = "",
+    ) -> Any:
+        """
+        func get():
+            - the response of fetch() for the key, from the cache or from the exchange.
+            - with ttl = 0, nothing is cached but the concurrent identical reads are still coalesced.
+        """
+        with self.__lock:
+            entry: Tuple[Any, float] | None = self.__entries.get(key)
+            age: float = self.clock() - entry[1] if entry is not None else float("inf")
+            flight: _Flight | None = self.__flights.get(key)
+
+            if age < ttl:
+                result: str = "hit"
+            elif age < ttl + stale:
+                result = "stale"
+                if flight is None:
+                    flight = self.__flights[key] = _Flight()
+                    threading.Thread(
+                        name = f"{self.name}_cache_refresh",
+                        target = self.__fetch,
+                        args = (key, fetch, flight),
+                        daemon = True,
+                    ).start()
+            elif flight is not None:
+                result = "coalesced"
+            else:
+                result = "miss"
+                flight = self.__flights[key] = _Flight()
+            self.stats[result] += 1
+        CACHE_REQUESTS.labels(exchange = self.name, endpoint = endpoint, result = result).inc()
+
+        if result in ("hit", "stale"):
+            return entry[0]  # type: ignore[index]
+        if result == "miss":
+            self.__fetch(key, fetch, flight)  # type: ignore[arg-type]
+
+        flight.done.wait()  # type: ignore[union-attr]
+        if flight.error is not None:  # type: ignore[union-attr]
+            raise flight.error  # type: ignore[union-attr]
+        return flight.value  # type: ignore[union-attr]
+
+    def __fetch(
+        self: "ResponseCache",
+        key: Hashable,
+        fetch: Callable[[], Any],
+        flight: _Flight,
+    ) -> None:
+        try:
+            flight.value = fetch()
+        except BaseException as e:
+            operation_logger.warning(f"{__name__} - {self.name} failed to fetch {key}: {str(e)}")
+            flight.error = e
+        finally:
+            with self.__lock:
+                if flight.error is None and flight.value is not None:
+                    self.__entries[key] = (flight.value, self.clock())
+                self.__flights.pop(key, None)
+            flight.done.set()
+        return
+
+    def invalidate(
+        self: "ResponseCache",
+        endpoint: str | None = None,
+    ) -> None:
+        """
+        func invalidate():
+            - drop the cached responses of the endpoint, every response if no endpoint is given.
+            - the keys built by CommonBaseSDK.cached_call() start with the endpoint.
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                if endpoint is None or (isinstance(key, tuple) and key[:1] == (endpoint,)):
+                    del self.__entries[key]
+        return
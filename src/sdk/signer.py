@@ -0,0 +1,85 @@
+# Standard Library
+import hashlib
+import hmac
+from typing import Any, Callable, Dict, Iterable, Tuple
+from urllib.parse import urlencode
+
+
+class HmacSigner:
+    '''
+    # HMAC with the key schedule done once.
+        # hmac.new() pads the key and hashes the inner and outer pads on every call,
+        # here the keyed state is built in __init__() and every message is signed on a copy() of it.
+        # prefixed() goes one step further and absorbs a fixed head of the messages, e.g., the MEXC apiKey.
+
+    - the signatures are the same hex digests as hmac.new(secret_key, message, digestmod).hexdigest().
+    '''
+    def __init__(
+        self: "HmacSigner",
+        secret_key: str | bytes,
+        digestmod: Callable[..., Any] = hashlib.sha256,
+    ) -> None:
+        key: bytes = secret_key.encode("utf-8") if isinstance(secret_key, str) else secret_key
+        self.__state: "hmac.HMAC" = hmac.new(key, digestmod = digestmod)
+        return
+
+    def prefixed(
+        self: "HmacSigner",
+        prefix: str | bytes,
+    ) -> "HmacSigner":
+        """
+        func prefixed():
+            - signer of the messages starting with the prefix, sign(message) signs prefix + message.
+        """
+        signer: HmacSigner = HmacSigner.__new__(HmacSigner)
+        state: "hmac.HMAC" = self.__state.copy()
+        state.update(prefix.encode("utf-8") if isinstance(prefix, str) else prefix)
+        signer.__state = state
+        return signer
+
+    def sign(
+        self: "HmacSigner",
+        *parts: str | bytes,
+    ) -> str:
+        """
+        func sign():
+            - hex digest of the concatenation of the parts, which are fed one by one instead of being joined.
+        """
+        state: "hmac.HMAC" = self.__state.copy()
+        for part in parts:
+            state.update(part.encode("utf-8") if isinstance(part, str) else part)
+        return state.hexdigest()
+
+
+class EncodedQuery:
+    '''
+    # urlencoded query of a fixed parameter set, e.g., the symbol, side, type and quantity of an order.
+        # the fixed part is encoded once, render() only encodes the parameters of the request, e.g., the timestamp.
+        # None values are dropped and the keys are used as given, so pass them the way the exchange spells them.
+    '''
+    def __init__(
+        self: "EncodedQuery",
+        params: Dict[str, Any],
+    ) -> None:
+        self.params: Dict[str, Any] = {key: value for key, value in params.items() if value is not None}
+        self.prefix: str = urlencode(list(self.params.items()))
+        self.prefix_bytes: bytes = self.prefix.encode("utf-8")
+        return
+
+    def render(
+        self: "EncodedQuery",
+        variable: Dict[str, Any] | Iterable[Tuple[str, Any]] | None = None,
+    ) -> Tuple[str, str]:
+        """
+        func render():
+            - (full query, the encoded tail with the leading "&") of the fixed part followed by the variable parameters.
+            - the tail is returned on its own so that the prefix bytes can be signed without being joined.
+        """
+        items: Iterable[Tuple[str, Any]] = variable.items() if isinstance(variable, dict) else (variable or ())
+        tail: str = urlencode([(key, value) for key, value in items if value is not None])
+        if not tail:
+            return self.prefix, ""
+        if not self.prefix:
+            return tail, tail
+        tail = f"&{tail}"
+        return f"{self.prefix}{tail}", tail
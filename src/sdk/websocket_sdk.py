@@ -6,11 +6,20 @@ import time
 import websocket
 import json
 import threading
-import hmac
-import hashlib
 
 # Get the logger
 from logger.set_logger import operation_logger
+from sdk.signer import HmacSigner
+from telemetry.metrics import metrics
+from telemetry.tracing import TRACE_KEY, TraceContext
+
+
+# reconnect attempts after the connection has been closed, by websocket and result.
+WS_RECONNECTS = metrics.counter(
+    "websocket_reconnects_total",
+    "Reconnect attempts of the websocket managers.",
+    ("name", "result"),
+)
 
 
 class BasicWebSocketManager(ABC):
@@ -94,6 +103,12 @@ class BasicWebSocketManager(ABC):
             # has the Websocket been authroized by the API? -> false initially
             # if api_key and secret_key are given, then it should be authentication needed.
             self.auth = False if (self.api_key is None or self.secret_key is None) else True
+
+            # the login signs apiKey + timestamp, so the key schedule and the apiKey are absorbed once.
+            self._signer: HmacSigner | None = HmacSigner(self.secret_key).prefixed(self.api_key) if self.auth else None
+
+            # set by exit(), so that the close is not taken for a dropped connection.
+            self._closing: bool = False
         except Exception as e:
             operation_logger.error(f"{__name__} - func __init__(): {e}")
 
@@ -221,13 +236,9 @@ class BasicWebSocketManager(ABC):
             timestamp = str(int(time.time() * 1000))
 
         if (self.api_key and self.secret_key):
-            _query_str = self.api_key + timestamp
-
-            return hmac.new(
-                self.secret_key.encode("utf-8"),
-                _query_str.encode("utf-8"),
-                hashlib.sha256,
-            ).hexdigest()
+            if self._signer is None:
+                self._signer = HmacSigner(self.secret_key).prefixed(self.api_key)
+            return self._signer.sign(timestamp)
 
         return
 
@@ -316,8 +327,13 @@ class BasicWebSocketManager(ABC):
         """
         # Parsing the message from the server
         """
+        # the trace starts before the parsing, so json.loads() is a part of the tick-to-order latency.
+        trace: TraceContext = TraceContext.start()
+
         # parsing the message into the json
         response = json.loads(message)
+        if isinstance(response, dict):
+            response[TRACE_KEY] = trace
 
         # now response is parsed as a dictionary so that we can do something with it.
         if (self.callback_function):
@@ -349,6 +365,10 @@ class BasicWebSocketManager(ABC):
         # websocket close
         # logging the status code and the msg into the operation_logger
         """
+        if self._closing:  # closed by exit(), no reconnect.
+            operation_logger.info(f"{__name__} - {self.ws_name} has been closed: {status_code} - {close_msg}.")
+            return
+
         operation_logger.warning(
             f"{__name__} - the websocket has been closed: {status_code} - {close_msg}. {self.ws_name} will try to reconnect."
         )
@@ -372,8 +392,10 @@ class BasicWebSocketManager(ABC):
                 operation_logger.info(
                     f"{__name__} - {self.ws_name} reconnected successfully."
                 )
+                WS_RECONNECTS.labels(name = self.ws_name, result = "success").inc()
                 break
             except Exception as e:
+                WS_RECONNECTS.labels(name = self.ws_name, result = "failure").inc()
                 operation_logger.error(
                     f"{__name__} - {self.ws_name} reconnect attempt {attempt} failed: {str(e)}"
                 )
@@ -442,7 +464,7 @@ class BasicWebSocketManager(ABC):
         # for the ping thread of WebSocketApp
         """
         curr_timestamp: int = 0
-        while True:
+        while not self._closing:
             if (BasicWebSocketManager.generate_timestamp() - curr_timestamp > (ping_interval * 1_000)):
                 self.ws.send(ping_payload)
                 curr_timestamp = BasicWebSocketManager.generate_timestamp()
@@ -468,11 +490,12 @@ class BasicWebSocketManager(ABC):
         """
         close the websocket
         """
+        self._closing = True
         self.ws.close()
 
         operation_logger.warning(
             "The WebSocket Manager has been terminated - You might need to restart the entire program"
         )
 
-        while self.ws.sock:
-            continue
+        # run_forever() returns once the socket is closed.
+        self.wst.join(timeout = self.conn_timeout)
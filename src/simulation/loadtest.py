@@ -0,0 +1,280 @@
+# Standard Library
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Custom Library
+from interface.pipeline_interface import STALE_ITEMS
+from logger.set_logger import operation_logger
+from manager.system_manager import SystemManager
+from simulation.market_feed import GeometricBrownianMotion, JumpDiffusion, PriceProcess, SyntheticFeed
+from simulation.mock_exchange_rest import MockExchangeRestServer, SimulatedAccount
+from simulation.mock_mexc_server import MockMexcWebSocketServer
+from telemetry.metrics import metrics
+from telemetry.tracing import tracer
+
+
+# (name, seconds, multiplier of the base tick rate), the default is a 10x burst for 30 seconds.
+DEFAULT_PHASES: Tuple[Tuple[str, float, float], ...] = (
+    ("warmup", 10.0, 1.0),
+    ("burst", 30.0, 10.0),
+    ("cooldown", 10.0, 1.0),
+)
+
+API_KEY: str = "load_test_api_key"
+SECRET_KEY: str = "load_test_secret_key"
+
+
+class _MirroredPrice(PriceProcess):
+    '''
+    # the price of another process, so the mark price of the mock REST server follows the websocket feed.
+    '''
+    def __init__(
+        self: "_MirroredPrice",
+        source: PriceProcess,
+    ) -> None:
+        self.source: PriceProcess = source
+        self.price: float = source.price
+        return
+
+    def step(
+        self: "_MirroredPrice",
+        dt: float,
+    ) -> float:
+        self.price = self.source.price
+        return self.price
+
+
+def thread_cpu_seconds() -> Dict[str, float]:
+    """
+    func thread_cpu_seconds():
+        - user + system CPU time of every live Python thread by name, from /proc/self/task/<tid>/stat.
+        - empty where /proc is not available, e.g., macOS.
+    """
+    ticks_per_second: float = float(os.sysconf("SC_CLK_TCK")) if hasattr(os, "sysconf") else 100.0
+    result: Dict[str, float] = dict()
+    for thread in threading.enumerate():
+        native_id: int | None = getattr(thread, "native_id", None)
+        if native_id is None:
+            continue
+        try:
+            with open(f"/proc/self/task/{native_id}/stat", "r") as file:
+                fields: List[str] = file.read().rpartition(")")[2].split()
+        except OSError:
+            continue
+        # fields[0] is the state, i.e., field 3 of proc(5), utime and stime are the fields 14 and 15.
+        result[thread.name] = result.get(thread.name, 0.0) + (int(fields[11]) + int(fields[12])) / ticks_per_second
+    return result
+
+
+class LoadTest:
+    '''
+    # boots the whole SystemManager graph against the mock exchanges and drives the tick rate through phases.
+        # the MEXC ticker comes from MockMexcWebSocketServer at <base_rate> x the multiplier of the phase.
+        # orders, positions and balances are served by MockExchangeRestServer, whose mark price follows the feed.
+        # the Binance websocket connects to the mock too, it gets no pushes, so the TradeManager falls back to REST.
+
+    - per phase: sustained tick throughput, queue high-water marks, dropped and stale ticks,
+    - CPU per thread and the tick-to-order latency of the tracer.
+    '''
+    def __init__(
+        self: "LoadTest",
+        base_rate: float = 1.0,  # ticks per second, MEXC pushes the ticker once a second
+        phases: Sequence[Tuple[str, float, float]] = DEFAULT_PHASES,
+        symbol: str = "BTC_USDT",
+        price: float = 60_000.0,
+        volatility: float = 0.6,
+        jump_intensity: float = 0.0,
+        latency_ms: float = 0.0,
+        sample_interval: float = 0.01,  # Second, queue depth sampling
+        drain_timeout: float = 10.0,
+        seed: int | None = None,
+    ) -> None:
+        self.base_rate: float = base_rate
+        self.phases: List[Tuple[str, float, float]] = list(phases)
+        self.symbol: str = symbol
+        self.sample_interval: float = sample_interval
+        self.drain_timeout: float = drain_timeout
+
+        if jump_intensity > 0:
+            process: PriceProcess = JumpDiffusion(price = price, volatility = volatility, jump_intensity = jump_intensity, seed = seed)
+        else:
+            process = GeometricBrownianMotion(price = price, volatility = volatility, seed = seed)
+        self.ws_server: MockMexcWebSocketServer = MockMexcWebSocketServer(
+            feeds = {symbol: SyntheticFeed(process, symbol = symbol, seed = seed)},
+            rate = base_rate,
+            api_key = API_KEY,
+            secret_key = SECRET_KEY,
+        )
+        binance_symbol: str = symbol.replace("_", "")
+        self.rest_server: MockExchangeRestServer = MockExchangeRestServer(
+            binance = SimulatedAccount(price_processes = {binance_symbol: _MirroredPrice(process)}),
+            mexc = SimulatedAccount(price_processes = {symbol: _MirroredPrice(process)}),
+            api_key = API_KEY,
+            secret_key = SECRET_KEY,
+            latency_ms = latency_ms,
+            seed = seed,
+        )
+        self.system: SystemManager | None = None
+        # the symbol metadata of the mock must not overwrite the snapshot of the real exchanges.
+        self.metadata_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        return
+
+    def boot(self: "LoadTest") -> SystemManager:
+        """
+        func boot():
+            - start the mock servers and construct the SystemManager against them, with the credentials they expect.
+        """
+        self.ws_server.start()
+        self.rest_server.start()
+        for venue in ("MEXC", "BINANCE"):
+            os.environ[f"{venue}_API_KEY"] = API_KEY
+            os.environ[f"{venue}_SECRET_KEY"] = SECRET_KEY
+
+        self.system = SystemManager(
+            mexc_rest_url = self.rest_server.base_url,
+            mexc_ws_url = self.ws_server.endpoint,
+            binance_rest_url = self.rest_server.base_url,
+            binance_ws_url = f"ws://{self.ws_server.host}:{self.ws_server.port}",
+            metrics_port = 0,
+            metadata_path = os.path.join(self.metadata_dir.name, "symbols.json"),
+            block = False,
+        )
+        return self.system
+
+    def shutdown(self: "LoadTest") -> None:
+        if self.system is not None:
+            self.system.stop()
+        self.ws_server.stop()
+        self.rest_server.stop()
+        self.metadata_dir.cleanup()
+        return
+
+    def queues(self: "LoadTest") -> Dict[str, Any]:
+        return {
+            "price_fetch_buffer": self.system.data_collector_processor.price_fetch_buffer,
+            "data_pipeline": self.system.data_pipeline.queue,
+            "signal_pipeline": self.system.signal_pipline.signal_queue,
+        }
+
+    def counters(self: "LoadTest") -> Dict[str, float]:
+        return {
+            "ticks_sent": self.ws_server.messages_sent,
+            "ticks_received": metrics.counter(
+                "ticks_received_total", "Ticker messages put into the price buffer.", ("symbol",),
+            ).labels(symbol = self.symbol).value,
+            "stale_indexes": STALE_ITEMS.labels(pipeline = "DataPipeline").value,
+            "stale_signals": STALE_ITEMS.labels(pipeline = "SignalPipeline").value,
+            "orders": self.rest_server.requests.get("POST /fapi/v1/order", 0),
+        }
+
+    def run_phase(
+        self: "LoadTest",
+        name: str,
+        seconds: float,
+        multiplier: float,
+    ) -> Dict[str, Any]:
+        queues: Dict[str, Any] = self.queues()
+        high_water: Dict[str, int] = {queue: 0 for queue in queues}
+        before: Dict[str, float] = self.counters()
+        cpu_before: Dict[str, float] = thread_cpu_seconds()
+        tracer.reset()
+
+        self.ws_server.rate = self.base_rate * multiplier
+        operation_logger.info(f"{__name__} - Load test phase {name}: {self.ws_server.rate} ticks/s for {seconds} s")
+        started: float = time.perf_counter()
+        while time.perf_counter() - started < seconds:
+            for queue, buffer in queues.items():
+                high_water[queue] = max(high_water[queue], buffer.qsize())
+            time.sleep(self.sample_interval)
+        elapsed: float = time.perf_counter() - started
+
+        after: Dict[str, float] = self.counters()
+        cpu_after: Dict[str, float] = thread_cpu_seconds()
+        delta: Dict[str, float] = {key: after[key] - before[key] for key in after}
+        cpu: Dict[str, float] = {
+            thread: round(seconds_used - cpu_before.get(thread, 0.0), 3)
+            for thread, seconds_used in cpu_after.items()
+            if seconds_used - cpu_before.get(thread, 0.0) > 0
+        }
+        return {
+            "phase": name,
+            "seconds": round(elapsed, 3),
+            "target_rate": self.ws_server.rate,
+            "sent_per_second": delta["ticks_sent"] / elapsed,
+            "received_per_second": delta["ticks_received"] / elapsed,
+            "queue_high_water": high_water,
+            "queue_depth_at_end": {queue: buffer.qsize() for queue, buffer in queues.items()},
+            "stale_indexes": delta["stale_indexes"],
+            "stale_signals": delta["stale_signals"],
+            "orders": delta["orders"],
+            "cpu_seconds": dict(sorted(cpu.items(), key = lambda item: -item[1])),
+            "latency_us": tracer.report(),
+        }
+
+    def run(self: "LoadTest") -> Dict[str, Any]:
+        """
+        func run():
+            - boot, run every phase, then stop the feed and wait for the buffers to drain before counting the drops.
+        """
+        self.boot()
+        try:
+            phases: List[Dict[str, Any]] = [self.run_phase(*phase) for phase in self.phases]
+
+            self.ws_server.rate = 0.0
+            deadline: float = time.perf_counter() + self.drain_timeout
+            while time.perf_counter() < deadline and any(buffer.qsize() for buffer in self.queues().values()):
+                time.sleep(self.sample_interval)
+            counters: Dict[str, float] = self.counters()
+        finally:
+            self.shutdown()
+
+        return {
+            "base_rate": self.base_rate,
+            "phases": phases,
+            "ticks_sent": counters["ticks_sent"],
+            "ticks_received": counters["ticks_received"],
+            "dropped_ticks": counters["ticks_sent"] - counters["ticks_received"],
+            "orders": counters["orders"],
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Tick-to-order load test of the SystemManager against the mock exchanges.")
+    parser.add_argument("--base-rate", type = float, default = 1.0, help = "ticks per second outside of the burst")
+    parser.add_argument("--burst", type = float, default = 10.0, help = "multiplier of the base rate during the burst")
+    parser.add_argument("--burst-seconds", type = float, default = 30.0)
+    parser.add_argument("--warmup-seconds", type = float, default = 10.0)
+    parser.add_argument("--cooldown-seconds", type = float, default = 10.0)
+    parser.add_argument("--latency-ms", type = float, default = 0.0, help = "injected REST latency")
+    parser.add_argument("--jumps", type = float, default = 0.0, help = "price jumps per second, 0 for plain GBM")
+    parser.add_argument("--seed", type = int, default = None)
+    parser.add_argument("--output", default = None, help = "write the report as JSON, printed if not given")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = LoadTest(
+        base_rate = args.base_rate,
+        phases = (
+            ("warmup", args.warmup_seconds, 1.0),
+            ("burst", args.burst_seconds, args.burst),
+            ("cooldown", args.cooldown_seconds, 1.0),
+        ),
+        latency_ms = args.latency_ms,
+        jump_intensity = args.jumps,
+        seed = args.seed,
+    ).run()
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(report, file, indent = 2)
+    else:
+        print(json.dumps(report, indent = 2))
+    return
+
+
+if __name__ == "__main__":
+    main()
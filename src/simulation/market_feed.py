@@ -0,0 +1,340 @@
+# Standard Library
+import json
+import math
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Custom Library
+from manager.market_data_store import MarketDataStore
+
+
+SECONDS_PER_YEAR: float = 365 * 24 * 60 * 60
+
+
+class PriceProcess(ABC):
+    '''
+    # source of the mid price of the synthetic feed.
+    # step(dt) advances the process by dt seconds and returns the new price.
+    '''
+    price: float
+
+    @abstractmethod
+    def step(
+        self: "PriceProcess",
+        dt: float,
+    ) -> float:
+        ...
+
+
+class GeometricBrownianMotion(PriceProcess):
+    '''
+    # dS / S = mu dt + sigma dW, with mu and sigma annualized, e.g., sigma = 0.6 for BTC.
+    # the exact solution is used, so the step size does not bias the price.
+    '''
+    def __init__(
+        self: "GeometricBrownianMotion",
+        price: float = 60_000.0,
+        drift: float = 0.0,
+        volatility: float = 0.6,
+        seed: int | None = None,
+    ) -> None:
+        self.price: float = price
+        self.drift: float = drift
+        self.volatility: float = volatility
+        self.rng: random.Random = random.Random(seed)
+        return
+
+    def _diffusion(
+        self: "GeometricBrownianMotion",
+        dt: float,
+    ) -> float:
+        years: float = dt / SECONDS_PER_YEAR
+        return (self.drift - 0.5 * self.volatility ** 2) * years + self.volatility * math.sqrt(years) * self.rng.gauss(0.0, 1.0)
+
+    def step(
+        self: "GeometricBrownianMotion",
+        dt: float,
+    ) -> float:
+        if dt > 0:
+            self.price *= math.exp(self._diffusion(dt))
+        return self.price
+
+
+class JumpDiffusion(GeometricBrownianMotion):
+    '''
+    # Merton jump diffusion: GBM plus jumps arriving at <jump_intensity> per second,
+    # with log-normal sizes, i.e., log(jump) ~ N(jump_mean, jump_std).
+    # the drift is compensated, so the jumps do not change the expected price.
+
+    - at most one jump per step, which is exact enough as long as jump_intensity * dt is small.
+    '''
+    def __init__(
+        self: "JumpDiffusion",
+        price: float = 60_000.0,
+        drift: float = 0.0,
+        volatility: float = 0.6,
+        jump_intensity: float = 1 / 60,  # one jump a minute
+        jump_mean: float = 0.0,
+        jump_std: float = 0.002,  # 20 bp
+        seed: int | None = None,
+    ) -> None:
+        super().__init__(price = price, drift = drift, volatility = volatility, seed = seed)
+        self.jump_intensity: float = jump_intensity
+        self.jump_mean: float = jump_mean
+        self.jump_std: float = jump_std
+        self.compensation: float = jump_intensity * (math.exp(jump_mean + 0.5 * jump_std ** 2) - 1)
+        self.jumps: int = 0
+        return
+
+    def step(
+        self: "JumpDiffusion",
+        dt: float,
+    ) -> float:
+        if dt <= 0:
+            return self.price
+        log_return: float = self._diffusion(dt) - self.compensation * dt
+        if self.rng.random() < 1 - math.exp(-self.jump_intensity * dt):
+            log_return += self.rng.gauss(self.jump_mean, self.jump_std)
+            self.jumps += 1
+        self.price *= math.exp(log_return)
+        return self.price
+
+
+class ReplayPrices(PriceProcess):
+    '''
+    # recorded prices replayed one per step, from the start again when <loop> is set.
+    # from_store() reads the MarketDataStore, from_jsonl() reads the messages written by FeedRecorder.
+    '''
+    def __init__(
+        self: "ReplayPrices",
+        prices: Sequence[float],
+        loop: bool = True,
+    ) -> None:
+        if len(prices) == 0:
+            raise ValueError("ReplayPrices needs at least one price.")
+        self.prices: List[float] = [float(price) for price in prices]
+        self.loop: bool = loop
+        self.position: int = 0
+        self.price: float = self.prices[0]
+        return
+
+    def step(
+        self: "ReplayPrices",
+        dt: float,
+    ) -> float:
+        if self.position >= len(self.prices):
+            if not self.loop:
+                return self.price
+            self.position = 0
+        self.price = self.prices[self.position]
+        self.position += 1
+        return self.price
+
+    @classmethod
+    def from_store(
+        cls,
+        store: MarketDataStore,
+        symbol: str,
+        start_ms: int,
+        end_ms: int,
+        column: str = "fairPrice",
+        loop: bool = True,
+    ) -> "ReplayPrices":
+        return cls(store.read(symbol, start_ms, end_ms, columns = (column, ))[column], loop = loop)
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        path: str,
+        loop: bool = True,
+    ) -> "ReplayPrices":
+        """
+        func from_jsonl():
+            - one MEXC message per line, the prices of push.ticker (fairPrice) and push.deal (p) are replayed.
+        """
+        prices: List[float] = list()
+        with open(path, "r", encoding = "utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                message: Dict[str, Any] = json.loads(line)
+                data: Any = message.get("data")
+                if not isinstance(data, dict):
+                    continue
+                if message.get("channel") == "push.ticker":
+                    price = data.get("fairPrice", data.get("lastPrice"))
+                elif message.get("channel") == "push.deal":
+                    price = data.get("p")
+                else:
+                    continue
+                if price is not None:
+                    prices.append(float(price))
+        return cls(prices, loop = loop)
+
+
+class FeedRecorder:
+    '''
+    # websocket callback which appends every message as a JSON line, to be replayed by ReplayPrices.from_jsonl().
+    '''
+    def __init__(
+        self: "FeedRecorder",
+        path: str,
+    ) -> None:
+        self.path: str = path
+        self.__file = open(path, "a", encoding = "utf-8")
+        return
+
+    def __call__(
+        self: "FeedRecorder",
+        message: Dict[str, Any],
+    ) -> None:
+        self.__file.write(json.dumps({key: value for key, value in message.items() if not key.startswith("_")}) + "\n")
+        return
+
+    def close(self: "FeedRecorder") -> None:
+        self.__file.close()
+        return
+
+
+class SyntheticFeed:
+    '''
+    # renders the MEXC contract websocket pushes of one symbol around the price of a PriceProcess.
+    # message() advances the process to the given time, so every channel sees the same price path.
+
+    - push.ticker: the ticker of DataCollectorAndProcessor, fairPrice / lastPrice / bid1 / ask1 ...
+    - push.deal: one trade at the bid or the ask.
+    - push.depth: <depth_levels> levels on each side, [price, orders, volume].
+    '''
+    CHANNELS = ("push.ticker", "push.deal", "push.depth")
+
+    def __init__(
+        self: "SyntheticFeed",
+        process: PriceProcess,
+        symbol: str = "BTC_USDT",
+        spread_bps: float = 1.0,
+        tick_size: float = 0.1,
+        depth_levels: int = 20,
+        seed: int | None = None,
+    ) -> None:
+        self.process: PriceProcess = process
+        self.symbol: str = symbol
+        self.spread_bps: float = spread_bps
+        self.tick_size: float = tick_size
+        self.depth_levels: int = depth_levels
+        self.rng: random.Random = random.Random(seed)
+
+        self.last_timestamp: int | None = None
+        self.open_price: float = process.price
+        self.high_price: float = process.price
+        self.low_price: float = process.price
+        self.volume24: float = 0.0
+        self.depth_version: int = 0
+        return
+
+    def __round(
+        self: "SyntheticFeed",
+        price: float,
+    ) -> float:
+        return round(round(price / self.tick_size) * self.tick_size, 10)
+
+    def advance(
+        self: "SyntheticFeed",
+        timestamp: int,
+    ) -> float:
+        """
+        func advance():
+            - move the price process to the timestamp in ms and keep the 24h statistics.
+        """
+        dt: float = 0.0 if self.last_timestamp is None else max(timestamp - self.last_timestamp, 0) / 1_000
+        self.last_timestamp = timestamp
+        price: float = self.process.step(dt)
+        self.high_price = max(self.high_price, price)
+        self.low_price = min(self.low_price, price)
+        return price
+
+    def quote(self: "SyntheticFeed") -> Tuple[float, float]:
+        price: float = self.process.price
+        half_spread: float = price * self.spread_bps / 20_000
+        bid: int = math.floor((price - half_spread) / self.tick_size)
+        ask: int = max(math.ceil((price + half_spread) / self.tick_size), bid + 1)  # at least one tick wide
+        return round(bid * self.tick_size, 10), round(ask * self.tick_size, 10)
+
+    def message(
+        self: "SyntheticFeed",
+        channel: str,
+        timestamp: int | None = None,
+    ) -> Dict[str, Any]:
+        if timestamp is None:
+            timestamp = int(time.time() * 1_000)
+        price: float = self.advance(timestamp)
+
+        if channel == "push.ticker":
+            data: Dict[str, Any] = self.ticker(price, timestamp)
+        elif channel == "push.deal":
+            data = self.deal(timestamp)
+        elif channel == "push.depth":
+            data = self.depth()
+        else:
+            raise ValueError(f"SyntheticFeed cannot render {channel}.")
+        return {"channel": channel, "data": data, "symbol": self.symbol, "ts": timestamp}
+
+    def ticker(
+        self: "SyntheticFeed",
+        price: float,
+        timestamp: int,
+    ) -> Dict[str, Any]:
+        bid, ask = self.quote()
+        rise_fall_value: float = price - self.open_price
+        rise_fall_rate: float = rise_fall_value / self.open_price if self.open_price else 0.0
+        return {
+            "symbol": self.symbol,
+            "lastPrice": self.__round(price),
+            "riseFallRate": round(rise_fall_rate, 4),
+            "fairPrice": self.__round(price),
+            "indexPrice": self.__round(price),
+            "volume24": round(self.volume24),
+            "amount24": round(self.volume24 * price, 2),
+            "maxBidPrice": self.__round(price * 1.1),
+            "minAskPrice": self.__round(price * 0.9),
+            "lower24Price": self.__round(self.low_price),
+            "high24Price": self.__round(self.high_price),
+            "timestamp": timestamp,
+            "bid1": bid,
+            "ask1": ask,
+            "holdVol": round(self.volume24 / 2),
+            "riseFallValue": round(rise_fall_value, 2),
+            "fundingRate": 0.0001,
+            "zone": "UTC+0",
+            "riseFallRates": {"zone": "UTC+0", "r": round(rise_fall_rate, 4), "v": round(rise_fall_value, 2)},
+            "riseFallRatesOfTimezone": [round(rise_fall_rate, 4)] * 3,
+        }
+
+    def deal(
+        self: "SyntheticFeed",
+        timestamp: int,
+    ) -> Dict[str, Any]:
+        bid, ask = self.quote()
+        side: int = 1 if self.rng.random() < 0.5 else 2  # 1: buy at the ask, 2: sell at the bid
+        volume: int = 1 + int(self.rng.expovariate(1 / 20))
+        self.volume24 += volume
+        return {
+            "p": ask if side == 1 else bid,
+            "v": volume,
+            "T": side,
+            "O": 3,
+            "M": 2,
+            "t": timestamp,
+        }
+
+    def depth(self: "SyntheticFeed") -> Dict[str, Any]:
+        bid, ask = self.quote()
+        self.depth_version += 1
+        levels = range(self.depth_levels)
+        uniform = self.rng.random  # randrange() is several times slower, this runs 80 times per message
+        return {
+            "asks": [[self.__round(ask + level * self.tick_size), 1 + int(uniform() * 5), 1 + int(uniform() * 500)] for level in levels],
+            "bids": [[self.__round(bid - level * self.tick_size), 1 + int(uniform() * 5), 1 + int(uniform() * 500)] for level in levels],
+            "version": self.depth_version,
+        }
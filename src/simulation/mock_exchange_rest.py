@@ -0,0 +1,1072 @@
+# Standard Library
+import argparse
+import hashlib
+import hmac
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Set, Tuple
+from urllib.parse import parse_qsl
+
+# Custom Library
+from logger.set_logger import operation_logger
+from simulation.market_feed import GeometricBrownianMotion, PriceProcess
+
+
+class MockApiError(Exception):
+    '''
+    # error response of the mock servers, rendered by the venue, i.e., {"code", "msg"} for Binance.
+    '''
+    def __init__(
+        self: "MockApiError",
+        status: int,
+        code: int,
+        message: str,
+    ) -> None:
+        super().__init__(message)
+        self.status: int = status
+        self.code: int = code
+        self.message: str = message
+        return
+
+
+class SimulatedAccount:
+    '''
+    # book keeping behind the mock REST servers: one-way positions in the base asset and a single margin asset.
+        # MARKET orders are filled at once at the best bid / ask if quoted, at the mark price otherwise,
+        # moved by <slippage_bps> against the taker.
+        # STOP_MARKET / TAKE_PROFIT_MARKET orders wait for the mark price, i.e., set_mark_price() or the price process.
+        # a triggered closePosition order closes the whole position, and expires when there is nothing to close.
+
+    - mark prices are set by hand with set_mark_price(), or follow a PriceProcess per symbol in wall clock time.
+    '''
+    def __init__(
+        self: "SimulatedAccount",
+        balance: float = 10_000.0,
+        asset: str = "USDT",
+        leverage: int = 20,
+        taker_fee: float = 0.0004,  # 4 bp
+        slippage_bps: float = 0.0,
+        mark_prices: Dict[str, float] | None = None,
+        price_processes: Dict[str, PriceProcess] | None = None,
+        book_quantity: float = 1.0,  # base asset at every level of the order book served by the mock
+    ) -> None:
+        self.asset: str = asset
+        self.wallet_balance: float = balance
+        self.default_leverage: int = leverage
+        self.taker_fee: float = taker_fee
+        self.slippage_bps: float = slippage_bps
+        self.book_quantity: float = book_quantity
+        self.lock: threading.RLock = threading.RLock()
+
+        self.mark_prices: Dict[str, float] = dict(mark_prices or dict())
+        self.quotes: Dict[str, Tuple[float, float]] = dict()  # symbol -> (best bid, best ask), see set_quote()
+        self.price_processes: Dict[str, PriceProcess] = dict(price_processes or dict())
+        for symbol, process in self.price_processes.items():
+            self.mark_prices.setdefault(symbol, process.price)
+        self.last_advance: float = time.monotonic()
+
+        self.leverages: Dict[str, int] = dict()
+        self.positions: Dict[str, Tuple[float, float]] = dict()  # symbol -> (signed amount, entry price)
+        self.orders: Dict[int, Dict[str, Any]] = dict()  # orderId -> order, in the Binance schema
+        self.fills: List[Dict[str, Any]] = list()
+        self.__order_ids: Iterator[int] = itertools.count(1)
+        return
+
+    @staticmethod
+    def now() -> int:
+        return int(time.time() * 1_000)
+
+    def advance(self: "SimulatedAccount") -> None:
+        """
+        func advance():
+            - step the price processes by the wall clock time since the last call and check the triggers.
+        """
+        with self.lock:
+            if not self.price_processes:
+                return
+            current: float = time.monotonic()
+            dt: float = current - self.last_advance
+            self.last_advance = current
+            for symbol, process in self.price_processes.items():
+                self.set_mark_price(symbol, process.step(dt))
+        return
+
+    def mark_price(
+        self: "SimulatedAccount",
+        symbol: str,
+    ) -> float:
+        with self.lock:
+            if symbol not in self.mark_prices:
+                raise MockApiError(400, -1121, "Invalid symbol.")
+            return self.mark_prices[symbol]
+
+    def set_mark_price(
+        self: "SimulatedAccount",
+        symbol: str,
+        price: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        func set_mark_price():
+            - move the mark price and fire the conditional orders it crosses, returns the fired orders.
+        """
+        with self.lock:
+            self.mark_prices[symbol] = price
+            fired: List[Dict[str, Any]] = list()
+            for order in list(self.orders.values()):
+                if order["symbol"] != symbol or order["status"] != "NEW" or not self.__crossed(order, price):
+                    continue
+                self.__fire(order)
+                fired.append(order)
+        return fired
+
+    def set_quote(
+        self: "SimulatedAccount",
+        symbol: str,
+        bid: float,
+        ask: float,
+    ) -> None:
+        """
+        func set_quote():
+            - the best bid / ask the MARKET orders are filled at from now on, e.g., of a live book ticker.
+        """
+        with self.lock:
+            self.quotes[symbol] = (bid, ask)
+        return
+
+    def leverage(
+        self: "SimulatedAccount",
+        symbol: str,
+    ) -> int:
+        return self.leverages.get(symbol, self.default_leverage)
+
+    def set_leverage(
+        self: "SimulatedAccount",
+        symbol: str,
+        leverage: int,
+    ) -> None:
+        if not 1 <= leverage <= 125:
+            raise MockApiError(400, -4028, f"Leverage {leverage} is not valid")
+        with self.lock:
+            self.leverages[symbol] = leverage
+        return
+
+    def position(
+        self: "SimulatedAccount",
+        symbol: str,
+    ) -> Tuple[float, float]:
+        with self.lock:
+            return self.positions.get(symbol, (0.0, 0.0))
+
+    def unrealized_pnl(
+        self: "SimulatedAccount",
+        symbol: str,
+    ) -> float:
+        with self.lock:
+            amount, entry_price = self.position(symbol)
+            if not amount:
+                return 0.0
+            return amount * (self.mark_prices.get(symbol, entry_price) - entry_price)
+
+    def initial_margin(self: "SimulatedAccount") -> float:
+        with self.lock:
+            return sum(abs(amount) * entry_price / self.leverage(symbol) for symbol, (amount, entry_price) in self.positions.items())
+
+    def available_balance(self: "SimulatedAccount") -> float:
+        with self.lock:
+            unrealized: float = sum(self.unrealized_pnl(symbol) for symbol in self.positions)
+            return self.wallet_balance + unrealized - self.initial_margin()
+
+    def place_order(
+        self: "SimulatedAccount",
+        symbol: str,
+        side: str,
+        type: str = "MARKET",
+        quantity: float | None = None,
+        stop_price: float | None = None,
+        close_position: bool = False,
+        reduce_only: bool = False,
+        client_order_id: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        func place_order():
+            - MARKET is filled before the order is returned, STOP_MARKET / TAKE_PROFIT_MARKET are returned as NEW.
+        """
+        if side not in ("BUY", "SELL"):
+            raise MockApiError(400, -1117, "Invalid side.")
+        if type not in ("MARKET", "STOP_MARKET", "TAKE_PROFIT_MARKET"):
+            raise MockApiError(400, -1116, "Invalid orderType.")
+        if type == "MARKET" and (quantity is None or quantity <= 0):
+            raise MockApiError(400, -1102, "Mandatory parameter 'quantity' was not sent, was empty/null, or malformed.")
+        if type != "MARKET" and stop_price is None:
+            raise MockApiError(400, -1102, "Mandatory parameter 'stopPrice' was not sent, was empty/null, or malformed.")
+        if type != "MARKET" and not close_position and (quantity is None or quantity <= 0):
+            raise MockApiError(400, -1102, "Mandatory parameter 'quantity' was not sent, was empty/null, or malformed.")
+
+        with self.lock:
+            self.mark_price(symbol)  # unknown symbol -> -1121
+            if client_order_id is not None and any(
+                order["clientOrderId"] == client_order_id and order["status"] == "NEW" for order in self.orders.values()
+            ):
+                raise MockApiError(400, -4116, "ClientOrderId is duplicated.")
+            order_id: int = next(self.__order_ids)
+            order: Dict[str, Any] = {
+                "orderId": order_id,
+                "clientOrderId": client_order_id or f"mock_{order_id}",
+                "symbol": symbol,
+                "side": side,
+                "positionSide": "BOTH",
+                "type": type,
+                "status": "NEW",
+                "origQty": str(quantity or 0.0),
+                "executedQty": "0",
+                "avgPrice": "0",
+                "stopPrice": str(stop_price or 0.0),
+                "closePosition": close_position,
+                "reduceOnly": reduce_only or close_position,
+                "updateTime": self.now(),
+            }
+            self.orders[order_id] = order
+            if type == "MARKET":
+                self.__fill(order, float(quantity))
+            elif self.__crossed(order, self.mark_prices[symbol]):
+                del self.orders[order_id]  # Binance rejects a conditional order which would trigger at once.
+                raise MockApiError(400, -2021, "Order would immediately trigger.")
+        return order
+
+    def find_order(
+        self: "SimulatedAccount",
+        symbol: str,
+        order_id: int | None = None,
+        client_order_id: str | None = None,
+    ) -> Dict[str, Any] | None:
+        """
+        func find_order():
+            - the order by its orderId, or the latest one of the clientOrderId.
+        """
+        with self.lock:
+            if order_id is not None:
+                order: Dict[str, Any] | None = self.orders.get(order_id)
+            else:
+                order = next((
+                    order for order in reversed(self.orders.values()) if order["clientOrderId"] == client_order_id
+                ), None)
+            return order if order is not None and order["symbol"] == symbol else None
+
+    def cancel_order(
+        self: "SimulatedAccount",
+        symbol: str,
+        order_id: int | None = None,
+        client_order_id: str | None = None,
+    ) -> Dict[str, Any]:
+        with self.lock:
+            order: Dict[str, Any] | None = self.find_order(symbol, order_id, client_order_id)
+            if order is None:
+                raise MockApiError(400, -2011, "Unknown order sent.")
+            if order["status"] != "NEW":
+                raise MockApiError(400, -2011, "Unknown order sent.")
+            order["status"] = "CANCELED"
+            order["updateTime"] = self.now()
+        return order
+
+    def open_orders(
+        self: "SimulatedAccount",
+        symbol: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [
+                dict(order) for order in self.orders.values()
+                if order["status"] == "NEW" and (symbol is None or order["symbol"] == symbol)
+            ]
+
+    @staticmethod
+    def __crossed(
+        order: Dict[str, Any],
+        price: float,
+    ) -> bool:
+        if order["type"] == "MARKET":
+            return False
+        stop_price: float = float(order["stopPrice"])
+        # STOP_MARKET sells below and buys above the stop price, TAKE_PROFIT_MARKET the other way around.
+        falling: bool = (order["type"] == "STOP_MARKET") == (order["side"] == "SELL")
+        return price <= stop_price if falling else price >= stop_price
+
+    def __fire(
+        self: "SimulatedAccount",
+        order: Dict[str, Any],
+    ) -> None:
+        amount, _ = self.position(order["symbol"])
+        closing: bool = (amount > 0 and order["side"] == "SELL") or (amount < 0 and order["side"] == "BUY")
+        if order["closePosition"] or order["reduceOnly"]:
+            if not closing:
+                order["status"] = "EXPIRED"
+                order["updateTime"] = self.now()
+                return
+            quantity: float = abs(amount) if order["closePosition"] else min(abs(amount), float(order["origQty"]))
+        else:
+            quantity = float(order["origQty"])
+        self.__fill(order, quantity)
+        return
+
+    def __fill(
+        self: "SimulatedAccount",
+        order: Dict[str, Any],
+        quantity: float,
+    ) -> None:
+        symbol: str = order["symbol"]
+        direction: int = 1 if order["side"] == "BUY" else -1
+        quote: Tuple[float, float] | None = self.quotes.get(symbol)
+        price: float = self.mark_prices[symbol] if quote is None else quote[direction == 1]
+        price *= 1 + direction * self.slippage_bps / 10_000
+        amount, entry_price = self.position(symbol)
+
+        if order["reduceOnly"]:
+            quantity = min(quantity, abs(amount)) if amount * direction < 0 else 0.0
+        signed: float = direction * quantity
+        realized: float = 0.0
+        if amount and amount * signed < 0:  # reduces the position, possibly flips it.
+            closed: float = min(abs(amount), quantity)
+            realized = closed * (price - entry_price) * (1 if amount > 0 else -1)
+            remaining: float = amount + signed
+            if abs(remaining) < 1e-12:
+                self.positions.pop(symbol, None)
+            elif remaining * amount > 0:
+                self.positions[symbol] = (remaining, entry_price)
+            else:
+                self.positions[symbol] = (remaining, price)
+        elif quantity:
+            total: float = amount + signed
+            self.positions[symbol] = (total, (abs(amount) * entry_price + quantity * price) / abs(total))
+
+        fee: float = quantity * price * self.taker_fee
+        self.wallet_balance += realized - fee
+        order["status"] = "FILLED"
+        order["executedQty"] = str(quantity)
+        order["avgPrice"] = str(price)
+        order["updateTime"] = self.now()
+        self.fills.append({
+            "orderId": order["orderId"],
+            "symbol": symbol,
+            "side": order["side"],
+            "type": order["type"],
+            "price": price,
+            "quantity": quantity,
+            "realizedPnl": realized,
+            "commission": fee,
+            "time": order["updateTime"],
+        })
+        return
+
+
+class MockExchangeRestServer:
+    '''
+    # local fake of the Binance USD-M futures REST API (/fapi) and the MEXC contract REST API (/api/v1),
+    # to run the order path of the TradeManager without credentials or network access.
+        # signatures are checked the way FutureBase.generate_signature() of each SDK produces them.
+        # every request sleeps <latency_ms> plus up to <jitter_ms>, and is rejected above <rate_limit> requests a second.
+        # the two venues keep their own SimulatedAccount, Binance symbols are BTCUSDT and MEXC symbols BTC_USDT.
+        # Binance orders off the <tick_size> / <step_size> of exchangeInfo are rejected like the exchange does.
+        # lose_responses(), the requests are answered like a backend timeout, i.e., the client cannot tell the outcome.
+
+    - base_url is passed to the SDKs, e.g., binance.future.FutureMarket(base_url = server.base_url, ...).
+    '''
+    def __init__(
+        self: "MockExchangeRestServer",
+        binance: SimulatedAccount | None = None,
+        mexc: SimulatedAccount | None = None,
+        api_key: str = "mock_api_key",
+        secret_key: str = "mock_secret_key",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit: float | None = None,  # requests per second, None -> unlimited
+        burst: int | None = None,  # bucket size, rate_limit by default
+        contract_size: float = 0.0001,  # MEXC vol -> base asset, 0.0001 BTC for BTC_USDT
+        tick_size: float = 0.1,  # price filter of every symbol
+        step_size: float = 0.001,  # Binance lot size of every symbol, MEXC vol is whole contracts
+        min_notional: float = 100.0,  # Binance MIN_NOTIONAL in USDT
+        seed: int | None = None,
+    ) -> None:
+        self.binance: SimulatedAccount = binance if binance is not None else SimulatedAccount(mark_prices = {"BTCUSDT": 60_000.0})
+        self.mexc: SimulatedAccount = mexc if mexc is not None else SimulatedAccount(mark_prices = {"BTC_USDT": 60_000.0})
+        self.api_key: str = api_key
+        self.secret_key: str = secret_key
+        self.host: str = host
+        self.port: int = port
+        self.latency_ms: float = latency_ms
+        self.jitter_ms: float = jitter_ms
+        self.rate_limit: float | None = rate_limit
+        self.burst: float = float(burst if burst is not None else max(rate_limit or 1.0, 1.0))
+        self.contract_size: float = contract_size
+        self.tick_size: float = tick_size
+        self.step_size: float = step_size
+        self.min_notional: float = min_notional
+
+        self.rng: random.Random = random.Random(seed)
+        self.lock: threading.Lock = threading.Lock()
+        self.tokens: float = self.burst
+        self.last_refill: float = time.monotonic()
+        self.requests: Dict[str, int] = dict()  # "<METHOD> <path>" -> count
+        self.lost_responses: Dict[str, List[bool]] = dict()  # "<METHOD> <path>" -> executed or not, of the next responses to lose
+
+        self.__routes: Dict[Tuple[str, str], Callable[[str, Dict[str, str]], Any]] = {
+            ("GET", "/fapi/v1/ping"): lambda venue, params: dict(),
+            ("GET", "/fapi/v1/time"): lambda venue, params: {"serverTime": SimulatedAccount.now()},
+            ("GET", "/fapi/v1/exchangeInfo"): self.__binance_exchange_info,
+            ("GET", "/fapi/v1/premiumIndex"): self.__binance_premium_index,
+            ("GET", "/fapi/v1/depth"): self.__binance_depth,
+            ("POST", "/fapi/v1/leverage"): self.__binance_leverage,
+            ("POST", "/fapi/v1/order"): self.__binance_new_order,
+            ("GET", "/fapi/v1/order"): self.__binance_query_order,
+            ("DELETE", "/fapi/v1/order"): self.__binance_cancel_order,
+            ("GET", "/fapi/v1/openOrders"): lambda venue, params: self.binance.open_orders(params.get("symbol")),
+            ("GET", "/fapi/v2/balance"): self.__binance_balance,
+            ("GET", "/fapi/v3/balance"): self.__binance_balance,
+            ("GET", "/fapi/v2/positionRisk"): self.__binance_position_risk,
+            ("POST", "/fapi/v1/listenKey"): lambda venue, params: {"listenKey": "mock_listen_key"},
+            ("PUT", "/fapi/v1/listenKey"): lambda venue, params: dict(),
+            ("DELETE", "/fapi/v1/listenKey"): lambda venue, params: dict(),
+            ("GET", "/api/v1/contract/ping"): lambda venue, params: SimulatedAccount.now(),
+            ("GET", "/api/v1/contract/detail"): self.__mexc_detail,
+            ("GET", "/api/v1/contract/depth"): self.__mexc_depth,
+            ("GET", "/api/v1/contract/fair_price"): self.__mexc_fair_price,
+            ("POST", "/api/v1/private/order/submit"): self.__mexc_submit_order,
+            ("GET", "/api/v1/private/account/assets"): lambda venue, params: [self.__mexc_asset()],
+            ("GET", "/api/v1/private/account/asset"): lambda venue, params: self.__mexc_asset(),
+            ("GET", "/api/v1/private/position/open_positions"): self.__mexc_open_positions,
+            ("GET", "/api/v1/private/account/tiered_fee_rate"): lambda venue, params: {
+                "level": 0, "makerFee": 0.0, "takerFee": self.mexc.taker_fee,
+            },
+            ("GET", "/api/v1/private/account/risk_limit"): self.__mexc_risk_limit,
+        }
+        # endpoints without a signature, the rest is signed.
+        self.__public: Set[str] = {
+            "/fapi/v1/ping", "/fapi/v1/time", "/fapi/v1/exchangeInfo", "/fapi/v1/premiumIndex", "/fapi/v1/depth",
+            "/fapi/v1/listenKey", "/api/v1/contract/ping", "/api/v1/contract/detail", "/api/v1/contract/depth",
+            "/api/v1/contract/fair_price",
+        }
+
+        self.__server: ThreadingHTTPServer | None = None
+        self.__thread: threading.Thread | None = None
+        return
+
+    @property
+    def base_url(self: "MockExchangeRestServer") -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self: "MockExchangeRestServer") -> "MockExchangeRestServer":
+        if self.__server is not None:
+            return self
+        dispatch: Callable[[BaseHTTPRequestHandler], None] = self.__dispatch
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, as the SDK sessions do
+
+            def do_GET(self) -> None:
+                dispatch(self)
+                return
+
+            do_POST = do_GET
+            do_PUT = do_GET
+            do_DELETE = do_GET
+
+            def log_message(self, format, *args) -> None:
+                return
+
+        self.__server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.__server.daemon_threads = True
+        self.port = self.__server.server_address[1]
+        self.__thread = threading.Thread(
+            name = "mock_exchange_rest",
+            target = self.__server.serve_forever,
+            daemon = True,
+        )
+        self.__thread.start()
+        operation_logger.info(f"{__name__} - Mock exchange REST server is listening on {self.base_url}")
+        return self
+
+    def lose_responses(
+        self: "MockExchangeRestServer",
+        key: str,
+        count: int = 1,
+        executed: bool = True,
+    ) -> None:
+        """
+        func lose_responses():
+            - the next <count> requests of the key, e.g., "POST /fapi/v1/order", are answered with 503 / -1007,
+            - the way Binance reports a request of unknown outcome, after being executed or without being executed.
+        """
+        with self.lock:
+            self.lost_responses.setdefault(key, list()).extend([executed] * count)
+        return
+
+    def stop(self: "MockExchangeRestServer") -> None:
+        if self.__server is None:
+            return
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__server = None
+        self.__thread = None
+        return
+
+    """
+    ####################################################################################################################
+    # Request handling                                                                                                 #
+    ####################################################################################################################
+    """
+    def __dispatch(
+        self: "MockExchangeRestServer",
+        handler: BaseHTTPRequestHandler,
+    ) -> None:
+        path, _, query = handler.path.partition("?")
+        length: int = int(handler.headers.get("Content-Length") or 0)
+        body: bytes = handler.rfile.read(length) if length else b""
+        status, response = self.handle(handler.command, path, query, handler.headers, body)
+
+        encoded: bytes = json.dumps(response).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(encoded)))
+        handler.end_headers()
+        handler.wfile.write(encoded)
+        return
+
+    def handle(
+        self: "MockExchangeRestServer",
+        method: str,
+        path: str,
+        query: str,
+        headers: Mapping[str, str],
+        body: bytes = b"",
+    ) -> Tuple[int, Any]:
+        """
+        func handle():
+            - (HTTP status, JSON response) of a request, served over HTTP by start() or in-process, e.g., for paper trading.
+        """
+        venue: str = "binance" if path.startswith("/fapi/") else "mexc"
+        with self.lock:
+            key: str = f"{method} {path}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+        delay_ms: float = self.latency_ms + (self.rng.uniform(0.0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1_000)
+
+        try:
+            self.__take_token(venue)
+            route, suffix = self.__route(method, path)
+            params: Dict[str, str] = dict(parse_qsl(query, keep_blank_values = True))
+            if route is None:
+                raise MockApiError(404, -5000 if venue == "binance" else 404, f"{method} {path} is not served by the mock.")
+            if (path.rpartition("/")[0] if suffix else path) not in self.__public:
+                if venue == "binance":
+                    self.__verify_binance(headers, query, params)
+                else:
+                    self.__verify_mexc(headers, params)
+            if venue == "mexc" and body:
+                try:
+                    payload: Any = json.loads(body)
+                except ValueError:
+                    raise MockApiError(400, 1002, "Malformed JSON body.")
+                if isinstance(payload, dict):
+                    params.update({key: str(value) for key, value in payload.items() if value is not None})
+            if suffix:
+                params["_suffix"] = suffix
+            self.binance.advance()
+            self.mexc.advance()
+            with self.lock:
+                lost: List[bool] = self.lost_responses.get(key) or list()
+                executed: bool | None = lost.pop(0) if lost else None
+            if executed is not None:
+                if executed:
+                    route(venue, params)
+                raise MockApiError(503, -1007, "Timeout waiting for response from backend server. Send status unknown; execution status unknown.")
+            result: Any = route(venue, params)
+            status: int = 200
+            response: Any = result if venue == "binance" else {"success": True, "code": 0, "data": result}
+        except MockApiError as error:
+            status = error.status
+            if venue == "binance":
+                response = {"code": error.code, "msg": error.message}
+            else:
+                response = {"success": False, "code": error.code, "message": error.message, "msg": error.message}
+        return status, response
+
+    def __route(
+        self: "MockExchangeRestServer",
+        method: str,
+        path: str,
+    ) -> Tuple[Callable[[str, Dict[str, str]], Any] | None, str]:
+        """
+        func __route():
+            - exact match first, then the MEXC path parameter, e.g., /api/v1/private/account/asset/USDT.
+        """
+        route = self.__routes.get((method, path))
+        if route is not None:
+            return route, ""
+        prefix, _, suffix = path.rpartition("/")
+        return self.__routes.get((method, prefix)), suffix
+
+    def __take_token(
+        self: "MockExchangeRestServer",
+        venue: str,
+    ) -> None:
+        if self.rate_limit is None:
+            return
+        with self.lock:
+            current: float = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (current - self.last_refill) * self.rate_limit)
+            self.last_refill = current
+            if self.tokens < 1.0:
+                # the status codes the SDKs map to a rate limit, 429 for Binance and 510 for MEXC.
+                if venue == "binance":
+                    raise MockApiError(429, -1003, "Too many requests; current limit is exceeded.")
+                raise MockApiError(510, 510, "Requests are too frequent.")
+            self.tokens -= 1.0
+        return
+
+    def __verify_binance(
+        self: "MockExchangeRestServer",
+        headers: Mapping[str, str],
+        query: str,
+        params: Dict[str, str],
+    ) -> None:
+        """
+        func __verify_binance():
+            - HMAC-SHA256 of the query string in the order it was sent, without the trailing signature parameter.
+        """
+        if headers.get("X-MBX-APIKEY") != self.api_key:
+            raise MockApiError(401, -2015, "Invalid API-key, IP, or permissions for action.")
+        payload, _, signature = query.rpartition("&signature=")
+        if not signature and query.startswith("signature="):
+            payload, signature = "", query[len("signature="):]
+        expected: str = hmac.new(self.secret_key.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).hexdigest()
+        if not signature or not hmac.compare_digest(signature, expected):
+            raise MockApiError(400, -1022, "Signature for this request is not valid.")
+        params.pop("signature", None)
+
+        if "timestamp" in params:
+            timestamp: int = int(params["timestamp"])
+            recv_window: int = int(params.get("recvWindow", 5_000))
+            now: int = SimulatedAccount.now()
+            if timestamp > now + 1_000 or now - timestamp > recv_window:
+                raise MockApiError(400, -1021, "Timestamp for this request is outside of the recvWindow.")
+        return
+
+    def __verify_mexc(
+        self: "MockExchangeRestServer",
+        headers: Mapping[str, str],
+        params: Dict[str, str],
+    ) -> None:
+        """
+        func __verify_mexc():
+            - HMAC-SHA256 of apiKey + Request-Time + the query parameters sorted by key, joined with "&".
+        """
+        if headers.get("ApiKey") != self.api_key:
+            raise MockApiError(401, 402, "Api key info invalid.")
+        request_time: str = headers.get("Request-Time", "")
+        query_string: str = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+        expected: str = hmac.new(
+            self.secret_key.encode("utf-8"),
+            f"{self.api_key}{request_time}{query_string}".encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        if not hmac.compare_digest(headers.get("Signature", ""), expected):
+            raise MockApiError(401, 602, "Signature verification failed.")
+        return
+
+    """
+    ####################################################################################################################
+    # Binance USD-M futures                                                                                            #
+    ####################################################################################################################
+    """
+    @staticmethod
+    def __off_step(
+        value: float,
+        step: float,
+    ) -> bool:
+        units: float = value / step
+        return abs(units - round(units)) > 1e-6
+
+    def __binance_exchange_info(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        return {
+            "timezone": "UTC",
+            "serverTime": SimulatedAccount.now(),
+            "symbols": [
+                {
+                    "symbol": symbol,
+                    "status": "TRADING",
+                    "contractType": "PERPETUAL",
+                    "filters": [
+                        {"filterType": "PRICE_FILTER", "tickSize": str(self.tick_size), "minPrice": str(self.tick_size), "maxPrice": "4529764"},
+                        {"filterType": "LOT_SIZE", "stepSize": str(self.step_size), "minQty": str(self.step_size), "maxQty": "1000"},
+                        {"filterType": "MIN_NOTIONAL", "notional": str(self.min_notional)},
+                    ],
+                }
+                for symbol in sorted(self.binance.mark_prices)
+            ],
+        }
+
+    def __binance_premium_index(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        symbol: str = params.get("symbol", "BTCUSDT")
+        price: str = str(self.binance.mark_price(symbol))
+        return {
+            "symbol": symbol,
+            "markPrice": price,
+            "indexPrice": price,
+            "estimatedSettlePrice": price,
+            "lastFundingRate": "0.00010000",
+            "interestRate": "0.00010000",
+            "nextFundingTime": (SimulatedAccount.now() // 28_800_000 + 1) * 28_800_000,
+            "time": SimulatedAccount.now(),
+        }
+
+    def __book(
+        self: "MockExchangeRestServer",
+        account: SimulatedAccount,
+        symbol: str,
+        limit: int,
+    ) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """
+        func __book():
+            - (bids, asks) of (price, base quantity), one tick apart from the quote, or around the mark price,
+            - with book_quantity of the account at every level.
+        """
+        with account.lock:
+            quote: Tuple[float, float] | None = account.quotes.get(symbol)
+            if quote is None:
+                bid: float = round(account.mark_price(symbol) / self.tick_size) * self.tick_size
+                quote = (bid, bid + self.tick_size)
+            quantity: float = account.book_quantity
+        return (
+            [(round(quote[0] - level * self.tick_size, 8), quantity) for level in range(limit)],
+            [(round(quote[1] + level * self.tick_size, 8), quantity) for level in range(limit)],
+        )
+
+    def __binance_depth(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        bids, asks = self.__book(self.binance, params.get("symbol", "BTCUSDT"), min(int(params.get("limit", 20)), 100))
+        return {
+            "lastUpdateId": SimulatedAccount.now(),
+            "E": SimulatedAccount.now(),
+            "T": SimulatedAccount.now(),
+            "bids": [[str(price), str(quantity)] for price, quantity in bids],
+            "asks": [[str(price), str(quantity)] for price, quantity in asks],
+        }
+
+    def __binance_leverage(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        symbol: str = params.get("symbol", "BTCUSDT")
+        self.binance.mark_price(symbol)
+        self.binance.set_leverage(symbol, int(params.get("leverage", 0)))
+        return {"leverage": self.binance.leverage(symbol), "maxNotionalValue": "1000000", "symbol": symbol}
+
+    def __binance_new_order(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        # the filters of exchangeInfo, Binance answers -1111 for the precision and -4164 for the notional.
+        if params.get("quantity") and MockExchangeRestServer.__off_step(float(params["quantity"]), self.step_size):
+            raise MockApiError(400, -1111, "Precision is over the maximum defined for this asset.")
+        if params.get("stopPrice") and MockExchangeRestServer.__off_step(float(params["stopPrice"]), self.tick_size):
+            raise MockApiError(400, -1111, "Precision is over the maximum defined for this asset.")
+        if (
+            params.get("type") == "MARKET" and params.get("reduceOnly") != "true"
+            and float(params.get("quantity") or 0) * self.binance.mark_price(params.get("symbol", "")) < self.min_notional
+        ):
+            raise MockApiError(400, -4164, f"Order's notional must be no smaller than {self.min_notional}.")
+        order: Dict[str, Any] = self.binance.place_order(
+            symbol = params.get("symbol", ""),
+            side = params.get("side", ""),
+            type = params.get("type", ""),
+            quantity = float(params["quantity"]) if params.get("quantity") else None,
+            stop_price = float(params["stopPrice"]) if params.get("stopPrice") else None,
+            close_position = params.get("closePosition") == "true",
+            reduce_only = params.get("reduceOnly") == "true",
+            client_order_id = params.get("newClientOrderId"),
+        )
+        response: Dict[str, Any] = dict(order)
+        if params.get("newOrderRespType", "ACK") == "ACK":
+            # ACK is the default of the endpoint, the fill is not part of the response.
+            response.update(status = "NEW", executedQty = "0", avgPrice = "0.00")
+        return response
+
+    def __binance_query_order(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        order: Dict[str, Any] | None = self.binance.find_order(
+            params.get("symbol", ""),
+            order_id = int(params["orderId"]) if params.get("orderId") else None,
+            client_order_id = params.get("origClientOrderId"),
+        )
+        if order is None:
+            raise MockApiError(400, -2013, "Order does not exist.")
+        return dict(order)
+
+    def __binance_cancel_order(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        return dict(self.binance.cancel_order(
+            params.get("symbol", ""),
+            order_id = int(params["orderId"]) if params.get("orderId") else None,
+            client_order_id = params.get("origClientOrderId"),
+        ))
+
+    def __binance_balance(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        account: SimulatedAccount = self.binance
+        with account.lock:
+            unrealized: float = sum(account.unrealized_pnl(symbol) for symbol in account.positions)
+            available: str = str(account.available_balance())
+            return [{
+                "accountAlias": "mock",
+                "asset": account.asset,
+                "balance": str(account.wallet_balance),
+                "crossWalletBalance": str(account.wallet_balance),
+                "crossUnPnl": str(unrealized),
+                "availableBalance": available,
+                "maxWithdrawAmount": available,
+                "marginAvailable": True,
+                "updateTime": SimulatedAccount.now(),
+            }]
+
+    def __binance_position_risk(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        account: SimulatedAccount = self.binance
+        with account.lock:
+            symbols: List[str] = [params["symbol"]] if params.get("symbol") else sorted(account.mark_prices)
+            positions: List[Dict[str, Any]] = list()
+            for symbol in symbols:
+                amount, entry_price = account.position(symbol)
+                positions.append({
+                    "symbol": symbol,
+                    "positionAmt": str(amount),
+                    "entryPrice": str(entry_price),
+                    "markPrice": str(account.mark_price(symbol)),
+                    "unRealizedProfit": str(account.unrealized_pnl(symbol)),
+                    "leverage": str(account.leverage(symbol)),
+                    "marginType": "cross",
+                    "positionSide": "BOTH",
+                    "notional": str(amount * account.mark_price(symbol)),
+                    "updateTime": SimulatedAccount.now(),
+                })
+            return positions
+
+    """
+    ####################################################################################################################
+    # MEXC contract                                                                                                    #
+    ####################################################################################################################
+    """
+    def __mexc_submit_order(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> int:
+        """
+        func __mexc_submit_order():
+            - market orders only (type 5 / 6), side 1: open long, 2: close short, 3: open short, 4: close long.
+            - stopLossPrice / takeProfitPrice become closePosition orders of the opened position.
+        """
+        symbol: str = params.get("symbol", "")
+        side: int = int(params.get("side", 0))
+        if side not in (1, 2, 3, 4):
+            raise MockApiError(400, 2005, "Invalid side.")
+        if params.get("type", "5") not in ("5", "6"):
+            raise MockApiError(400, 2005, "Only market orders are simulated.")
+        if float(params.get("vol", 0)) <= 0:
+            raise MockApiError(400, 2011, "Invalid volume.")
+        if params.get("leverage"):
+            self.mexc.set_leverage(symbol, int(params["leverage"]))
+
+        order_side: str = "BUY" if side in (1, 2) else "SELL"
+        opening: bool = side in (1, 3)
+        amount, _ = self.mexc.position(symbol)
+        if not opening and amount * (1 if order_side == "BUY" else -1) >= 0:
+            raise MockApiError(400, 2009, "The position does not exist.")
+        order: Dict[str, Any] = self.mexc.place_order(
+            symbol = symbol,
+            side = order_side,
+            quantity = float(params["vol"]) * self.contract_size,
+            reduce_only = not opening,
+            client_order_id = params.get("externalOid"),
+        )
+        if opening:
+            closing_side: str = "SELL" if order_side == "BUY" else "BUY"
+            for key, type in (("stopLossPrice", "STOP_MARKET"), ("takeProfitPrice", "TAKE_PROFIT_MARKET")):
+                if params.get(key):
+                    self.mexc.place_order(symbol, closing_side, type, stop_price = float(params[key]), close_position = True)
+        return order["orderId"]
+
+    def __mexc_detail(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any] | List[Dict[str, Any]]:
+        contracts: List[Dict[str, Any]] = [
+            {
+                "symbol": symbol,
+                "baseCoin": symbol.partition("_")[0],
+                "quoteCoin": symbol.partition("_")[2],
+                "contractSize": self.contract_size,
+                "priceUnit": self.tick_size,
+                "volUnit": 1,
+                "minVol": 1,
+                "maxVol": 1_000_000,
+                "minLeverage": 1,
+                "maxLeverage": 125,
+                "makerFeeRate": 0.0,
+                "takerFeeRate": self.mexc.taker_fee,
+                "state": 0,
+            }
+            for symbol in sorted(self.mexc.mark_prices)
+        ]
+        if params.get("symbol"):
+            for contract in contracts:
+                if contract["symbol"] == params["symbol"]:
+                    return contract
+            raise MockApiError(400, 1001, "The contract does not exist.")
+        return contracts
+
+    def __mexc_depth(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        # [price, vol in contracts, order count] per level.
+        bids, asks = self.__book(self.mexc, params.get("_suffix", ""), min(int(params.get("limit", 20)), 100))
+        return {
+            "asks": [[price, round(quantity / self.contract_size), 1] for price, quantity in asks],
+            "bids": [[price, round(quantity / self.contract_size), 1] for price, quantity in bids],
+            "version": SimulatedAccount.now(),
+            "timestamp": SimulatedAccount.now(),
+        }
+
+    def __mexc_fair_price(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, Any]:
+        symbol: str = params.get("_suffix", "")
+        return {"symbol": symbol, "fairPrice": self.mexc.mark_price(symbol), "timestamp": SimulatedAccount.now()}
+
+    def __mexc_risk_limit(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        symbols: List[str] = [params["symbol"]] if params.get("symbol") else sorted(self.mexc.mark_prices)
+        return {
+            symbol: [
+                {"symbol": symbol, "level": 1, "maxVol": 1_000_000, "mmr": 0.004, "imr": 0.008, "maxLeverage": 125, "positionType": 1},
+                {"symbol": symbol, "level": 1, "maxVol": 1_000_000, "mmr": 0.004, "imr": 0.008, "maxLeverage": 125, "positionType": 2},
+            ]
+            for symbol in symbols
+        }
+
+    def __mexc_asset(self: "MockExchangeRestServer") -> Dict[str, Any]:
+        account: SimulatedAccount = self.mexc
+        with account.lock:
+            unrealized: float = sum(account.unrealized_pnl(symbol) for symbol in account.positions)
+            return {
+                "currency": account.asset,
+                "positionMargin": account.initial_margin(),
+                "availableBalance": account.available_balance(),
+                "cashBalance": account.wallet_balance,
+                "frozenBalance": 0.0,
+                "equity": account.wallet_balance + unrealized,
+                "unrealized": unrealized,
+                "bonus": 0.0,
+            }
+
+    def __mexc_open_positions(
+        self: "MockExchangeRestServer",
+        venue: str,
+        params: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        account: SimulatedAccount = self.mexc
+        with account.lock:
+            positions: List[Dict[str, Any]] = list()
+            for symbol, (amount, entry_price) in sorted(account.positions.items()):
+                if params.get("symbol") and params["symbol"] != symbol:
+                    continue
+                positions.append({
+                    "positionId": abs(hash(symbol)) % 1_000_000_000,
+                    "symbol": symbol,
+                    "positionType": 1 if amount > 0 else 2,
+                    "openType": 2,
+                    "state": 1,
+                    "holdVol": round(abs(amount) / self.contract_size),
+                    "holdAvgPrice": entry_price,
+                    "openAvgPrice": entry_price,
+                    "leverage": account.leverage(symbol),
+                    "realised": 0.0,
+                })
+            return positions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Mock Binance futures / MEXC contract REST server.")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 8766)
+    parser.add_argument("--api-key", default = "mock_api_key")
+    parser.add_argument("--secret-key", default = "mock_secret_key")
+    parser.add_argument("--latency-ms", type = float, default = 0.0)
+    parser.add_argument("--jitter-ms", type = float, default = 0.0)
+    parser.add_argument("--rate-limit", type = float, default = None, help = "requests per second")
+    parser.add_argument("--price", type = float, default = 60_000.0)
+    parser.add_argument("--volatility", type = float, default = 0.6, help = "annualized, the mark price follows a GBM")
+    parser.add_argument("--seed", type = int, default = None)
+    args = parser.parse_args()
+
+    server = MockExchangeRestServer(
+        binance = SimulatedAccount(price_processes = {"BTCUSDT": GeometricBrownianMotion(args.price, volatility = args.volatility, seed = args.seed)}),
+        mexc = SimulatedAccount(price_processes = {"BTC_USDT": GeometricBrownianMotion(args.price, volatility = args.volatility, seed = args.seed)}),
+        api_key = args.api_key,
+        secret_key = args.secret_key,
+        host = args.host,
+        port = args.port,
+        latency_ms = args.latency_ms,
+        jitter_ms = args.jitter_ms,
+        rate_limit = args.rate_limit,
+        seed = args.seed,
+    ).start()
+    print(f"Serving on {server.base_url}, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+# Standard Library
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import socket
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+# Custom Library
+from logger.set_logger import operation_logger
+from simulation.market_feed import GeometricBrownianMotion, JumpDiffusion, SyntheticFeed
+
+
+WEBSOCKET_GUID: str = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OPCODE_CONTINUATION: int = 0x0
+OPCODE_TEXT: int = 0x1
+OPCODE_BINARY: int = 0x2
+OPCODE_CLOSE: int = 0x8
+OPCODE_PING: int = 0x9
+OPCODE_PONG: int = 0xA
+
+# sub.<topic> of the client -> channel of the pushes.
+TOPIC_CHANNELS: Dict[str, str] = {
+    "ticker": "push.ticker",
+    "deal": "push.deal",
+    "depth": "push.depth",
+}
+
+
+def encode_frame(
+    payload: bytes,
+    opcode: int = OPCODE_TEXT,
+) -> bytes:
+    """
+    func encode_frame():
+        - single unmasked frame, the server never masks its frames.
+    """
+    length: int = len(payload)
+    if length < 126:
+        header: bytes = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+class _Connection:
+    '''
+    # one client of the mock server.
+    # sends are serialized by the lock, since the reader thread (acks, pongs) and the publisher thread share the socket.
+    '''
+    def __init__(
+        self: "_Connection",
+        sock: socket.socket,
+        address: Tuple[str, int],
+    ) -> None:
+        self.sock: socket.socket = sock
+        self.address: Tuple[str, int] = address
+        self.lock: threading.Lock = threading.Lock()
+        self.streams: Set[Tuple[str, str]] = set()  # (channel, symbol)
+        self.authenticated: bool = False
+        self.open: bool = True
+        self.buffer: bytes = b""
+        return
+
+    def send(
+        self: "_Connection",
+        frame: bytes,
+    ) -> bool:
+        if not self.open:
+            return False
+        try:
+            with self.lock:
+                self.sock.sendall(frame)
+            return True
+        except OSError:
+            self.open = False
+            return False
+
+    def send_json(
+        self: "_Connection",
+        message: Dict[str, Any],
+    ) -> bool:
+        return self.send(encode_frame(json.dumps(message).encode("utf-8")))
+
+    def recv_exactly(
+        self: "_Connection",
+        size: int,
+    ) -> bytes:
+        while len(self.buffer) < size:
+            chunk: bytes = self.sock.recv(65_536)
+            if not chunk:
+                raise ConnectionError("client has closed the connection")
+            self.buffer += chunk
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def close(self: "_Connection") -> None:
+        if not self.open:
+            return
+        self.open = False
+        try:
+            with self.lock:
+                self.sock.sendall(encode_frame(struct.pack("!H", 1000), OPCODE_CLOSE))
+        except OSError:
+            pass
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        return
+
+
+class MockMexcWebSocketServer:
+    '''
+    # local server speaking the MEXC contract websocket protocol, for the offline load tests.
+        # {"method": "login"} -> rs.login, the signature is checked when a secret key is given.
+        # {"method": "sub.ticker" | "sub.deal" | "sub.depth", "param": {"symbol": ...}} -> rs.sub.<topic>, then the pushes.
+        # {"method": "unsub.<topic>"} -> rs.unsub.<topic>
+        # {"method": "ping"} -> pong
+    # the pushes are rendered by one SyntheticFeed per symbol at <rate> messages per second per subscribed stream,
+    # every message is encoded once and sent to all of its subscribers.
+
+    - endpoint is the ws:// URL to give to mexc.future.FutureWebSocket.
+    - disconnect_all() drops every client, to exercise the reconnect path.
+    '''
+    def __init__(
+        self: "MockMexcWebSocketServer",
+        feeds: Dict[str, SyntheticFeed] | None = None,
+        rate: float = 1.0,  # messages per second per stream, MEXC pushes the ticker once a second
+        host: str = "127.0.0.1",
+        port: int = 0,  # 0 -> picked by the OS
+        api_key: str | None = None,
+        secret_key: str | None = None,
+        feed_factory: Callable[[str], SyntheticFeed] | None = None,
+        max_batch: int = 1_000,
+    ) -> None:
+        self.feeds: Dict[str, SyntheticFeed] = dict(feeds or dict())
+        self.__rate: float = rate
+        self.__rate_changed: threading.Event = threading.Event()
+        self.host: str = host
+        self.port: int = port
+        self.api_key: str | None = api_key
+        self.secret_key: str | None = secret_key
+        self.feed_factory: Callable[[str], SyntheticFeed] = feed_factory or (
+            lambda symbol: SyntheticFeed(GeometricBrownianMotion(), symbol = symbol)
+        )
+        self.max_batch: int = max_batch
+
+        self.connections: List[_Connection] = list()
+        self.connections_lock: threading.Lock = threading.Lock()
+        self.messages_sent: int = 0
+
+        self.__stop: threading.Event = threading.Event()
+        self.__server_socket: socket.socket | None = None
+        self.__threads: List[threading.Thread] = list()
+        return
+
+    @property
+    def endpoint(self: "MockMexcWebSocketServer") -> str:
+        return f"ws://{self.host}:{self.port}/edge"
+
+    @property
+    def rate(self: "MockMexcWebSocketServer") -> float:
+        return self.__rate
+
+    @rate.setter
+    def rate(
+        self: "MockMexcWebSocketServer",
+        rate: float,
+    ) -> None:
+        """
+        - the schedule starts over at the new rate, e.g., for a burst, instead of catching up from the start.
+        """
+        self.__rate = rate
+        self.__rate_changed.set()
+        return
+
+    """
+    ######################################################################################################################
+    #                                               Threading Management                                                 #
+    ######################################################################################################################
+    """
+    def start(self: "MockMexcWebSocketServer") -> "MockMexcWebSocketServer":
+        if self.__server_socket is not None:
+            return self
+        self.__stop.clear()
+        server_socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server_socket.bind((self.host, self.port))
+        server_socket.listen(64)
+        server_socket.settimeout(0.2)
+        self.port = server_socket.getsockname()[1]
+        self.__server_socket = server_socket
+
+        for name, target in (("mock_mexc_accept", self.__accept_loop), ("mock_mexc_publish", self.__publish_loop)):
+            thread: threading.Thread = threading.Thread(name = name, target = target, daemon = True)
+            thread.start()
+            self.__threads.append(thread)
+        operation_logger.info(f"{__name__} - Mock MEXC websocket server is listening on {self.endpoint}")
+        return self
+
+    def stop(self: "MockMexcWebSocketServer") -> None:
+        self.__stop.set()
+        self.disconnect_all()
+        if self.__server_socket is not None:
+            self.__server_socket.close()
+            self.__server_socket = None
+        for thread in self.__threads:
+            thread.join(timeout = 2)
+        self.__threads = list()
+        return
+
+    def disconnect_all(self: "MockMexcWebSocketServer") -> None:
+        with self.connections_lock:
+            connections: List[_Connection] = self.connections
+            self.connections = list()
+        for connection in connections:
+            connection.close()
+        return
+
+    def __accept_loop(self: "MockMexcWebSocketServer") -> None:
+        while not self.__stop.is_set():
+            try:
+                sock, address = self.__server_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                name = f"mock_mexc_client_{address[1]}",
+                target = self.__serve,
+                args = (_Connection(sock, address), ),
+                daemon = True,
+            ).start()
+        return
+
+    """
+    ######################################################################################################################
+    #                                                 Client Protocol                                                    #
+    ######################################################################################################################
+    """
+    def __handshake(
+        self: "MockMexcWebSocketServer",
+        connection: _Connection,
+    ) -> bool:
+        request: bytes = b""
+        while b"\r\n\r\n" not in request:
+            chunk: bytes = connection.sock.recv(4_096)
+            if not chunk:
+                return False
+            request += chunk
+        head, _, connection.buffer = request.partition(b"\r\n\r\n")
+
+        headers: Dict[str, str] = dict()
+        for line in head.decode("latin-1").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        key: str | None = headers.get("sec-websocket-key")
+        if key is None:
+            connection.sock.sendall(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            return False
+
+        accept: str = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+        connection.sock.sendall(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode("ascii")
+        )
+        return True
+
+    def __read_message(
+        self: "MockMexcWebSocketServer",
+        connection: _Connection,
+    ) -> Tuple[int, bytes]:
+        """
+        func __read_message():
+            - read the next message, control frames are returned as they come, fragments are joined.
+        """
+        fragments: List[bytes] = list()
+        message_opcode: int = OPCODE_TEXT
+        while True:
+            first, second = connection.recv_exactly(2)
+            fin: bool = bool(first & 0x80)
+            opcode: int = first & 0x0F
+            length: int = second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", connection.recv_exactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", connection.recv_exactly(8))[0]
+            mask: bytes = connection.recv_exactly(4) if second & 0x80 else b""
+            payload: bytes = connection.recv_exactly(length)
+            if mask:
+                payload = bytes(byte ^ mask[position % 4] for position, byte in enumerate(payload))
+
+            if opcode >= OPCODE_CLOSE:
+                return opcode, payload
+            if opcode != OPCODE_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(payload)
+            if fin:
+                return message_opcode, b"".join(fragments)
+
+    def __serve(
+        self: "MockMexcWebSocketServer",
+        connection: _Connection,
+    ) -> None:
+        try:
+            if not self.__handshake(connection):
+                connection.sock.close()
+                return
+            with self.connections_lock:
+                self.connections.append(connection)
+
+            while connection.open and not self.__stop.is_set():
+                opcode, payload = self.__read_message(connection)
+                if opcode == OPCODE_CLOSE:
+                    break
+                if opcode == OPCODE_PING:
+                    connection.send(encode_frame(payload, OPCODE_PONG))
+                    continue
+                if opcode in (OPCODE_TEXT, OPCODE_BINARY):
+                    self.__handle_request(connection, payload)
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            with self.connections_lock:
+                if connection in self.connections:
+                    self.connections.remove(connection)
+            connection.close()
+        return
+
+    def __handle_request(
+        self: "MockMexcWebSocketServer",
+        connection: _Connection,
+        payload: bytes,
+    ) -> None:
+        timestamp: int = int(time.time() * 1_000)
+        try:
+            request: Dict[str, Any] = json.loads(payload)
+            method: str = str(request.get("method", ""))
+        except (ValueError, AttributeError):
+            connection.send_json({"channel": "rs.error", "data": "invalid request", "ts": timestamp})
+            return
+        param: Dict[str, Any] = request.get("param") or dict()
+
+        if method == "ping":
+            connection.send_json({"channel": "pong", "data": timestamp})
+        elif method == "login":
+            connection.authenticated = self.__verify_login(param)
+            connection.send_json({
+                "channel": "rs.login",
+                "data": "success" if connection.authenticated else "invalid signature",
+                "ts": timestamp,
+            })
+        elif method.startswith("sub.") or method.startswith("unsub."):
+            action, _, topic = method.partition(".")
+            channel: str | None = TOPIC_CHANNELS.get(topic)
+            if channel is None:
+                connection.send_json({"channel": "rs.error", "data": f"unsupported topic: {topic}", "ts": timestamp})
+                return
+            symbol: str = str(param.get("symbol", "BTC_USDT"))
+            with self.connections_lock:
+                if action == "sub":
+                    if symbol not in self.feeds:
+                        self.feeds[symbol] = self.feed_factory(symbol)
+                    connection.streams.add((channel, symbol))
+                else:
+                    connection.streams.discard((channel, symbol))
+            connection.send_json({"channel": f"rs.{method}", "data": "success", "ts": timestamp})
+        else:
+            connection.send_json({"channel": "rs.error", "data": f"unsupported method: {method}", "ts": timestamp})
+        return
+
+    def __verify_login(
+        self: "MockMexcWebSocketServer",
+        param: Dict[str, Any],
+    ) -> bool:
+        """
+        func __verify_login():
+            - same signature as BasicWebSocketManager._generate_signature(), HMAC-SHA256 of apiKey + reqTime.
+        """
+        if self.secret_key is None:
+            return True
+        api_key: str = str(param.get("apiKey", ""))
+        expected: str = hmac.new(
+            self.secret_key.encode("utf-8"),
+            (api_key + str(param.get("reqTime", ""))).encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return (self.api_key is None or api_key == self.api_key) and hmac.compare_digest(expected, str(param.get("signature", "")))
+
+    """
+    ######################################################################################################################
+    #                                                    Publishing                                                      #
+    ######################################################################################################################
+    """
+    def __publish_loop(self: "MockMexcWebSocketServer") -> None:
+        """
+        func __publish_loop():
+            - every stream is due rate * elapsed messages since the start, the backlog is sent in batches of max_batch.
+            - the loop sleeps only when no stream is behind, so the rate holds up to what the sockets can take.
+        """
+        started: float = time.perf_counter()
+        sent_per_stream: Dict[Tuple[str, str], int] = dict()
+        while not self.__stop.is_set():
+            if self.__rate_changed.is_set():
+                self.__rate_changed.clear()
+                started = time.perf_counter()
+                sent_per_stream = dict()
+
+            with self.connections_lock:
+                subscribers: Dict[Tuple[str, str], List[_Connection]] = dict()
+                for connection in self.connections:
+                    for stream in connection.streams:
+                        subscribers.setdefault(stream, list()).append(connection)
+
+            due_total: int = 0
+            elapsed: float = time.perf_counter() - started
+            for stream, connections in subscribers.items():
+                due: int = int(elapsed * self.rate) - sent_per_stream.setdefault(stream, int(elapsed * self.rate) - 1)
+                due = min(due, self.max_batch)
+                if due <= 0:
+                    continue
+                channel, symbol = stream
+                feed: SyntheticFeed = self.feeds[symbol]
+                timestamp: int = int(time.time() * 1_000)
+                for _ in range(due):
+                    frame: bytes = encode_frame(json.dumps(feed.message(channel, timestamp)).encode("utf-8"))
+                    for connection in connections:
+                        if connection.send(frame):
+                            self.messages_sent += 1
+                sent_per_stream[stream] += due
+                due_total += due
+
+            if not due_total:
+                time.sleep(min(0.001, 1 / self.rate) if self.rate > 0 else 0.1)
+        return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Mock MEXC contract websocket server driven by a synthetic feed.")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 8765)
+    parser.add_argument("--rate", type = float, default = 1.0, help = "messages per second per subscribed stream")
+    parser.add_argument("--symbol", default = "BTC_USDT")
+    parser.add_argument("--price", type = float, default = 60_000.0)
+    parser.add_argument("--volatility", type = float, default = 0.6, help = "annualized")
+    parser.add_argument("--jumps", type = float, default = 0.0, help = "jumps per second, 0 for plain GBM")
+    parser.add_argument("--seed", type = int, default = None)
+    args = parser.parse_args()
+
+    if args.jumps > 0:
+        process = JumpDiffusion(price = args.price, volatility = args.volatility, jump_intensity = args.jumps, seed = args.seed)
+    else:
+        process = GeometricBrownianMotion(price = args.price, volatility = args.volatility, seed = args.seed)
+    server = MockMexcWebSocketServer(
+        feeds = {args.symbol: SyntheticFeed(process, symbol = args.symbol, seed = args.seed)},
+        rate = args.rate,
+        host = args.host,
+        port = args.port,
+    ).start()
+    print(f"Serving {args.symbol} on {server.endpoint}, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# Standard Library
+import json
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+# Third-party Library
+import requests
+from requests.adapters import BaseAdapter
+
+# Custom Library
+from binance.future import FutureMarket as BinanceFutureMarket, FutureWebSocket as BinanceFutureWebSocket
+from logger.set_logger import operation_logger
+from simulation.mock_exchange_rest import MockExchangeRestServer, SimulatedAccount
+
+
+class _InProcessAdapter(BaseAdapter):
+    '''
+    # requests transport answering from a MockExchangeRestServer of this process, no socket is opened.
+    '''
+    def __init__(
+        self: "_InProcessAdapter",
+        exchange: MockExchangeRestServer,
+    ) -> None:
+        super().__init__()
+        self.exchange: MockExchangeRestServer = exchange
+        return
+
+    def send(
+        self: "_InProcessAdapter",
+        request: requests.PreparedRequest,
+        **kwargs: Any,
+    ) -> requests.Response:
+        url = urlsplit(request.url)
+        body: Any = request.body or b""
+        status, payload = self.exchange.handle(
+            request.method, url.path, url.query, request.headers, body.encode("utf-8") if isinstance(body, str) else body,
+        )
+        response: requests.Response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self: "_InProcessAdapter") -> None:
+        return
+
+
+class PaperFutureMarket(BinanceFutureMarket):
+    '''
+    # Binance USD-M futures SDK for paper trading, every request is answered in memory and no order reaches the exchange.
+        # the requests go through the same FutureMarket methods, signatures and error handling, so the TradeManager and
+        # the OrderManager run unchanged, the mock exchange serves them from a SimulatedAccount on an in-process transport.
+        # prices come from the live streams, see subscribe(): the mark price triggers the STOP_MARKET / TAKE_PROFIT_MARKET
+        # orders, and the MARKET orders are filled at the best bid / ask of the book ticker, moved by slippage_bps.
+        # every request waits latency_ms plus up to jitter_ms, as the round trip to the exchange would.
+        # positions, balance, fees and PnL are kept by the account, see summary().
+
+    - the symbols are tradable once their first price has arrived, or seeded with mark_prices.
+    '''
+    BASE_URL: str = "http://paper.binance.local"  # never resolved, the session sends it to the in-process transport.
+    CREDENTIALS: str = "paper"
+
+    def __init__(
+        self: "PaperFutureMarket",
+        mark_prices: Dict[str, float] | None = None,
+        balance: float = 10_000.0,  # USDT
+        leverage: int = 20,
+        taker_fee: float = 0.0004,  # 4 bp
+        slippage_bps: float = 0.0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        tick_size: float = 0.1,
+        step_size: float = 0.001,
+        min_notional: float = 100.0,  # USDT
+        seed: int | None = None,
+    ) -> None:
+        self.account: SimulatedAccount = SimulatedAccount(
+            balance = balance,
+            leverage = leverage,
+            taker_fee = taker_fee,
+            slippage_bps = slippage_bps,
+            mark_prices = mark_prices,
+        )
+        self.exchange: MockExchangeRestServer = MockExchangeRestServer(
+            binance = self.account,
+            api_key = PaperFutureMarket.CREDENTIALS,
+            secret_key = PaperFutureMarket.CREDENTIALS,
+            latency_ms = latency_ms,
+            jitter_ms = jitter_ms,
+            tick_size = tick_size,
+            step_size = step_size,
+            min_notional = min_notional,
+            seed = seed,
+        )
+        super().__init__(
+            base_url = PaperFutureMarket.BASE_URL,
+            api_key = PaperFutureMarket.CREDENTIALS,
+            secret_key = PaperFutureMarket.CREDENTIALS,
+        )
+        self.session.mount(PaperFutureMarket.BASE_URL, _InProcessAdapter(self.exchange))
+        return
+
+    def subscribe(
+        self: "PaperFutureMarket",
+        ws: BinanceFutureWebSocket,
+        symbol: str = "BTCUSDT",
+    ) -> "PaperFutureMarket":
+        """
+        func subscribe():
+            - follow the live mark price and book ticker of the symbol, only the public streams are used.
+        """
+        ws.mark_price(callback = self.on_mark_price, symbol = symbol)
+        ws.book_ticker(callback = self.on_book_ticker, symbol = symbol)
+        return self
+
+    def on_mark_price(
+        self: "PaperFutureMarket",
+        msg: dict,
+    ) -> None:
+        data: dict = msg.get("data") or msg
+        try:
+            self.account.set_mark_price(data["s"], float(data["p"]))
+        except (KeyError, TypeError, ValueError) as e:
+            operation_logger.warning(f"{__name__} - Unexpected mark price message: {msg} - {str(e)}")
+        return
+
+    def on_book_ticker(
+        self: "PaperFutureMarket",
+        msg: dict,
+    ) -> None:
+        data: dict = msg.get("data") or msg
+        try:
+            symbol: str = data["s"]
+            bid, ask = float(data["b"]), float(data["a"])
+            if symbol not in self.account.mark_prices:
+                self.account.set_mark_price(symbol, (bid + ask) / 2)
+            self.account.set_quote(symbol, bid, ask)
+        except (KeyError, TypeError, ValueError) as e:
+            operation_logger.warning(f"{__name__} - Unexpected book ticker message: {msg} - {str(e)}")
+        return
+
+    def summary(self: "PaperFutureMarket") -> Dict[str, float]:
+        """
+        func summary():
+            - balance, realized and unrealized PnL, fees and equity of the paper account in USDT.
+        """
+        account: SimulatedAccount = self.account
+        with account.lock:
+            unrealized: float = sum(account.unrealized_pnl(symbol) for symbol in account.positions)
+            return {
+                "balance": account.wallet_balance,
+                "realized_pnl": sum(fill["realizedPnl"] for fill in account.fills),
+                "fees": sum(fill["commission"] for fill in account.fills),
+                "unrealized_pnl": unrealized,
+                "equity": account.wallet_balance + unrealized,
+                "fills": len(account.fills),
+            }
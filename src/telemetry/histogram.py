@@ -0,0 +1,141 @@
+# Standard Library
+from typing import Dict, Iterable, List
+
+
+class HdrHistogram:
+    '''
+    # HDR-style log-linear histogram of non-negative integers, e.g., latencies in microseconds.
+    # values below 2^precision_bits are counted exactly, above that every power of two is split into
+    # 2^(precision_bits - 1) equal buckets, i.e., the relative error is below 2^-(precision_bits - 1).
+    # recording is O(1) and the memory is fixed, ~1.4k buckets for 7 bits up to a minute in microseconds.
+
+    - percentile() returns the highest value equivalent to the bucket, same as HdrHistogram.
+    '''
+    __slots__ = ("precision_bits", "sub_bucket_count", "half_count", "highest", "counts", "total", "minimum", "maximum", "sum")
+
+    def __init__(
+        self: "HdrHistogram",
+        highest: int = 60_000_000,  # one minute in microseconds
+        precision_bits: int = 7,  # < 1.6% relative error
+    ) -> None:
+        self.precision_bits: int = precision_bits
+        self.sub_bucket_count: int = 1 << precision_bits
+        self.half_count: int = self.sub_bucket_count >> 1
+        self.highest: int = highest
+        self.counts: List[int] = [0] * (self.__index(highest) + 1)
+        self.total: int = 0
+        self.minimum: int | None = None
+        self.maximum: int = 0
+        self.sum: int = 0
+        return
+
+    def __index(
+        self: "HdrHistogram",
+        value: int,
+    ) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        shift: int = value.bit_length() - self.precision_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + ((value >> shift) - self.half_count)
+
+    def __highest_equivalent(
+        self: "HdrHistogram",
+        index: int,
+    ) -> int:
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        shift += 1
+        return (((offset + self.half_count) + 1) << shift) - 1
+
+    def record(
+        self: "HdrHistogram",
+        value: int | float,
+        count: int = 1,
+    ) -> None:
+        """
+        func record():
+            - count the value, negative values are counted as 0 and values above highest as highest.
+        """
+        value = int(value)
+        if value < 0:
+            value = 0
+        elif value > self.highest:
+            value = self.highest
+
+        self.counts[self.__index(value)] += count
+        self.total += count
+        self.sum += value * count
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        return
+
+    def merge(
+        self: "HdrHistogram",
+        other: "HdrHistogram",
+    ) -> "HdrHistogram":
+        """
+        func merge():
+            - add the counts of a histogram with the same configuration.
+        """
+        if (other.precision_bits, other.highest) != (self.precision_bits, self.highest):
+            raise ValueError("Histograms with different configurations cannot be merged.")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def reset(self: "HdrHistogram") -> None:
+        self.counts = [0] * len(self.counts)
+        self.total = 0
+        self.minimum = None
+        self.maximum = 0
+        self.sum = 0
+        return
+
+    def percentile(
+        self: "HdrHistogram",
+        percentile: float,
+    ) -> int:
+        """
+        func percentile():
+            - value at the given percentile in [0, 100], 0 for an empty histogram.
+        """
+        return self.percentiles((percentile, ))[percentile]
+
+    def percentiles(
+        self: "HdrHistogram",
+        percentiles: Iterable[float],
+    ) -> Dict[float, int]:
+        """
+        func percentiles():
+            - several percentiles in one pass over the buckets.
+        """
+        targets: List[float] = sorted(percentiles)
+        result: Dict[float, int] = {percentile: 0 for percentile in targets}
+        if not self.total:
+            return result
+
+        position: int = 0
+        running: int = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            running += count
+            while position < len(targets) and running >= max(1, targets[position] / 100 * self.total):
+                result[targets[position]] = min(self.__highest_equivalent(index), self.maximum)
+                position += 1
+            if position == len(targets):
+                break
+        return result
+
+    @property
+    def mean(self: "HdrHistogram") -> float:
+        return self.sum / self.total if self.total else 0.0
@@ -0,0 +1,385 @@
+# Standard Library
+import bisect
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Custom Library
+from logger.set_logger import operation_logger
+
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# default buckets of the histograms, in microseconds, i.e., 50 us to 5 s.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000,
+)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs: List[str] = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Sharded:
+    '''
+    # per-thread shards of a metric child.
+    # every thread writes only to its own shard, so the hot path takes no lock, the GIL keeps a single write atomic.
+    # the shard of a thread is created once under the lock, and the reader merges all the shards.
+    '''
+    def __init__(
+        self: "_Sharded",
+        factory: Callable[[], List[float]],
+    ) -> None:
+        self._factory: Callable[[], List[float]] = factory
+        self._local: threading.local = threading.local()
+        self._shards: List[List[float]] = list()
+        self._shards_lock: threading.Lock = threading.Lock()
+        return
+
+    def _shard(self: "_Sharded") -> List[float]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: List[float] = self._factory()
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _merged(self: "_Sharded") -> List[float]:
+        with self._shards_lock:
+            shards: List[List[float]] = list(self._shards)
+        merged: List[float] = self._factory()
+        for shard in shards:
+            for position, value in enumerate(shard):
+                merged[position] += value
+        return merged
+
+
+class Counter(_Sharded):
+    '''
+    # monotonically increasing value, e.g., the number of the REST errors.
+    '''
+    def __init__(self: "Counter") -> None:
+        super().__init__(lambda: [0.0])
+        return
+
+    def inc(
+        self: "Counter",
+        amount: float = 1.0,
+    ) -> None:
+        self._shard()[0] += amount
+        return
+
+    @property
+    def value(self: "Counter") -> float:
+        return self._merged()[0]
+
+
+class Gauge:
+    '''
+    # value which goes up and down, e.g., the depth of a queue.
+    # set_function() samples the value on every scrape, so nothing is paid on the hot path.
+    '''
+    def __init__(self: "Gauge") -> None:
+        self._value: float = 0.0
+        self._function: Callable[[], float] | None = None
+        self._lock: threading.Lock = threading.Lock()
+        return
+
+    def set(
+        self: "Gauge",
+        value: float,
+    ) -> None:
+        self._value = float(value)
+        return
+
+    def inc(
+        self: "Gauge",
+        amount: float = 1.0,
+    ) -> None:
+        with self._lock:
+            self._value += amount
+        return
+
+    def dec(
+        self: "Gauge",
+        amount: float = 1.0,
+    ) -> None:
+        self.inc(-amount)
+        return
+
+    def set_function(
+        self: "Gauge",
+        function: Callable[[], float],
+    ) -> None:
+        self._function = function
+        return
+
+    @property
+    def value(self: "Gauge") -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception as e:
+                operation_logger.warning(f"{__name__} - Gauge function has failed: {str(e)}")
+                return math.nan
+        return self._value
+
+
+class Histogram(_Sharded):
+    '''
+    # distribution of the observed values over fixed buckets, e.g., the latency of a stage in microseconds.
+    # shard layout: [count of bucket 0, ..., count of +Inf, sum]
+    '''
+    def __init__(
+        self: "Histogram",
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        size: int = len(self.buckets) + 2
+        super().__init__(lambda: [0.0] * size)
+        return
+
+    def observe(
+        self: "Histogram",
+        value: float,
+    ) -> None:
+        shard: List[float] = self._shard()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+        return
+
+    def snapshot(
+        self: "Histogram",
+    ) -> Tuple[List[Tuple[float, float]], float, float]:
+        """
+        func snapshot():
+            - ([(upper bound, cumulative count), ..., (+Inf, count)], sum, count)
+        """
+        merged: List[float] = self._merged()
+        cumulative: List[Tuple[float, float]] = list()
+        running: float = 0.0
+        for bound, count in zip(self.buckets + (math.inf, ), merged[:-1]):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, merged[-1], running
+
+
+class MetricFamily:
+    '''
+    # metric with a name, a help text and a fixed set of label names.
+    # labels() returns the child of the given label values, the children are created once and cached.
+    # a family without label names has a single child, i.e., labels().
+    '''
+    def __init__(
+        self: "MetricFamily",
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...],
+        factory: Callable[[], Counter | Gauge | Histogram],
+    ) -> None:
+        self.kind: str = kind
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._factory: Callable[[], Counter | Gauge | Histogram] = factory
+        self._children: Dict[Tuple[str, ...], Counter | Gauge | Histogram] = dict()
+        self._lock: threading.Lock = threading.Lock()
+        return
+
+    def labels(
+        self: "MetricFamily",
+        *values: str,
+        **kwargs: str,
+    ) -> Counter | Gauge | Histogram:
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key: Tuple[str, ...] = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects the labels {self.labelnames}, got {key}.")
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def expose(self: "MetricFamily") -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        with self._lock:
+            children: List[Tuple[Tuple[str, ...], Counter | Gauge | Histogram]] = sorted(self._children.items(), key = lambda item: item[0])
+        for values, child in children:
+            if isinstance(child, Histogram):
+                cumulative, total, count = child.snapshot()
+                for bound, running in cumulative:
+                    labels: str = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                    yield f"{self.name}_bucket{labels} {_format_value(running)}"
+                yield f"{self.name}_sum{_format_labels(self.labelnames, values)} {_format_value(total)}"
+                yield f"{self.name}_count{_format_labels(self.labelnames, values)} {_format_value(count)}"
+            else:
+                yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class MetricsRegistry:
+    '''
+    # in-process registry of the counters, gauges and histograms.
+    # counter(), gauge() and histogram() return the existing family of the same name, so modules can declare
+    # their metrics at import time without sharing the objects.
+    # add_collector() plugs in a function which renders its own lines on every scrape, e.g., the tracer percentiles.
+
+    - expose() renders every family in the Prometheus text format.
+    '''
+    def __init__(self: "MetricsRegistry") -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._families: Dict[str, MetricFamily] = dict()
+        self._collectors: List[Callable[[], Iterable[str]]] = list()
+        return
+
+    def __family(
+        self: "MetricsRegistry",
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...],
+        factory: Callable[[], Counter | Gauge | Histogram],
+    ) -> MetricFamily:
+        with self._lock:
+            family: MetricFamily | None = self._families.get(name)
+            if family is None:
+                family = self._families[name] = MetricFamily(kind, name, documentation, labelnames, factory)
+            elif family.kind != kind or family.labelnames != tuple(labelnames):
+                raise ValueError(f"{name} has already been registered as a {family.kind} with the labels {family.labelnames}.")
+            return family
+
+    def counter(
+        self: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+    ) -> MetricFamily:
+        return self.__family("counter", name, documentation, labelnames, Counter)
+
+    def gauge(
+        self: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+    ) -> MetricFamily:
+        return self.__family("gauge", name, documentation, labelnames, Gauge)
+
+    def histogram(
+        self: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> MetricFamily:
+        return self.__family("histogram", name, documentation, labelnames, lambda: Histogram(buckets))
+
+    def add_collector(
+        self: "MetricsRegistry",
+        collector: Callable[[], Iterable[str]],
+    ) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+        return
+
+    def expose(self: "MetricsRegistry") -> str:
+        with self._lock:
+            families: List[MetricFamily] = [self._families[name] for name in sorted(self._families)]
+            collectors: List[Callable[[], Iterable[str]]] = list(self._collectors)
+
+        lines: List[str] = list()
+        for family in families:
+            lines.extend(family.expose())
+        for collector in collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                operation_logger.warning(f"{__name__} - Metrics collector has failed: {str(e)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    '''
+    # local HTTP endpoint which serves the registry in the Prometheus text format, GET /metrics.
+    # bound to the loopback by default, the metrics are not meant to leave the host.
+    '''
+    def __init__(
+        self: "MetricsServer",
+        registry: "MetricsRegistry | None" = None,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+    ) -> None:
+        self.registry: MetricsRegistry = registry if registry is not None else metrics
+        self.host: str = host
+        self.port: int = port
+        self.__server: ThreadingHTTPServer | None = None
+        self.__thread: threading.Thread | None = None
+        return
+
+    def start(self: "MetricsServer") -> "MetricsServer":
+        if self.__server is not None:
+            return self
+        registry: MetricsRegistry = self.registry
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body: bytes = registry.expose().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            def log_message(self, format, *args) -> None:  # scrapes are not worth a log line.
+                return
+
+        self.__server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.__server.daemon_threads = True
+        self.port = self.__server.server_address[1]  # port 0 -> the port picked by the OS
+        self.__thread = threading.Thread(
+            name = "metrics_server",
+            target = self.__server.serve_forever,
+            daemon = True,
+        )
+        self.__thread.start()
+        operation_logger.info(f"{__name__} - Metrics are served at http://{self.host}:{self.port}/metrics")
+        return self
+
+    def stop(self: "MetricsServer") -> None:
+        if self.__server is None:
+            return
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__server = None
+        self.__thread = None
+        return
+
+
+# process-wide registry, every component declares its metrics in it.
+metrics: MetricsRegistry = MetricsRegistry()
@@ -0,0 +1,197 @@
+# Standard Library
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Custom Library
+from telemetry.histogram import HdrHistogram
+
+
+# key under which the websocket managers attach the TraceContext to a received message.
+TRACE_KEY: str = "_trace"
+
+REPORTED_PERCENTILES: Tuple[float, ...] = (50.0, 99.0, 99.9)
+
+
+class Stage(IntEnum):
+    '''
+    # checkpoints of the tick-to-order path, in the order a tick goes through them.
+    '''
+    WS_RECEIVE = 0  # BasicWebSocketManager.__on_message(), before json.loads()
+    TICK_BUFFERED = 1  # DataCollectorAndProcessor._put_ticker_data(), price_fetch_buffer.put()
+    TICK_DEQUEUED = 2  # DataCollectorAndProcessor._price_data_fetch(), price_fetch_buffer.get()
+    INDICATOR_UPDATED = 3  # IndicatorRegistry.update()
+    INDEX_PUBLISHED = 4  # DataPipeline.push()
+    INDEX_RECEIVED = 5  # SignalGenerator.get_data()
+    SIGNAL_GENERATED = 6  # SignalPipeline.push()
+    SIGNAL_RECEIVED = 7  # TradeManager.__get_signal()
+    SIGNAL_SCORED = 8  # TradeManager.trade_score updated
+    ORDER_SUBMITTED = 9  # FutureMarket.order() called
+    ORDER_ACKED = 10  # FutureMarket.order() returned
+
+
+class TraceContext:
+    '''
+    # compact trace of one tick: perf_counter_ns() of every reached Stage, 0 if not reached.
+    # the context travels with the data, i.e., message dict -> Index -> Signal, so no lookup is needed.
+
+    - fork() copies the context, when one tick fans out into several signals or orders.
+    '''
+    __slots__ = ("trace_id", "marks")
+
+    _ids: Iterator[int] = itertools.count(1)
+
+    def __init__(
+        self: "TraceContext",
+        trace_id: int,
+        marks: List[int],
+    ) -> None:
+        self.trace_id: int = trace_id
+        self.marks: List[int] = marks
+        return
+
+    @classmethod
+    def start(cls) -> "TraceContext":
+        marks: List[int] = [0] * len(Stage)
+        marks[Stage.WS_RECEIVE] = time.perf_counter_ns()
+        return cls(next(cls._ids), marks)
+
+    def mark(
+        self: "TraceContext",
+        stage: Stage,
+    ) -> "TraceContext":
+        self.marks[stage] = time.perf_counter_ns()
+        return self
+
+    def mark_once(
+        self: "TraceContext",
+        stage: Stage,
+    ) -> "TraceContext":
+        """
+        func mark_once():
+            - keep the first mark, e.g., several Index objects of one tick arrive at the SignalGenerator.
+        """
+        if not self.marks[stage]:
+            self.marks[stage] = time.perf_counter_ns()
+        return self
+
+    def fork(self: "TraceContext") -> "TraceContext":
+        return TraceContext(self.trace_id, list(self.marks))
+
+    def elapsed_us(
+        self: "TraceContext",
+        first: Stage,
+        last: Stage,
+    ) -> float | None:
+        if not (self.marks[first] and self.marks[last]):
+            return None
+        return (self.marks[last] - self.marks[first]) / 1_000
+
+
+class Tracer:
+    '''
+    # collects finished TraceContexts into HDR histograms, in microseconds.
+        # per stage: time since the previous reached stage, e.g., INDEX_RECEIVED is the DataPipeline queueing delay.
+        # total: time since the websocket frame, i.e., WS_RECEIVE -> the last stage of the record() call.
+
+    - report() returns p50 / p99 / p999 of every histogram, reset() starts a new window.
+    '''
+    def __init__(
+        self: "Tracer",
+        highest_us: int = 60_000_000,
+    ) -> None:
+        self.highest_us: int = highest_us
+        self.__lock: threading.Lock = threading.Lock()
+        self.__stages: Dict[Stage, HdrHistogram] = {stage: HdrHistogram(highest_us) for stage in Stage}
+        self.__totals: Dict[Stage, HdrHistogram] = {stage: HdrHistogram(highest_us) for stage in Stage}
+        return
+
+    def record(
+        self: "Tracer",
+        context: "TraceContext | None",
+        first: Stage,
+        last: Stage,
+    ) -> None:
+        """
+        func record():
+            - record the stages in (first, last] that the context has reached.
+            - the caller records every segment once, e.g., the scoring records up to SIGNAL_SCORED and the order from there.
+        """
+        if context is None:
+            return
+        marks: List[int] = context.marks
+        previous: int = marks[first]
+        origin: int = marks[Stage.WS_RECEIVE]
+        with self.__lock:
+            for stage in Stage:
+                if stage <= first or stage > last or not marks[stage]:
+                    continue
+                if previous:
+                    self.__stages[stage].record((marks[stage] - previous) // 1_000)
+                previous = marks[stage]
+            if origin and marks[last]:
+                self.__totals[last].record((marks[last] - origin) // 1_000)
+        return
+
+    def histogram(
+        self: "Tracer",
+        stage: Stage,
+        total: bool = False,
+    ) -> HdrHistogram:
+        """
+        func histogram():
+            - copy of the histogram of the stage, or of WS_RECEIVE -> stage with total = True.
+        """
+        with self.__lock:
+            source: HdrHistogram = (self.__totals if total else self.__stages)[stage]
+            return HdrHistogram(source.highest, source.precision_bits).merge(source)
+
+    def report(
+        self: "Tracer",
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        func report():
+            - {"<STAGE>" | "total:<STAGE>": {"count", "mean", "p50", "p99", "p999", "max"}} in us, recorded entries only.
+        """
+        result: Dict[str, Dict[str, float]] = dict()
+        with self.__lock:
+            entries: List[Tuple[str, HdrHistogram]] = [(stage.name, histogram) for stage, histogram in self.__stages.items()]
+            entries.extend((f"total:{stage.name}", histogram) for stage, histogram in self.__totals.items())
+            for name, histogram in entries:
+                if not histogram.total:
+                    continue
+                percentiles: Dict[float, int] = histogram.percentiles(REPORTED_PERCENTILES)
+                result[name] = {
+                    "count": histogram.total,
+                    "mean": histogram.mean,
+                    "p50": percentiles[50.0],
+                    "p99": percentiles[99.0],
+                    "p999": percentiles[99.9],
+                    "max": histogram.maximum,
+                }
+        return result
+
+    def expose(self: "Tracer") -> Iterable[str]:
+        """
+        func expose():
+            - report() in the Prometheus text format, to be plugged in with MetricsRegistry.add_collector().
+        """
+        yield "# HELP trace_latency_us Tick-to-order latency per stage since the last reset, in microseconds."
+        yield "# TYPE trace_latency_us gauge"
+        for name, latency in self.report().items():
+            scope, _, stage = name.rpartition(":")
+            for quantile, key in (("0.5", "p50"), ("0.99", "p99"), ("0.999", "p999")):
+                yield f'trace_latency_us{{stage="{stage}",scope="{scope or "stage"}",quantile="{quantile}"}} {latency[key]}'
+        return
+
+    def reset(self: "Tracer") -> None:
+        with self.__lock:
+            for histogram in itertools.chain(self.__stages.values(), self.__totals.values()):
+                histogram.reset()
+        return
+
+
+# process-wide tracer, every component of the tick-to-order path records into it.
+tracer: Tracer = Tracer()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+import random
+import sys
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: The streams are replaced by hand-made fair price, index price and mark
+# price messages, stamped with the exchange time the monitor aligns on.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from interface.pipeline_interface import PipelineController  # type: ignore
+    from manager.basis_monitor import BASIS_LAYOUT, BasisMonitor, _RingBuffer  # type: ignore
+    from object.constants import IndexType  # type: ignore
+    from pipeline.data_pipeline import DataPipeline  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (pandas, websocket-client)
+    BasisMonitor = None  # type: ignore
+
+
+def _fair(price: float, ts: int) -> dict:
+    return {"channel": "push.fair.price", "data": {"symbol": "BTC_USDT", "price": price}, "symbol": "BTC_USDT", "ts": ts}
+
+
+def _index(price: float, ts: int) -> dict:
+    return {"channel": "push.index.price", "data": {"symbol": "BTC_USDT", "price": price}, "symbol": "BTC_USDT", "ts": ts}
+
+
+def _mark(price: float, ts: int, index: float | None = None) -> dict:
+    data = {"e": "markPriceUpdate", "E": ts, "s": "BTCUSDT", "p": str(price)}
+    if index is not None:
+        data["i"] = str(index)
+    return {"stream": "btcusdt@markPrice@1s", "data": data}
+
+
+class RingBufferTest(unittest.TestCase):
+    """as-of lookups over the ring, across the wrap-around."""
+
+    def setUp(self) -> None:
+        if BasisMonitor is None:
+            self.skipTest("pandas unavailable")
+
+    def test_asof_after_wrap_around(self) -> None:
+        """The latest row at or before the time is found, the overwritten rows are gone, late rows are dropped."""
+        ring = _RingBuffer(4)
+        for timestamp in (10, 20, 30, 40, 50, 60):
+            ring.append(timestamp, float(timestamp), math.nan)
+        self.assertFalse(ring.append(55, 0.0, math.nan))
+
+        self.assertEqual(ring.asof(25), -1)  # 10 and 20 have been overwritten
+        self.assertEqual(ring.prices[ring.asof(30)], 30.0)
+        self.assertEqual(ring.prices[ring.asof(59)], 50.0)
+        self.assertEqual(ring.prices[ring.asof(1_000)], 60.0)
+
+
+class BasisMonitorTest(unittest.TestCase):
+    """The venues are joined as-of the exchange time and the basis is published per tick."""
+
+    def setUp(self) -> None:
+        if BasisMonitor is None:
+            self.skipTest("pandas unavailable")
+
+    def test_ticks_are_joined_as_of_their_timestamp(self) -> None:
+        """A tick takes the latest row of the other venue before it, unless that row is stale."""
+        controller = PipelineController(pipeline = DataPipeline())
+        monitor = BasisMonitor(pipeline_controller = controller, max_staleness = 1_000)
+        now = int(time.time() * 1_000)  # the controller drops the indexes older than its window
+
+        monitor.on_binance_mark_price(_mark(60_000.0, now + 1_000, index = 59_990.0))
+        monitor.on_mexc_index_price(_index(59_995.0, now + 1_100))  # no fair price yet
+        self.assertIsNone(monitor.latest_timestamp)
+
+        monitor.on_mexc_fair_price(_fair(60_030.0, now + 1_500))
+        self.assertEqual(monitor.latest_timestamp, now + 1_500)
+        self.assertAlmostEqual(monitor.latest["basis"], 30.0)
+        self.assertAlmostEqual(monitor.latest["basis_bps"], 5.0)
+        self.assertAlmostEqual(monitor.latest["index_spread_bps"], (59_995.0 / 59_990.0 - 1) * 10_000)
+
+        index = controller.pop(block = False)
+        self.assertEqual((index.index_type, index.layout, index.timestamp), (IndexType.BASIS, BASIS_LAYOUT, now + 1_500))
+
+        monitor.on_mexc_fair_price(_fair(60_060.0, now + 2_600))  # the mark of 1_000 is too old
+        self.assertEqual(monitor.latest_timestamp, now + 1_500)
+        monitor.on_binance_mark_price(_mark(60_000.0, now + 2_500))  # joined with the fair price of 1_500, within 1_000
+        self.assertAlmostEqual(monitor.latest["basis"], 30.0)
+
+    def test_zscore_and_lead_lag(self) -> None:
+        """MEXC repeating the Binance moves a second later shows as a 1_000 ms lead of Binance."""
+        monitor = BasisMonitor(lead_lag_alpha = 0.05, zscore_window = 100)
+        rng = random.Random(7)
+        marks = [60_000.0]
+        for _ in range(600):
+            marks.append(marks[-1] * math.exp(rng.gauss(0.0, 0.0005)))
+
+        for step in range(1, 600):
+            timestamp = step * 1_000
+            monitor.on_binance_mark_price(_mark(marks[step], timestamp + 10))
+            monitor.on_mexc_fair_price(_fair(marks[step - 1] + 3.0, timestamp + 20))
+
+        self.assertEqual(monitor.latest["lead_lag_ms"], 1_000.0)
+        self.assertGreater(monitor.latest["lead_lag_corr"], 0.9)
+        self.assertTrue(math.isfinite(monitor.latest["zscore"]))
+
+    def test_asymmetric_lags_wait_for_the_rows(self) -> None:
+        """A negative lag reads Binance after the grid point, so the point waits for those rows, whatever the order of the venues."""
+        rng = random.Random(11)
+        marks = [60_000.0]
+        for _ in range(60):
+            marks.append(marks[-1] * math.exp(rng.gauss(0.0, 0.0005)))
+        binance = [_mark(mark, step * 1_000 + 10) for step, mark in enumerate(marks)]
+        mexc = [_fair(mark + 3.0, step * 1_000 + 20) for step, mark in enumerate(marks)]
+
+        def lead_lag(messages: list) -> dict:
+            monitor = BasisMonitor(lags = (-5_000, 0), lead_lag_alpha = 1.0)  # the EWMA is the latest sample
+            samples = dict()
+            for venue, message in messages:
+                getattr(monitor, venue)(message)
+                samples[monitor.lead_lag_samples] = monitor.cross.tolist()
+            return samples
+
+        interleaved = lead_lag([
+            message for pair in zip(binance, mexc)
+            for message in (("on_binance_mark_price", pair[0]), ("on_mexc_fair_price", pair[1]))
+        ])
+        binance_first = lead_lag(
+            [("on_binance_mark_price", message) for message in binance] + [("on_mexc_fair_price", message) for message in mexc]
+        )
+        self.assertGreater(len(interleaved), 40)
+        for count, cross in interleaved.items():
+            for value, expected in zip(cross, binance_first.get(count, cross)):
+                self.assertAlmostEqual(value, expected, msg = f"sample {count}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+# NOTE: Covers the benchmark harness and runs the quick hot-path cases once with
+# a tiny time budget, so the cases keep up with the code they measure.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from benchmark.harness import BenchmarkSuite, compare, load, save  # type: ignore
+
+try:
+    from benchmark.hot_paths import suite as hot_paths  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency chain
+    hot_paths = None  # type: ignore
+
+
+class BenchmarkHarnessTest(unittest.TestCase):
+    """Rounds are calibrated, results round-trip through JSON and slowdowns are flagged."""
+
+    def test_run_save_and_compare(self) -> None:
+        """A case slower than the baseline by more than the threshold is a regression."""
+        suite = BenchmarkSuite()
+        calls = []
+
+        @suite.case("sum")
+        def _sum():
+            yield lambda number: calls.append(sum(range(number)))
+
+        results = suite.run(rounds = 3, min_time = 0.001)
+        self.assertGreaterEqual(len(calls), 3)  # calibration rounds plus the 2 timed ones
+        self.assertGreater(results["results"]["sum"]["median_ns"], 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "baseline.json")
+            save(results, path)
+            baseline = load(path)
+
+        slower = {"results": {"sum": dict(baseline["results"]["sum"], median_ns = baseline["results"]["sum"]["median_ns"] * 1.5)}}
+        (name, _, _, ratio, regressed), = compare(baseline, slower, threshold = 0.2)
+        self.assertEqual(name, "sum")
+        self.assertAlmostEqual(ratio, 1.5)
+        self.assertTrue(regressed)
+        self.assertFalse(compare(baseline, baseline, threshold = 0.2)[0][4])
+
+        with self.assertRaises(ValueError):
+            suite.case("sum")(_sum)
+
+    def test_hot_path_cases_run(self) -> None:
+        """Every case but the collector, which sleeps on start-up, runs without errors."""
+        if hot_paths is None:
+            self.skipTest("hot path dependencies unavailable")
+        names = [name for name in hot_paths.select() if not name.startswith("collector.")]
+        results = hot_paths.run(names, rounds = 1, min_time = 0.0)
+
+        self.assertEqual(sorted(results["results"]), sorted(names))
+        self.assertIn("rest.parse_response_pydantic", results["results"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# NOTE: Drives the Binance combined-stream manager with a fake socket, so the
+# subscription bookkeeping and the message dispatch are covered offline.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from binance.websocket_base import _FutureWebSocketManager  # type: ignore
+    from binance.future import FutureWebSocket  # type: ignore
+    from sdk.websocket_sdk import BasicWebSocketManager  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (websocket-client)
+    _FutureWebSocketManager = None  # type: ignore
+    FutureWebSocket = None  # type: ignore
+
+
+class _FakeSocket:
+    """Collects the frames the manager would send."""
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    def send(self, payload: str) -> None:
+        self.sent.append(json.loads(payload))
+
+
+class BinanceCombinedStreamTest(unittest.TestCase):
+    """Streams share one connection and messages are routed by stream name."""
+
+    def setUp(self) -> None:
+        """Build the manager without connecting and plug in the fake socket."""
+        if _FutureWebSocketManager is None:
+            self.skipTest("websocket-client unavailable")
+        self.manager = _FutureWebSocketManager()
+        self.manager.ws = _FakeSocket()
+        self.manager._is_connected = lambda: True
+
+    def test_subscribe_sends_only_new_streams(self) -> None:
+        """Duplicate streams are not re-sent and every stream goes into the reconnect URL."""
+        received = []
+        self.manager.subscribe(FutureWebSocket._stream_names(["BTCUSDT", "ETHUSDT"], "markPrice@1s"), received.append)
+        self.manager.subscribe(["btcusdt@markPrice@1s", "btcusdt@bookTicker"], received.append)
+
+        self.assertEqual(
+            [frame["params"] for frame in self.manager.ws.sent],
+            [["btcusdt@markPrice@1s", "ethusdt@markPrice@1s"], ["btcusdt@bookTicker"]],
+        )
+        self.assertEqual([frame["id"] for frame in self.manager.ws.sent], [1, 2])
+        self.assertEqual(
+            self.manager._combined_endpoint(),
+            "wss://fstream.binance.com/stream?streams=btcusdt@markPrice@1s/ethusdt@markPrice@1s/btcusdt@bookTicker",
+        )
+
+    def test_messages_are_dispatched_by_stream(self) -> None:
+        """Only the callback of the message's stream is called; acks are not forwarded."""
+        marks, books = [], []
+        self.manager.subscribe(["btcusdt@markPrice@1s"], marks.append)
+        self.manager.subscribe(["btcusdt@bookTicker"], books.append)
+
+        message = {"stream": "btcusdt@bookTicker", "data": {"b": "1.0"}}
+        self.manager._deal_with_response(message)
+        self.manager._deal_with_response({"result": None, "id": 1})
+
+        self.assertEqual((marks, books), ([], [message]))
+
+    def test_unsubscribe_drops_stream(self) -> None:
+        """Unsubscribed streams leave the URL and stop dispatching."""
+        received = []
+        self.manager.subscribe(["btcusdt@aggTrade"], received.append)
+        self.manager.unsubscribe(["btcusdt@aggTrade"])
+        self.manager._deal_with_response({"stream": "btcusdt@aggTrade", "data": {}})
+
+        self.assertEqual(self.manager.ws.sent[-1]["method"], "UNSUBSCRIBE")
+        self.assertEqual(self.manager._combined_endpoint(), "wss://fstream.binance.com/stream")
+        self.assertEqual(received, [])
+
+    def test_stream_keeps_every_callback(self) -> None:
+        """A second subscriber of the same stream is called as well, and the stream is only sent once."""
+        first, second = [], []
+        self.manager.subscribe(["btcusdt@markPrice@1s"], first.append)
+        self.manager.subscribe(["btcusdt@markPrice@1s"], second.append)
+        self.manager.subscribe(["btcusdt@markPrice@1s"], second.append)
+
+        message = {"stream": "btcusdt@markPrice@1s", "data": {"p": "1.0"}}
+        self.manager._deal_with_response(message)
+        self.assertEqual((first, second), ([message], [message]))
+        self.assertEqual(len(self.manager.ws.sent), 1)
+
+    def test_subscribe_does_not_wait_forever(self) -> None:
+        """Without a connection the SUBSCRIBE gives up after REQUEST_TIMEOUT and the stream waits in the URL."""
+        self.manager._is_connected = lambda: False
+        self.manager.REQUEST_TIMEOUT = 0.2
+
+        started = time.monotonic()
+        self.manager.subscribe(["btcusdt@markPrice@1s"], print)
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(self.manager.ws.sent, [])
+        self.assertEqual(self.manager._combined_endpoint(), "wss://fstream.binance.com/stream?streams=btcusdt@markPrice@1s")
+
+    def test_reconnect_notifies_and_sends_the_missed_streams(self) -> None:
+        """Listeners hear of the drop and of the reconnect, a stream added while connecting is sent afterwards."""
+        events = []
+        self.manager.add_connection_listener(events.append)
+        self.manager.subscribe(["btcusdt@markPrice@1s"], print)
+
+        def connect(manager) -> None:
+            if len(events) > 1:  # subscribed to while the socket was reconnecting, i.e., not in its URL
+                manager.subscriptions.append("btcusdt@bookTicker")
+
+        with mock.patch.object(BasicWebSocketManager, "_connect", connect):
+            self.manager._connect()
+            self.assertEqual(self.manager.endpoint, "wss://fstream.binance.com/stream?streams=btcusdt@markPrice@1s")
+            self.manager._connect()
+
+        self.assertEqual(events, [True, False, True])
+        self.assertEqual(self.manager.ws.sent[-1]["params"], ["btcusdt@bookTicker"])
+        self.assertEqual(len(self.manager.ws.sent), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Feeds the clock-offset estimator with synthetic samples, no exchange
+# is contacted.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from sdk.clock_sync import ClockSync  # type: ignore
+
+try:
+    from binance.future import FutureMarket  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests/pydantic)
+    FutureMarket = None  # type: ignore
+
+
+class ClockSyncTest(unittest.TestCase):
+    """Offset and latency come from the minimum-RTT sample."""
+
+    def test_minimum_rtt_sample_wins(self) -> None:
+        """A congested sample with a skewed offset does not move the estimate."""
+        clock = ClockSync(fetch_server_time = lambda: None)
+        clock.add_sample(rtt = 40.0, offset = 250.0)
+        clock.add_sample(rtt = 8.0, offset = 120.0)
+        clock.add_sample(rtt = 90.0, offset = -300.0)
+
+        self.assertEqual(clock.offset_ms, 120.0)
+        self.assertEqual(clock.one_way_latency_ms, 4.0)
+
+    def test_sample_measures_offset(self) -> None:
+        """An exchange 1 s ahead of us yields an offset of about +1000 ms."""
+        clock = ClockSync(fetch_server_time = lambda: int(ClockSync.local_time_ms() + 1_000))
+        rtt, offset = clock.sample()
+
+        self.assertGreaterEqual(rtt, 0.0)
+        self.assertAlmostEqual(offset, 1_000.0, delta = 5.0)
+        self.assertAlmostEqual(clock.now() - ClockSync.local_time_ms(), 1_000.0, delta = 5.0)
+
+    def test_latency_uses_exchange_clock(self) -> None:
+        """An event stamped 50 ms ago by an exchange 1 s ahead is 50 ms old, not -950 ms."""
+        clock = ClockSync(fetch_server_time = lambda: None)
+        clock.add_sample(rtt = 2.0, offset = 1_000.0)
+        stamped = ClockSync.local_time_ms() + 1_000.0 - 50.0
+
+        self.assertAlmostEqual(clock.latency_ms(stamped), 50.0, delta = 5.0)
+
+    def test_failed_sample_is_ignored(self) -> None:
+        """Fetch errors leave the clock unsynced."""
+        def fail():
+            raise ConnectionError("offline")
+
+        clock = ClockSync(fetch_server_time = fail)
+
+        self.assertIsNone(clock.sample())
+        self.assertFalse(clock.synced)
+
+    def test_sdk_timestamp_follows_clock(self) -> None:
+        """Signed requests are stamped on the exchange clock once it is synced."""
+        if FutureMarket is None:
+            self.skipTest("binance sdk dependencies unavailable")
+        market = FutureMarket()
+        market.clock = ClockSync(fetch_server_time = lambda: None)
+        self.assertAlmostEqual(market.timestamp(), ClockSync.local_time_ms(), delta = 5.0)
+
+        market.clock.add_sample(rtt = 2.0, offset = -2_000.0)
+        self.assertAlmostEqual(market.timestamp(), ClockSync.local_time_ms() - 2_000.0, delta = 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,7 +53,7 @@ class IndexFactoryTest(unittest.TestCase):
         payload = {
             "timestamp": 1_700_000_000_000,
             "type": IndexType.SMA,
-            "data": {5: 1.0, 10: 2.0},
+            "data": {10: 1.0, 30: 2.0},  # keys must be MA_READ_PERIODS, the values are kept in an aligned array.
         }
 
         index = factory.generate_index(payload)  # type: ignore[arg-type]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Covers the array-backed Index, its dict-compatible view and the free-list
+# used on the indicator hot path.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np
+
+from object.constants import IndexType, MA_READ_PERIODS  # type: ignore
+from object.indexes import Index, IndexPool, MA_LAYOUT  # type: ignore
+from object.signal import Signal, TradeSignal  # type: ignore
+
+
+class IndexTest(unittest.TestCase):
+    """Index values are aligned to MA_READ_PERIODS and read like a dict."""
+
+    def test_dict_payload_is_aligned_to_read_periods(self) -> None:
+        """Dict payloads land on the offsets of the lookup table; NaN hides missing periods."""
+        index = Index(1_700_000_000_000, IndexType.SMA, {10: 1.0, 300: 4.0})
+
+        self.assertEqual(index.values.shape, (len(MA_READ_PERIODS),))
+        self.assertEqual(index.values[MA_LAYOUT.offsets[300]], 4.0)
+        self.assertEqual(index.data.get(10), 1.0)
+        self.assertIsNone(index.data.get(60))
+        self.assertEqual(dict(index.data), {10: 1.0, 300: 4.0})
+        self.assertIn(300, index.data)
+        self.assertNotIn(60, index.data)
+        with self.assertRaises(KeyError):
+            index.data[60]
+
+    def test_empty_values_are_falsy(self) -> None:
+        """Rules check `if sma_data` so an all-NaN view must be falsy."""
+        index = Index(0, IndexType.EMA, np.full(len(MA_LAYOUT), np.nan))
+        self.assertFalse(index.data)
+
+    def test_price_index_returns_float(self) -> None:
+        """PRICE keeps returning the float itself for the existing rules."""
+        index = Index(0, IndexType.PRICE, 42_000.5)
+        self.assertEqual(index.data, 42_000.5)
+
+    def test_objects_have_no_instance_dict(self) -> None:
+        """Index and Signal are __slots__ classes."""
+        self.assertFalse(hasattr(Index(0, IndexType.SMA, {}), "__dict__"))
+        self.assertFalse(hasattr(Signal(TradeSignal.HOLD), "__dict__"))
+
+
+class IndexPoolTest(unittest.TestCase):
+    """The pool hands released objects back out instead of allocating."""
+
+    def test_release_then_acquire_recycles(self) -> None:
+        """A released Index is reused and overwritten in place."""
+        pool = IndexPool()
+        first = pool.acquire(1, IndexType.SMA, np.arange(len(MA_LAYOUT), dtype = float))
+        pool.release(first)
+
+        second = pool.acquire(2, IndexType.EMA, np.full(len(MA_LAYOUT), 3.0))
+
+        self.assertIs(first, second)
+        self.assertEqual(second.timestamp, 2)
+        self.assertEqual(second.index_type, IndexType.EMA)
+        self.assertEqual(second.data.get(1_800), 3.0)
+        self.assertEqual(len(pool), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
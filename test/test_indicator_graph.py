@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Covers the planning of the indicator DAG: shared intermediates are
+# evaluated once per tick, unused nodes are skipped and cycles are rejected.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np
+import pandas as pd
+
+from object.constants import IndexType, MA_WRITE_PERIODS  # type: ignore
+from object.indexes import PRICE_LAYOUT  # type: ignore
+from analysis.graph import IndicatorGraph, TICK  # type: ignore
+from analysis.indicators import BollingerBands, MovingAverageConvergenceDivergence  # type: ignore
+from analysis.registry import IndicatorRegistry  # type: ignore
+
+
+def _prices(count: int, seed: int = 11) -> np.ndarray:
+    """Random walk long enough to warm up every default output."""
+    rng = np.random.default_rng(seed)
+    return 30_000.0 + np.cumsum(rng.normal(0.0, 5.0, count))
+
+
+class IndicatorGraphTest(unittest.TestCase):
+    """Planning and memoization of the generic graph."""
+
+    def _counting_graph(self):
+        """Two outputs over one shared node that counts its evaluations."""
+        graph = IndicatorGraph()
+        calls = {"shared": 0}
+
+        def shared_step():
+            def step(tick):
+                calls["shared"] += 1
+                return tick[0] * 2.0
+            return step
+
+        graph.add_node("shared", (TICK,), shared_step)
+        graph.add_node("unused", (TICK,), lambda: (lambda tick: 1 / 0))
+        graph.add_output(IndexType.PRICE, ("shared",), PRICE_LAYOUT, lambda out, value: out.__setitem__(0, value))
+        graph.add_output(IndexType.SMA, ("shared",), PRICE_LAYOUT, lambda out, value: out.__setitem__(0, -value))
+        graph.add_output(IndexType.ATR, ("unused",), PRICE_LAYOUT, lambda out, value: None)
+        return graph, calls
+
+    def test_shared_node_runs_once_per_tick(self) -> None:
+        """Both consumers read the memoized value of the shared node."""
+        graph, calls = self._counting_graph()
+        graph.subscribe(IndexType.PRICE | IndexType.SMA)
+        for price in (1.0, 2.0, 3.0):
+            graph.update(price)
+
+        snapshot = {index_type: values[0] for index_type, _, values in graph.snapshot()}
+
+        self.assertEqual(calls["shared"], 3)
+        self.assertEqual(snapshot, {IndexType.PRICE: 6.0, IndexType.SMA: -6.0})
+
+    def test_unsubscribed_nodes_are_skipped(self) -> None:
+        """A node only needed by an unsubscribed output never runs."""
+        graph, _ = self._counting_graph()
+        graph.subscribe(IndexType.PRICE)
+        graph.update(1.0)  # "unused" would raise ZeroDivisionError
+
+        self.assertEqual(graph.active_nodes, ("shared",))
+        self.assertEqual(set(graph.timings()), {"shared", "output:PRICE"})
+        self.assertEqual(graph.timings()["shared"]["calls"], 1)
+
+    def test_cycle_is_rejected(self) -> None:
+        """Kahn's algorithm leaves the cycle unsorted and the plan is refused."""
+        graph = IndicatorGraph()
+        graph.add_node("a", ("b",), lambda: (lambda value: value))
+        graph.add_node("b", ("a",), lambda: (lambda value: value))
+        graph.add_output(IndexType.PRICE, ("a",), PRICE_LAYOUT, lambda out, value: None)
+
+        with self.assertRaises(ValueError):
+            graph.subscribe(IndexType.PRICE)
+
+
+class DefaultRegistryGraphTest(unittest.TestCase):
+    """The default declarations match the standalone indicators."""
+
+    def setUp(self) -> None:
+        """Subscribe everything and feed a random walk."""
+        self.prices = _prices(600)
+        self.registry = IndicatorRegistry.default(subscriptions = IndexType.SMA | IndexType.ZSCORE | IndexType.MACD | IndexType.BOLLINGER)
+        for price in self.prices:
+            self.registry.update(float(price))
+        self.snapshot = {index_type: values for index_type, _, values in self.registry.snapshot()}
+
+    def test_shared_moments_feed_sma_bollinger_and_zscore(self) -> None:
+        """One rolling-moments node serves three outputs with correct values."""
+        series = pd.Series(self.prices)
+        bands = BollingerBands()
+        for price in self.prices:
+            bands.update(float(price))
+
+        self.assertEqual(self.registry.active_nodes, ("price", "moments", "emas", "sma", "bollinger", "macd"))
+        np.testing.assert_allclose(self.snapshot[IndexType.BOLLINGER], bands.values())
+        for offset, period in enumerate(MA_WRITE_PERIODS[:4]):
+            window = series.tail(period)
+            self.assertAlmostEqual(self.snapshot[IndexType.SMA][offset], window.mean(), places = 6)
+            self.assertAlmostEqual(
+                self.snapshot[IndexType.ZSCORE][offset],
+                (self.prices[-1] - window.mean()) / window.std(ddof = 0),
+                places = 6,
+            )
+
+    def test_macd_matches_standalone(self) -> None:
+        """MACD on the shared EMA bank equals the standalone indicator."""
+        macd = MovingAverageConvergenceDivergence()
+        for price in self.prices:
+            macd.update(float(price))
+
+        np.testing.assert_allclose(self.snapshot[IndexType.MACD], macd.values())
+
+
+if __name__ == "__main__":
+    unittest.main()
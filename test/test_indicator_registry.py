@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Checks the streaming indicators against batch pandas computations and
+# the subscription behaviour of the registry.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np
+import pandas as pd
+
+from object.constants import IndexType, MA_WRITE_PERIODS  # type: ignore
+from object.indexes import MA_LAYOUT  # type: ignore
+from analysis.indicators import (  # type: ignore
+    AverageTrueRange,
+    BollingerBands,
+    ExponentialMovingAverage,
+    MovingAverageConvergenceDivergence,
+    RelativeStrengthIndex,
+    SimpleMovingAverage,
+)
+from analysis.registry import IndicatorRegistry  # type: ignore
+
+
+def _prices(count: int, seed: int = 7) -> np.ndarray:
+    """Random walk around 30_000 so every indicator leaves its warm-up."""
+    rng = np.random.default_rng(seed)
+    return 30_000.0 + np.cumsum(rng.normal(0.0, 5.0, count))
+
+
+def _feed(indicator, prices: np.ndarray) -> np.ndarray:
+    """Push every price and return the rendered values."""
+    for price in prices:
+        indicator.update(float(price))
+    return indicator.values()
+
+
+class StreamingIndicatorTest(unittest.TestCase):
+    """Incremental results match the batch definitions."""
+
+    def test_moving_averages_match_pandas(self) -> None:
+        """SMA/EMA agree with rolling().mean() and ewm(adjust=False) on the last window."""
+        prices = _prices(2_500)
+        series = pd.Series(prices)
+        sma = _feed(SimpleMovingAverage(), prices)
+        ema = _feed(ExponentialMovingAverage(), prices)
+
+        for offset, period in enumerate(MA_WRITE_PERIODS):
+            self.assertAlmostEqual(sma[offset], series.tail(period).mean(), places = 6)
+            self.assertAlmostEqual(ema[offset], series.ewm(span = period, adjust = False).mean().iloc[-1], places = 6)
+
+    def test_warm_up_is_nan(self) -> None:
+        """Periods without enough ticks stay NaN."""
+        sma = _feed(SimpleMovingAverage(), _prices(10))
+        self.assertFalse(np.isnan(sma[0]))
+        self.assertTrue(np.isnan(sma[1:]).all())
+
+    def test_rsi_matches_wilder_definition(self) -> None:
+        """RSI equals the Wilder recursion computed with ewm(alpha=1/period) after the seed mean."""
+        prices = _prices(500)
+        rsi = _feed(RelativeStrengthIndex(periods = (14,)), prices)
+
+        change = np.diff(prices)
+        gain, loss = np.clip(change, 0, None), np.clip(-change, 0, None)
+        avg_gain, avg_loss = gain[:14].mean(), loss[:14].mean()
+        for g, l in zip(gain[14:], loss[14:]):
+            avg_gain += (g - avg_gain) / 14
+            avg_loss += (l - avg_loss) / 14
+
+        self.assertAlmostEqual(rsi[0], 100.0 - 100.0 / (1.0 + avg_gain / avg_loss), places = 9)
+        self.assertTrue(0.0 <= rsi[0] <= 100.0)
+
+    def test_macd_and_bollinger(self) -> None:
+        """MACD line is the EMA spread; Bollinger bands are symmetric around the SMA."""
+        prices = _prices(300)
+        series = pd.Series(prices)
+        macd = _feed(MovingAverageConvergenceDivergence(), prices)
+        bands = _feed(BollingerBands(), prices)
+
+        spread = series.ewm(span = 12, adjust = False).mean() - series.ewm(span = 26, adjust = False).mean()
+        self.assertAlmostEqual(macd[0], spread.iloc[-1], places = 6)
+        self.assertAlmostEqual(macd[2], macd[0] - macd[1], places = 9)
+
+        window = series.tail(20)
+        self.assertAlmostEqual(bands[1], window.mean(), places = 6)
+        self.assertAlmostEqual(bands[0] - bands[1], 2.0 * window.std(ddof = 0), places = 6)
+        self.assertAlmostEqual(bands[1] - bands[2], bands[0] - bands[1], places = 6)
+
+    def test_atr_uses_high_low_when_given(self) -> None:
+        """True range falls back to |price - previous| without high/low."""
+        atr = AverageTrueRange(periods = (2,))
+        for price in (100.0, 102.0, 101.0):
+            atr.update(price)
+        self.assertAlmostEqual(atr.values()[0], 1.5)
+
+        atr = AverageTrueRange(periods = (2,))
+        atr.update(100.0)
+        atr.update(100.0, high = 104.0, low = 99.0)
+        atr.update(100.0, high = 101.0, low = 98.0)
+        self.assertAlmostEqual(atr.values()[0], 4.0)
+
+
+class IndicatorRegistryTest(unittest.TestCase):
+    """Only subscribed indicators are computed and late subscribers are warmed up."""
+
+    def test_only_subscribed_indicators_are_snapshotted(self) -> None:
+        """Registered but unsubscribed indicators do not show up."""
+        registry = IndicatorRegistry.default(subscriptions = IndexType.SMA | IndexType.PRICE)
+        registry.update(10.0)
+
+        snapshot = {index_type: (layout, values) for index_type, layout, values in registry.snapshot()}
+
+        self.assertEqual(set(snapshot), {IndexType.SMA, IndexType.PRICE})
+        self.assertIs(snapshot[IndexType.SMA][0], MA_LAYOUT)
+        self.assertEqual(snapshot[IndexType.PRICE][1][0], 10.0)
+        self.assertEqual(registry.subscriptions, IndexType.SMA | IndexType.PRICE)
+
+    def test_late_subscription_replays_history(self) -> None:
+        """A new subscriber sees the same values as one subscribed from the start."""
+        prices = _prices(100)
+        early = IndicatorRegistry.default(subscriptions = IndexType.RSI)
+        late = IndicatorRegistry.default()
+        for price in prices:
+            early.update(float(price))
+            late.update(float(price))
+        late.subscribe(IndexType.RSI)
+
+        np.testing.assert_allclose(early.snapshot()[0][2], late.snapshot()[0][2])
+
+    def test_duplicate_registration_is_rejected(self) -> None:
+        """A flag maps to exactly one indicator."""
+        registry = IndicatorRegistry.default()
+        with self.assertRaises(ValueError):
+            registry.register(IndexType.SMA, SimpleMovingAverage)
+
+
+if __name__ == "__main__":
+    unittest.main()
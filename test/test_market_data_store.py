@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+# NOTE: Exercises the on-disk tick store against a temporary directory, covering
+# day partitioning, the sparse index lookup and out-of-order writes.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    import numpy as np
+    import pandas as pd
+    from manager.market_data_store import MarketDataStore  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (numpy/pandas)
+    MarketDataStore = None  # type: ignore
+
+
+DAY_MS = 86_400_000
+START_MS = 1_700_006_400_000  # 2023-11-15 00:00:00 UTC
+
+
+class MarketDataStoreTest(unittest.TestCase):
+    """Round-trip ticks through the store and slice them by time range."""
+
+    def setUp(self) -> None:
+        """Create a store with a small stride so every query crosses index blocks."""
+        if MarketDataStore is None:
+            self.skipTest("numpy/pandas unavailable")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = MarketDataStore(root_dir = self.tmp_dir.name, index_stride = 8)
+
+    def tearDown(self) -> None:
+        """Drop the memory maps before removing the temporary directory."""
+        if MarketDataStore is not None:
+            self.store._memmaps.clear()
+            self.tmp_dir.cleanup()
+
+    def _frame(self, timestamps) -> "pd.DataFrame":
+        """Build a ticker-shaped DataFrame with fairPrice equal to the row number."""
+        return pd.DataFrame(
+            {
+                "symbol": "BTC_USDT",
+                "fairPrice": np.arange(len(timestamps), dtype = float),
+                "lastPrice": np.arange(len(timestamps), dtype = float) + 0.5,
+            },
+            index = pd.Index(timestamps, name = "timestamp"),
+        )
+
+    def test_read_returns_half_open_range(self) -> None:
+        """Records in [start, end) come back in order with the requested columns."""
+        timestamps = [START_MS + i * 1_000 for i in range(100)]
+        self.assertEqual(self.store.write("BTC_USDT", self._frame(timestamps)), 100)
+
+        result = self.store.read("BTC_USDT", START_MS + 10_000, START_MS + 42_000, columns = ["fairPrice"])
+
+        self.assertEqual(sorted(result), ["fairPrice", "timestamp"])
+        self.assertEqual(result["timestamp"][0], START_MS + 10_000)
+        self.assertEqual(result["timestamp"][-1], START_MS + 41_000)
+        np.testing.assert_array_equal(result["fairPrice"], np.arange(10, 42, dtype = float))
+
+    def test_read_spans_day_files(self) -> None:
+        """A range over midnight stitches the two day files together."""
+        timestamps = [START_MS + DAY_MS - 5_000 + i * 1_000 for i in range(10)]
+        self.store.write("BTC_USDT", self._frame(timestamps))
+
+        frame = self.store.read("BTC_USDT", START_MS, START_MS + 2 * DAY_MS, as_frame = True)
+
+        self.assertEqual(len(list(Path(self.tmp_dir.name, "BTC_USDT").glob("*.ticks"))), 2)
+        self.assertEqual(list(frame.index), timestamps)
+        self.assertTrue(np.isnan(frame["bid1"]).all())
+
+    def test_out_of_order_records_are_dropped(self) -> None:
+        """Appends older than the latest stored record are rejected to keep files sorted."""
+        self.store.write("BTC_USDT", self._frame([START_MS + 5_000, START_MS + 6_000]))
+        written = self.store.write("BTC_USDT", self._frame([START_MS + 1_000, START_MS + 7_000]))
+
+        self.assertEqual(written, 1)
+        self.assertEqual(self.store.time_range("BTC_USDT"), (START_MS + 5_000, START_MS + 7_000))
+
+    def test_catalog_survives_reopen(self) -> None:
+        """A new store instance reads what a previous instance wrote."""
+        timestamps = [START_MS + i * 1_000 for i in range(20)]
+        self.store.write("BTC_USDT", self._frame(timestamps))
+
+        reopened = MarketDataStore(root_dir = self.tmp_dir.name, index_stride = 8)
+        result = reopened.read("BTC_USDT", START_MS + 3_000, START_MS + 4_000)
+
+        self.assertEqual(list(result["timestamp"]), [START_MS + 3_000])
+        reopened._memmaps.clear()
+
+    def test_empty_range(self) -> None:
+        """Unknown symbols and empty ranges return empty arrays."""
+        result = self.store.read("ETH_USDT", START_MS, START_MS + 1_000)
+        self.assertEqual(result["timestamp"].shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
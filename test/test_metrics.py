@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sys
+import threading
+import urllib.request
+from pathlib import Path
+import unittest
+
+# NOTE: Exercises the metrics registry in-process and scrapes the HTTP endpoint
+# on a loopback port picked by the OS.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from telemetry.metrics import MetricsRegistry, MetricsServer  # type: ignore
+from interface.pipeline_interface import PipelineController, STALE_ITEMS  # type: ignore
+
+
+class _Item:
+    """Pipeline item with a fixed timestamp."""
+
+    def __init__(self, timestamp: int) -> None:
+        self.timestamp = timestamp
+
+
+class _ListPipeline:
+    """Pops the given items in order."""
+
+    def __init__(self, items) -> None:
+        self.items = list(items)
+
+    def pop(self, block: bool = True):
+        return self.items.pop(0)
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    """Shards are merged on read and rendered in the Prometheus text format."""
+
+    def test_counter_shards_are_merged(self) -> None:
+        """Increments from several threads all show up in the value."""
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "Events.", ("source",)).labels(source = "ws")
+
+        def work() -> None:
+            for _ in range(1_000):
+                counter.inc()
+
+        threads = [threading.Thread(target = work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(0.5)
+
+        self.assertEqual(counter.value, 4_000.5)
+        self.assertIn('events_total{source="ws"} 4000.5', registry.expose())
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Bucket bounds are inclusive and the +Inf bucket equals the count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_us", "Latency.", buckets = (10, 100)).labels()
+        for value in (5, 10, 50, 1_000):
+            histogram.observe(value)
+
+        lines = registry.expose().splitlines()
+
+        self.assertIn('latency_us_bucket{le="10"} 2', lines)
+        self.assertIn('latency_us_bucket{le="100"} 3', lines)
+        self.assertIn('latency_us_bucket{le="+Inf"} 4', lines)
+        self.assertIn("latency_us_sum 1065", lines)
+        self.assertIn("latency_us_count 4", lines)
+
+    def test_families_are_shared_by_name(self) -> None:
+        """Declaring a metric twice returns the same family, a conflicting declaration raises."""
+        registry = MetricsRegistry()
+        first = registry.counter("errors_total", "Errors.", ("status",))
+
+        self.assertIs(registry.counter("errors_total", "Errors.", ("status",)), first)
+        with self.assertRaises(ValueError):
+            registry.gauge("errors_total", "Errors.", ("status",))
+        with self.assertRaises(ValueError):
+            first.labels("429", "extra")
+
+    def test_gauge_function_is_sampled_on_scrape(self) -> None:
+        """Queue depths are read when the endpoint is scraped."""
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("queue_depth", "Depth.", ("queue",)).labels(queue = "signal").set_function(lambda: depth[0])
+        registry.add_collector(lambda: ["custom_metric 1"])
+        server = MetricsServer(registry = registry, port = 0).start()
+        self.addCleanup(server.stop)
+
+        depth[0] = 7
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout = 5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+
+        self.assertIn('queue_depth{queue="signal"} 7', body)
+        self.assertIn("custom_metric 1", body)
+        self.assertTrue(content_type.startswith("text/plain"))
+
+    def test_stale_items_are_counted(self) -> None:
+        """Items older than the validity window are dropped and counted per pipeline."""
+        now = PipelineController.generate_timestamp()
+        controller = PipelineController(pipeline = _ListPipeline([_Item(now - 60_000), _Item(now)]))
+        stale = STALE_ITEMS.labels(pipeline = "_ListPipeline")
+        before = stale.value
+
+        self.assertIsNone(controller.pop())
+        self.assertIsNotNone(controller.pop())
+        self.assertEqual(stale.value - before, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: Runs the mock exchange REST server on a loopback port and drives it with
+# the real Binance and MEXC SDKs, so the signed order path is covered offline.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from simulation.mock_exchange_rest import MockApiError, MockExchangeRestServer, SimulatedAccount  # type: ignore
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from mexc.future import FutureMarket as MexcFutureMarket  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests)
+    BinanceFutureMarket = None  # type: ignore
+
+
+class SimulatedAccountTest(unittest.TestCase):
+    """Fills, conditional orders and the balance follow the mark price."""
+
+    def test_stop_loss_closes_the_position(self) -> None:
+        """The stop fires when the mark crosses it, the take profit of the same position then expires."""
+        account = SimulatedAccount(balance = 1_000.0, taker_fee = 0.0, mark_prices = {"BTCUSDT": 100.0})
+        account.place_order("BTCUSDT", "BUY", quantity = 2.0)
+        stop = account.place_order("BTCUSDT", "SELL", "STOP_MARKET", stop_price = 95.0, close_position = True)
+        take = account.place_order("BTCUSDT", "SELL", "TAKE_PROFIT_MARKET", stop_price = 110.0, close_position = True)
+
+        self.assertEqual(account.set_mark_price("BTCUSDT", 96.0), [])
+        self.assertEqual([order["orderId"] for order in account.set_mark_price("BTCUSDT", 94.0)], [stop["orderId"]])
+        self.assertEqual(account.position("BTCUSDT"), (0.0, 0.0))
+        self.assertEqual(account.wallet_balance, 1_000.0 - 2 * 6.0)
+
+        account.set_mark_price("BTCUSDT", 111.0)
+        self.assertEqual(take["status"], "EXPIRED")
+
+    def test_conditional_order_which_would_trigger_is_rejected(self) -> None:
+        """A take profit below the mark of a long is refused like Binance does."""
+        account = SimulatedAccount(mark_prices = {"BTCUSDT": 100.0})
+        with self.assertRaises(MockApiError) as context:
+            account.place_order("BTCUSDT", "SELL", "TAKE_PROFIT_MARKET", stop_price = 90.0, close_position = True)
+        self.assertEqual(context.exception.code, -2021)
+
+
+class MockExchangeRestServerTest(unittest.TestCase):
+    """The SDKs talk to the mock like they talk to the exchanges."""
+
+    def setUp(self) -> None:
+        if BinanceFutureMarket is None:
+            self.skipTest("requests unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+
+    def test_binance_order_path(self) -> None:
+        """order() sets the leverage, opens the position and places both exits."""
+        self.assertEqual(self.binance.mark_price(symbol = "BTCUSDT")["indexPrice"], "60000.0")
+
+        self.binance.order(sl_price = 57_000.0, tp_price = 66_000.0, leverage = 5, symbol_curr_quantity = 0.01, side = "BUY")
+
+        positions = self.binance.get_position_information_v2()
+        self.assertEqual((positions[0]["positionAmt"], positions[0]["leverage"]), ("0.01", "5"))
+        self.assertEqual(sorted(order["type"] for order in self.server.binance.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        balance = self.binance.future_account_balance_v2()[0]
+        self.assertAlmostEqual(float(balance["availableBalance"]), 10_000.0 - 0.01 * 60_000 * (0.0004 + 1 / 5))
+
+        self.server.binance.set_mark_price("BTCUSDT", 66_500.0)
+        self.assertEqual(self.binance.get_position_information_v2()[0]["positionAmt"], "0.0")
+
+    def test_bad_signature_and_rate_limit_are_rejected(self) -> None:
+        """A wrong secret gets -1022 and requests above the limit get 429 / 510."""
+        forged = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "wrong")
+        self.assertIsNone(forged.future_account_balance_v2())
+        self.assertEqual(self.server.requests["GET /fapi/v2/balance"], 1)
+
+        self.server.rate_limit, self.server.burst, self.server.tokens = 1.0, 1.0, 1.0
+        self.assertIsNotNone(self.binance.server_time())
+        self.assertIsNone(self.binance.server_time())
+
+        mexc = MexcFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        self.assertIsNone(mexc.ping())
+
+    def test_mexc_signed_order_and_latency(self) -> None:
+        """The MEXC signature is checked, the order opens a position and the injected latency is paid."""
+        mexc = MexcFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        response = mexc.place_order(symbol = "BTC_USDT", price = 60_000.0, vol = 10, leverage = 10, side = 1, type = 5, openType = 2, stopLossPrice = 59_000.0)
+
+        self.assertTrue(response["success"])
+        self.assertEqual(mexc.current_position()["data"][0]["holdVol"], 10)
+        self.assertEqual(mexc.assets()["data"][0]["currency"], "USDT")
+
+        self.server.latency_ms = 50.0
+        started = time.perf_counter()
+        mexc.ping()
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
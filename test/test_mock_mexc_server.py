@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: Runs the mock MEXC websocket server on a loopback port and talks to it
+# with websocket-client, so the protocol and the synthetic feed are covered offline.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from simulation.market_feed import (  # type: ignore
+    FeedRecorder,
+    GeometricBrownianMotion,
+    JumpDiffusion,
+    ReplayPrices,
+    SyntheticFeed,
+)
+
+try:
+    import websocket  # type: ignore
+    from simulation.mock_mexc_server import MockMexcWebSocketServer  # type: ignore
+    from mexc.future import FutureWebSocket  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (websocket-client)
+    websocket = None  # type: ignore
+
+
+class SyntheticFeedTest(unittest.TestCase):
+    """Price processes are reproducible and the pushes carry what the collector reads."""
+
+    def test_processes_are_seeded(self) -> None:
+        """The same seed gives the same path, jumps arrive at the given intensity."""
+        first = [GeometricBrownianMotion(seed = 3).step(1.0) for _ in range(3)]
+        second = [GeometricBrownianMotion(seed = 3).step(1.0) for _ in range(3)]
+        self.assertEqual(first, second)
+
+        process = JumpDiffusion(volatility = 0.0, jump_intensity = 10.0, jump_std = 0.01, seed = 5)
+        for _ in range(1_000):
+            process.step(0.01)
+        self.assertAlmostEqual(process.jumps, 1_000 * (1 - 2.718281828 ** -0.1), delta = 40)
+
+    def test_ticker_matches_the_collector_schema(self) -> None:
+        """fairPrice and timestamp are present and the book is not crossed."""
+        feed = SyntheticFeed(GeometricBrownianMotion(price = 100.0, volatility = 0.0), symbol = "ETH_USDT", tick_size = 0.01)
+        message = feed.message("push.ticker", timestamp = 1_000)
+        data = message["data"]
+
+        self.assertEqual((message["channel"], message["symbol"], data["timestamp"]), ("push.ticker", "ETH_USDT", 1_000))
+        self.assertEqual(data["fairPrice"], 100.0)
+        self.assertLess(data["bid1"], data["ask1"])
+
+        depth = feed.message("push.depth", timestamp = 1_001)["data"]
+        self.assertEqual(len(depth["asks"]), 20)
+        self.assertLess(depth["bids"][0][0], depth["asks"][0][0])
+
+    def test_recorded_feed_is_replayed(self) -> None:
+        """Messages written by FeedRecorder replay their prices in order."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "feed.jsonl")
+            recorder = FeedRecorder(path)
+            recorder({"channel": "push.ticker", "data": {"fairPrice": 1.5}, "_trace": object()})
+            recorder({"channel": "push.deal", "data": {"p": 2.5}})
+            recorder({"channel": "pong", "data": 0})
+            recorder.close()
+
+            replay = ReplayPrices.from_jsonl(path, loop = False)
+
+        self.assertEqual([replay.step(1.0) for _ in range(3)], [1.5, 2.5, 2.5])
+
+
+class MockMexcWebSocketServerTest(unittest.TestCase):
+    """The server answers like the MEXC contract endpoint."""
+
+    def setUp(self) -> None:
+        if websocket is None:
+            self.skipTest("websocket-client unavailable")
+        self.server = MockMexcWebSocketServer(rate = 200.0, api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.client = websocket.create_connection(self.server.endpoint, timeout = 5)
+        self.addCleanup(self.client.close)
+
+    def request(self, payload: dict) -> dict:
+        self.client.send(json.dumps(payload))
+        return json.loads(self.client.recv())
+
+    def test_login_checks_the_signature(self) -> None:
+        """Only the HMAC of apiKey + reqTime with the secret key logs in."""
+        signature = hmac.new(b"secret", b"key1700000000000", hashlib.sha256).hexdigest()
+        accepted = self.request({"method": "login", "param": {"apiKey": "key", "reqTime": "1700000000000", "signature": signature}})
+        rejected = self.request({"method": "login", "param": {"apiKey": "key", "reqTime": "1700000000001", "signature": signature}})
+
+        self.assertEqual((accepted["channel"], accepted["data"]), ("rs.login", "success"))
+        self.assertNotEqual(rejected["data"], "success")
+
+    def test_subscription_acks_pushes_and_pong(self) -> None:
+        """sub.* is acked, pushes follow, ping is answered and unknown topics are errors."""
+        ack = self.request({"method": "sub.deal", "param": {"symbol": "BTC_USDT"}})
+        push = json.loads(self.client.recv())
+
+        self.assertEqual((ack["channel"], ack["data"]), ("rs.sub.deal", "success"))
+        self.assertEqual((push["channel"], push["symbol"]), ("push.deal", "BTC_USDT"))
+        self.assertIn(push["data"]["T"], (1, 2))
+
+        self.request({"method": "unsub.deal", "param": {"symbol": "BTC_USDT"}})
+        self.client.send(json.dumps({"method": "ping"}))
+        self.client.send(json.dumps({"method": "sub.unknown"}))
+        channels = set()
+        while not {"pong", "rs.error"} <= channels:
+            channels.add(json.loads(self.client.recv())["channel"])
+
+    def test_future_websocket_receives_tickers(self) -> None:
+        """The SDK's MEXC websocket subscribes through the mock and gets ticker callbacks."""
+        received = threading.Event()
+        messages = []
+
+        def on_ticker(message: dict) -> None:
+            messages.append(message)
+            received.set()
+
+        sdk = FutureWebSocket(endpoint = self.server.endpoint)
+        self.addCleanup(lambda: sdk.ws.close())
+        sdk.ticker(callback = on_ticker)
+
+        self.assertTrue(received.wait(timeout = 5))
+        self.assertEqual(messages[0]["channel"], "push.ticker")
+        self.assertIn("fairPrice", messages[0]["data"])
+
+    def test_rate_change_does_not_catch_up(self) -> None:
+        """Pausing the feed and resuming it restarts the schedule instead of flushing the missed ticks."""
+        self.request({"method": "sub.ticker", "param": {"symbol": "BTC_USDT"}})
+        self.server.rate = 0.0
+        time.sleep(0.2)
+        paused = self.server.messages_sent
+        time.sleep(0.3)
+        self.assertEqual(self.server.messages_sent, paused)
+
+        self.server.rate = 20.0
+        time.sleep(0.5)
+        self.assertLessEqual(self.server.messages_sent - paused, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: Uses a stub bot whose send_text() is slow on purpose, notify() must not
+# wait for it, and what piles up meanwhile must go out batched and coalesced.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from custom_telegram.notification_service import NotificationService, Priority  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (telegram)
+    NotificationService = None  # type: ignore
+
+
+class _SlowBot:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.messages = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.messages.append(message)
+
+
+class NotificationServiceTest(unittest.TestCase):
+    """The callers only enqueue, the loop batches, coalesces and sheds the low priority."""
+
+    def setUp(self) -> None:
+        if NotificationService is None:
+            self.skipTest("telegram unavailable")
+
+    def start(self, bot: _SlowBot, **kwargs) -> NotificationService:
+        service = NotificationService(bot = bot, min_interval = 0.0, **kwargs).start()
+        self.addCleanup(service.stop)
+        return service
+
+    def test_burst_is_batched_behind_a_slow_send(self) -> None:
+        """notify() returns at once, and the messages queued during a send go out together."""
+        bot = _SlowBot(delay = 0.2)
+        service = self.start(bot)
+
+        started = time.perf_counter()
+        for index in range(5):
+            self.assertTrue(service.notify(f"order {index}"))
+            time.sleep(0.01)
+        self.assertLess(time.perf_counter() - started, 0.15)
+
+        self.assertTrue(service.flush())
+        self.assertEqual(bot.messages, ["order 0", "order 1\n\norder 2\n\norder 3\n\norder 4"])
+
+    def test_low_priority_waits_for_the_digest_and_is_coalesced(self) -> None:
+        """LOW messages are held until the digest, and those of a key are merged into the latest."""
+        bot = _SlowBot()
+        service = self.start(bot, digest_interval = 60.0)
+        for price in (1, 2, 3):
+            service.notify(f"golden cross at {price}", priority = Priority.LOW, key = "golden_cross")
+        service.notify("death cross", priority = Priority.LOW, key = "death_cross")
+        time.sleep(0.05)
+        self.assertEqual((bot.messages, service.qsize()), ([], 2))
+
+        self.assertTrue(service.flush())
+        self.assertEqual(bot.messages, ["[x3] golden cross at 3\n\ndeath cross"])
+
+    def test_overload_drops_low_priority_first(self) -> None:
+        """A full queue makes room for HIGH messages by dropping LOW ones, then refuses."""
+        bot = _SlowBot(delay = 0.2)
+        service = self.start(bot, max_pending = 2)
+        service.notify("in flight")
+        time.sleep(0.05)  # taken by the loop, the queue is empty again
+
+        self.assertTrue(service.notify("signal", priority = Priority.LOW))
+        self.assertTrue(service.notify("order 1"))
+        self.assertTrue(service.notify("order 2"))  # drops "signal"
+        self.assertFalse(service.notify("order 3"))
+        self.assertFalse(service.notify("signal", priority = Priority.LOW))
+
+        self.assertTrue(service.flush())
+        self.assertEqual(bot.messages, ["in flight", "order 1\n\norder 2"])
+
+    def test_pack_respects_the_length_limit(self) -> None:
+        """Messages are joined up to the limit, a longer one is truncated."""
+        self.assertEqual(NotificationService.pack(["aaaa", "bbbb", "cc"], max_length = 10), [("aaaa\n\nbbbb", 2), ("cc", 1)])
+        self.assertEqual(NotificationService.pack(["a" * 12], max_length = 10), [("aaaaaaa...", 1)])
+
+    def test_without_a_bot_nothing_is_queued(self) -> None:
+        """A service without a bot never starts and notify() refuses."""
+        service = NotificationService(bot = None).start()
+        self.assertFalse(service.notify("order"))
+        self.assertTrue(service.flush())
+
+
+if __name__ == "__main__":
+    unittest.main()
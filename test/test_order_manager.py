@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Sends the orders to the mock exchange REST server, whose responses can be
+# lost on purpose, to check that a retry never fills an order twice.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from manager.order_manager import OrderManager, OrderState  # type: ignore
+    from simulation.mock_exchange_rest import MockExchangeRestServer  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests)
+    OrderManager = None  # type: ignore
+
+
+class OrderManagerTest(unittest.TestCase):
+    """Orders move through their states from the REST responses and the user data events."""
+
+    def setUp(self) -> None:
+        if OrderManager is None:
+            self.skipTest("requests unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        self.orders = OrderManager(binance = self.binance)
+
+    def event(self, order, status: str, filled: str = "0", time: int = 0) -> dict:
+        return {"data": {"e": "ORDER_TRADE_UPDATE", "E": time, "o": {
+            "s": order.symbol, "c": order.client_order_id, "S": order.side, "o": order.type,
+            "X": status, "i": order.order_id, "z": filled, "ap": "60000", "T": time,
+        }}}
+
+    def test_lifecycle_and_lookups(self) -> None:
+        """The ACK is NEW, the stream fills it, and a late NEW does not move it back."""
+        entry = self.orders.submit(side = "BUY", role = "entry", quantity = 0.002)
+        stop = self.orders.submit(
+            side = "SELL", type = "STOP_MARKET", role = "sl", parent = entry.client_order_id,
+            stop_price = 50_000.0, close_position = "true",
+        )
+        self.assertEqual((entry.state, stop.state), (OrderState.NEW, OrderState.NEW))
+        self.assertTrue(entry.client_order_id.startswith("act-"))
+
+        self.orders.on_user_data(self.event(entry, "FILLED", filled = "0.002", time = entry.updated + 1))
+        self.orders.on_user_data(self.event(entry, "NEW", time = entry.updated + 2))
+        self.assertEqual((entry.state, entry.executed_qty, entry.avg_price), (OrderState.FILLED, 0.002, 60_000.0))
+
+        self.assertIs(self.orders.get_by_order_id(stop.order_id), stop)
+        self.assertEqual(self.orders.by_symbol("BTCUSDT"), [entry, stop])
+        self.assertEqual(self.orders.by_state(OrderState.FILLED), [entry])
+        self.assertEqual(self.orders.open_orders("BTCUSDT"), [stop])
+        self.assertEqual(self.orders.legs(entry.client_order_id), [stop])
+
+        self.assertIs(self.orders.cancel(stop.client_order_id), stop)
+        self.assertEqual(stop.state, OrderState.CANCELED)
+        self.assertEqual(self.orders.open_orders(), [])
+
+    def test_lost_response_is_not_sent_again(self) -> None:
+        """An order executed behind a lost response is found by its client id, not sent twice."""
+        self.server.lose_responses("POST /fapi/v1/order", executed = True)
+        order = self.orders.submit(side = "BUY", quantity = 0.002)
+
+        self.assertEqual((order.state, order.attempts), (OrderState.FILLED, 1))
+        self.assertEqual(self.server.requests["POST /fapi/v1/order"], 1)
+        self.assertAlmostEqual(self.server.binance.position("BTCUSDT")[0], 0.002)
+
+    def test_lost_request_is_not_sent_again(self) -> None:
+        """An order the exchange does not have yet is left UNKNOWN, it may still land, and is settled by reconcile()."""
+        self.server.lose_responses("POST /fapi/v1/order", executed = False)
+        order = self.orders.submit(side = "BUY", quantity = 0.002)
+
+        self.assertEqual((order.state, order.attempts), (OrderState.UNKNOWN, 1))
+        self.assertEqual(self.server.requests["POST /fapi/v1/order"], 1)
+        self.assertEqual(self.orders.reconcile(), 1)
+        self.assertEqual(order.state, OrderState.REJECTED)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.0)
+
+    def test_rejection_and_unknown_outcome(self) -> None:
+        """A rejected order is not retried, an order nobody can account for stays UNKNOWN until reconciled."""
+        rejected = self.orders.submit(side = "BUY", quantity = 0.0021)  # off the step size
+        self.assertEqual((rejected.state, rejected.attempts), (OrderState.REJECTED, 1))
+
+        self.server.lose_responses("POST /fapi/v1/order", executed = False)
+        self.server.lose_responses("GET /fapi/v1/order", executed = False)
+        unknown = self.orders.submit(side = "BUY", quantity = 0.002)
+        self.assertEqual(unknown.state, OrderState.UNKNOWN)
+
+        self.assertEqual(self.orders.reconcile(), 1)
+        self.assertEqual(unknown.state, OrderState.REJECTED)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: The paper market answers in-process, the live streams are replaced by
+# hand-made mark price and book ticker messages.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from interface.pipeline_interface import PipelineController  # type: ignore
+    from manager.symbol_metadata import SymbolMetadataCache  # type: ignore
+    from manager.trade_manager import TradeManager  # type: ignore
+    from object.score_mapping import ScoreMapper  # type: ignore
+    from pipeline.signal_pipeline import SignalPipeline  # type: ignore
+    from simulation.paper_trading import PaperFutureMarket  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests, telegram)
+    PaperFutureMarket = None  # type: ignore
+
+
+class _StubTelegramBot:
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        pass
+
+
+class PaperFutureMarketTest(unittest.TestCase):
+    """Orders are filled in memory at the live quotes, with the latency and the slippage asked for."""
+
+    def setUp(self) -> None:
+        if PaperFutureMarket is None:
+            self.skipTest("requests unavailable")
+
+    def test_fills_at_the_book_ticker_and_stops_on_the_mark_price(self) -> None:
+        """A BUY pays the ask plus slippage, the STOP_MARKET closes at the mark price, PnL and fees add up."""
+        paper = PaperFutureMarket(slippage_bps = 1.0, taker_fee = 0.0)
+        self.assertIsNone(paper.new_order(side = "BUY", quantity = 0.002))  # no price yet
+        self.assertEqual(paper.last_error, (400, -1121))
+
+        paper.on_book_ticker({"data": {"e": "bookTicker", "s": "BTCUSDT", "b": "59999.0", "a": "60001.0"}})
+        order = paper.new_order(side = "BUY", quantity = 0.002, new_order_resp_type = "RESULT")
+        self.assertAlmostEqual(float(order["avgPrice"]), 60_001.0 * 1.0001)
+        paper.new_order(side = "SELL", type = "STOP_MARKET", stop_price = 59_000.0, close_position = "true")
+
+        paper.on_mark_price({"data": {"e": "markPriceUpdate", "s": "BTCUSDT", "p": "58900.0", "i": "58900.0"}})
+        self.assertEqual(paper.get_position_information_v2()[0]["positionAmt"], "0.0")
+        summary = paper.summary()
+        self.assertEqual(summary["fills"], 2)
+        self.assertAlmostEqual(summary["realized_pnl"], 0.002 * (59_999.0 * 0.9999 - 60_001.0 * 1.0001))
+        self.assertAlmostEqual(summary["equity"], 10_000.0 + summary["realized_pnl"])
+
+    def test_requests_wait_for_the_latency(self) -> None:
+        """Every request takes at least latency_ms, as the round trip would."""
+        paper = PaperFutureMarket(mark_prices = {"BTCUSDT": 60_000.0}, latency_ms = 50.0)
+        started = time.perf_counter()
+        self.assertIsNotNone(paper.new_order(side = "BUY", quantity = 0.002))
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+    def test_trade_manager_runs_on_the_paper_market(self) -> None:
+        """The TradeManager opens a position with its exits without any order leaving the process."""
+        paper = PaperFutureMarket(mark_prices = {"BTCUSDT": 60_000.0})
+        metadata = SymbolMetadataCache(binance = paper)
+        metadata.put(SymbolMetadataCache.parse_binance_exchange_info(paper.exchange_info()))
+        manager = TradeManager(
+            signal_pipeline_controller = PipelineController(pipeline = SignalPipeline()),
+            mexc_future = None,
+            binanace_future = paper,
+            delta_mapper = ScoreMapper(),
+            telegram_bot = _StubTelegramBot(),
+            symbol_metadata = metadata,
+            arm_fraction = None,
+        )
+        self.addCleanup(manager.notifier.stop)
+
+        asyncio.run(manager._TradeManager__execute_trade(-1))
+        self.assertLess(paper.account.position("BTCUSDT")[0], 0)
+        self.assertEqual(sorted(order["type"] for order in paper.account.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        self.assertEqual(paper.exchange.requests["POST /fapi/v1/order"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# NOTE: The local stops close the positions of the mock exchange REST server,
+# the ticks are fed by hand, and by the mark price callback of the TradeManager.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from interface.pipeline_interface import PipelineController  # type: ignore
+    from manager.order_manager import ManagedOrder, OrderManager, OrderState  # type: ignore
+    from manager.protective_orders import ProtectiveOrderEngine  # type: ignore
+    from manager.symbol_metadata import SymbolMetadataCache  # type: ignore
+    from manager.trade_manager import TradeManager  # type: ignore
+    from object.score_mapping import ScoreMapper  # type: ignore
+    from pipeline.signal_pipeline import SignalPipeline  # type: ignore
+    from simulation.mock_exchange_rest import MockExchangeRestServer  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests, telegram)
+    ProtectiveOrderEngine = None  # type: ignore
+
+
+class _StubTelegramBot:
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        pass
+
+
+class ProtectiveOrderEngineTest(unittest.TestCase):
+    """A crossed stop closes the position once, takes its siblings out and cancels the backstop."""
+
+    def setUp(self) -> None:
+        if ProtectiveOrderEngine is None:
+            self.skipTest("requests unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        self.orders = OrderManager(binance = self.binance)
+        self.engine = ProtectiveOrderEngine(orders = self.orders, max_retries = 2, retry_delay = 0.05)
+        self.addCleanup(self.engine.stop)
+
+    def open(self, side: str, backstop_price: float):
+        entry = self.orders.submit(side = side, role = "entry", quantity = 0.002)
+        backstop = self.orders.submit(
+            side = "SELL" if side == "BUY" else "BUY", type = "STOP_MARKET", role = "backstop",
+            parent = entry.client_order_id, stop_price = backstop_price, close_position = "true",
+        )
+        return entry, backstop
+
+    def test_take_profit_closes_the_position(self) -> None:
+        """The TP fires at its price, the SL is gone with it and the backstop is cancelled."""
+        entry, backstop = self.open("BUY", backstop_price = 58_000.0)
+        sl, tp = self.engine.protect(
+            "BTCUSDT", side = 1, quantity = 0.002, sl_price = 59_000.0, tp_price = 61_000.0,
+            parent = entry.client_order_id, backstop = backstop.client_order_id,
+        )
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 60_500.0), [])
+        self.assertEqual(self.engine.on_tick("ETHUSDT", 61_000.0), [])
+
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 61_000.0), [tp])
+        order = tp.future.result(timeout = 5)
+        self.assertEqual((order.side, order.type, order.role, order.parent), ("SELL", "MARKET", "virtual_tp", entry.client_order_id))
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.0)
+        self.assertEqual(backstop.state, OrderState.CANCELED)
+
+        self.assertFalse(sl.active)
+        self.assertEqual(self.engine.stops("BTCUSDT"), [])
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 58_500.0), [])
+
+    def test_trailing_stop_follows_the_price(self) -> None:
+        """The SL of a short moves down with the price, never up, and fires on the rebound."""
+        entry, _ = self.open("SELL", backstop_price = 62_000.0)
+        sl, = self.engine.protect("BTCUSDT", side = -1, quantity = 0.002, sl_price = 61_000.0, trail = 0.01, parent = entry.client_order_id)
+
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 59_000.0), [])
+        self.assertAlmostEqual(sl.trigger, 59_590.0)
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 59_500.0), [])
+        self.assertAlmostEqual(sl.trigger, 59_590.0)
+
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 59_600.0), [sl])
+        self.assertEqual(sl.future.result(timeout = 5).side, "BUY")
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.0)
+
+    def test_only_the_crossed_stops_fire(self) -> None:
+        """A tick takes the stops it crosses, on both sides of the book, and leaves the others."""
+        stops = [
+            self.engine.protect("BTCUSDT", side = side, quantity = 0.001, sl_price = price)[0]
+            for side, price in ((1, 59_000.0), (1, 59_500.0), (-1, 60_500.0), (-1, 61_000.0))
+        ]
+        self.server.binance.place_order("BTCUSDT", "BUY", quantity = 0.002)
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 59_500.0), [stops[1]])
+        self.assertEqual(self.engine.stops("BTCUSDT"), [stops[0], stops[2], stops[3]])
+
+        self.assertEqual(self.engine.cancel("missing"), 0)
+        stops[1].future.result(timeout = 5)
+
+    def protect(self):
+        entry, backstop = self.open("BUY", backstop_price = 58_000.0)
+        sl, tp = self.engine.protect(
+            "BTCUSDT", side = 1, quantity = 0.002, sl_price = 59_000.0, tp_price = 61_000.0,
+            parent = entry.client_order_id, backstop = backstop.client_order_id,
+        )
+        rejected = ManagedOrder("rejected", "BTCUSDT", "SELL", "MARKET", quantity = 0.002, role = "virtual_sl")
+        rejected.state = OrderState.REJECTED
+        return entry, backstop, sl, tp, rejected
+
+    def tick_until(self, stop, seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.engine.on_tick("BTCUSDT", 58_900.0)
+            if stop.future is not None:
+                stop.future.result(timeout = 5)
+            time.sleep(0.01)
+
+    def test_rejected_close_keeps_the_backstop(self) -> None:
+        """A rejected closing order leaves the backstop alone and puts the stops back in the book after the delay."""
+        entry, backstop, sl, tp, rejected = self.protect()
+        with mock.patch.object(self.orders, "submit", return_value = rejected), mock.patch.object(self.orders, "cancel") as cancel:
+            self.assertEqual(self.engine.on_tick("BTCUSDT", 58_900.0), [sl])
+            self.assertIs(sl.future.result(timeout = 5), rejected)
+            self.assertEqual(self.engine.on_tick("BTCUSDT", 58_900.0), [])  # not before the delay
+            time.sleep(0.2)
+        cancel.assert_not_called()
+        self.assertEqual(backstop.state, OrderState.NEW)
+
+        self.assertTrue(sl.active and tp.active)
+        self.assertEqual(self.engine.stops("BTCUSDT"), [sl, tp])
+        self.assertEqual(self.engine.on_tick("BTCUSDT", 58_900.0), [sl])
+        sl.future.result(timeout = 5)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.0)
+        self.assertEqual(backstop.state, OrderState.CANCELED)
+
+    def test_failed_closes_are_bounded(self) -> None:
+        """Ticks past the trigger send no more than max_retries + 1 closing orders, then the backstop is in charge."""
+        entry, backstop, sl, tp, rejected = self.protect()
+        with mock.patch.object(self.orders, "submit", return_value = rejected) as submit, mock.patch.object(self.orders, "cancel") as cancel:
+            self.tick_until(sl, 0.6)
+        self.assertEqual(submit.call_count, 3)
+        cancel.assert_not_called()
+        self.assertEqual(self.engine.stops("BTCUSDT"), [])
+        self.assertEqual(self.engine.cancel(entry.client_order_id), 0)
+        self.assertEqual(backstop.state, OrderState.NEW)
+
+    def test_position_gone_or_cancelled_is_not_rearmed(self) -> None:
+        """A reduce-only rejection drops the stops at once, so does a position cancelled before the retry."""
+        entry, backstop, sl, tp, rejected = self.protect()
+        rejected.error = -2022
+        with mock.patch.object(self.orders, "submit", return_value = rejected) as submit:
+            self.tick_until(sl, 0.3)
+        self.assertEqual(submit.call_count, 1)
+        self.assertEqual(self.engine.stops("BTCUSDT"), [])
+
+        entry, backstop, sl, tp, rejected = self.protect()
+        with mock.patch.object(self.orders, "submit", return_value = rejected) as submit:
+            self.assertEqual(self.engine.on_tick("BTCUSDT", 58_900.0), [sl])
+            sl.future.result(timeout = 5)
+            self.assertEqual(self.engine.cancel(entry.client_order_id), 0)  # e.g., the backstop has filled
+            self.tick_until(sl, 0.3)
+        self.assertEqual(submit.call_count, 1)
+        self.assertFalse(sl.active or tp.active)
+        self.assertEqual(self.engine.stops("BTCUSDT"), [])
+
+
+class _MarkPriceWebSocket:
+    """Takes the mark price subscription of the TradeManager, without a user data stream."""
+
+    def add_connection_listener(self, listener) -> None:
+        pass
+
+    def mark_price(self, callback, symbol) -> None:
+        self.callback = callback
+
+    def user_data(self, callback) -> None:
+        return None
+
+    def is_connected(self) -> bool:
+        return True
+
+
+class TradeManagerProtectiveOrderTest(unittest.TestCase):
+    """With the engine, the trade sends the entry and a wide backstop, the mark price closes it."""
+
+    def setUp(self) -> None:
+        if ProtectiveOrderEngine is None:
+            self.skipTest("trade manager dependencies unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        metadata = SymbolMetadataCache(binance = binance)
+        metadata.put(SymbolMetadataCache.parse_binance_exchange_info(binance.exchange_info()))
+        orders = OrderManager(binance = binance)
+        self.engine = ProtectiveOrderEngine(orders = orders)
+        self.addCleanup(self.engine.stop)
+        self.binance_ws = _MarkPriceWebSocket()
+        self.manager = self.trade_manager(
+            binanace_future = binance, symbol_metadata = metadata, order_manager = orders,
+            protective_orders = self.engine, binance_ws = self.binance_ws,
+        )
+
+    def trade_manager(self, **kwargs):
+        manager = TradeManager(
+            signal_pipeline_controller = PipelineController(pipeline = SignalPipeline()),
+            mexc_future = None,
+            delta_mapper = ScoreMapper(),
+            telegram_bot = _StubTelegramBot(),
+            arm_fraction = None,
+            **kwargs,
+        )
+        self.addCleanup(manager.notifier.stop)
+        return manager
+
+    def test_local_stops_need_the_mark_price_stream(self) -> None:
+        """Without binance_ws nothing would trigger the local stops, so the engine alone is refused."""
+        with self.assertRaises(ValueError):
+            self.trade_manager(binanace_future = self.manager.binance_future_market, protective_orders = self.engine)
+
+    def test_trailing_stop_needs_the_local_stops(self) -> None:
+        """Only the local SL trails the price, so a trailing_stop without the engine is refused."""
+        with self.assertRaises(ValueError):
+            self.trade_manager(binanace_future = self.manager.binance_future_market, binance_ws = self.binance_ws, trailing_stop = 0.005)
+
+    def test_stop_loss_on_the_mark_price(self) -> None:
+        """The SL and the TP stay local, the backstop is twice as far as the SL, and a mark price below the SL closes."""
+        self.manager.arm(1)
+        asyncio.run(self.manager._TradeManager__execute_trade(1))
+
+        self.assertEqual([order["stopPrice"] for order in self.server.binance.open_orders()], ["59400.0"])
+        sl, tp = self.engine.stops("BTCUSDT")
+        self.assertEqual((sl.kind, sl.trigger, tp.kind, tp.trigger), ("sl", 59_700.0, "tp", 60_900.0))
+
+        self.binance_ws.callback({"data": {"e": "markPriceUpdate", "E": 1, "s": "BTCUSDT", "p": "59650.0", "i": "59650.0"}})
+        sl.future.result(timeout = 5)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.0)
+        self.assertEqual(self.server.binance.open_orders(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
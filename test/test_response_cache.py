@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: Drives the response cache with a fake clock and blocking fetches, then
+# checks that the SDK reads of the public endpoints reach the mock exchange once.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from sdk.response_cache import ResponseCache  # type: ignore
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from simulation.mock_exchange_rest import MockExchangeRestServer  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests)
+    BinanceFutureMarket = None  # type: ignore
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """Fresh responses are hits, stale ones are revalidated in the background, misses are coalesced."""
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache = ResponseCache(name = "test", clock = lambda: self.now)
+        self.fetches = 0
+
+    def fetch(self) -> dict:
+        self.fetches += 1
+        return {"fetch": self.fetches}
+
+    def test_ttl_and_stale_while_revalidate(self) -> None:
+        """Within the ttl the cached response comes back, past it the old one is served while one refresh runs."""
+        self.assertEqual(self.cache.get("key", self.fetch, ttl = 1.0, stale = 1.0), {"fetch": 1})
+        self.now = 0.5
+        self.assertEqual(self.cache.get("key", self.fetch, ttl = 1.0, stale = 1.0), {"fetch": 1})
+
+        self.now = 1.5
+        self.assertEqual(self.cache.get("key", self.fetch, ttl = 1.0, stale = 1.0), {"fetch": 1})
+        deadline = time.monotonic() + 5
+        while self.cache.get("key", self.fetch, ttl = 1.0, stale = 1.0) != {"fetch": 2} and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.fetches, 2)
+
+        self.now = 10.0
+        self.assertEqual(self.cache.get("key", self.fetch, ttl = 1.0, stale = 1.0), {"fetch": 3})
+        self.assertEqual(self.cache.stats["miss"], 2)
+        self.assertGreaterEqual(self.cache.stats["stale"], 1)
+
+    def test_concurrent_misses_share_one_fetch(self) -> None:
+        """Callers arriving while a fetch is in flight wait for it, even without a ttl."""
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch() -> dict:
+            started.set()
+            release.wait(5)
+            return self.fetch()
+
+        results = []
+        first = threading.Thread(target = lambda: results.append(self.cache.get("key", slow_fetch)))
+        first.start()
+        self.assertTrue(started.wait(5))
+        followers = [threading.Thread(target = lambda: results.append(self.cache.get("key", slow_fetch))) for _ in range(4)]
+        for thread in followers:
+            thread.start()
+        while self.cache.stats["coalesced"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in [first] + followers:
+            thread.join(5)
+
+        self.assertEqual(results, [{"fetch": 1}] * 5)
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(self.cache.get("key", self.fetch), {"fetch": 2})
+
+    def test_failures_are_not_cached(self) -> None:
+        """A None response or an exception reaches the caller and the next read fetches again."""
+        self.assertIsNone(self.cache.get("key", lambda: None, ttl = 60.0))
+        with self.assertRaises(RuntimeError):
+            self.cache.get("key", lambda: (_ for _ in ()).throw(RuntimeError("down")), ttl = 60.0)
+        self.assertEqual(self.cache.get("key", self.fetch, ttl = 60.0), {"fetch": 1})
+
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get("key", self.fetch, ttl = 60.0), {"fetch": 2})
+
+
+class CachedEndpointTest(unittest.TestCase):
+    """The public reads of the SDKs go through the cache with their own ttl."""
+
+    def setUp(self) -> None:
+        if BinanceFutureMarket is None:
+            self.skipTest("requests unavailable")
+        self.server = MockExchangeRestServer().start()
+        self.addCleanup(self.server.stop)
+        self.binance = BinanceFutureMarket(base_url = self.server.base_url)
+
+    def test_mark_price_is_fetched_once_per_ttl(self) -> None:
+        """Repeated reads within the ttl do not reach the exchange, another symbol or an expired entry does."""
+        self.binance.cache_ttl["mark_price"] = (60.0, 0.0)
+        for _ in range(5):
+            self.assertEqual(self.binance.mark_price(symbol = "BTCUSDT")["symbol"], "BTCUSDT")
+        self.assertEqual(self.server.requests["GET /fapi/v1/premiumIndex"], 1)
+
+        self.binance.cache.invalidate("mark_price")
+        self.binance.mark_price(symbol = "BTCUSDT")
+        self.assertEqual(self.server.requests["GET /fapi/v1/premiumIndex"], 2)
+
+        self.binance.cache_ttl["mark_price"] = (0.0, 0.0)
+        self.binance.mark_price(symbol = "BTCUSDT")
+        self.assertEqual(self.server.requests["GET /fapi/v1/premiumIndex"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+import unittest
+
+# NOTE: The score accumulator wakes its waiters on a band crossing only, a
+# coroutine waiting on it must be resumed by a delta added from another thread.
+# The decay is checked on a hand-driven clock, so the time never depends on the run.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from object.score_accumulator import ScoreAccumulator  # type: ignore
+from object.signal import TradeSignal  # type: ignore
+
+
+class ScoreAccumulatorTest(unittest.TestCase):
+    """Bands follow the thresholds, and the waiters see the crossings and nothing else."""
+
+    def test_bands(self) -> None:
+        """The threshold is strict, the arm threshold is not."""
+        score = ScoreAccumulator(threshold = 10, arm_threshold = 8)
+        self.assertEqual([score.band_of(value) for value in (-11, -10, -8, -7, 0, 7, 8, 10, 11)], [-2, -1, -1, 0, 0, 0, 1, 1, 2])
+        self.assertEqual(ScoreAccumulator(threshold = 10).band_of(9), 0)
+
+    def test_wait_returns_on_crossing_only(self) -> None:
+        """Deltas inside the band do not wake the waiter, the crossing one does."""
+        score = ScoreAccumulator(threshold = 10, arm_threshold = 8)
+        woken = list()
+        waiter = threading.Thread(target = lambda: woken.append(score.wait(0, timeout = 5)))
+        waiter.start()
+
+        score.add(3)
+        score.add(4)
+        time.sleep(0.05)
+        self.assertEqual(woken, [])
+        score.add(4, trace = "trace")
+        waiter.join(timeout = 5)
+
+        self.assertEqual(woken, [2])
+        self.assertEqual(score.snapshot(), (11, 2, "trace"))
+        self.assertEqual(score.wait(0, timeout = 0), 2)  # already out of the band
+
+    def test_coroutine_is_woken_from_another_thread(self) -> None:
+        """changed() resumes right after the crossing add() of another thread."""
+        score = ScoreAccumulator(threshold = 10)
+
+        async def decide() -> tuple[int, float]:
+            band = await score.changed(0)
+            return band, time.perf_counter()
+
+        def signal() -> None:
+            time.sleep(0.05)
+            score.add(-5)
+            crossed.append(time.perf_counter())
+            score.add(-6)
+
+        crossed = list()
+        thread = threading.Thread(target = signal)
+        thread.start()
+        band, woken_at = asyncio.run(decide())
+        thread.join()
+
+        self.assertEqual(band, -2)
+        self.assertLess(woken_at - crossed[0], 0.05)
+        score.reset(0)
+        self.assertEqual((score.score, score.band), (0, 0))
+
+
+class DecayTest(unittest.TestCase):
+    """Contributions halve with the half-life of their signal, evaluated on read."""
+
+    HALF_LIVES = {TradeSignal.SHORT_TERM_BUY: 1_000, TradeSignal.LONG_TERM_SELL: 4_000, None: None}
+
+    def setUp(self) -> None:
+        self.now = 0
+        self.score = ScoreAccumulator(threshold = 10, half_lives = self.HALF_LIVES, clock = lambda: self.now)
+
+    def test_decay_per_signal_and_strategy(self) -> None:
+        """Every signal decays at its own rate, and the contributions add up to the score."""
+        self.score.add(8, signal = TradeSignal.SHORT_TERM_BUY, strategy = "price_reversal", timestamp = 0)
+        self.score.add(-8, signal = TradeSignal.LONG_TERM_SELL, strategy = "death_cross", timestamp = 0)
+        self.now = 4_000
+
+        self.assertAlmostEqual(self.score.score, 0.5 - 4.0)
+        self.assertEqual(self.score.contributions("signal"), {TradeSignal.SHORT_TERM_BUY: 0.5, TradeSignal.LONG_TERM_SELL: -4.0})
+        self.assertEqual(self.score.contributions("strategy", timestamp = 1_000), {"price_reversal": 4.0, "death_cross": -8 * 0.5 ** 0.25})
+        with self.assertRaises(ValueError):
+            self.score.contributions("indicator")
+
+    def test_band_follows_the_decayed_score(self) -> None:
+        """A delta lands on the decayed value, and refresh() sees the decay leaving the band."""
+        self.score.add(12, signal = TradeSignal.SHORT_TERM_BUY, timestamp = 0)
+        self.assertEqual(self.score.band, 2)
+        self.assertEqual(self.score.add(1, signal = TradeSignal.SHORT_TERM_BUY, timestamp = 1_000), 7)
+        self.assertEqual(self.score.band, 0)
+
+        self.score.add(6, signal = TradeSignal.SHORT_TERM_BUY, timestamp = 1_000)
+        self.assertEqual(self.score.band, 2)
+        self.now = 2_000
+        self.assertEqual(self.score.band, 2)  # nothing is evaluated until the next update
+        self.assertEqual(self.score.refresh(), 0)
+
+        self.score.reset(12, timestamp = 2_000)  # the carry does not decay with the half-life None
+        self.now = 10_000_000
+        self.assertEqual((self.score.refresh(), self.score.score), (2, 12))
+
+    def test_replay_matches_regardless_of_order_and_clock(self) -> None:
+        """The signal timestamps drive the decay, so a late signal or another clock gives the same score."""
+        signals = [(0, 4), (500, 2), (1_500, 6), (2_000, -1)]
+        replay = ScoreAccumulator(threshold = 10, half_lives = self.HALF_LIVES, clock = lambda: 123_456)
+        for timestamp, delta in signals:
+            self.score.add(delta, signal = TradeSignal.SHORT_TERM_BUY, timestamp = timestamp)
+        for timestamp, delta in [signals[0], signals[2], signals[1], signals[3]]:
+            replay.add(delta, signal = TradeSignal.SHORT_TERM_BUY, timestamp = timestamp)
+
+        self.assertAlmostEqual(self.score.snapshot()[0], replay.snapshot()[0])
+        self.assertAlmostEqual(self.score.snapshot()[0], 4 * 0.25 + 2 * 0.5 ** 1.5 + 6 * 0.5 ** 0.5 - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
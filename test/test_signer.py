@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import sys
+from pathlib import Path
+import unittest
+from urllib.parse import urlencode
+
+# NOTE: The precomputed signer must produce the signatures of hmac.new(), and a
+# prepared Binance order must pass the signature check of the mock exchange.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from sdk.signer import EncodedQuery, HmacSigner  # type: ignore
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from simulation.mock_exchange_rest import MockExchangeRestServer  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests)
+    BinanceFutureMarket = None  # type: ignore
+
+
+class HmacSignerTest(unittest.TestCase):
+    """Signatures match hmac.new() however the message is split."""
+
+    def test_matches_hmac_new(self) -> None:
+        """sign() of the parts, sign() of a prefixed signer and hmac.new() of the joined message agree."""
+        expected = hmac.new(b"secret", b"key1700000000000symbol=BTC_USDT", hashlib.sha256).hexdigest()
+        signer = HmacSigner("secret")
+
+        self.assertEqual(signer.sign("key1700000000000symbol=BTC_USDT"), expected)
+        self.assertEqual(signer.sign(b"key", "1700000000000", "symbol=BTC_USDT"), expected)
+        self.assertEqual(signer.prefixed("key").sign("1700000000000", "symbol=BTC_USDT"), expected)
+        # the keyed state is copied, so signing does not consume it.
+        self.assertEqual(signer.sign("key1700000000000symbol=BTC_USDT"), expected)
+
+    def test_encoded_query_appends_the_variable_part(self) -> None:
+        """render() gives the query of urlencode() over all the parameters, with the tail on its own."""
+        query = EncodedQuery({"symbol": "BTCUSDT", "side": "BUY", "price": None, "quantity": 0.002})
+        full, tail = query.render({"timestamp": 1_700_000_000_000})
+
+        self.assertEqual(full, urlencode({"symbol": "BTCUSDT", "side": "BUY", "quantity": 0.002, "timestamp": 1_700_000_000_000}))
+        self.assertEqual(query.prefix + tail, full)
+        self.assertEqual(query.render(), (query.prefix, ""))
+        self.assertEqual(EncodedQuery(dict()).render({"timestamp": 1}), ("timestamp=1", "timestamp=1"))
+
+
+class PreparedOrderTest(unittest.TestCase):
+    """A prepared order is signed over the exact query it sends."""
+
+    def setUp(self) -> None:
+        if BinanceFutureMarket is None:
+            self.skipTest("requests unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+
+    def test_prepared_order_is_accepted_and_reusable(self) -> None:
+        """The same prepared query is sent twice with fresh timestamps, a wrong secret is refused."""
+        prepared = self.binance.prepare_order(side = "BUY", quantity = 0.002, new_order_resp_type = "RESULT")
+        for _ in range(2):
+            self.assertEqual(self.binance.send_prepared_order(prepared)["status"], "FILLED")
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0.004)
+
+        self.binance.secret_key = "wrong"
+        self.assertIsNone(self.binance.send_prepared_order(prepared))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: The allocation is checked on hand-made books, the split orders on one
+# MockExchangeRestServer serving both venues through the real SDKs.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from simulation.mock_exchange_rest import MockExchangeRestServer, SimulatedAccount  # type: ignore
+
+try:
+    from binance.adapter import BinanceAdapter  # type: ignore
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from manager.smart_order_router import LocalBook, SmartOrderRouter  # type: ignore
+    from mexc.adapter import MexcAdapter  # type: ignore
+    from mexc.future import FutureMarket as MexcFutureMarket  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests)
+    SmartOrderRouter = None  # type: ignore
+
+
+BOOKS = {
+    "binance": ([(59_999.9, 0.01), (59_999.8, 0.02)], [(60_000.0, 0.01), (60_000.1, 0.02), (60_100.0, 5.0)]),
+    "mexc": ([(59_999.8, 1.0)], [(60_000.05, 0.015), (60_000.2, 1.0)]),
+}
+
+
+class AllocateTest(unittest.TestCase):
+    """The levels of both books are taken best price first, within the slippage, the fees and the margin."""
+
+    def setUp(self) -> None:
+        if SmartOrderRouter is None:
+            self.skipTest("requests unavailable")
+
+    def test_best_levels_first_across_the_books(self) -> None:
+        """A buy walks up the asks of both venues, a sell down their bids, and stops at max_slippage."""
+        allocations, price = SmartOrderRouter.allocate(BOOKS, 1, 0.05, 0.001)
+        self.assertEqual({venue: round(quantity, 8) for venue, quantity in allocations.items()}, {"binance": 0.03, "mexc": 0.02})
+        self.assertAlmostEqual(price, (0.01 * 60_000.0 + 0.015 * 60_000.05 + 0.02 * 60_000.1 + 0.005 * 60_000.2) / 0.05)
+
+        allocations, _ = SmartOrderRouter.allocate(BOOKS, -1, 0.04, 0.001)
+        self.assertEqual({venue: round(quantity, 8) for venue, quantity in allocations.items()}, {"binance": 0.03, "mexc": 0.01})
+
+        allocations, _ = SmartOrderRouter.allocate(BOOKS, 1, 10.0, 0.0)  # only the touch
+        self.assertEqual(allocations, {"binance": 0.01})
+
+    def test_fees_and_capacities(self) -> None:
+        """The taker fee moves a venue down the queue, and a venue never takes more than its margin covers."""
+        allocations, _ = SmartOrderRouter.allocate(BOOKS, 1, 0.01, 0.001, fees = {"binance": 0.0005, "mexc": 0.0002})
+        self.assertEqual(allocations, {"mexc": 0.01})
+
+        allocations, _ = SmartOrderRouter.allocate(BOOKS, 1, 0.05, 0.001, capacities = {"mexc": 0.005})
+        self.assertEqual({venue: round(quantity, 8) for venue, quantity in allocations.items()}, {"binance": 0.03, "mexc": 0.005})
+
+
+class SmartOrderRouterTest(unittest.TestCase):
+    """An order larger than either book near the touch is filled on both venues at once."""
+
+    def setUp(self) -> None:
+        if SmartOrderRouter is None:
+            self.skipTest("requests unavailable")
+        self.server = MockExchangeRestServer(
+            binance = SimulatedAccount(mark_prices = {"BTCUSDT": 60_000.0}, book_quantity = 0.001),
+            mexc = SimulatedAccount(mark_prices = {"BTC_USDT": 60_000.0}, book_quantity = 0.001),
+            api_key = "key",
+            secret_key = "secret",
+        ).start()
+        self.addCleanup(self.server.stop)
+        self.binance = BinanceAdapter(future = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret"))
+        self.mexc = MexcAdapter(future = MexcFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret"))
+
+    def test_order_is_split_across_the_venues(self) -> None:
+        """20 levels of 0.001 on each book, so 0.03 is shared between the venues, each child with its own exits."""
+        router = SmartOrderRouter([self.binance, self.mexc])
+        order = asyncio.run(router.place_bracket(1, "BTC", "USDT", 0.03, 10, lambda price: (price * 1.01, price * 0.99)))
+
+        self.assertTrue(order.accepted)
+        self.assertEqual(sorted(child.venue for child in order.children), ["binance", "mexc"])
+        self.assertAlmostEqual(order.quantity, 0.03)
+        self.assertAlmostEqual(self.server.binance.position("BTCUSDT")[0] + self.server.mexc.position("BTC_USDT")[0], 0.03)
+        self.assertEqual(sorted(order["type"] for order in self.server.binance.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        self.assertGreater(order.expected_price, 60_000.0)
+
+    def test_unknown_child_is_flagged_not_rejected(self) -> None:
+        """A child of unknown outcome is left out of the filled quantity, but flags the split, the venue may hold its share."""
+        self.server.lose_responses("POST /fapi/v1/order", executed = True)
+        self.server.lose_responses("GET /fapi/v1/order", count = 2, executed = True)
+        router = SmartOrderRouter([self.binance, self.mexc])
+        order = asyncio.run(router.place_bracket(1, "BTC", "USDT", 0.03, 10, lambda price: (price * 1.01, price * 0.99)))
+
+        self.assertTrue(order.accepted)
+        self.assertTrue(order.unknown)
+        self.assertEqual(order.venue, "mexc")
+        binance, = [child for child in order.children if child.venue == "binance"]
+        self.assertTrue(binance.unknown)
+        self.assertAlmostEqual(order.quantity, self.server.mexc.position("BTC_USDT")[0])
+        self.assertAlmostEqual(self.server.binance.position("BTCUSDT")[0], binance.quantity)
+        self.assertEqual(self.server.binance.open_orders(), [])
+
+    def test_local_books_spare_the_depth_requests(self) -> None:
+        """With fresh books from the streams the depth endpoints are not called, a stale book falls back to REST."""
+        router = SmartOrderRouter([self.binance, self.mexc])
+        now = SimulatedAccount.now()
+        router.books = {"binance": LocalBook("binance"), "mexc": LocalBook("mexc", ttl = 0, clock = lambda: now + 1)}
+        router.books["binance"].update("binance", ([(60_000.5, 1.0)], [(60_000.6, 1.0)]), SimulatedAccount.now())
+        router.books["mexc"].update("mexc", ([(59_999.9, 1.0)], [(60_000.0, 1.0)]), now)
+
+        order = asyncio.run(router.place_bracket(-1, "BTC", "USDT", 0.01, 10, lambda price: (price * 0.99, price * 1.01)))
+        self.assertEqual([child.venue for child in order.children], ["binance"])
+        self.assertNotIn("GET /fapi/v1/depth", self.server.requests)
+        self.assertEqual(self.server.requests["GET /api/v1/contract/depth/BTC_USDT"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+# NOTE: Covers the symbol filters, the snapshot round trip and a refresh from the
+# mock exchange REST server, whose Binance orders are checked against the same filters.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    import numpy as np  # type: ignore
+    from manager.symbol_metadata import SymbolFilters, SymbolMetadataCache  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (numpy)
+    np = None  # type: ignore
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from mexc.future import FutureMarket as MexcFutureMarket  # type: ignore
+    from simulation.mock_exchange_rest import MockExchangeRestServer  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests)
+    BinanceFutureMarket = None  # type: ignore
+
+
+class SymbolFiltersTest(unittest.TestCase):
+    """Prices go to the tick, quantities to the step, and an order quantity always passes the filters."""
+
+    def setUp(self) -> None:
+        if np is None:
+            self.skipTest("numpy unavailable")
+        self.filters = SymbolFilters("binance", "BTCUSDT", tick_size = 0.1, step_size = 0.001, min_qty = 0.001, max_qty = 100.0, min_notional = 100.0)
+
+    def test_vectorized_rounding(self) -> None:
+        """Arrays are rounded element-wise without float noise, scalars come back as floats."""
+        prices = self.filters.round_price(np.array([60_000.04, 60_000.07, 60_000.16]))
+        np.testing.assert_array_equal(prices, [60_000.0, 60_000.1, 60_000.2])
+        self.assertEqual(self.filters.round_price(60_000.04, mode = "up"), 60_000.1)
+
+        quantities = self.filters.round_quantity([0.0019999, 0.3, 0.0301])
+        self.assertEqual(quantities.tolist(), [0.001, 0.3, 0.03])
+        self.assertIsInstance(self.filters.round_quantity(0.0025), float)
+
+    def test_order_quantity_meets_the_minimums(self) -> None:
+        """A small quantity is raised to the minimum notional, a large one is floored to the step and capped."""
+        self.assertEqual(self.filters.order_quantity(0.0001, price = 60_000.0), 0.002)
+        self.assertEqual(self.filters.order_quantity(0.01234, price = 60_000.0), 0.012)
+        self.assertEqual(self.filters.order_quantity(1_000.0, price = 60_000.0), 100.0)
+
+
+class SymbolMetadataCacheTest(unittest.TestCase):
+    """The cache starts from the snapshot and refreshes it from the exchanges."""
+
+    def setUp(self) -> None:
+        if np is None:
+            self.skipTest("numpy unavailable")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "metadata", "symbols.json")
+
+    def test_snapshot_round_trip(self) -> None:
+        """save() and load() keep every field, a broken snapshot is ignored."""
+        cache = SymbolMetadataCache(path = self.path)
+        cache.put([SymbolFilters("mexc", "BTC_USDT", tick_size = 0.1, step_size = 1, min_qty = 1, contract_size = 0.0001, taker_fee = 0.0002)])
+        cache.save()
+
+        restored = SymbolMetadataCache(path = self.path)
+        self.assertEqual(restored.load(), 1)
+        self.assertEqual(restored[("mexc", "BTC_USDT")].to_dict(), cache[("mexc", "BTC_USDT")].to_dict())
+        self.assertIsNone(restored.get("binance", "BTC_USDT"))
+
+        with open(self.path, "w", encoding = "utf-8") as file:
+            json.dump({"version": 0}, file)
+        self.assertEqual(SymbolMetadataCache(path = self.path).load(), 0)
+
+    def test_refresh_from_the_exchanges(self) -> None:
+        """exchangeInfo and detail are parsed, saved, and the rounded order is accepted where the raw one is not."""
+        if BinanceFutureMarket is None:
+            self.skipTest("requests unavailable")
+        server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(server.stop)
+        binance = BinanceFutureMarket(base_url = server.base_url, api_key = "key", secret_key = "secret")
+        mexc = MexcFutureMarket(base_url = server.base_url, api_key = "key", secret_key = "secret")
+
+        cache = SymbolMetadataCache(binance = binance, mexc = mexc, path = self.path)
+        self.assertEqual(cache.refresh(), 2)
+        self.assertEqual(cache[("mexc", "BTC_USDT")].contract_size, 0.0001)
+        self.assertEqual((cache[("mexc", "BTC_USDT")].taker_fee, cache[("mexc", "BTC_USDT")].max_leverage), (0.0004, 125))
+        self.assertEqual(SymbolMetadataCache(path = self.path).load(), 2)
+
+        self.assertIsNone(binance.new_order(symbol = "BTCUSDT", side = "BUY", type = "MARKET", quantity = 0.00234))
+        quantity = cache[("binance", "BTCUSDT")].order_quantity(0.00234, price = 60_000.0)
+        self.assertEqual(binance.new_order(symbol = "BTCUSDT", side = "BUY", type = "MARKET", quantity = quantity)["origQty"], str(quantity))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Checks the HDR histogram against exact percentiles and drives the
+# tracer with hand-made trace contexts, no pipeline thread is started.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from telemetry.histogram import HdrHistogram  # type: ignore
+from telemetry.tracing import Stage, TraceContext, Tracer  # type: ignore
+
+
+def _context(**marks_us: int) -> TraceContext:
+    """Trace whose stages were reached at the given microseconds."""
+    marks = [0] * len(Stage)
+    for name, value in marks_us.items():
+        marks[Stage[name]] = value * 1_000
+    return TraceContext(trace_id = 1, marks = marks)
+
+
+class HdrHistogramTest(unittest.TestCase):
+    """Percentiles stay within the precision of the buckets."""
+
+    def test_small_values_are_exact(self) -> None:
+        """Values below 2^precision_bits have a bucket of their own."""
+        histogram = HdrHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        self.assertEqual(histogram.percentile(50), 50)
+        self.assertEqual(histogram.percentile(99), 99)
+        self.assertEqual(histogram.percentile(100), 100)
+        self.assertEqual((histogram.minimum, histogram.maximum, histogram.mean), (1, 100, 50.5))
+
+    def test_relative_error_is_bounded(self) -> None:
+        """Large values are reported within 1/64 of the exact percentile."""
+        rng = random.Random(7)
+        values = sorted(rng.randint(0, 5_000_000) for _ in range(20_000))
+        histogram = HdrHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50.0, 99.0, 99.9):
+            exact = values[int(percentile / 100 * len(values)) - 1]
+            with self.subTest(percentile = percentile):
+                self.assertAlmostEqual(histogram.percentile(percentile), exact, delta = exact / 64 + 1)
+
+    def test_merge_and_reset(self) -> None:
+        """Merged counts add up and reset empties the histogram."""
+        first, second = HdrHistogram(), HdrHistogram()
+        first.record(10, count = 3)
+        second.record(1_000_000)
+
+        first.merge(second)
+        self.assertEqual((first.total, first.maximum), (4, 1_000_000))
+        with self.assertRaises(ValueError):
+            first.merge(HdrHistogram(precision_bits = 5))
+
+        first.reset()
+        self.assertEqual((first.total, first.percentile(99)), (0, 0))
+
+
+class TracerTest(unittest.TestCase):
+    """Stage latencies are the gaps between the reached checkpoints."""
+
+    def test_stage_deltas_skip_unreached_stages(self) -> None:
+        """A stage without a mark is skipped and the next one is measured from the last reached stage."""
+        tracer = Tracer()
+        tracer.record(
+            _context(WS_RECEIVE = 100, TICK_BUFFERED = 110, INDICATOR_UPDATED = 160, SIGNAL_SCORED = 1_100),
+            Stage.WS_RECEIVE,
+            Stage.SIGNAL_SCORED,
+        )
+        report = tracer.report()
+
+        self.assertEqual(report["TICK_BUFFERED"]["p50"], 10)
+        self.assertEqual(report["INDICATOR_UPDATED"]["p50"], 50)
+        self.assertEqual(report["SIGNAL_SCORED"]["p50"], 940)
+        self.assertEqual(report["total:SIGNAL_SCORED"]["max"], 1_000)
+        self.assertNotIn("TICK_DEQUEUED", report)
+
+    def test_forked_segments_are_recorded_once(self) -> None:
+        """The order segment of a fork adds only the order stages, with the end-to-end total."""
+        tracer = Tracer()
+        scored = _context(WS_RECEIVE = 100, SIGNAL_SCORED = 500)
+        tracer.record(scored, Stage.WS_RECEIVE, Stage.SIGNAL_SCORED)
+
+        order = scored.fork()
+        order.marks[Stage.ORDER_SUBMITTED] = 800_000
+        order.marks[Stage.ORDER_ACKED] = 3_800_000
+        tracer.record(order, Stage.SIGNAL_SCORED, Stage.ORDER_ACKED)
+        report = tracer.report()
+
+        self.assertEqual(report["SIGNAL_SCORED"]["count"], 1)
+        self.assertEqual(report["ORDER_SUBMITTED"]["p50"], 300)
+        self.assertEqual(report["ORDER_ACKED"]["p50"], 3_000)
+        self.assertEqual(report["total:ORDER_ACKED"]["p999"], 3_700)
+        self.assertEqual(scored.marks[Stage.ORDER_ACKED], 0)
+
+    def test_mark_once_keeps_first_mark(self) -> None:
+        """Several indexes of one tick do not move the receive mark."""
+        context = TraceContext.start().mark_once(Stage.INDEX_RECEIVED)
+        first = context.marks[Stage.INDEX_RECEIVED]
+        context.mark_once(Stage.INDEX_RECEIVED)
+
+        self.assertEqual(context.marks[Stage.INDEX_RECEIVED], first)
+        self.assertGreaterEqual(context.elapsed_us(Stage.WS_RECEIVE, Stage.INDEX_RECEIVED), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Runs the TradeManager order path against the mock exchange REST server,
+# with a stub Telegram bot, so arming and firing the orders is covered offline.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from interface.pipeline_interface import PipelineController  # type: ignore
+    from manager.symbol_metadata import SymbolMetadataCache  # type: ignore
+    from manager.trade_manager import TradeManager  # type: ignore
+    from object.score_mapping import ScoreMapper  # type: ignore
+    from pipeline.signal_pipeline import SignalPipeline  # type: ignore
+    from simulation.mock_exchange_rest import MockExchangeRestServer  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests, telegram)
+    TradeManager = None  # type: ignore
+
+
+class _StubTelegramBot:
+    def __init__(self) -> None:
+        self.messages = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class PreArmedOrderTest(unittest.TestCase):
+    """Arming does the REST work up front, firing sends only the orders."""
+
+    def setUp(self) -> None:
+        if TradeManager is None:
+            self.skipTest("trade manager dependencies unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.telegram_bot = _StubTelegramBot()
+        binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        metadata = SymbolMetadataCache(binance = binance)
+        metadata.put(SymbolMetadataCache.parse_binance_exchange_info(binance.exchange_info()))
+        self.manager = TradeManager(
+            signal_pipeline_controller = PipelineController(pipeline = SignalPipeline()),
+            mexc_future = None,
+            binanace_future = binance,
+            delta_mapper = ScoreMapper(),
+            telegram_bot = self.telegram_bot,
+            symbol_metadata = metadata,
+            arm_fraction = None,  # armed by hand, without the background thread
+        )
+        self.addCleanup(self.manager.notifier.stop)
+
+    def execute(self, buy_or_sell: int) -> None:
+        asyncio.run(self.manager._TradeManager__execute_trade(buy_or_sell))
+
+    def test_armed_order_is_fired_with_order_requests_only(self) -> None:
+        """After arm(), the trade sends the entry and both exits and nothing else."""
+        armed = self.manager.arm(1)
+        self.assertIsNotNone(armed)
+        self.assertEqual(self.server.requests["POST /fapi/v1/leverage"], 1)
+        before = dict(self.server.requests)
+
+        self.execute(1)
+
+        sent = {key: count - before.get(key, 0) for key, count in self.server.requests.items() if count != before.get(key, 0)}
+        self.assertEqual(sent, {"POST /fapi/v1/order": 3})
+        self.assertAlmostEqual(self.server.binance.position("BTCUSDT")[0], armed.quantity)
+        self.assertEqual(sorted(order["type"] for order in self.server.binance.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        self.assertTrue(self.manager.notifier.flush())
+        self.assertEqual(len(self.telegram_bot.messages), 1)
+        self.assertEqual(self.manager.armed, dict())
+
+    def test_stale_armed_order_falls_back(self) -> None:
+        """An armed order past its ttl is not sent, the trade goes through the regular path."""
+        self.manager.arm(-1).created -= self.manager.arm_ttl + 1
+        self.execute(-1)
+
+        self.assertEqual(self.server.requests["POST /fapi/v1/leverage"], 2)
+        self.assertLess(self.server.binance.position("BTCUSDT")[0], 0)
+
+    def test_rejected_entry_is_reported_not_announced(self) -> None:
+        """A rejected entry sends no exits and its notification is the failure, not the trade."""
+        self.server.min_notional = 10_000_000.0  # the entry is below the notional filter, -4164
+        self.execute(1)
+
+        self.assertEqual(self.server.requests["POST /fapi/v1/order"], 1)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0)
+        self.assertTrue(self.manager.notifier.flush())
+        self.assertEqual(len(self.telegram_bot.messages), 1)
+        self.assertIn("However, the entry order is REJECTED", self.telegram_bot.messages[0])
+
+
+class UnknownEntryTest(unittest.TestCase):
+    """The exits of an entry of unknown outcome wait for the exchange to tell it has been accepted."""
+
+    def setUp(self) -> None:
+        if TradeManager is None:
+            self.skipTest("trade manager dependencies unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        binance = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        metadata = SymbolMetadataCache(binance = binance)
+        metadata.put(SymbolMetadataCache.parse_binance_exchange_info(binance.exchange_info()))
+        self.manager = TradeManager(
+            signal_pipeline_controller = PipelineController(pipeline = SignalPipeline()),
+            mexc_future = None,
+            binanace_future = binance,
+            delta_mapper = ScoreMapper(),
+            telegram_bot = _StubTelegramBot(),
+            symbol_metadata = metadata,
+            arm_fraction = None,
+            reconcile_interval = 60.0,  # reconciled by hand
+        )
+        self.addCleanup(self.manager.notifier.stop)
+
+        # the entry is filled, but neither its response nor the query of its outcome come back.
+        self.server.lose_responses("POST /fapi/v1/order", executed = True)
+        self.server.lose_responses("GET /fapi/v1/order", executed = True)
+        asyncio.run(self.manager._TradeManager__execute_trade(1))
+        (self.entry_id, ) = self.manager.pending_exits
+        self.assertGreater(self.server.binance.position("BTCUSDT")[0], 0)
+        self.assertEqual(self.server.binance.open_orders(), [])
+
+    def test_exits_follow_the_reconcile(self) -> None:
+        """reconcile() finds the entry FILLED and the exits go out, once."""
+        self.manager._TradeManager__reconcile()
+        self.manager._TradeManager__reconcile()
+
+        self.assertEqual(self.manager.orders.get(self.entry_id).state.value, "FILLED")
+        self.assertEqual(sorted(order["type"] for order in self.server.binance.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        self.assertEqual(self.manager.pending_exits, dict())
+
+    def test_exits_follow_the_order_update(self) -> None:
+        """The FILLED of the user data stream sends the exits as well."""
+        order = self.server.binance.find_order("BTCUSDT", client_order_id = self.entry_id)
+        self.manager._TradeManager__on_user_data({"data": {"e": "ORDER_TRADE_UPDATE", "E": order["updateTime"], "o": {
+            "c": self.entry_id, "s": "BTCUSDT", "S": "BUY", "o": "MARKET", "X": "FILLED",
+            "i": order["orderId"], "z": order["executedQty"], "ap": order["avgPrice"], "T": order["updateTime"],
+        }}})
+
+        self.assertEqual(sorted(order["type"] for order in self.server.binance.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        self.assertEqual(self.manager.pending_exits, dict())
+
+
+class _FakeBinanceWebSocket:
+    """Takes the subscriptions of the TradeManager and keeps its connection listener."""
+
+    def __init__(self) -> None:
+        self.listen_key = "listen-key"
+        self.listeners = []
+
+    def add_connection_listener(self, listener) -> None:
+        self.listeners.append(listener)
+
+    def mark_price(self, callback, symbol) -> None:
+        pass
+
+    def user_data(self, callback) -> str:
+        return self.listen_key
+
+    def is_connected(self) -> bool:
+        return True
+
+
+class AccountStreamTest(unittest.TestCase):
+    """The balance and the positions are cached while the user data stream is up, and read over REST while it is down."""
+
+    def setUp(self) -> None:
+        if TradeManager is None:
+            self.skipTest("trade manager dependencies unavailable")
+        self.server = MockExchangeRestServer(api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.binance_ws = _FakeBinanceWebSocket()
+        self.manager = TradeManager(
+            signal_pipeline_controller = PipelineController(pipeline = SignalPipeline()),
+            mexc_future = None,
+            binanace_future = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret"),
+            delta_mapper = ScoreMapper(),
+            telegram_bot = _StubTelegramBot(),
+            binance_ws = self.binance_ws,
+            arm_fraction = None,
+        )
+        self.addCleanup(self.manager.notifier.stop)
+
+    def test_cache_is_dropped_with_the_stream(self) -> None:
+        """A drop clears the cache and nothing is cached until the stream is back."""
+        self.assertEqual(self.manager.get_available_usdt_amt(), 10_000.0)
+        self.assertTrue(self.manager._TradeManager__decide_to_make_trade())
+        self.manager.get_available_usdt_amt()
+        self.manager._TradeManager__decide_to_make_trade()
+        self.assertEqual((self.server.requests["GET /fapi/v2/balance"], self.server.requests["GET /fapi/v2/positionRisk"]), (1, 1))
+
+        self.binance_ws.listeners[0](False)
+        self.assertIsNone(self.manager.available_usdt)
+        self.assertIsNone(self.manager.position_amounts)
+        for _ in range(2):
+            self.manager.get_available_usdt_amt()
+            self.manager._TradeManager__decide_to_make_trade()
+        self.assertEqual((self.server.requests["GET /fapi/v2/balance"], self.server.requests["GET /fapi/v2/positionRisk"]), (3, 3))
+
+        self.binance_ws.listeners[0](True)
+        self.manager.get_available_usdt_amt()
+        self.manager.get_available_usdt_amt()
+        self.assertEqual(self.server.requests["GET /fapi/v2/balance"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
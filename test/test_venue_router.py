@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+import unittest
+
+# NOTE: Both venues are served by one MockExchangeRestServer on a loopback port,
+# and driven through the real SDKs behind their ExchangeAdapters.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from simulation.mock_exchange_rest import MockExchangeRestServer, SimulatedAccount  # type: ignore
+
+try:
+    from binance.adapter import BinanceAdapter  # type: ignore
+    from binance.future import FutureMarket as BinanceFutureMarket  # type: ignore
+    from interface.pipeline_interface import PipelineController  # type: ignore
+    from manager.trade_manager import TradeManager  # type: ignore
+    from manager.venue_router import VenueRouter  # type: ignore
+    from mexc.adapter import MexcAdapter  # type: ignore
+    from mexc.future import FutureMarket as MexcFutureMarket  # type: ignore
+    from object.score_mapping import ScoreMapper  # type: ignore
+    from pipeline.signal_pipeline import SignalPipeline  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency (requests, telegram)
+    VenueRouter = None  # type: ignore
+
+
+class _StubTelegramBot:
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        pass
+
+
+class VenueRouterTest(unittest.TestCase):
+    """The order goes to the fastest venue which has the margin and the book for it."""
+
+    def setUp(self) -> None:
+        if VenueRouter is None:
+            self.skipTest("requests unavailable")
+
+    def start(self, binance: SimulatedAccount | None = None, mexc: SimulatedAccount | None = None) -> None:
+        self.server = MockExchangeRestServer(binance = binance, mexc = mexc, api_key = "key", secret_key = "secret").start()
+        self.addCleanup(self.server.stop)
+        self.binance_future = BinanceFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret")
+        self.binance = BinanceAdapter(future = self.binance_future)
+        self.mexc = MexcAdapter(future = MexcFutureMarket(base_url = self.server.base_url, api_key = "key", secret_key = "secret"))
+
+    def test_adapters_speak_for_their_venue(self) -> None:
+        """Price, balance, position and depth come back in the same units from both venues."""
+        self.start()
+        for adapter in (self.binance, self.mexc):
+            self.assertEqual(adapter.price("BTC", "USDT"), 60_000.0)
+            self.assertEqual(adapter.available_balance("USDT"), 10_000.0)
+            self.assertEqual(adapter.position("BTC", "USDT"), 0.0)
+            bids, asks = adapter.depth("BTC", "USDT", limit = 5)
+            self.assertLess(bids[0][0], asks[0][0])
+            self.assertAlmostEqual(asks[0][1], 1.0)
+            self.assertIsNotNone(adapter.latency_ms)
+
+    def test_fastest_eligible_venue_takes_the_order(self) -> None:
+        """The lower latency wins, and a venue short of margin is skipped whatever its latency."""
+        self.start()
+        router = VenueRouter([self.binance, self.mexc])
+        self.binance.price("BTC", "USDT")
+        self.mexc.price("BTC", "USDT")
+        self.binance._ExchangeAdapter__latency_ms, self.mexc._ExchangeAdapter__latency_ms = 5.0, 1.0
+
+        ranked = asyncio.run(router.rank(1, "BTC", "USDT", 0.01, 10))
+        self.assertEqual([quote.adapter.name for quote in ranked], ["mexc", "binance"])
+
+        self.server.mexc.wallet_balance = 10.0
+        ranked = asyncio.run(router.rank(1, "BTC", "USDT", 0.01, 10))
+        self.assertEqual([quote.adapter.name for quote in ranked], ["binance"])
+
+    def test_thin_book_and_failover(self) -> None:
+        """A venue without the quantity near the touch is skipped, a rejection moves the order to the next venue."""
+        self.start(mexc = SimulatedAccount(mark_prices = {"BTC_USDT": 60_000.0}, book_quantity = 0.0001))
+        router = VenueRouter([self.binance, self.mexc])
+        ranked = asyncio.run(router.rank(-1, "BTC", "USDT", 0.01, 10))
+        self.assertEqual([quote.adapter.name for quote in ranked], ["binance"])
+
+        self.server.mexc.book_quantity = 1.0
+        self.binance._ExchangeAdapter__latency_ms, self.mexc._ExchangeAdapter__latency_ms = 1.0, 5.0
+        # off the step size of Binance without its metadata, so rejected there, whole contracts on MEXC.
+        order = asyncio.run(router.place_bracket(1, "BTC", "USDT", 0.0105, 10, lambda price: (price * 1.01, price * 0.99)))
+        self.assertTrue(order.accepted)
+        self.assertEqual(order.venue, "mexc")
+        self.assertAlmostEqual(order.quantity, 0.0105)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0)
+        self.assertAlmostEqual(self.server.mexc.position("BTC_USDT")[0], 0.0105)
+        self.assertFalse(asyncio.run(router.flat("BTC", "USDT")))
+
+    def test_unknown_entry_is_not_failed_over(self) -> None:
+        """An entry of unknown outcome is queried again, and stays on its venue when the query cannot tell either."""
+        self.start()
+        router = VenueRouter([self.binance, self.mexc])
+        self.binance._ExchangeAdapter__latency_ms, self.mexc._ExchangeAdapter__latency_ms = 1.0, 1_000.0
+        targets = lambda price: (price * 1.01, price * 0.99)  # noqa: E731
+
+        self.server.lose_responses("POST /fapi/v1/order", executed = True)
+        self.server.lose_responses("GET /fapi/v1/order", executed = True)
+        order = asyncio.run(router.place_bracket(1, "BTC", "USDT", 0.01, 10, targets))
+        self.assertTrue(order.accepted)
+        self.assertEqual(order.venue, "binance")
+        self.assertEqual(sorted(order["type"] for order in self.server.binance.open_orders()), ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+
+        self.server.lose_responses("POST /fapi/v1/order", executed = True)
+        self.server.lose_responses("GET /fapi/v1/order", count = 2, executed = True)
+        self.binance._ExchangeAdapter__latency_ms, self.mexc._ExchangeAdapter__latency_ms = 1.0, 1_000.0
+        order = asyncio.run(router.place_bracket(1, "BTC", "USDT", 0.01, 10, targets))
+        self.assertFalse(order.accepted)
+        self.assertTrue(order.unknown)
+        self.assertEqual(order.venue, "binance")
+        self.assertAlmostEqual(self.server.binance.position("BTCUSDT")[0], 0.02)
+        self.assertEqual(len(self.server.binance.open_orders()), 2)  # the exits of the first entry only
+        self.assertEqual(self.server.mexc.position("BTC_USDT")[0], 0)
+        self.assertNotIn("POST /api/v1/private/order/submit", self.server.requests)
+
+    def test_trade_manager_places_through_the_router(self) -> None:
+        """With a router, the trade lands on the venue it picks, here MEXC, with its SL / TP on the entry."""
+        self.start()
+        router = VenueRouter([self.binance, self.mexc])
+        self.binance._ExchangeAdapter__latency_ms, self.mexc._ExchangeAdapter__latency_ms = 5.0, 1.0
+        manager = TradeManager(
+            signal_pipeline_controller = PipelineController(pipeline = SignalPipeline()),
+            mexc_future = self.mexc.future,
+            binanace_future = self.binance_future,
+            delta_mapper = ScoreMapper(),
+            telegram_bot = _StubTelegramBot(),
+            venue_router = router,
+        )
+        self.addCleanup(manager.notifier.stop)
+        self.assertIsNone(manager.arm_fraction)
+
+        asyncio.run(manager._TradeManager__execute_trade(1))
+        self.assertGreater(self.server.mexc.position("BTC_USDT")[0], 0)
+        self.assertEqual(self.server.binance.position("BTCUSDT")[0], 0)
+
+        asyncio.run(manager._TradeManager__execute_trade(1))  # a position is open on MEXC
+        self.assertEqual(self.server.requests["POST /api/v1/private/order/submit"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()